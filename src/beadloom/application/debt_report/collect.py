@@ -5,18 +5,33 @@
 Queries the indexed graph (undocumented/stale/untracked/oversized/high-fan-out
 nodes) and the cross-domain signals (rule violations, git dormancy, test gaps)
 into the raw counts + per-node issue map the scorer consumes.
+
+Every category's result is cached in process memory against the database file
+and its reindex stamp (``last_reindex_at``), so a long-lived TUI or MCP server
+computes each category once per reindex instead of re-running lint, git and
+test mapping on every refresh. Collecting never writes to the index.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 from beadloom.application.debt_report.models import DebtData, DebtWeights
+from beadloom.infrastructure.db import get_meta
+from beadloom.infrastructure.path_stats import path_stats
 
 if TYPE_CHECKING:
     import sqlite3
+    from collections.abc import Callable
     from pathlib import Path
 
+# Category results computed by this process, keyed by (database file, reindex
+# stamp); each maps a category to its key and its result as JSON text.
+_DEBT_CATEGORY_CACHE: dict[tuple[str, str], dict[str, tuple[str, str]]] = {}
+
 
 def _count_undocumented(conn: sqlite3.Connection) -> tuple[int, list[str]]:
     """Count nodes that have no associated documentation.
@@ -67,7 +82,8 @@ def _count_oversized(
     """Count nodes whose *own* source directory has more symbols than threshold.
 
     For each node, child nodes' source prefixes are excluded so that only
-    symbols from files directly owned by the node are counted.
+    symbols from files directly owned by the node are counted. Each prefix
+    total is a primary-key lookup in the ``path_stats`` aggregate.
 
     Returns (count, list_of_ref_ids).
     """
@@ -93,40 +109,16 @@ def _count_oversized(
         if child_source is not None:
             child_prefixes.setdefault(parent_ref, []).append(child_source)
 
+    def under(prefix: str) -> int:
+        return path_stats(conn, prefix).symbol_count
+
     oversized_refs: list[str] = []
     for node in nodes:
         ref_id = str(node[0])
-        prefix = source_map[ref_id]
-
-        # Get children's prefixes to exclude
-        excludes = child_prefixes.get(ref_id, [])
-
-        if not excludes:
-            # No children — count all symbols under this prefix
-            row = conn.execute(
-                "SELECT COUNT(*) FROM code_symbols WHERE file_path LIKE ?",
-                (prefix + "%",),
-            ).fetchone()
-            count = int(row[0]) if row else 0
-        else:
-            # Count all symbols under prefix, then subtract those under
-            # child prefixes
-            row = conn.execute(
-                "SELECT COUNT(*) FROM code_symbols WHERE file_path LIKE ?",
-                (prefix + "%",),
-            ).fetchone()
-            total = int(row[0]) if row else 0
-
-            child_count = 0
-            for child_prefix in excludes:
-                crow = conn.execute(
-                    "SELECT COUNT(*) FROM code_symbols WHERE file_path LIKE ?",
-                    (child_prefix + "%",),
-                ).fetchone()
-                child_count += int(crow[0]) if crow else 0
-
-            count = total - child_count
-
+        # Own symbols: everything under the prefix minus the children's.
+        count = under(source_map[ref_id]) - sum(
+            under(child) for child in child_prefixes.get(ref_id, [])
+        )
         if count > threshold:
             oversized_refs.append(ref_id)
 
@@ -269,6 +261,40 @@ def _count_violations(
     return errors, warnings, node_violations
 
 
+class _CategoryCache:
+    """Per-category debt results cached in process memory per reindex stamp.
+
+    A category is recomputed only when the stamp changed or its own *key*
+    (threshold, rules-file hash, day) differs from the cached one. Values are
+    kept as JSON text, and fresh results go through the same round trip, so
+    hits and misses return the same shapes and callers never share objects.
+    In-memory databases and an index that was never reindexed (no stamp) are
+    not cached.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        stamp = get_meta(conn, "last_reindex_at")
+        db_file = str(conn.execute("PRAGMA database_list").fetchone()[2] or "")
+        self._entries: dict[str, tuple[str, str]] = {}
+        if db_file and stamp is not None:
+            entries = _DEBT_CATEGORY_CACHE.get((db_file, stamp))
+            if entries is None:
+                # Results from earlier reindexes of this database are stale for good.
+                for old in [old for old in _DEBT_CATEGORY_CACHE if old[0] == db_file]:
+                    del _DEBT_CATEGORY_CACHE[old]
+                entries = _DEBT_CATEGORY_CACHE[(db_file, stamp)] = {}
+            self._entries = entries
+
+    def get(self, name: str, key: str, compute: Callable[[], object]) -> Any:
+        """The cached result of *name* for *key*, else ``compute()`` (then cached)."""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == key:
+            return json.loads(entry[1])
+        text = json.dumps(compute())
+        self._entries[name] = (key, text)
+        return json.loads(text)
+
+
 def collect_debt_data(
     conn: sqlite3.Connection,
     project_root: Path,
@@ -277,68 +303,96 @@ def collect_debt_data(
     """Aggregate debt data from all data sources.
 
     Collects counts from rule engine, sync state, doctor, git activity,
-    and test mapper.
+    and test mapper. Each category is served from the reindex-stamped cache
+    when possible (see :class:`_CategoryCache`): rule violations are also
+    keyed by the rules file's content, stale and untracked docs by a
+    fingerprint of ``sync_state`` (sync checks and ``mark_synced`` rewrite it
+    between reindexes), dormancy by the current UTC day (its 90-day window
+    moves with the clock).
     """
     if weights is None:
         weights = DebtWeights()
 
+    cache = _CategoryCache(conn)
     node_issues: dict[str, list[str]] = {}
 
     # 1. Rule violations
-    error_count, warning_count, violation_nodes = _count_violations(
-        conn, project_root
+    rules_key = ""
+    for rules_path in (project_root / "rules.yml", project_root / ".beadloom" / "rules.yml"):
+        if rules_path.is_file():
+            rules_key = hashlib.sha256(rules_path.read_bytes()).hexdigest()
+            break
+    error_count, warning_count, violation_nodes = cache.get(
+        "violations", rules_key, lambda: _count_violations(conn, project_root)
     )
     for ref_id, reasons in violation_nodes.items():
         node_issues.setdefault(ref_id, []).extend(reasons)
 
+    def refs(name: str, key: str, compute: Callable[[], tuple[int, list[str]]]) -> list[str]:
+        return [str(r) for r in cache.get(name, key, lambda: compute()[1])]
+
     # 2. Undocumented nodes
-    undocumented_count, undoc_refs = _count_undocumented(conn)
+    undoc_refs = refs("undocumented", "", lambda: _count_undocumented(conn))
     for ref_id in undoc_refs:
         node_issues.setdefault(ref_id, []).append("undocumented")
 
-    # 3. Stale docs
-    stale_count, stale_refs = _count_stale(conn)
+    # 3. Stale docs. ``sync-check`` and ``mark_synced`` rewrite ``sync_state``
+    # between reindexes, so this and the untracked category are also keyed by
+    # a fingerprint of that table.
+    sync_key = json.dumps(
+        list(
+            conn.execute(
+                "SELECT count(*), sum(status = 'stale'), max(synced_at) FROM sync_state"
+            ).fetchone()
+        )
+    )
+    stale_refs = refs("stale", sync_key, lambda: _count_stale(conn))
     for ref_id in stale_refs:
         node_issues.setdefault(ref_id, []).append("stale_doc")
 
     # 4. Untracked files
-    untracked_count, untracked_refs = _count_untracked(conn)
+    untracked_refs = refs("untracked", sync_key, lambda: _count_untracked(conn))
     for ref_id in untracked_refs:
         node_issues.setdefault(ref_id, []).append("untracked")
 
     # 5. Oversized domains
-    oversized_count, oversized_refs = _count_oversized(
-        conn, weights.oversized_symbols
+    oversized_refs = refs(
+        "oversized",
+        str(weights.oversized_symbols),
+        lambda: _count_oversized(conn, weights.oversized_symbols),
     )
     for ref_id in oversized_refs:
         node_issues.setdefault(ref_id, []).append("oversized")
 
     # 6. High fan-out
-    high_fan_out_count, fan_out_refs = _count_high_fan_out(
-        conn, weights.high_fan_out_threshold
+    fan_out_refs = refs(
+        "high_fan_out",
+        str(weights.high_fan_out_threshold),
+        lambda: _count_high_fan_out(conn, weights.high_fan_out_threshold),
     )
     for ref_id in fan_out_refs:
         node_issues.setdefault(ref_id, []).append("high_fan_out")
 
     # 7. Dormant domains
-    dormant_count, dormant_refs = _count_dormant(conn, project_root)
+    today = datetime.now(tz=timezone.utc).date().isoformat()
+    dormant_refs = refs("dormant", today, lambda: _count_dormant(conn, project_root))
     for ref_id in dormant_refs:
         node_issues.setdefault(ref_id, []).append("dormant")
 
     # 8. Untested domains
-    untested_count, untested_refs = _count_untested(conn, project_root)
+    untested_refs = refs("untested", "", lambda: _count_untested(conn, project_root))
     for ref_id in untested_refs:
         node_issues.setdefault(ref_id, []).append("untested")
 
     return DebtData(
-        error_count=error_count,
-        warning_count=warning_count,
-        undocumented_count=undocumented_count,
-        stale_count=stale_count,
-        untracked_count=untracked_count,
-        oversized_count=oversized_count,
-        high_fan_out_count=high_fan_out_count,
-        dormant_count=dormant_count,
-        untested_count=untested_count,
+        error_count=int(error_count),
+        warning_count=int(warning_count),
+        undocumented_count=len(undoc_refs),
+        stale_count=len(stale_refs),
+        untracked_count=len(untracked_refs),
+        oversized_count=len(oversized_refs),
+        high_fan_out_count=len(fan_out_refs),
+        dormant_count=len(dormant_refs),
+        untested_count=len(untested_refs),
         node_issues=node_issues,
     )
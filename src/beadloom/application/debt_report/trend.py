@@ -92,9 +92,7 @@ def compute_debt_trend(
     Returns:
         A :class:`DebtTrend` or ``None`` if no snapshot exists.
     """
-    import json
-
-    from beadloom.graph.snapshot import list_snapshots
+    from beadloom.graph.snapshot import list_snapshots, load_snapshot
 
     if weights is None:
         weights = load_debt_weights(project_root)
@@ -107,19 +105,10 @@ def compute_debt_trend(
     latest = snapshots[0]
 
     # Load snapshot data
-    row = conn.execute(
-        "SELECT nodes_json, edges_json, symbols_count, label, created_at "
-        "FROM graph_snapshots WHERE id = ?",
-        (latest.id,),
-    ).fetchone()
-    if row is None:
-        return None
-
-    snapshot_nodes: list[dict[str, str]] = json.loads(row["nodes_json"])
-    snapshot_edges: list[dict[str, str]] = json.loads(row["edges_json"])
-    symbols_count: int = row["symbols_count"]
-    snapshot_label: str = row["label"] or ""
-    snapshot_date: str = row["created_at"]
+    snapshot_nodes, snapshot_edges = load_snapshot(conn, latest.id)
+    symbols_count = latest.symbols_count
+    snapshot_label: str = latest.label or ""
+    snapshot_date: str = latest.created_at
 
     # Build the display string: prefer label, fallback to date
     snapshot_display = f"{snapshot_date} [{snapshot_label}]" if snapshot_label else snapshot_date
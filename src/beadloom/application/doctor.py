@@ -179,6 +179,27 @@ def _check_stale_sync(conn: sqlite3.Connection) -> list[Check]:
     ]
 
 
+def _check_reindex_timings(conn: sqlite3.Connection) -> list[Check]:
+    """Reindex stages that took far longer than in earlier runs of the same mode."""
+    from beadloom.infrastructure.reindex_timings import load_timing_history, timing_regressions
+
+    history = load_timing_history(conn)
+    if not history:
+        return [Check("reindex_timings", Severity.OK, "No reindex timings recorded yet.")]
+    regressions = timing_regressions(history)
+    if not regressions:
+        return [Check("reindex_timings", Severity.OK, "No reindex stage regressions.")]
+    return [
+        Check(
+            "reindex_timings",
+            Severity.WARNING,
+            f"Reindex stage '{r.stage}' took {r.wall_s:.2f}s, "
+            f"usually {r.baseline_s:.2f}s ({r.mode} runs)",
+        )
+        for r in regressions
+    ]
+
+
 def _check_source_coverage(conn: sqlite3.Connection) -> list[Check]:
     """Check for nodes with untracked source files.
 
@@ -514,6 +535,7 @@ def run_checks(
     results.extend(_check_symbol_drift(conn))
     results.extend(_check_stale_sync(conn))
     results.extend(_check_source_coverage(conn))
+    results.extend(_check_reindex_timings(conn))
     if project_root is not None:
         results.extend(_check_agent_instructions(project_root))
     return results
@@ -16,6 +16,8 @@ responsibility (BDL-059 S4, cohesion-driven):
 - :mod:`.sync_state` — snapshot and rebuild the ``sync_state`` baselines.
 - :mod:`.change_detection` — file-index hashing/diffing + parser fingerprint
   (the incremental change-detection layer).
+- :mod:`.graph_delta` — apply a graph-YAML edit as an in-place node/edge
+  delta, or report the structural conflict that needs a full rebuild.
 - :mod:`.full` — the :func:`reindex` (full rebuild) orchestration.
 - :mod:`.incremental` — the :func:`incremental_reindex` orchestration.
 
@@ -31,10 +33,13 @@ from beadloom.application.reindex.change_detection import (
     _compute_file_hash,
     _compute_parser_fingerprint,
     _diff_files,
+    _full_sweep_due,
     _get_stored_file_index,
     _get_stored_parser_fingerprint,
     _graph_yaml_changed,
+    _mark_full_scan,
     _populate_file_index,
+    _scan_changed_files,
     _scan_project_files,
     _store_parser_fingerprint,
     _update_file_index,
@@ -46,7 +51,12 @@ from beadloom.application.reindex.enrichment import (
     _update_node_extra,
 )
 from beadloom.application.reindex.full import _beadloom_version, _drop_all_tables, reindex
-from beadloom.application.reindex.incremental import incremental_reindex
+from beadloom.application.reindex.graph_delta import (
+    _plan_graph_delta,
+    _record_declared_edges,
+    _reload_graph_delta,
+)
+from beadloom.application.reindex.incremental import FULL_SWEEP_INTERVAL_S, incremental_reindex
 from beadloom.application.reindex.indexing import (
     _build_doc_ref_map,
     _index_code_files,
@@ -86,6 +96,7 @@ from beadloom.infrastructure.scan_paths import resolve_scan_paths
 # from ``beadloom.application.reindex`` directly; they are listed so the
 # re-exports are explicit (and not flagged as unused).
 __all__ = [
+    "FULL_SWEEP_INTERVAL_S",
     "_CODE_EXTENSIONS",
     "_EXT_TO_LANG",
     "_TABLES_TO_DROP",
@@ -99,6 +110,7 @@ __all__ = [
     "_diff_files",
     "_drop_all_tables",
     "_extract_and_store_routes",
+    "_full_sweep_due",
     "_get_stored_file_index",
     "_get_stored_parser_fingerprint",
     "_graph_yaml_changed",
@@ -107,8 +119,13 @@ __all__ = [
     "_index_single_doc",
     "_is_missing_table_error",
     "_load_rules_into_db",
+    "_mark_full_scan",
+    "_plan_graph_delta",
     "_populate_file_index",
+    "_record_declared_edges",
+    "_reload_graph_delta",
     "_resolve_docs_dir",
+    "_scan_changed_files",
     "_scan_project_files",
     "_serialize_node_matcher",
     "_serialize_rule",
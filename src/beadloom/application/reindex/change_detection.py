@@ -12,16 +12,25 @@ indexing or orchestration.
 
 from __future__ import annotations
 
-import hashlib
 import sqlite3
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from beadloom.application.reindex.models import _CODE_EXTENSIONS, _is_missing_table_error
+from beadloom.infrastructure.db import get_meta, set_meta
+from beadloom.infrastructure.project_tree import project_tree
 from beadloom.infrastructure.scan_paths import resolve_scan_paths
+from beadloom.infrastructure.source_files import hash_file
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable
+
+# Graph YAML directory, relative to the project root.
+_GRAPH_DIR_REL = Path(".beadloom") / "_graph"
+
+# ``meta`` key stamping the last run that hashed every project file.
+_LAST_FULL_SCAN_KEY = "last_full_scan_at"
 
 
 def _compute_parser_fingerprint() -> str:
@@ -72,8 +81,8 @@ def _store_parser_fingerprint(conn: sqlite3.Connection, fingerprint: str) -> Non
 
 
 def _compute_file_hash(path: Path) -> str:
-    """Compute SHA-256 hash of a file."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    """Compute SHA-256 hash of a file, streamed in chunks."""
+    return hash_file(path)
 
 
 def _scan_project_files(
@@ -82,6 +91,7 @@ def _scan_project_files(
 ) -> dict[str, tuple[str, str]]:
     """Scan project files and return ``{relative_path: (sha256, kind)}``."""
     files: dict[str, tuple[str, str]] = {}
+    tree = project_tree(project_root)
 
     # Graph YAML files
     graph_dir = project_root / ".beadloom" / "_graph"
@@ -92,7 +102,7 @@ def _scan_project_files(
 
     # Doc files
     if docs_dir.is_dir():
-        for f in sorted(docs_dir.rglob("*.md")):
+        for f in tree.files(docs_dir, suffixes={".md"}):
             rel = str(f.relative_to(project_root))
             files[rel] = (_compute_file_hash(f), "doc")
 
@@ -101,15 +111,111 @@ def _scan_project_files(
         scan_dir = project_root / dirname
         if not scan_dir.is_dir():
             continue
-        for f in sorted(scan_dir.rglob("*")):
-            if f.suffix not in _CODE_EXTENSIONS or not f.is_file():
-                continue
+        for f in tree.files(scan_dir, suffixes=_CODE_EXTENSIONS):
             rel = str(f.relative_to(project_root))
             files[rel] = (_compute_file_hash(f), "code")
 
     return files
 
 
+def _normalize_changed_path(project_root: Path, path: str | Path) -> str | None:
+    """Return *path* relative to *project_root* (``None`` when outside it)."""
+    candidate = Path(path)
+    if not candidate.is_absolute():
+        return str(candidate)
+    try:
+        return str(candidate.relative_to(project_root))
+    except ValueError:
+        return None
+
+
+def _classify_project_path(
+    rel: str,
+    docs_dir_rel: Path,
+    scan_dirs: list[str],
+) -> str | None:
+    """Return the ``file_index`` kind :func:`_scan_project_files` gives *rel*, if any."""
+    path = Path(rel)
+    kind: str | None = None
+    if path.parent == _GRAPH_DIR_REL and path.suffix == ".yml":
+        kind = "graph"
+    if path.suffix == ".md" and docs_dir_rel in path.parents:
+        kind = "doc"
+    if path.suffix in _CODE_EXTENSIONS and any(
+        Path(d) in path.parents for d in scan_dirs
+    ):
+        kind = "code"
+    return kind
+
+
+def _scan_changed_files(
+    project_root: Path,
+    docs_dir: Path,
+    changed_paths: Iterable[str | Path],
+    stored_files: dict[str, tuple[str, str]],
+) -> dict[str, tuple[str, str] | None]:
+    """Re-hash only *changed_paths* (as reported by a file watcher).
+
+    Returns ``{relative_path: (sha256, kind)}`` for every indexable file among
+    them, with ``None`` for files that no longer exist. A changed path naming a
+    directory (e.g. a removed folder) expands to the indexed files beneath it.
+    Paths outside the project or outside every indexed area are ignored, so the
+    result matches what :func:`_scan_project_files` would report for them.
+    """
+    docs_dir_rel = docs_dir.relative_to(project_root)
+    scan_dirs = resolve_scan_paths(project_root)
+    tree = project_tree(project_root)
+
+    rels: set[str] = set()
+    for raw in changed_paths:
+        rel = _normalize_changed_path(project_root, raw)
+        if rel is None:
+            continue
+        abs_path = project_root / rel
+        if abs_path.is_dir() or (rel not in stored_files and not abs_path.exists()):
+            prefix = rel.rstrip("/") + "/"
+            rels.update(p for p in stored_files if p.startswith(prefix))
+        rels.add(rel)
+
+    result: dict[str, tuple[str, str] | None] = {}
+    for rel in sorted(rels):
+        kind = _classify_project_path(rel, docs_dir_rel, scan_dirs)
+        if kind is None or tree.is_ignored(Path(rel).as_posix()):
+            continue
+        abs_path = project_root / rel
+        if abs_path.is_file():
+            try:
+                result[rel] = (_compute_file_hash(abs_path), kind)
+            except OSError:
+                result[rel] = None
+        else:
+            result[rel] = None
+    return result
+
+
+def _full_sweep_due(
+    conn: sqlite3.Connection,
+    interval_s: float,
+    *,
+    now: datetime | None = None,
+) -> bool:
+    """True when the last full project scan is older than *interval_s* seconds."""
+    last = get_meta(conn, _LAST_FULL_SCAN_KEY)
+    if last is None:
+        return True
+    try:
+        last_at = datetime.fromisoformat(last)
+    except ValueError:
+        return True
+    current = now or datetime.now(tz=timezone.utc)
+    return (current - last_at).total_seconds() >= interval_s
+
+
+def _mark_full_scan(conn: sqlite3.Connection) -> None:
+    """Record that the whole project was just hashed (see :func:`_full_sweep_due`)."""
+    set_meta(conn, _LAST_FULL_SCAN_KEY, datetime.now(tz=timezone.utc).isoformat())
+
+
 def _get_stored_file_index(
     conn: sqlite3.Connection,
 ) -> dict[str, tuple[str, str]]:
@@ -11,36 +11,53 @@ left untouched.
 
 from __future__ import annotations
 
+import hashlib
 import json
 from typing import TYPE_CHECKING, Any
 
 from beadloom.application.reindex.models import _EXT_TO_LANG
+from beadloom.infrastructure.db import get_meta, set_meta
 
 if TYPE_CHECKING:
     import sqlite3
     from pathlib import Path
 
+    from beadloom.context_oracle.route_extractor import Route
+
+# Meta key: fingerprint of the inputs of the stored test mappings.
+_TEST_MAPPING_INPUTS_KEY = "test_mapping_inputs"
+
 
 def _store_test_mappings(
     project_root: Path,
     conn: sqlite3.Connection,
-) -> None:
+    *,
+    reuse_unchanged: bool = False,
+) -> bool:
     """Run test mapper and merge results into ``nodes.extra["tests"]``.
 
     Builds a ``source_dirs`` dict from nodes that have a non-null ``source``
     field, calls :func:`~beadloom.context_oracle.test_mapper.map_tests`, and
     updates each node's ``extra`` JSON blob with the test mapping data.
+
+    The mapping depends only on the test files (paths and contents), the
+    nodes' sources and the ``part_of`` hierarchy. Their fingerprint is stored
+    in meta; with *reuse_unchanged* (incremental reindex) a matching
+    fingerprint keeps the stored mappings. Returns whether anything was
+    re-mapped.
     """
-    from beadloom.context_oracle.test_mapper import aggregate_parent_tests, map_tests
+    from beadloom.context_oracle.test_mapper import (
+        aggregate_parent_tests,
+        discover_tests,
+        map_tests,
+    )
 
     # Build source_dirs: {ref_id: source_path} for nodes with a source field.
     rows = conn.execute("SELECT ref_id, source FROM nodes WHERE source IS NOT NULL").fetchall()
     source_dirs: dict[str, str] = {row["ref_id"]: row["source"] for row in rows}
 
     if not source_dirs:
-        return
-
-    mappings = map_tests(project_root, source_dirs)
+        return False
 
     # Build parent->children hierarchy from part_of edges for aggregation.
     parent_children: dict[str, list[str]] = {}
@@ -54,6 +71,21 @@ def _store_test_mappings(
             parent_children[parent_id] = []
         parent_children[parent_id].append(child_id)
 
+    discovered = discover_tests(project_root)
+    inputs = hashlib.sha256(
+        json.dumps(
+            [
+                discovered.stamp,
+                sorted(source_dirs.items()),
+                sorted((p, sorted(c)) for p, c in parent_children.items()),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+    if reuse_unchanged and get_meta(conn, _TEST_MAPPING_INPUTS_KEY) == inputs:
+        return False
+
+    mappings = map_tests(project_root, source_dirs, discovered=discovered)
+
     # Aggregate child test counts up to parent (domain) nodes.
     mappings = aggregate_parent_tests(mappings, parent_children)
 
@@ -75,7 +107,9 @@ def _store_test_mappings(
             (json.dumps(extra, ensure_ascii=False), ref_id),
         )
 
+    set_meta(conn, _TEST_MAPPING_INPUTS_KEY, inputs)
     conn.commit()
+    return True
 
 
 def _update_node_extra(
@@ -114,37 +148,26 @@ def _extract_and_store_routes(
     Files without routes are skipped (no empty arrays stored).
     """
     from beadloom.context_oracle.route_extractor import extract_routes
+    from beadloom.infrastructure.project_tree import project_tree
     from beadloom.infrastructure.scan_paths import resolve_scan_paths
 
-    all_routes: list[dict[str, object]] = []
+    # (file, route) pairs; the JSON dicts are built per node when stored.
+    all_routes: list[tuple[str, Route]] = []
 
     scan_dirs = [project_root / d for d in resolve_scan_paths(project_root)]
+    tree = project_tree(project_root)
     for scan_dir in scan_dirs:
         if not scan_dir.is_dir():
             continue
-        for file_path in sorted(scan_dir.rglob("*")):
-            if not file_path.is_file():
-                continue
-            lang = _EXT_TO_LANG.get(file_path.suffix)
-            if lang is None:
-                continue
+        for file_path in tree.files(scan_dir, suffixes=_EXT_TO_LANG):
+            lang = _EXT_TO_LANG[file_path.suffix]
 
             routes = extract_routes(file_path, lang)
             if not routes:
                 continue
 
             rel_path = str(file_path.relative_to(project_root))
-            for route in routes:
-                all_routes.append(
-                    {
-                        "method": route.method,
-                        "path": route.path,
-                        "handler": route.handler,
-                        "file": rel_path,
-                        "line": route.line,
-                        "framework": route.framework,
-                    }
-                )
+            all_routes.extend((rel_path, route) for route in routes)
 
     if not all_routes:
         return
@@ -162,7 +185,18 @@ def _extract_and_store_routes(
         # e.g. "src/beadloom/context_oracle" matches "src/beadloom/context_oracle/builder.py"
         source_prefix = source.rstrip("/")
 
-        node_routes = [r for r in all_routes if str(r.get("file", "")).startswith(source_prefix)]
+        node_routes = [
+            {
+                "method": route.method,
+                "path": route.path,
+                "handler": route.handler,
+                "file": rel_path,
+                "line": route.line,
+                "framework": route.framework,
+            }
+            for rel_path, route in all_routes
+            if rel_path.startswith(source_prefix)
+        ]
         if node_routes:
             _update_node_extra(conn, ref_id, "routes", node_routes)
     conn.commit()
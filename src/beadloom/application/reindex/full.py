@@ -7,6 +7,8 @@ that snapshots sync baselines, drops and re-creates the schema, then reloads
 the YAML graph, docs, code symbols, imports, rules, node-extra enrichments,
 sync state, search index, and health snapshot from scratch. It composes the
 cohesive helpers in this package; it holds the sequence, not the mechanics.
+Each stage runs under a :class:`~beadloom.infrastructure.reindex_timings.StageClock`
+and the run's timings are appended to the history in ``meta``.
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ from typing import TYPE_CHECKING, Any
 
 from beadloom.application.reindex.change_detection import (
     _compute_parser_fingerprint,
+    _mark_full_scan,
     _populate_file_index,
     _scan_project_files,
     _store_parser_fingerprint,
@@ -26,8 +29,11 @@ from beadloom.application.reindex.enrichment import (
     _store_git_activity,
     _store_test_mappings,
 )
+from beadloom.application.reindex.graph_delta import _record_declared_edges
 from beadloom.application.reindex.indexing import (
     _build_doc_ref_map,
+    _configure_source_limits,
+    _configure_yaml_cache,
     _index_code_files,
     _resolve_docs_dir,
 )
@@ -39,6 +45,13 @@ from beadloom.application.reindex.sync_state import (
 )
 from beadloom.infrastructure.db import SCHEMA_VERSION, create_schema, open_db, set_meta
 from beadloom.infrastructure.health import take_snapshot
+from beadloom.infrastructure.path_stats import refresh_path_stats
+from beadloom.infrastructure.project_tree import shares_project_tree
+from beadloom.infrastructure.reindex_timings import (
+    StageClock,
+    load_timing_history,
+    record_timings,
+)
 
 if TYPE_CHECKING:
     import sqlite3
@@ -65,6 +78,7 @@ def _drop_all_tables(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+@shares_project_tree
 def reindex(project_root: Path, *, docs_dir: Path | None = None) -> ReindexResult:
     """Full reindex: drop all tables, re-create schema, reload everything.
 
@@ -88,107 +102,132 @@ def reindex(project_root: Path, *, docs_dir: Path | None = None) -> ReindexResul
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = open_db(db_path)
+    clock = StageClock(conn)
+    _configure_yaml_cache(project_root)
+    _configure_source_limits(project_root)
 
-    # Snapshot sync baselines before drop.
-    preserved_symbols, preserved_pairs = _snapshot_sync_baselines(conn)
+    with clock.stage("schema"):
+        # Snapshot sync baselines and timing history before drop.
+        preserved_symbols, preserved_pairs = _snapshot_sync_baselines(conn)
+        timing_history = load_timing_history(conn)
 
-    # Drop + re-create.
-    _drop_all_tables(conn)
-    create_schema(conn)
+        # Drop + re-create.
+        _drop_all_tables(conn)
+        create_schema(conn)
 
     # 1. Load YAML graph.
     from beadloom.graph.loader import load_graph
 
     graph_dir = project_root / ".beadloom" / "_graph"
-    if graph_dir.is_dir():
-        graph_result = load_graph(graph_dir, conn)
-        result.nodes_loaded = graph_result.nodes_loaded
-        result.edges_loaded = graph_result.edges_loaded
-        result.errors.extend(graph_result.errors)
-        result.warnings.extend(graph_result.warnings)
-
-    # Collect known ref_ids for edge creation.
-    seen_ref_ids = {row[0] for row in conn.execute("SELECT ref_id FROM nodes").fetchall()}
-
-    # 1b. Store deep config in root node's extra.
-    from beadloom.onboarding.config_reader import read_deep_config
-
-    deep_config = read_deep_config(project_root)
-    root_row = conn.execute(
-        "SELECT ref_id, extra FROM nodes WHERE source = '' OR source IS NULL"
-    ).fetchone()
-    if root_row is not None:
-        existing_extra: dict[str, Any] = json.loads(root_row["extra"] or "{}")
-        existing_extra["config"] = deep_config
-        conn.execute(
-            "UPDATE nodes SET extra = ? WHERE ref_id = ?",
-            (json.dumps(existing_extra, ensure_ascii=False), root_row["ref_id"]),
-        )
-        conn.commit()
+    with clock.stage("graph") as stage:
+        if graph_dir.is_dir():
+            stage.files = len(list(graph_dir.glob("*.yml")))
+            graph_result = load_graph(graph_dir, conn)
+            result.nodes_loaded = graph_result.nodes_loaded
+            result.edges_loaded = graph_result.edges_loaded
+            result.errors.extend(graph_result.errors)
+            result.warnings.extend(graph_result.warnings)
+        # Only YAML-declared edges exist at this point; the graph delta reload
+        # uses them to tell removed YAML edges from derived ones.
+        _record_declared_edges(conn)
+
+        # Collect known ref_ids for edge creation.
+        seen_ref_ids = {row[0] for row in conn.execute("SELECT ref_id FROM nodes").fetchall()}
+
+        # 1b. Store deep config in root node's extra.
+        from beadloom.onboarding.config_reader import read_deep_config
+
+        deep_config = read_deep_config(project_root)
+        root_row = conn.execute(
+            "SELECT ref_id, extra FROM nodes WHERE source = '' OR source IS NULL"
+        ).fetchone()
+        if root_row is not None:
+            existing_extra: dict[str, Any] = json.loads(root_row["extra"] or "{}")
+            existing_extra["config"] = deep_config
+            conn.execute(
+                "UPDATE nodes SET extra = ? WHERE ref_id = ?",
+                (json.dumps(existing_extra, ensure_ascii=False), root_row["ref_id"]),
+            )
+            conn.commit()
 
     # 2. Index documents.
     if docs_dir is None:
         docs_dir = _resolve_docs_dir(project_root)
-    if docs_dir.is_dir():
-        from beadloom.doc_sync.doc_indexer import index_docs
-
-        if graph_dir.is_dir():
-            ref_map, doc_ref_warnings = _build_doc_ref_map(
-                graph_dir,
-                project_root,
-                docs_dir,
-            )
-            result.warnings.extend(doc_ref_warnings)
-        else:
-            ref_map = {}
-        doc_result = index_docs(docs_dir, conn, ref_id_map=ref_map)
-        result.docs_indexed = doc_result.docs_indexed
-        result.chunks_indexed = doc_result.chunks_indexed
+    with clock.stage("docs") as stage:
+        if docs_dir.is_dir():
+            from beadloom.doc_sync.doc_indexer import index_docs
+
+            if graph_dir.is_dir():
+                ref_map, doc_ref_warnings = _build_doc_ref_map(
+                    graph_dir,
+                    project_root,
+                    docs_dir,
+                )
+                result.warnings.extend(doc_ref_warnings)
+            else:
+                ref_map = {}
+            doc_result = index_docs(docs_dir, conn, ref_id_map=ref_map)
+            result.docs_indexed = doc_result.docs_indexed
+            result.chunks_indexed = doc_result.chunks_indexed
+            stage.files = doc_result.docs_indexed
 
     # 3. Index code symbols.
-    symbols_count, sym_warnings = _index_code_files(project_root, conn, seen_ref_ids)
-    result.symbols_indexed = symbols_count
-    result.warnings.extend(sym_warnings)
+    with clock.stage("symbols") as stage:
+        symbols_count, stage.files, sym_warnings = _index_code_files(
+            project_root, conn, seen_ref_ids
+        )
+        result.symbols_indexed = symbols_count
+        result.warnings.extend(sym_warnings)
+        refresh_path_stats(conn)
 
     # 3b. Extract and index code imports.
     from beadloom.graph.import_resolver import index_imports
 
-    result.imports_indexed = index_imports(project_root, conn)
+    with clock.stage("imports"):
+        result.imports_indexed = index_imports(project_root, conn)
 
     # 3c. Load architecture rules from rules.yml.
     rules_path = project_root / ".beadloom" / "_graph" / "rules.yml"
-    if rules_path.is_file():
-        _load_rules_into_db(rules_path, conn, result)
+    with clock.stage("rules") as stage:
+        if rules_path.is_file():
+            stage.files = 1
+            _load_rules_into_db(rules_path, conn, result)
 
     # 3d. Map test files to source nodes and store in nodes.extra.
-    _store_test_mappings(project_root, conn)
+    with clock.stage("tests"):
+        _store_test_mappings(project_root, conn)
 
     # 3e. Analyze git activity and store in nodes.extra.
-    _store_git_activity(conn, project_root)
+    with clock.stage("git_activity"):
+        _store_git_activity(conn, project_root)
 
     # 3f. Extract API routes and store in nodes.extra.
-    _extract_and_store_routes(project_root, conn)
+    with clock.stage("routes"):
+        _extract_and_store_routes(project_root, conn)
 
     # 4. Build initial sync state.
-    _build_initial_sync_state(
-        conn,
-        preserved_symbols=preserved_symbols,
-        preserved_pairs=preserved_pairs,
-    )
+    with clock.stage("sync_state"):
+        _build_initial_sync_state(
+            conn,
+            preserved_symbols=preserved_symbols,
+            preserved_pairs=preserved_pairs,
+        )
 
     # 4b. Baseline reference-doc surface hashes (BDL-057 Layer 2; advisory).
     from beadloom.doc_sync.engine import build_reference_state
 
-    build_reference_state(conn, project_root)
+    with clock.stage("reference_state"):
+        build_reference_state(conn, project_root)
 
     # 5. Populate FTS5 search index.
     from beadloom.context_oracle.search import populate_search_index
 
-    populate_search_index(conn)
+    with clock.stage("search"):
+        populate_search_index(conn)
 
-    # 5b. Clear persistent bundle cache (invalidated by full reindex).
-    conn.execute("DELETE FROM bundle_cache")
-    conn.commit()
+        # 5b. Clear persistent bundle cache (invalidated by full reindex).
+        conn.execute("DELETE FROM bundle_cache")
+        conn.commit()
 
     # 6. Set meta.
     now = datetime.now(tz=timezone.utc).isoformat()
@@ -197,14 +236,23 @@ def reindex(project_root: Path, *, docs_dir: Path | None = None) -> ReindexResul
     set_meta(conn, "schema_version", SCHEMA_VERSION)
 
     # 7. Take health snapshot for trend tracking.
-    take_snapshot(conn)
+    with clock.stage("health"):
+        take_snapshot(conn)
 
     # 8. Populate file_index for subsequent incremental runs.
-    current_files = _scan_project_files(project_root, docs_dir)
-    _populate_file_index(conn, current_files)
-
-    # 9. Store parser fingerprint for incremental reindex to detect new parsers.
-    _store_parser_fingerprint(conn, _compute_parser_fingerprint())
+    with clock.stage("file_index") as stage:
+        current_files = _scan_project_files(project_root, docs_dir)
+        stage.files = len(current_files)
+        _populate_file_index(conn, current_files)
+        _mark_full_scan(conn)
+
+        # 9. Store parser fingerprint for incremental reindex to detect new parsers.
+        _store_parser_fingerprint(conn, _compute_parser_fingerprint())
+
+    # 10. Record stage timings (status / doctor compare them across runs).
+    result.timings = clock.timings
+    result.wall_s = clock.elapsed_s
+    record_timings(conn, "full", clock, history=timing_history)
 
     conn.close()
     return result
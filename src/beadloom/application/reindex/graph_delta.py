@@ -0,0 +1,307 @@
+# beadloom:domain=application
+# beadloom:feature=reindex
+"""Reindex graph delta: apply a graph-YAML edit without a full rebuild.
+
+This module owns the incremental path's answer to a changed
+``.beadloom/_graph/*.yml`` file. It collects the graph the YAML now declares
+(:func:`~beadloom.graph.loader.collect_graph`, same validation as a full load),
+diffs its nodes and edges against the database, and upserts/deletes only what
+differs — preserving the derived ``nodes.extra`` keys, the annotation-derived
+``touches_code`` and import-derived ``depends_on`` edges, and re-pointing only
+the docs whose owning ref_id changed. Edits whose effects reach past the graph
+tables (a node ``source`` change, a new import-resolution target, a
+``part_of`` change that moves test aggregation, YAML errors) are *structural
+conflicts*: the plan reports one and the caller falls back to a full reindex.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from beadloom.application.reindex.rules_loader import _load_rules_into_db
+from beadloom.graph.loader import DeclaredGraph, EdgeRow, NodeRow, collect_graph
+from beadloom.infrastructure.db import get_meta, set_meta
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+    from beadloom.application.reindex.models import ReindexResult
+
+# Edge identity: (src_ref_id, dst_ref_id, kind, contract_key).
+_EdgeKey = tuple[str, str, str, str]
+
+# Meta key: JSON list of the edge keys the graph YAML declared at the last
+# graph load — tells a removed YAML edge apart from a derived one.
+_DECLARED_EDGES_KEY = "graph_declared_edges"
+
+# ``nodes.extra`` keys written by reindex enrichment, not by the YAML.
+_DERIVED_EXTRA_KEYS = ("activity", "config", "routes", "tests")
+
+# Ref-id prefixes the import resolver looks up from code annotations
+# (``# beadloom:domain=X`` -> ``domain:X``).
+_ANNOTATION_REF_PREFIXES = ("domain:", "feature:", "service:")
+
+_DEFAULT_EDGE_ATTRS = ("{}", "active")
+
+
+@dataclass
+class _GraphDelta:
+    """Planned graph-table changes (nothing is written while planning)."""
+
+    declared: DeclaredGraph
+    added_nodes: list[NodeRow] = field(default_factory=list)
+    updated_nodes: list[NodeRow] = field(default_factory=list)
+    removed_nodes: list[str] = field(default_factory=list)
+    upserted_edges: list[EdgeRow] = field(default_factory=list)
+    reset_edges: list[_EdgeKey] = field(default_factory=list)
+    deleted_edges: list[_EdgeKey] = field(default_factory=list)
+    touches_code: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    conflict: str | None = None
+
+
+def _edge_key(row: EdgeRow) -> _EdgeKey:
+    return (row[0], row[1], row[2], row[5])
+
+
+def _record_declared_edges(
+    conn: sqlite3.Connection, keys: Iterable[Sequence[str]] | None = None
+) -> None:
+    """Remember which edges the graph YAML declared.
+
+    Without *keys* the current ``edges`` table is recorded — call it right
+    after :func:`~beadloom.graph.loader.load_graph`, before any derived edge
+    is added.
+    """
+    if keys is None:
+        keys = conn.execute(
+            "SELECT src_ref_id, dst_ref_id, kind, contract_key FROM edges"
+        ).fetchall()
+    set_meta(conn, _DECLARED_EDGES_KEY, json.dumps(sorted(tuple(k) for k in keys)))
+
+
+def _read_declared_edges(conn: sqlite3.Connection) -> set[_EdgeKey] | None:
+    raw = get_meta(conn, _DECLARED_EDGES_KEY)
+    if raw is None:
+        return None
+    return {(k[0], k[1], k[2], k[3]) for k in json.loads(raw)}
+
+
+def _annotated_ref_ids(conn: sqlite3.Connection) -> set[str]:
+    """Values of every code-symbol annotation (the ``touches_code`` sources)."""
+    rows = conn.execute(
+        "SELECT DISTINCT a.value FROM code_symbols, json_each(code_symbols.annotations) AS a"
+    ).fetchall()
+    return {str(row[0]) for row in rows}
+
+
+def _root_ref_id(nodes: Iterable[Sequence[Any]]) -> str | None:
+    """First node without a ``source`` — the holder of ``extra["config"]``."""
+    for row in nodes:
+        if not row[3]:
+            return str(row[0])
+    return None
+
+
+def _plan_graph_delta(
+    conn: sqlite3.Connection,
+    graph_dir: Path,
+    project_root: Path,
+) -> _GraphDelta:
+    """Diff the graph the YAML declares against the ``nodes``/``edges`` tables."""
+    declared = collect_graph(graph_dir, project_root=project_root)
+    delta = _GraphDelta(declared=declared)
+    if declared.result.errors:
+        delta.conflict = "graph YAML has errors"
+        return delta
+    old_declared = _read_declared_edges(conn)
+    if old_declared is None:
+        delta.conflict = "no declared-edge baseline"
+        return delta
+
+    db_rows = conn.execute(
+        "SELECT ref_id, kind, summary, source, extra, lifecycle FROM nodes ORDER BY rowid"
+    ).fetchall()
+    if _root_ref_id(db_rows) != _root_ref_id(declared.nodes.values()):
+        delta.conflict = "root node changed"
+        return delta
+    db_nodes = {row[0]: row for row in db_rows}
+
+    # --- Nodes ---
+    for ref_id, row in declared.nodes.items():
+        old = db_nodes.get(ref_id)
+        if old is None:
+            delta.added_nodes.append(row)
+            continue
+        if old[3] != row[3]:
+            delta.conflict = f"source of '{ref_id}' changed"
+            return delta
+        old_extra: dict[str, Any] = json.loads(old[4] or "{}")
+        extra: dict[str, Any] = json.loads(row[4])
+        for extra_key in _DERIVED_EXTRA_KEYS:
+            if extra_key in old_extra:
+                extra[extra_key] = old_extra[extra_key]
+        if (old[1], old[2], old[5]) != (row[1], row[2], row[5]) or old_extra != extra:
+            delta.updated_nodes.append(
+                (row[0], row[1], row[2], row[3], json.dumps(extra, ensure_ascii=False), row[5])
+            )
+    delta.removed_nodes = [ref_id for ref_id in db_nodes if ref_id not in declared.nodes]
+
+    sourced = {ref_id for ref_id, row in declared.nodes.items() if row[3]}
+    for ref_id in [r[0] for r in delta.added_nodes] + delta.removed_nodes:
+        row = declared.nodes.get(ref_id) or db_nodes[ref_id]
+        if row[3]:
+            delta.conflict = f"node '{ref_id}' with a source added or removed"
+            return delta
+        if ref_id.startswith(_ANNOTATION_REF_PREFIXES):
+            delta.conflict = f"import-resolution target '{ref_id}' added or removed"
+            return delta
+
+    # --- Edges ---
+    desired: dict[_EdgeKey, EdgeRow] = {}
+    for row in declared.edges:
+        key = _edge_key(row)
+        if key in desired:
+            delta.warnings.append(f"Failed to insert edge '{row[0]}→{row[1]}': duplicate edge")
+            continue
+        desired[key] = row
+    db_edges: dict[_EdgeKey, tuple[str, str]] = {
+        (r[0], r[1], r[2], r[3]): (r[4] or "{}", r[5])
+        for r in conn.execute(
+            "SELECT src_ref_id, dst_ref_id, kind, contract_key, extra, lifecycle FROM edges"
+        ).fetchall()
+    }
+
+    # ``part_of`` edges drive test-count aggregation onto the parent node.
+    for src, _dst, kind, _ck in old_declared ^ desired.keys():
+        if kind == "part_of" and src in sourced:
+            delta.conflict = f"part_of hierarchy of '{src}' changed"
+            return delta
+
+    delta.upserted_edges = [
+        row for key, row in desired.items() if db_edges.get(key) != (row[3], row[4])
+    ]
+
+    annotated: set[str] | None = None
+    for key in sorted(old_declared - desired.keys()):
+        src, dst, kind, contract = key
+        if key not in db_edges or src not in declared.nodes or dst not in declared.nodes:
+            continue  # never stored, or removed with its node
+        if kind == "touches_code" and src == dst and not contract:
+            if annotated is None:
+                annotated = _annotated_ref_ids(conn)
+            if src in annotated:
+                # Still derived from a code annotation: keep it, minus YAML attrs.
+                if db_edges[key] != _DEFAULT_EDGE_ATTRS:
+                    delta.reset_edges.append(key)
+                continue
+        elif kind == "depends_on" and not contract:
+            hit = conn.execute(
+                "SELECT 1 FROM code_imports WHERE resolved_ref_id = ? LIMIT 1", (dst,)
+            ).fetchone()
+            if hit is not None:
+                delta.conflict = f"declared depends_on '{src}→{dst}' may be import-derived"
+                return delta
+        delta.deleted_edges.append(key)
+
+    if delta.added_nodes:
+        if annotated is None:
+            annotated = _annotated_ref_ids(conn)
+        delta.touches_code = [row[0] for row in delta.added_nodes if row[0] in annotated]
+    return delta
+
+
+def _apply_graph_delta(conn: sqlite3.Connection, delta: _GraphDelta) -> None:
+    """Write a conflict-free :class:`_GraphDelta` to the graph tables."""
+    for ref_id in delta.removed_nodes:
+        # ``sync_state`` has no ON DELETE action; it is rebuilt afterwards.
+        conn.execute("DELETE FROM sync_state WHERE ref_id = ?", (ref_id,))
+        conn.execute("DELETE FROM nodes WHERE ref_id = ?", (ref_id,))
+    conn.executemany(
+        "INSERT INTO nodes (ref_id, kind, summary, source, extra, lifecycle) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        delta.added_nodes,
+    )
+    conn.executemany(
+        "UPDATE nodes SET kind = ?, summary = ?, extra = ?, lifecycle = ? WHERE ref_id = ?",
+        [(row[1], row[2], row[4], row[5], row[0]) for row in delta.updated_nodes],
+    )
+
+    conn.executemany(
+        "DELETE FROM edges WHERE src_ref_id = ? AND dst_ref_id = ? AND kind = ? "
+        "AND contract_key = ?",
+        delta.deleted_edges,
+    )
+    conn.executemany(
+        "UPDATE edges SET extra = '{}', lifecycle = 'active' WHERE src_ref_id = ? "
+        "AND dst_ref_id = ? AND kind = ? AND contract_key = ?",
+        delta.reset_edges,
+    )
+    conn.executemany(
+        "INSERT INTO edges (src_ref_id, dst_ref_id, kind, extra, lifecycle, contract_key) "
+        "VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(src_ref_id, dst_ref_id, kind, contract_key) "
+        "DO UPDATE SET extra = excluded.extra, lifecycle = excluded.lifecycle",
+        delta.upserted_edges,
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO edges (src_ref_id, dst_ref_id, kind) "
+        "VALUES (?, ?, 'touches_code')",
+        [(ref_id, ref_id) for ref_id in delta.touches_code],
+    )
+    conn.executemany(
+        "INSERT OR REPLACE INTO foreign_edges "
+        "(src_ref_id, dst_ref_id, kind, extra, lifecycle, contract_key) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        delta.declared.foreign_edges,
+    )
+    _record_declared_edges(conn, {_edge_key(row) for row in delta.declared.edges})
+    conn.commit()
+
+
+def _repoint_docs(conn: sqlite3.Connection, ref_map: dict[str, str]) -> None:
+    """Update ``docs.ref_id`` (and their chunks) whose owning node changed."""
+    for row in conn.execute("SELECT id, path, ref_id FROM docs").fetchall():
+        ref_id = ref_map.get(row["path"])
+        if ref_id != row["ref_id"]:
+            conn.execute("UPDATE docs SET ref_id = ? WHERE id = ?", (ref_id, row["id"]))
+            conn.execute(
+                "UPDATE chunks SET node_ref_id = ? WHERE doc_id = ?", (ref_id, row["id"])
+            )
+    conn.commit()
+
+
+def _reload_graph_delta(
+    conn: sqlite3.Connection,
+    project_root: Path,
+    ref_map: dict[str, str],
+    changed_graph_files: set[str],
+    result: ReindexResult,
+) -> bool:
+    """Apply changed graph YAML in place; ``False`` when a full reindex is needed.
+
+    *ref_map* is the doc-path -> ref_id map built from the current YAML and
+    *changed_graph_files* the project-relative graph paths that changed.
+    Nothing is written when the plan reports a structural conflict.
+    """
+    graph_dir = project_root / ".beadloom" / "_graph"
+    delta = _plan_graph_delta(conn, graph_dir, project_root)
+    if delta.conflict is not None:
+        return False
+
+    _apply_graph_delta(conn, delta)
+    _repoint_docs(conn, ref_map)
+    result.warnings.extend(delta.declared.result.warnings)
+    result.warnings.extend(delta.warnings)
+
+    if any(path.endswith("/rules.yml") for path in changed_graph_files):
+        conn.execute("DELETE FROM rules")
+        conn.commit()
+        rules_path = graph_dir / "rules.yml"
+        if rules_path.is_file():
+            _load_rules_into_db(rules_path, conn, result)
+    return True
@@ -4,53 +4,81 @@
 
 This module owns the :func:`incremental_reindex` use case — the fast path that
 diffs the file index, falls back to a full reindex on first run / parser-change
-/ graph-YAML change, and otherwise re-indexes only the changed/added/deleted
-docs and code files, rebuilds sync state from preserved baselines, and
-backfills live-DB totals. It composes the cohesive helpers in this package; it
-holds the change-driven sequence, not the mechanics.
+/ structural graph-YAML change, applies other graph-YAML edits as an in-place
+node/edge delta, re-indexes only the changed/added/deleted docs and code
+files, rebuilds sync state from preserved baselines, and backfills live-DB
+totals. It composes the cohesive helpers in this package; it
+holds the change-driven sequence, not the mechanics. Stages are timed as in
+the full reindex; the per-file doc and code stages add up across files.
 """
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from beadloom.application.reindex.change_detection import (
     _compute_parser_fingerprint,
     _diff_files,
+    _full_sweep_due,
     _get_stored_file_index,
     _get_stored_parser_fingerprint,
     _graph_yaml_changed,
+    _mark_full_scan,
+    _normalize_changed_path,
+    _scan_changed_files,
     _scan_project_files,
     _update_file_index,
 )
-from beadloom.application.reindex.enrichment import _extract_and_store_routes
+from beadloom.application.reindex.enrichment import (
+    _extract_and_store_routes,
+    _store_test_mappings,
+)
 from beadloom.application.reindex.full import _beadloom_version, reindex
+from beadloom.application.reindex.graph_delta import _reload_graph_delta
 from beadloom.application.reindex.indexing import (
     _build_doc_ref_map,
+    _configure_source_limits,
+    _configure_yaml_cache,
     _index_single_code_file,
     _index_single_doc,
     _resolve_docs_dir,
 )
 from beadloom.application.reindex.models import ReindexResult, _SyncPairSnapshot
 from beadloom.application.reindex.sync_state import _build_initial_sync_state
+from beadloom.context_oracle.test_mapper import is_test_file
+from beadloom.doc_sync.doc_indexer import remove_doc
 from beadloom.infrastructure.db import create_schema, open_db, set_meta
 from beadloom.infrastructure.health import take_snapshot
+from beadloom.infrastructure.path_stats import refresh_path_stats
+from beadloom.infrastructure.project_tree import shares_project_tree
+from beadloom.infrastructure.reindex_timings import StageClock, record_timings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
+# Longest time (seconds) path-targeted runs may trust a watcher's path set
+# before the next run re-hashes the whole project as a safety net.
+FULL_SWEEP_INTERVAL_S = 300.0
+
 
+@shares_project_tree
 def incremental_reindex(
     project_root: Path,
     *,
     docs_dir: Path | None = None,
+    changed_paths: Iterable[str | Path] | None = None,
+    full_sweep_interval_s: float = FULL_SWEEP_INTERVAL_S,
 ) -> ReindexResult:
     """Incremental reindex: only process changed files.
 
     Falls back to full reindex when:
     - ``file_index`` is empty (first run after upgrade)
-    - Any graph YAML file changed (safest: full reload)
+    - A graph YAML edit is a structural conflict for the in-place graph
+      delta reload (see :mod:`.graph_delta`); other graph edits only upsert
+      or delete the affected nodes and edges.
 
     Parameters
     ----------
@@ -58,6 +86,16 @@ def incremental_reindex(
         Root of the project.
     docs_dir:
         Optional explicit docs directory.
+    changed_paths:
+        Paths a file watcher reported as changed (absolute or relative to
+        *project_root*). When given, only these are re-hashed and every other
+        file keeps its stored hash, so the cost follows the size of the edit.
+        The whole project is still re-hashed when the last full scan is older
+        than *full_sweep_interval_s* seconds — a verification sweep that
+        catches anything the watcher missed. ``None`` (the default) always
+        scans the whole project.
+    full_sweep_interval_s:
+        Maximum age of the last full scan before a path-targeted run does one.
 
     Returns
     -------
@@ -70,163 +108,253 @@ def incremental_reindex(
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = open_db(db_path)
+    clock = StageClock(conn)
     create_schema(conn)
+    _configure_yaml_cache(project_root)
+    _configure_source_limits(project_root)
 
     if docs_dir is None:
         docs_dir = _resolve_docs_dir(project_root)
 
-    # Scan current files on disk.
-    current_files = _scan_project_files(project_root, docs_dir)
-
-    # Read stored hashes from previous run.
-    stored_files = _get_stored_file_index(conn)
+    with clock.stage("scan") as stage:
+        # Read stored hashes from previous run.
+        stored_files = _get_stored_file_index(conn)
+
+        # Current files on disk: trust the watcher's path set unless a full
+        # verification sweep is due.
+        full_scan = changed_paths is None or _full_sweep_due(conn, full_sweep_interval_s)
+        if full_scan:
+            current_files = _scan_project_files(project_root, docs_dir)
+            stage.files = len(current_files)
+        else:
+            current_files = dict(stored_files)
+            rehashed = _scan_changed_files(
+                project_root, docs_dir, changed_paths or (), stored_files
+            )
+            stage.files = len(rehashed)
+            for rel, entry in rehashed.items():
+                if entry is None:
+                    current_files.pop(rel, None)
+                else:
+                    current_files[rel] = entry
 
     if not stored_files:
         # First run — fall back to full reindex.
         conn.close()
-        return reindex(project_root, docs_dir=docs_dir)
+        return replace(reindex(project_root, docs_dir=docs_dir), full_fallback=True)
 
     # Check if parser availability changed (e.g. new tree-sitter grammar installed).
     current_fingerprint = _compute_parser_fingerprint()
     stored_fingerprint = _get_stored_parser_fingerprint(conn)
     if stored_fingerprint is not None and current_fingerprint != stored_fingerprint:
         conn.close()
-        return reindex(project_root, docs_dir=docs_dir)
+        return replace(reindex(project_root, docs_dir=docs_dir), full_fallback=True)
 
     # Belt-and-suspenders: always check graph YAML files directly.
     # This catches changes even if file_index got out of sync with the DB
     # (e.g. interrupted reindex, partial writes, or upgrade edge cases).
     graph_affected = _graph_yaml_changed(current_files, stored_files)
-    if graph_affected:
-        conn.close()
-        return reindex(project_root, docs_dir=docs_dir)
 
     changed, added, deleted = _diff_files(current_files, stored_files)
 
-    if not changed and not added and not deleted:
-        # Nothing changed — just update timestamp.
+    # Test files usually live outside the scanned source dirs, so a test-only
+    # edit never shows up in the file diff. Re-check the mapping inputs when a
+    # full scan ran or the watcher reported a test file; a graph change is
+    # handled after its delta is applied.
+    with clock.stage("tests"):
+        tests_remapped = (
+            not graph_affected
+            and (
+                full_scan
+                or any(
+                    is_test_file(rel)
+                    for rel in (
+                        _normalize_changed_path(project_root, p) for p in changed_paths or ()
+                    )
+                    if rel is not None
+                )
+            )
+            and _store_test_mappings(project_root, conn, reuse_unchanged=True)
+        )
+
+    if not changed and not added and not deleted and not graph_affected and not tests_remapped:
+        # Nothing changed — just update timestamp. The timings are reported
+        # but not recorded: a no-op run says nothing about stage costs.
         now = datetime.now(tz=timezone.utc).isoformat()
         set_meta(conn, "last_reindex_at", now)
-        take_snapshot(conn)
+        if full_scan:
+            _mark_full_scan(conn)
+        with clock.stage("health"):
+            take_snapshot(conn)
         conn.close()
         result.nothing_changed = True
+        result.timings = clock.timings
+        result.wall_s = clock.elapsed_s
         return result
 
-    # --- Only docs / code changed — true incremental path ---
-
     docs_dir_rel = docs_dir.relative_to(project_root)
 
+    with clock.stage("graph") as stage:
+        # Doc → ref_id mapping (from graph YAML).
+        graph_dir = project_root / ".beadloom" / "_graph"
+        if graph_dir.is_dir():
+            ref_map, doc_ref_warns = _build_doc_ref_map(
+                graph_dir,
+                project_root,
+                docs_dir,
+            )
+        else:
+            ref_map, doc_ref_warns = {}, []
+
+        # Graph YAML changed: apply the node/edge delta in place. Structural
+        # conflicts (source changes, YAML errors, ...) need the full pipeline.
+        if graph_affected:
+            graph_files = {
+                p
+                for p in changed | added | deleted
+                if (current_files.get(p) or stored_files[p])[1] == "graph"
+            }
+            stage.files = len(graph_files)
+            if not _reload_graph_delta(conn, project_root, ref_map, graph_files, result):
+                conn.close()
+                return replace(reindex(project_root, docs_dir=docs_dir), full_fallback=True)
+    result.warnings.extend(doc_ref_warns)
+
+    # --- Docs / code changes — true incremental path ---
+
     # Known ref_ids for edge creation.
     seen_ref_ids: set[str] = {
         row[0] for row in conn.execute("SELECT ref_id FROM nodes").fetchall()
     }
 
-    # Doc → ref_id mapping (from graph YAML).
-    graph_dir = project_root / ".beadloom" / "_graph"
-    if graph_dir.is_dir():
-        ref_map, doc_ref_warns = _build_doc_ref_map(
-            graph_dir,
-            project_root,
-            docs_dir,
-        )
-        result.warnings.extend(doc_ref_warns)
-    else:
-        ref_map = {}
-
     # Snapshot symbols_hash and two-phase data BEFORE deleting/re-indexing
     # files so we can preserve baselines for drift detection.
     old_symbols: dict[str, str] = {}
     old_pairs: dict[tuple[str, str], _SyncPairSnapshot] = {}
-    for row in conn.execute("SELECT * FROM sync_state").fetchall():
-        if row["symbols_hash"]:
-            old_symbols[row["ref_id"]] = row["symbols_hash"]
-        # sqlite3.Row `in` checks values not keys; use .keys()
-        has_edit_col = "doc_hash_at_last_edit" in row.keys()  # noqa: SIM118
-        edit_hash: str = row["doc_hash_at_last_edit"] if has_edit_col else ""
-        if edit_hash:
-            old_pairs[(row["doc_path"], row["code_path"])] = _SyncPairSnapshot(
-                doc_hash_at_last_edit=edit_hash,
-                code_hash_at_sync=row["code_hash_at_sync"],
-            )
+    with clock.stage("sync_state"):
+        for row in conn.execute("SELECT * FROM sync_state").fetchall():
+            if row["symbols_hash"]:
+                old_symbols[row["ref_id"]] = row["symbols_hash"]
+            # sqlite3.Row `in` checks values not keys; use .keys()
+            has_edit_col = "doc_hash_at_last_edit" in row.keys()  # noqa: SIM118
+            edit_hash: str = row["doc_hash_at_last_edit"] if has_edit_col else ""
+            if edit_hash:
+                old_pairs[(row["doc_path"], row["code_path"])] = _SyncPairSnapshot(
+                    doc_hash_at_last_edit=edit_hash,
+                    code_hash_at_sync=row["code_hash_at_sync"],
+                )
+
+    # Nodes whose doc text changed, from the per-doc chunk deltas.
+    search_refs: set[str] = set()
 
     # Process deleted files.
     for path in deleted:
         kind = stored_files[path][1]
         if kind == "doc":
-            doc_rel = str(type(docs_dir_rel)(path).relative_to(docs_dir_rel))
-            conn.execute(
-                "DELETE FROM sync_state WHERE doc_path = ?",
-                (doc_rel,),
-            )
-            conn.execute("DELETE FROM docs WHERE path = ?", (doc_rel,))
+            with clock.stage("docs") as stage:
+                stage.files = 1
+                doc_rel = str(type(docs_dir_rel)(path).relative_to(docs_dir_rel))
+                conn.execute(
+                    "DELETE FROM sync_state WHERE doc_path = ?",
+                    (doc_rel,),
+                )
+                search_refs |= remove_doc(conn, doc_rel).ref_ids
         elif kind == "code":
-            conn.execute(
-                "DELETE FROM code_symbols WHERE file_path = ?",
-                (path,),
-            )
-            conn.execute(
-                "DELETE FROM sync_state WHERE code_path = ?",
-                (path,),
-            )
-
-    # Process changed files (delete old data, re-index).
+            with clock.stage("symbols") as stage:
+                stage.files = 1
+                conn.execute(
+                    "DELETE FROM code_symbols WHERE file_path = ?",
+                    (path,),
+                )
+                conn.execute(
+                    "DELETE FROM sync_state WHERE code_path = ?",
+                    (path,),
+                )
+
+    # Process changed files. Code is deleted and re-indexed; a doc keeps its
+    # row and only the chunks that actually changed are replaced.
     for path in changed:
         kind = current_files[path][1]
         if kind == "doc":
-            doc_rel = str(type(docs_dir_rel)(path).relative_to(docs_dir_rel))
-            conn.execute("DELETE FROM docs WHERE path = ?", (doc_rel,))
-            conn.execute(
-                "DELETE FROM sync_state WHERE doc_path = ?",
-                (doc_rel,),
-            )
-            abs_path = project_root / path
-            d, c = _index_single_doc(conn, abs_path, docs_dir, ref_map)
-            result.docs_indexed += d
-            result.chunks_indexed += c
+            with clock.stage("docs") as stage:
+                stage.files = 1
+                doc_rel = str(type(docs_dir_rel)(path).relative_to(docs_dir_rel))
+                conn.execute(
+                    "DELETE FROM sync_state WHERE doc_path = ?",
+                    (doc_rel,),
+                )
+                abs_path = project_root / path
+                delta = _index_single_doc(conn, abs_path, docs_dir, ref_map)
+                search_refs |= delta.ref_ids
+                result.docs_indexed += 1
+                result.chunks_indexed += delta.chunk_count
         elif kind == "code":
-            conn.execute(
-                "DELETE FROM code_symbols WHERE file_path = ?",
-                (path,),
-            )
-            conn.execute(
-                "DELETE FROM sync_state WHERE code_path = ?",
-                (path,),
-            )
-            abs_path = project_root / path
-            result.symbols_indexed += _index_single_code_file(
-                conn,
-                abs_path,
-                project_root,
-                seen_ref_ids,
-            )
+            with clock.stage("symbols") as stage:
+                stage.files = 1
+                conn.execute(
+                    "DELETE FROM code_symbols WHERE file_path = ?",
+                    (path,),
+                )
+                conn.execute(
+                    "DELETE FROM sync_state WHERE code_path = ?",
+                    (path,),
+                )
+                abs_path = project_root / path
+                symbols_count, sym_warnings = _index_single_code_file(
+                    conn,
+                    abs_path,
+                    project_root,
+                    seen_ref_ids,
+                )
+                result.symbols_indexed += symbols_count
+                result.warnings.extend(sym_warnings)
 
     # Process added files.
     for path in added:
         kind = current_files[path][1]
         if kind == "doc":
-            abs_path = project_root / path
-            d, c = _index_single_doc(conn, abs_path, docs_dir, ref_map)
-            result.docs_indexed += d
-            result.chunks_indexed += c
+            with clock.stage("docs") as stage:
+                stage.files = 1
+                abs_path = project_root / path
+                delta = _index_single_doc(conn, abs_path, docs_dir, ref_map)
+                search_refs |= delta.ref_ids
+                result.docs_indexed += 1
+                result.chunks_indexed += delta.chunk_count
         elif kind == "code":
-            abs_path = project_root / path
-            result.symbols_indexed += _index_single_code_file(
-                conn,
-                abs_path,
-                project_root,
-                seen_ref_ids,
-            )
-
-    # Re-extract routes after code changes and update nodes.extra.
-    _extract_and_store_routes(project_root, conn)
+            with clock.stage("symbols") as stage:
+                stage.files = 1
+                abs_path = project_root / path
+                symbols_count, sym_warnings = _index_single_code_file(
+                    conn,
+                    abs_path,
+                    project_root,
+                    seen_ref_ids,
+                )
+                result.symbols_indexed += symbols_count
+                result.warnings.extend(sym_warnings)
+
+    # Re-extract routes after code changes and update nodes.extra. Routes come
+    # only from code files (and the unchanged graph), so a docs-only run keeps
+    # the stored ones instead of re-parsing every source file.
+    code_touched = any(stored_files[p][1] == "code" for p in deleted) or any(
+        current_files[p][1] == "code" for p in changed | added
+    )
+    if code_touched:
+        with clock.stage("routes"):
+            _extract_and_store_routes(project_root, conn)
+            refresh_path_stats(conn)
+    if graph_affected:
+        with clock.stage("tests"):
+            _store_test_mappings(project_root, conn, reuse_unchanged=True)
 
     # Rebuild sync_state (cheap full rebuild) using preserved baselines.
-    conn.execute("DELETE FROM sync_state")
-    _build_initial_sync_state(
-        conn,
-        preserved_symbols=old_symbols or None,
-        preserved_pairs=old_pairs or None,
-    )
+    with clock.stage("sync_state"):
+        conn.execute("DELETE FROM sync_state")
+        _build_initial_sync_state(
+            conn,
+            preserved_symbols=old_symbols or None,
+            preserved_pairs=old_pairs or None,
+        )
 
     # Re-baseline reference-doc surface hashes, preserving existing baselines
     # (BDL-057 Layer 2; advisory). Unlike sync_state this is NOT deleted first —
@@ -234,40 +362,55 @@ def incremental_reindex(
     # drift survives a routine incremental reindex.
     from beadloom.doc_sync.engine import build_reference_state
 
-    build_reference_state(conn, project_root)
+    with clock.stage("reference_state"):
+        build_reference_state(conn, project_root)
 
-    # Rebuild FTS5 search index.
-    from beadloom.context_oracle.search import populate_search_index
+    # FTS5 rows are per node: rebuild them all after a graph change (summaries,
+    # new or removed nodes), otherwise only those the chunk deltas touched.
+    from beadloom.context_oracle.search import populate_search_index, update_search_index
 
-    populate_search_index(conn)
+    with clock.stage("search"):
+        if graph_affected:
+            populate_search_index(conn)
+        elif search_refs:
+            update_search_index(conn, search_refs)
 
-    # Clear persistent bundle cache (conservative invalidation).
-    conn.execute("DELETE FROM bundle_cache")
-    conn.commit()
+        # Clear persistent bundle cache (conservative invalidation).
+        conn.execute("DELETE FROM bundle_cache")
+        conn.commit()
 
     # Update file_index.
-    _update_file_index(conn, current_files, changed, added, deleted)
+    with clock.stage("file_index") as stage:
+        stage.files = len(changed) + len(added) + len(deleted)
+        _update_file_index(conn, current_files, changed, added, deleted)
 
     # Update meta.
     now = datetime.now(tz=timezone.utc).isoformat()
     set_meta(conn, "last_reindex_at", now)
     set_meta(conn, "beadloom_version", _beadloom_version())
+    if full_scan:
+        _mark_full_scan(conn)
 
     # Health snapshot.
-    take_snapshot(conn)
+    with clock.stage("health"):
+        take_snapshot(conn)
 
-    # #88: the incremental path never touches the graph (nodes/edges), so the
-    # ReindexResult defaults of 0 would make the CLI print "Nodes: 0" on an
-    # intact index. Populate the true live-DB totals (mirroring the
-    # nothing_changed branch handled in services/cli.py).
+    # #88: the incremental path only re-applies the graph when its YAML
+    # changed, so the ReindexResult defaults of 0 would make the CLI print
+    # "Nodes: 0" on an intact index. Report the true live-DB totals either
+    # way (mirroring the nothing_changed branch handled in services/cli.py).
     result.nodes_loaded = conn.execute("SELECT count(*) FROM nodes").fetchone()[0]
     result.edges_loaded = conn.execute("SELECT count(*) FROM edges").fetchone()[0]
 
     # #112: symbols_indexed accumulated only the per-run delta (re-indexed
     # changed/added code files), so a docs-only incremental run reported
-    # "Symbols: 0" even on an intact index. Mirror the #88 nodes/edges
-    # backfill: report the true live-DB symbol total.
+    # "Symbols: 0" even on an intact index. Like the nodes/edges totals
+    # above, report the true live-DB symbol total.
     result.symbols_indexed = conn.execute("SELECT count(*) FROM code_symbols").fetchone()[0]
 
+    result.timings = clock.timings
+    result.wall_s = clock.elapsed_s
+    record_timings(conn, "incremental", clock)
+
     conn.close()
     return result
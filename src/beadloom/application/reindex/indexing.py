@@ -11,19 +11,24 @@ self-edges for annotated symbols.
 
 from __future__ import annotations
 
-import hashlib
 import json
 from typing import TYPE_CHECKING, Any
 
 from beadloom.application.reindex.models import _CODE_EXTENSIONS
 from beadloom.context_oracle.code_indexer import extract_symbols
-from beadloom.doc_sync.doc_indexer import chunk_markdown
+from beadloom.doc_sync.doc_indexer import index_doc
+from beadloom.infrastructure.project_config import load_project_config
+from beadloom.infrastructure.project_tree import project_tree
 from beadloom.infrastructure.scan_paths import resolve_scan_paths
+from beadloom.infrastructure.source_files import configure_max_file_size, skip_reason
+from beadloom.infrastructure.yaml_cache import configure_disk_cache, load_yaml_file
 
 if TYPE_CHECKING:
     import sqlite3
     from pathlib import Path
 
+    from beadloom.doc_sync.doc_indexer import ChunkDelta
+
 
 def _resolve_docs_dir(project_root: Path) -> Path:
     """Resolve docs directory from config.yml or use default ``docs``.
@@ -32,15 +37,31 @@ def _resolve_docs_dir(project_root: Path) -> Path:
     returns ``project_root / <value>``.  Otherwise falls back to
     ``project_root / "docs"``.
     """
-    config_path = project_root / ".beadloom" / "config.yml"
-    if config_path.exists():
-        import yaml
+    docs_path = load_project_config(project_root).docs_dir
+    return project_root / docs_path if docs_path else project_root / "docs"
+
+
+def _configure_yaml_cache(project_root: Path) -> None:
+    """Enable the on-disk parsed-YAML cache when ``config.yml`` opts in.
+
+    ``yaml_cache: disk`` persists parsed graph YAML documents under
+    ``.beadloom/cache/yaml/`` (keyed by content hash) so separate processes —
+    CI steps, hooks, the MCP server — skip re-parsing unchanged files. Any
+    other value (or no key) keeps the in-memory cache only.
+    """
+    enabled = load_project_config(project_root).yaml_cache == "disk"
+    configure_disk_cache(
+        project_root / ".beadloom" / "cache" / "yaml" if enabled else None
+    )
+
 
-        config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-        docs_path = config.get("docs_dir")
-        if isinstance(docs_path, str) and docs_path:
-            return project_root / docs_path
-    return project_root / "docs"
+def _configure_source_limits(project_root: Path) -> None:
+    """Apply ``max_file_size`` from ``config.yml`` to source parsing.
+
+    Source files above the ceiling (1 MiB when unset) are still hashed for
+    change detection, but no symbols, imports or routes are extracted.
+    """
+    configure_max_file_size(load_project_config(project_root).max_file_size)
 
 
 def _build_doc_ref_map(
@@ -68,13 +89,11 @@ def _build_doc_ref_map(
         ``(ref_map, warnings)`` where *warnings* lists any doc path conflicts
         (i.e. a doc referenced by more than one node).
     """
-    import yaml
-
     ref_map: dict[str, str] = {}
     warnings: list[str] = []
     for yml_path in sorted(graph_dir.glob("*.yml")):
-        text = yml_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(text)
+        # Served from the content-hash cache: load_graph parsed these already.
+        data = load_yaml_file(yml_path)
         if data is None:
             continue
         for node in data.get("nodes") or []:
@@ -100,27 +119,29 @@ def _index_code_files(
     project_root: Path,
     conn: sqlite3.Connection,
     seen_ref_ids: set[str],
-) -> tuple[int, list[str]]:
+) -> tuple[int, int, list[str]]:
     """Scan source files, extract symbols, and insert into SQLite.
 
-    Returns (symbols_indexed, warnings).
+    Returns (symbols_indexed, files_scanned, warnings).
     """
     count = 0
+    files = 0
     warnings: list[str] = []
 
     # Scan directories from config.yml (or defaults).
     scan_dirs = [project_root / d for d in resolve_scan_paths(project_root)]
+    tree = project_tree(project_root)
     for scan_dir in scan_dirs:
         if not scan_dir.is_dir():
             continue
-        for file_path in sorted(scan_dir.rglob("*")):
-            if file_path.suffix not in _CODE_EXTENSIONS:
-                continue
-            if not file_path.is_file():
+        for file_path in tree.files(scan_dir, suffixes=_CODE_EXTENSIONS):
+            files += 1
+            rel_path = str(file_path.relative_to(project_root))
+            reason = skip_reason(file_path)
+            if reason is not None:
+                warnings.append(f"Source '{rel_path}' not parsed: {reason}")
                 continue
-
             symbols = extract_symbols(file_path)
-            rel_path = str(file_path.relative_to(project_root))
 
             for sym in symbols:
                 conn.execute(
@@ -150,7 +171,7 @@ def _index_code_files(
                         )
 
     conn.commit()
-    return count, warnings
+    return count, files, warnings
 
 
 def _index_single_doc(
@@ -158,35 +179,16 @@ def _index_single_doc(
     md_path: Path,
     docs_dir: Path,
     ref_map: dict[str, str],
-) -> tuple[int, int]:
-    """Index one doc file. Returns ``(docs_count, chunks_count)``."""
+) -> ChunkDelta:
+    """Index one doc file, keeping the ids of its unchanged chunks.
+
+    Returns the chunk delta; the doc's existing row is updated in place.
+    """
     content = md_path.read_text(encoding="utf-8")
     rel_path = str(md_path.relative_to(docs_dir))
-    file_hash = hashlib.sha256(content.encode()).hexdigest()
-    ref_id = ref_map.get(rel_path)
-
-    conn.execute(
-        "INSERT INTO docs (path, kind, ref_id, hash) VALUES (?, ?, ?, ?)",
-        (rel_path, "other", ref_id, file_hash),
-    )
-    doc_id = conn.execute("SELECT id FROM docs WHERE path = ?", (rel_path,)).fetchone()[0]
-
-    chunks = chunk_markdown(content)
-    for chunk in chunks:
-        conn.execute(
-            "INSERT INTO chunks (doc_id, chunk_index, heading, section, "
-            "content, node_ref_id) VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                doc_id,
-                chunk["chunk_index"],
-                chunk["heading"],
-                chunk["section"],
-                chunk["content"],
-                ref_id,
-            ),
-        )
+    delta = index_doc(conn, rel_path, content, ref_map.get(rel_path))
     conn.commit()
-    return 1, len(chunks)
+    return delta
 
 
 def _index_single_code_file(
@@ -194,10 +196,13 @@ def _index_single_code_file(
     file_path: Path,
     project_root: Path,
     seen_ref_ids: set[str],
-) -> int:
-    """Index one code file. Returns symbol count."""
-    symbols = extract_symbols(file_path)
+) -> tuple[int, list[str]]:
+    """Index one code file. Returns (symbols_indexed, warnings)."""
     rel_path = str(file_path.relative_to(project_root))
+    reason = skip_reason(file_path)
+    if reason is not None:
+        return 0, [f"Source '{rel_path}' not parsed: {reason}"]
+    symbols = extract_symbols(file_path)
     count = 0
 
     for sym in symbols:
@@ -226,4 +231,4 @@ def _index_single_code_file(
                 )
 
     conn.commit()
-    return count
+    return count, []
@@ -17,12 +17,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import sqlite3
 
+    from beadloom.infrastructure.reindex_timings import StageTiming
+
 # Tables to drop on reindex (order matters for FK constraints).
 _TABLES_TO_DROP = [
     "search_index",
     "sync_state",
     "code_imports",
     "rules",
+    "path_stats_dirty",
+    "path_stats",
     "code_symbols",
     "chunks",
     "docs",
@@ -84,8 +88,13 @@ class ReindexResult:
     imports_indexed: int = 0
     rules_loaded: int = 0
     nothing_changed: bool = False
+    # An incremental reindex that had to run the full pipeline instead.
+    full_fallback: bool = False
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Per-stage cost of this run and its total wall time.
+    timings: list[StageTiming] = field(default_factory=list)
+    wall_s: float = 0.0
 
 
 @dataclass
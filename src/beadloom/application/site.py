@@ -32,6 +32,11 @@ Reads the indexed graph read-only and emits, under ``--out`` (default ``site/``)
 Beadloom produces, VitePress renders. Output is deterministic (sorted, stable
 frontmatter, NO wall-clock in the diffed output) and is NEVER written into the
 source ``docs/`` tree — only under ``--out``.
+
+Generation is incremental (see :mod:`beadloom.infrastructure.output_manifest`):
+node pages whose inputs are unchanged since the previous run are not
+re-rendered, files whose bytes are unchanged are not rewritten, and outputs the
+previous run produced but this one did not are pruned.
 """
 
 # beadloom:domain=application
@@ -61,9 +66,17 @@ from beadloom.application.site_metrics_history import (
     backfill_structural_history,
 )
 from beadloom.application.site_nav import human_label, render_nav_config
-from beadloom.application.site_pages import NodeRow, load_nodes, render_all_pages
+from beadloom.application.site_pages import (
+    NodeRow,
+    graph_fingerprint,
+    load_nodes,
+    page_fingerprint,
+    page_rel_path,
+    render_all_pages,
+)
 from beadloom.application.site_published import build_published_docs, publish_docs
-from beadloom.graph.c4 import filter_c4_nodes, map_to_c4, render_c4_mermaid
+from beadloom.graph.c4 import C4Model, build_c4_model, render_c4_mermaid
+from beadloom.infrastructure.output_manifest import StagedOutput
 
 if TYPE_CHECKING:
     import sqlite3
@@ -75,6 +88,10 @@ logger = logging.getLogger(__name__)
 #: GitHub URLs (so the About page never carries a broken site-relative link).
 _REPO_URL = "https://github.com/zoologov/beadloom"
 
+#: The site build manifest, relative to ``out_dir`` (content hash + render
+#: inputs per output file; drives incremental regeneration).
+_MANIFEST_REL = ".vitepress/beadloom-manifest.json"
+
 
 class MermaidValidationError(RuntimeError):
     """A generated diagram failed the structural Mermaid guard.
@@ -93,10 +110,17 @@ class MermaidValidationError(RuntimeError):
 
 @dataclass(frozen=True)
 class SiteResult:
-    """The outcome of a site generation: every file written, sorted."""
+    """The outcome of a site generation.
+
+    ``written`` is every file the site consists of (sorted), whether or not its
+    bytes changed; ``updated`` the subset actually rewritten this run and
+    ``removed`` the orphaned outputs of a previous run that were pruned.
+    """
 
     out_dir: Path
     written: tuple[Path, ...]
+    updated: tuple[Path, ...] = ()
+    removed: tuple[Path, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -143,18 +167,17 @@ def _plural(count: int, singular: str) -> str:
     return f"{count} {singular}" if count == 1 else f"{count} {singular}s"
 
 
-def _top_level_diagram(conn: sqlite3.Connection) -> str:
+def _top_level_diagram(model: C4Model) -> str:
     """The top-level (container) C4/Mermaid diagram for the overview page."""
-    nodes, rels = map_to_c4(conn)
-    nodes, rels = filter_c4_nodes(nodes, rels, level="container")
+    nodes, rels = model.filter(level="container")
     return render_c4_mermaid(nodes, rels)
 
 
-def _render_index(conn: sqlite3.Connection, nodes: list[NodeRow]) -> str:
+def _render_index(conn: sqlite3.Connection, nodes: list[NodeRow], model: C4Model) -> str:
     """The architecture overview page (counts + diagram + health line)."""
     counts = _count_kinds(nodes)
     health = _compute_health(conn)
-    diagram = _top_level_diagram(conn)
+    diagram = _top_level_diagram(model)
 
     summary_parts = [
         _plural(counts.get("domain", 0), "domain"),
@@ -329,16 +352,38 @@ def _guard_diagrams(path: Path, content: str) -> None:
         raise MermaidValidationError(path.name, issues)
 
 
-def _write(path: Path, content: str, written: list[Path]) -> None:
-    """Write *content* to *path* (creating parents) and record it.
+def _write(path: Path, content: str, output: StagedOutput, *, inputs: str = "") -> None:
+    """Stage *content* for *path* on *output* (written on commit if changed).
 
     Every Markdown page is run through the Mermaid structural guard first, so a
     diagram that would crash the VitePress render fails generation instead.
     """
     _guard_diagrams(path, content)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    written.append(path)
+    output.add_text(path, content, inputs=inputs)
+
+
+def _stage_node_pages(
+    conn: sqlite3.Connection,
+    nodes: list[NodeRow],
+    out_dir: Path,
+    output: StagedOutput,
+    model: C4Model,
+) -> None:
+    """Stage every node page, re-rendering only those whose inputs changed.
+
+    The stale pages are rendered in one batch against the build's shared C4
+    model (across a process pool for large builds, see ``render_all_pages``).
+    """
+    graph_fp = graph_fingerprint(conn)
+    stale: dict[str, str] = {}
+    to_render: list[NodeRow] = []
+    for node in nodes:
+        inputs = page_fingerprint(conn, node, graph_fp)
+        if not output.unchanged(out_dir / page_rel_path(node), inputs):
+            stale[page_rel_path(node)] = inputs
+            to_render.append(node)
+    for page in render_all_pages(conn, to_render, model=model):
+        _write(out_dir / page.rel_path, page.body, output, inputs=stale[page.rel_path])
 
 
 def _to_int(value: object) -> int:
@@ -419,26 +464,27 @@ def generate_site(
             append-only history store — never into the diffed dashboard fields).
 
     Returns:
-        A :class:`SiteResult` listing every written file (sorted).
+        A :class:`SiteResult` listing every output file (sorted), plus the ones
+        rewritten and pruned by this run.
     """
     nodes = load_nodes(conn)
-    written: list[Path] = []
+    model = build_c4_model(conn)  # shared by the overview and every node page
+    output = StagedOutput(out_dir, manifest_path=out_dir / _MANIFEST_REL)
 
     # About home (EN) from README.md, with the architecture overview moved to
     # its own /architecture page. Falls back to the overview when no README.
     slugs = _published_doc_slugs(conn, project_root)
-    overview = _render_index(conn, nodes)
+    overview = _render_index(conn, nodes, model)
     about_en = _render_about_page(project_root / "README.md", slugs)
-    _write(out_dir / "index.md", about_en if about_en is not None else overview, written)
-    _write(out_dir / "architecture.md", overview, written)
+    _write(out_dir / "index.md", about_en if about_en is not None else overview, output)
+    _write(out_dir / "architecture.md", overview, output)
 
     # RU About (locale root) from README.ru.md — skipped if absent (no failure).
     about_ru = _render_about_page(project_root / "README.ru.md", slugs)
     if about_ru is not None:
-        _write(out_dir / "ru" / "index.md", about_ru, written)
+        _write(out_dir / "ru" / "index.md", about_ru, output)
 
-    for page in render_all_pages(conn):
-        _write(out_dir / page.rel_path, page.body, written)
+    _stage_node_pages(conn, nodes, out_dir, output, model)
 
     # Showcase A — the metrics dashboard (machine data + human page). Numbers
     # come from the same code paths as the gates (honest by construction).
@@ -456,9 +502,9 @@ def generate_site(
     _write(
         out_dir / "public" / "dashboard.data.json",
         serialize_dashboard_data(dashboard_data),
-        written,
+        output,
     )
-    _write(out_dir / "dashboard.md", render_dashboard_md(dashboard_data), written)
+    _write(out_dir / "dashboard.md", render_dashboard_md(dashboard_data), output)
 
     # Showcase B — the 🌟 cross-repo landscape map (Mermaid, generated from the
     # federate hub output when given, else a degenerate single-repo map).
@@ -467,28 +513,31 @@ def generate_site(
     _write(
         out_dir / "landscape.md",
         render_landscape_md(landscape_data, pages=landscape_pages),
-        written,
+        output,
     )
 
     # Showcase C — the published validated docs. Copy the REAL docs/ tree into
     # site/docs/ preserving structure (source never mutated) and inject a
     # per-doc validation badge from the doc_sync engine (same source as
     # sync-check). Badges land only in the copy under out_dir.
-    published = publish_docs(conn, out_dir, project_root=project_root)
-    written.extend(published)
+    published = publish_docs(conn, out_dir, project_root=project_root, output=output)
     # Replace the flat docs landing publish_docs emits with a grouped overview
-    # (Domains / Services / Guides …). The path is already recorded by
-    # publish_docs, so overwrite its body in place — exactly one docs/index.md.
+    # (Domains / Services / Guides …). Re-staging the same path replaces its
+    # body before anything is written — exactly one docs/index.md.
     docs_index = out_dir / "docs" / "index.md"
     if docs_index in published:
-        overview_md = _render_docs_overview(slugs)
-        _guard_diagrams(docs_index, overview_md)
-        docs_index.write_text(overview_md, encoding="utf-8")
+        _write(docs_index, _render_docs_overview(slugs), output)
 
     _write(
         out_dir / ".vitepress" / "config.generated.mjs",
         render_nav_config(conn, project_root),
-        written,
+        output,
     )
 
-    return SiteResult(out_dir=out_dir, written=tuple(sorted(written)))
+    committed = output.commit()
+    return SiteResult(
+        out_dir=out_dir,
+        written=committed.outputs,
+        updated=committed.updated,
+        removed=committed.removed,
+    )
@@ -2,28 +2,37 @@
 # beadloom:feature=site-generation
 """Metrics-history append-store for honest dashboard trends (BDL-041 F4.4).
 
-A tiny additive append-log of real metric points persisted to
-``.beadloom/metrics_history.json``. ``docs site`` records one point per run
+A small SQLite store of real metric points at
+``.beadloom/metrics_history.db``. ``docs site`` records one point per run
 (:func:`append_metrics_point`); :func:`read_history` returns the sorted series
 that :mod:`beadloom.application.site_dashboard` emits into
 ``dashboard.data.json.trends``.
 
 Design invariants (honest + deterministic):
 
-- **No fabrication.** The series is *exactly* the recorded points — no
-  interpolation, no synthesized in-between samples. Sparse at first is correct.
+- **No fabrication.** The series holds only recorded points — no
+  interpolation, no synthesized in-between samples, no averaged buckets.
+  Sparse at first is correct.
 - **Injected timestamp.** The point's ``ts`` is supplied by the caller (never
   ``now()`` inside this module), so tests are deterministic and the diffed
   ``dashboard.data.json`` is byte-stable for a fixed history.
 - **Idempotent per ts.** Appending the same ``ts`` overwrites that point (a
   re-run of one build does not double-count the series).
+- **Bounded.** Appends are single-row inserts. Old points are downsampled
+  relative to the newest recorded point, never to the wall clock:
+  points older than ``_RAW_DAYS`` keep only the latest point of each UTC day,
+  and points older than ``_DAILY_DAYS`` keep only the latest point of each ISO
+  week. The survivor of a bucket is a real recorded point. Reads return at
+  most ``_MAX_POINTS`` points from the ``ts`` index.
 - **Day-one backfill.** :func:`backfill_structural_history` seeds *structural*
   counts (nodes/edges/symbols) from the existing ``graph_snapshots`` history so
   the structural trend isn't empty before the first ``docs site`` run; it never
-  overwrites a richer recorded point.
+  overwrites a richer recorded point, and downsamples like an append.
 
-The store is additive append-state (a JSON file), NOT a versioned artifact — no
-schema bump.
+A legacy ``.beadloom/metrics_history.json`` log is imported once, when a write
+creates the store, and is not written afterwards. Reads never create or migrate
+anything: until then they serve the legacy log, downsampled in memory. The store is additive
+append-state, NOT a versioned artifact — no schema bump.
 """
 
 # beadloom:domain=application
@@ -32,16 +41,53 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, dataclass
+import sqlite3
+from contextlib import closing
+from dataclasses import astuple, dataclass
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.db import open_db
+
 if TYPE_CHECKING:
-    import sqlite3
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-_HISTORY_FILENAME = "metrics_history.json"
+_HISTORY_FILENAME = "metrics_history.db"
+_LEGACY_FILENAME = "metrics_history.json"
+
+#: Downsampling tiers, in days before the newest recorded point.
+_RAW_DAYS = 2
+_DAILY_DAYS = 90
+_DAY = 86_400
+
+#: Upper bound on the series :func:`read_history` returns (the newest points).
+_MAX_POINTS = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics_points (
+    ts              TEXT PRIMARY KEY,
+    epoch           INTEGER,
+    tier            INTEGER NOT NULL DEFAULT 0,
+    lint_violations INTEGER NOT NULL,
+    debt_score      REAL NOT NULL,
+    coverage_pct    REAL NOT NULL,
+    sync_pct        REAL NOT NULL,
+    nodes           INTEGER NOT NULL,
+    edges           INTEGER NOT NULL,
+    symbols         INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_points_tier ON metrics_points(tier, epoch);
+CREATE TABLE IF NOT EXISTS metrics_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "ts, lint_violations, debt_score, coverage_pct, sync_pct, nodes, edges, symbols"
+)
 
 
 @dataclass(frozen=True)
@@ -102,51 +148,189 @@ def _coerce_point(raw: dict[str, object]) -> MetricsPoint | None:
     )
 
 
+class _HistoryStore:
+    """One open metrics-history database (see the module docstring)."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self.conn.close()
+
+    @staticmethod
+    def read_legacy(path: Path) -> list[MetricsPoint]:
+        """The points of a legacy JSON log (malformed rows/files are skipped)."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Could not read metrics history %s", path)
+            return []
+        if not isinstance(payload, list):
+            return []
+        return [
+            pt
+            for raw in payload
+            if isinstance(raw, dict) and (pt := _coerce_point(raw)) is not None
+        ]
+
+    @staticmethod
+    def epoch(ts: str) -> int | None:
+        """Seconds since the epoch for an ISO-8601 *ts* (naive = UTC); None if unparsable."""
+        try:
+            parsed = datetime.fromisoformat(ts)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    @classmethod
+    def open(cls, project_root: Path) -> _HistoryStore:
+        """Open the store, creating it (and importing a legacy log) on first use."""
+        path = history_path(project_root)
+        created = not path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        store = cls(open_db(path))
+        store.conn.executescript(_SCHEMA)
+        legacy = project_root / ".beadloom" / _LEGACY_FILENAME
+        if created and legacy.is_file():
+            store.import_legacy(legacy)
+        return store
+
+    @classmethod
+    def open_readonly(cls, project_root: Path) -> _HistoryStore | None:
+        """Open the store for reading without creating or migrating anything.
+
+        Without a store, a legacy log is imported into an in-memory one, so a
+        read returns what the first write would have migrated. ``None`` when
+        there is no history at all.
+        """
+        path = history_path(project_root)
+        if path.exists():
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            conn.row_factory = sqlite3.Row
+            return cls(conn)
+        legacy = project_root / ".beadloom" / _LEGACY_FILENAME
+        if not legacy.is_file():
+            return None
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        store = cls(conn)
+        store.conn.executescript(_SCHEMA)
+        store.import_legacy(legacy)
+        return store
+
+    def import_legacy(self, legacy: Path) -> None:
+        """Import the points of a legacy JSON log and downsample them."""
+        with self.conn:
+            for point in self.read_legacy(legacy):
+                self.upsert(point)
+            self.compact()
+
+    def upsert(self, point: MetricsPoint, *, replace: bool = True) -> None:
+        """Insert *point*; an existing ``ts`` is overwritten unless not *replace*."""
+        conflict = (
+            "DO UPDATE SET epoch = excluded.epoch, tier = 0, "
+            "lint_violations = excluded.lint_violations, "
+            "debt_score = excluded.debt_score, coverage_pct = excluded.coverage_pct, "
+            "sync_pct = excluded.sync_pct, nodes = excluded.nodes, "
+            "edges = excluded.edges, symbols = excluded.symbols"
+            if replace
+            else "DO NOTHING"
+        )
+        self.conn.execute(
+            f"INSERT INTO metrics_points ({_COLUMNS}, epoch) "  # noqa: S608
+            f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(ts) {conflict}",
+            (*astuple(point), self.epoch(point.ts)),
+        )
+
+    def compacted_before(self) -> int | None:
+        """The raw-tier cutoff of the last compaction (older buckets are final)."""
+        row = self.conn.execute(
+            "SELECT value FROM metrics_meta WHERE key = 'compacted_before'"
+        ).fetchone()
+        return int(row["value"]) if row is not None else None
+
+    def compact(self) -> None:
+        """Downsample points past each tier cutoff to the latest point per bucket.
+
+        Only rows not yet at the target tier are scanned (plus the survivors
+        already in their buckets), so the cost is proportional to what ages
+        out, not to the size of the store.
+        """
+        row = self.conn.execute("SELECT max(epoch) AS newest FROM metrics_points").fetchone()
+        if row is None or row["newest"] is None:
+            return
+        newest = int(row["newest"])
+        self._bucket(newest - _RAW_DAYS * _DAY, tier=1, days=1)
+        self._bucket(newest - _DAILY_DAYS * _DAY, tier=2, days=7)
+        self.conn.execute(
+            "INSERT INTO metrics_meta (key, value) VALUES ('compacted_before', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (str(newest - _RAW_DAYS * _DAY),),
+        )
+
+    def _bucket(self, cutoff: int, *, tier: int, days: int) -> None:
+        """Keep the latest point per *days*-wide UTC bucket older than *cutoff*."""
+        # Day 0 (1970-01-01) is a Thursday: shift by 3 so weeks start on Monday.
+        offset = 3 if days == 7 else 0
+        bucket = f"((epoch / {_DAY} + {offset}) / {days})"
+        rows = self.conn.execute(
+            f"SELECT ts, epoch, {bucket} AS bucket FROM metrics_points "  # noqa: S608
+            f"WHERE epoch < ? AND {bucket} IN ("
+            f"SELECT DISTINCT {bucket} FROM metrics_points WHERE tier < ? AND epoch < ?)",
+            (cutoff, tier, cutoff),
+        ).fetchall()
+        latest: dict[int, tuple[int, str]] = {}
+        for r in rows:
+            key = (int(r["epoch"]), str(r["ts"]))
+            if key > latest.get(int(r["bucket"]), (-(2**62), "")):
+                latest[int(r["bucket"])] = key
+        keep = {ts for _, ts in latest.values()}
+        self.conn.executemany(
+            "DELETE FROM metrics_points WHERE ts = ?",
+            [(str(r["ts"]),) for r in rows if r["ts"] not in keep],
+        )
+        self.conn.executemany(
+            "UPDATE metrics_points SET tier = ? WHERE ts = ? AND tier < ?",
+            [(tier, ts, tier) for ts in sorted(keep)],
+        )
+
+    def read(self) -> list[MetricsPoint]:
+        """The newest ``_MAX_POINTS`` points, sorted by ``ts``."""
+        rows = self.conn.execute(
+            f"SELECT {_COLUMNS} FROM metrics_points "  # noqa: S608
+            "ORDER BY ts DESC LIMIT ?",
+            (_MAX_POINTS,),
+        ).fetchall()
+        return [MetricsPoint(*row) for row in reversed(rows)]
+
+
 def read_history(project_root: Path) -> list[MetricsPoint]:
-    """Return the recorded series, sorted by ``ts`` (empty when no store yet).
+    """Return the recorded series, sorted by ``ts`` (empty when no history yet).
 
     Only real recorded points are returned — never an interpolated or fabricated
-    sample. Malformed rows are skipped (the store is best-effort, additive).
+    sample. The series is bounded: downsampled on append, and capped at the
+    newest ``_MAX_POINTS`` points. Reading never writes to disk.
     """
-    path = history_path(project_root)
-    if not path.is_file():
+    store = _HistoryStore.open_readonly(project_root)
+    if store is None:
         return []
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, ValueError):
-        logger.warning("Could not read metrics history %s", path)
-        return []
-    if not isinstance(payload, list):
-        return []
-    points = [
-        pt
-        for raw in payload
-        if isinstance(raw, dict) and (pt := _coerce_point(raw)) is not None
-    ]
-    return sorted(points, key=lambda p: p.ts)
-
-
-def _write_history(project_root: Path, points: list[MetricsPoint]) -> None:
-    """Persist *points* deterministically (sorted by ts, key-sorted JSON)."""
-    ordered = sorted(points, key=lambda p: p.ts)
-    serialized = json.dumps(
-        [asdict(p) for p in ordered], sort_keys=True, indent=2, ensure_ascii=False
-    )
-    path = history_path(project_root)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(serialized + "\n", encoding="utf-8")
+    with closing(store):
+        return store.read()
 
 
 def append_metrics_point(project_root: Path, point: MetricsPoint) -> None:
-    """Append (or overwrite by ts) one recorded point and persist the store.
+    """Append (or overwrite by ts) one recorded point and downsample old ones.
 
     The caller supplies ``point.ts`` (injected, never ``now()`` here). Appending
     an existing ``ts`` overwrites that point so a re-run of one build does not
     double-count the series.
     """
-    by_ts = {p.ts: p for p in read_history(project_root)}
-    by_ts[point.ts] = point
-    _write_history(project_root, list(by_ts.values()))
+    with closing(_HistoryStore.open(project_root)) as store, store.conn:
+        store.upsert(point)
+        store.compact()
 
 
 def _normalize_snapshot_ts(created_at: str) -> str:
@@ -169,31 +353,33 @@ def backfill_structural_history(conn: sqlite3.Connection, project_root: Path) ->
 
     For every snapshot whose normalized timestamp has no recorded point yet, add
     a structural-only point (full metrics default to neutral values). Existing
-    recorded points are never overwritten — real, richer data always wins. The
-    operation is idempotent (re-running adds nothing new).
+    recorded points are never overwritten — real, richer data always wins.
+    Snapshots older than the last compaction's raw cutoff are skipped: their
+    buckets are already downsampled, so re-adding them would only churn. The
+    new points are then downsampled exactly as an append does. The operation
+    is idempotent (re-running adds nothing new).
     """
-    by_ts = {p.ts: p for p in read_history(project_root)}
-    rows = conn.execute(
-        "SELECT created_at, nodes_json, edges_json, symbols_count "
-        "FROM graph_snapshots ORDER BY created_at, id"
-    ).fetchall()
-    added = False
-    for row in rows:
-        ts = _normalize_snapshot_ts(str(row["created_at"]))
-        if ts in by_ts:
-            continue
-        nodes = len(json.loads(row["nodes_json"]))
-        edges = len(json.loads(row["edges_json"]))
-        by_ts[ts] = MetricsPoint(
-            ts=ts,
-            lint_violations=0,
-            debt_score=0.0,
-            coverage_pct=0.0,
-            sync_pct=100.0,
-            nodes=nodes,
-            edges=edges,
-            symbols=int(row["symbols_count"]),
-        )
-        added = True
-    if added:
-        _write_history(project_root, list(by_ts.values()))
+    from beadloom.graph.snapshot import list_snapshots
+
+    snapshots = list_snapshots(conn)
+    if not snapshots:
+        return
+    with closing(_HistoryStore.open(project_root)) as store, store.conn:
+        floor = store.compacted_before()
+        for snap in reversed(snapshots):
+            ts = _normalize_snapshot_ts(snap.created_at)
+            epoch = _HistoryStore.epoch(ts)
+            if floor is not None and epoch is not None and epoch < floor:
+                continue
+            point = MetricsPoint(
+                ts=ts,
+                lint_violations=0,
+                debt_score=0.0,
+                coverage_pct=0.0,
+                sync_pct=100.0,
+                nodes=snap.node_count,
+                edges=snap.edge_count,
+                symbols=snap.symbols_count,
+            )
+            store.upsert(point, replace=False)
+        store.compact()
@@ -7,20 +7,29 @@ limit. Renders one Markdown page per graph node (domain / service / feature)
 with summary, source, public symbols, edges-as-links, linked hand-written docs,
 and an embedded scoped C4/Mermaid diagram. All output is deterministic
 (sorted, no wall-clock).
+
+:func:`page_fingerprint` summarises everything a page is rendered from, so
+incremental generation (:mod:`beadloom.infrastructure.output_manifest`) can skip
+pages whose inputs did not change.
 """
 
 # beadloom:domain=application
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from beadloom.graph.c4 import filter_c4_nodes, map_to_c4, render_c4_mermaid
-
-if TYPE_CHECKING:
-    import sqlite3
+from pathlib import Path
+from typing import ClassVar
 
+from beadloom.graph import c4
+from beadloom.graph.c4 import C4Model, build_c4_model, render_c4_mermaid
+from beadloom.infrastructure.output_manifest import fingerprint
+from beadloom.infrastructure.path_stats import prefix_bounds
 
 # Node kind -> output sub-directory (sorted, stable).
 _KIND_DIR: dict[str, str] = {
@@ -72,6 +81,60 @@ def _kind_dir(kind: str) -> str:
     return _KIND_DIR.get(kind, "other")
 
 
+def page_rel_path(node: NodeRow) -> str:
+    """A node page's path relative to the site root (e.g. ``domains/graph.md``)."""
+    return f"{_kind_dir(node.kind)}/{node.ref_id}.md"
+
+
+@functools.lru_cache(maxsize=1)
+def _renderer_fingerprint() -> str:
+    """Fingerprint of the page renderer itself (version + rendering modules).
+
+    Part of every page fingerprint, so a template change re-renders all pages
+    even when the graph did not change. The sources cannot change under a
+    running process, so they are read once.
+    """
+    from beadloom import __version__
+
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for module_file in (__file__, c4.__file__):
+        if module_file is not None:
+            digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+def graph_fingerprint(conn: sqlite3.Connection) -> str:
+    """Fingerprint of the graph rows every page depends on.
+
+    Covers exactly what the C4 mapping and the relationship sections read
+    (node ``ref_id/kind/summary/source/extra``, edge ``src/dst/kind``): any
+    change there can alter any page's diagram or links.
+    """
+    digest = hashlib.sha256(_renderer_fingerprint().encode("utf-8"))
+    for row in conn.execute(
+        "SELECT ref_id, kind, summary, source, extra FROM nodes ORDER BY ref_id"
+    ):
+        digest.update(repr(tuple(row)).encode("utf-8"))
+    digest.update(b"\0edges\0")
+    for row in conn.execute(
+        "SELECT src_ref_id, dst_ref_id, kind FROM edges "
+        "ORDER BY src_ref_id, dst_ref_id, kind"
+    ):
+        digest.update(repr(tuple(row)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def page_fingerprint(conn: sqlite3.Connection, node: NodeRow, graph_fp: str) -> str:
+    """Fingerprint of every input of *node*'s page.
+
+    The graph fingerprint (*graph_fp*, from :func:`graph_fingerprint`) plus the
+    node-local inputs: its public symbols and its linked docs.
+    """
+    return fingerprint(
+        graph_fp, node, _load_symbols(conn, node.source), _load_docs(conn, node.ref_id)
+    )
+
+
 def _node_link(target_kind: str, target_ref: str) -> str:
     """A relative Markdown link from one node page to another's page.
 
@@ -160,9 +223,9 @@ def _load_symbols(conn: sqlite3.Connection, source: str | None) -> list[str]:
         return []
     rows = conn.execute(
         "SELECT DISTINCT symbol_name FROM code_symbols "
-        "WHERE file_path = ? OR file_path LIKE ? "
+        "WHERE file_path = ? OR (file_path >= ? AND file_path < ?) "
         "ORDER BY symbol_name",
-        (source, f"{source.rstrip('/')}/%"),
+        (source, *prefix_bounds(f"{source.rstrip('/')}/")),
     ).fetchall()
     return [
         str(row["symbol_name"])
@@ -179,20 +242,17 @@ def _load_docs(conn: sqlite3.Connection, ref_id: str) -> list[str]:
     return [str(row["path"]) for row in rows]
 
 
-def _scoped_diagram(conn: sqlite3.Connection, ref_id: str) -> str:
+def _scoped_diagram(model: C4Model, ref_id: str) -> str:
     """A scoped C4/Mermaid diagram for one node (its component view).
 
     Falls back to the container view when the node has no children.
     """
-    nodes, rels = map_to_c4(conn)
     try:
-        scoped_nodes, scoped_rels = filter_c4_nodes(
-            nodes, rels, level="component", scope=ref_id
-        )
+        scoped_nodes, scoped_rels = model.filter(level="component", scope=ref_id)
     except ValueError:
-        scoped_nodes, scoped_rels = filter_c4_nodes(nodes, rels, level="container")
+        scoped_nodes, scoped_rels = model.filter(level="container")
     if not scoped_nodes:
-        scoped_nodes, scoped_rels = filter_c4_nodes(nodes, rels, level="container")
+        scoped_nodes, scoped_rels = model.filter(level="container")
     return render_c4_mermaid(scoped_nodes, scoped_rels)
 
 
@@ -268,13 +328,24 @@ def _diagram_section(diagram: str) -> list[str]:
     return ["## Diagram", "", "```mermaid", diagram.rstrip("\n"), "```", ""]
 
 
-def render_node_page(conn: sqlite3.Connection, node: NodeRow, kinds: dict[str, str]) -> NodePage:
-    """Render one node's Markdown page (deterministic)."""
+def render_node_page(
+    conn: sqlite3.Connection,
+    node: NodeRow,
+    kinds: dict[str, str],
+    model: C4Model | None = None,
+) -> NodePage:
+    """Render one node's Markdown page (deterministic).
+
+    *model* is the site build's shared C4 model; without it the graph is
+    mapped to C4 for this page alone.
+    """
+    if model is None:
+        model = build_c4_model(conn)
     grouped = _load_edges_for(conn, node.ref_id, kinds)
     incoming = _load_incoming_for(conn, node.ref_id, kinds)
     symbols = _load_symbols(conn, node.source)
     docs = _load_docs(conn, node.ref_id)
-    diagram = _scoped_diagram(conn, node.ref_id)
+    diagram = _scoped_diagram(model, node.ref_id)
 
     lines: list[str] = [
         "---",
@@ -296,12 +367,79 @@ def render_node_page(conn: sqlite3.Connection, node: NodeRow, kinds: dict[str, s
     lines.extend(_docs_section(docs))
     lines.extend(_diagram_section(diagram))
 
-    rel_path = f"{_kind_dir(node.kind)}/{node.ref_id}.md"
-    return NodePage(rel_path=rel_path, body="\n".join(lines) + "\n")
+    return NodePage(rel_path=page_rel_path(node), body="\n".join(lines) + "\n")
+
 
+# Below this many pages the process pool's start-up cost outweighs the gain.
+_PARALLEL_MIN_PAGES = 200
 
-def render_all_pages(conn: sqlite3.Connection) -> list[NodePage]:
-    """Render every node page, sorted by output path (deterministic)."""
-    kinds = _load_kinds(conn)
-    pages = [render_node_page(conn, node, kinds) for node in load_nodes(conn)]
+@dataclass(frozen=True)
+class _PageWorker:
+    """Render state of a pool worker process, built once by its initializer."""
+
+    conn: sqlite3.Connection
+    kinds: dict[str, str]
+    model: C4Model
+
+    # The state of this worker process (empty outside a pool worker).
+    current: ClassVar[list[_PageWorker]] = []
+
+    @classmethod
+    def start(cls, db_path: str) -> None:
+        """Pool initializer: open the DB read-only and build the shared state."""
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        cls.current[:] = [cls(conn, _load_kinds(conn), build_c4_model(conn))]
+
+    @staticmethod
+    def render(nodes: list[NodeRow]) -> list[NodePage]:
+        """Pool task: render a chunk of pages with this worker's shared state."""
+        worker = _PageWorker.current[0]
+        return [render_node_page(worker.conn, node, worker.kinds, worker.model) for node in nodes]
+
+
+def _pool_db_path(conn: sqlite3.Connection) -> str | None:
+    """The file behind *conn* when pool workers can read the same data."""
+    if conn.in_transaction:
+        return None  # uncommitted rows would be invisible to the workers
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main":
+            return str(row[2]) or None  # "" for an in-memory database
+    return None
+
+
+def render_all_pages(
+    conn: sqlite3.Connection,
+    nodes: list[NodeRow] | None = None,
+    *,
+    model: C4Model | None = None,
+    workers: int | None = None,
+) -> list[NodePage]:
+    """Render node pages (all, or *nodes*), sorted by output path (deterministic).
+
+    The kind map and C4 model are built once and shared by every page (pass
+    *model* to reuse the caller's). Large file-backed builds render across a
+    process pool: *workers* ``None`` picks the CPU count once there are at
+    least ``_PARALLEL_MIN_PAGES`` pages, ``1`` forces in-process rendering.
+    In-memory databases and connections with uncommitted changes always
+    render in-process.
+    """
+    if nodes is None:
+        nodes = load_nodes(conn)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(nodes) >= _PARALLEL_MIN_PAGES else 1
+    workers = min(workers, len(nodes))
+    db_path = _pool_db_path(conn) if workers > 1 else None
+
+    if db_path is None:
+        kinds = _load_kinds(conn)
+        shared = model if model is not None else build_c4_model(conn)
+        pages = [render_node_page(conn, node, kinds, shared) for node in nodes]
+    else:
+        chunk = -(-len(nodes) // (workers * 4))
+        chunks = [nodes[i : i + chunk] for i in range(0, len(nodes), chunk)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_PageWorker.start, initargs=(db_path,)
+        ) as pool:
+            pages = [page for part in pool.map(_PageWorker.render, chunks) for page in part]
     return sorted(pages, key=lambda p: p.rel_path)
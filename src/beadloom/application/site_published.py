@@ -38,9 +38,13 @@ badge region and leaves the authored prose byte-for-byte intact.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.output_manifest import StagedOutput
+from beadloom.infrastructure.project_tree import project_tree
+
 if TYPE_CHECKING:
     import sqlite3
     from pathlib import Path
@@ -56,6 +60,9 @@ BADGE_END = "<!-- beadloom:badge-end -->"
 #: the doc_sync engine's exclusions).
 _COVERAGE_EXCLUDE = frozenset({"__init__.py", "__main__.py", "conftest.py"})
 
+#: Threads reading + badge-injecting published Markdown files.
+_PUBLISH_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class PublishedDoc:
@@ -92,56 +99,55 @@ def inject_badge(prose: str, badge_body: str) -> str:
     return f"{block}{prose}"
 
 
-def _node_coverage_pct(
-    conn: sqlite3.Connection, ref_id: str, project_root: Path
-) -> float:
-    """The owning node's doc-coverage %: tracked source files / total (read-only).
+def _coverage_by_ref(
+    conn: sqlite3.Connection, ref_ids: set[str], project_root: Path
+) -> dict[str, float]:
+    """Each owning node's doc-coverage %: tracked source files / total (read-only).
 
     Mirrors the doc_sync engine's source-coverage notion without mutating
-    anything. Returns 100.0 when the node has no directory source (nothing to
-    track) and it is documented; 0.0 for an untracked / unknown node.
+    anything. A node scores 100.0 when it has no directory source or no source
+    files (nothing to track); an empty ref_id scores 0.0. The node sources, tracked ``sync_state``
+    paths and annotated symbol files are each read with one query for all
+    *ref_ids*, not one round of lookups per published doc.
     """
-    if not ref_id:
-        return 0.0
-    row = conn.execute(
-        "SELECT source FROM nodes WHERE ref_id = ?", (ref_id,)
-    ).fetchone()
-    source = row["source"] if row is not None else None
-    if not source or not source.endswith("/"):
-        # File-level or no source: documented nodes count as fully covered.
-        return 100.0
-    source_dir = project_root / source
-    if not source_dir.is_dir():
-        return 100.0
-    disk_files = {
-        str(p.relative_to(project_root))
-        for p in sorted(source_dir.glob("*.py"))
-        if p.name not in _COVERAGE_EXCLUDE
+    sources = {
+        str(row["ref_id"]): row["source"]
+        for row in conn.execute("SELECT ref_id, source FROM nodes").fetchall()
     }
-    if not disk_files:
-        return 100.0
-    tracked: set[str] = set()
-    for tbl_row in conn.execute(
-        "SELECT code_path FROM sync_state WHERE ref_id = ?", (ref_id,)
-    ).fetchall():
-        tracked.add(tbl_row["code_path"])
-    for sym_row in conn.execute(
-        "SELECT file_path FROM code_symbols WHERE annotations LIKE ?",
-        (f'%"{ref_id}"%',),
+    tracked: dict[str, set[str]] = {}
+    for row in conn.execute("SELECT ref_id, code_path FROM sync_state").fetchall():
+        tracked.setdefault(str(row["ref_id"]), set()).add(str(row["code_path"]))
+    # json_each fans the annotations object out into its keys and values: the
+    # same matches as the former ``annotations LIKE '%"<ref_id>"%'`` scan.
+    for row in conn.execute(
+        "SELECT cs.file_path, je.key, je.value "
+        "FROM code_symbols cs, json_each(cs.annotations) je"
     ).fetchall():
-        tracked.add(sym_row["file_path"])
-    covered = len(disk_files & tracked)
-    return round(covered / len(disk_files) * 100.0, 1)
-
-
-def _synced_at_for(conn: sqlite3.Connection, doc_path: str) -> str:
-    """The stored ``sync_state.synced_at`` for *doc_path* (empty if none)."""
-    row = conn.execute(
-        "SELECT synced_at FROM sync_state WHERE doc_path = ? "
-        "ORDER BY synced_at LIMIT 1",
-        (doc_path,),
-    ).fetchone()
-    return str(row["synced_at"]) if row is not None else ""
+        for rid in (row["key"], row["value"]):
+            if isinstance(rid, str) and rid in ref_ids:
+                tracked.setdefault(rid, set()).add(str(row["file_path"]))
+
+    coverage: dict[str, float] = {}
+    for ref_id in ref_ids:
+        source = sources.get(ref_id)
+        source_dir = project_root / source if source and source.endswith("/") else None
+        disk_files = (
+            {
+                str(p.relative_to(project_root))
+                for p in sorted(source_dir.glob("*.py"))
+                if p.name not in _COVERAGE_EXCLUDE
+            }
+            if source_dir is not None and source_dir.is_dir()
+            else set()
+        )
+        if not ref_id:
+            coverage[ref_id] = 0.0
+        elif not disk_files:
+            coverage[ref_id] = 100.0  # file-level / no source: fully covered
+        else:
+            covered = len(disk_files & tracked.get(ref_id, set()))
+            coverage[ref_id] = round(covered / len(disk_files) * 100.0, 1)
+    return coverage
 
 
 def build_published_docs(
@@ -172,6 +178,16 @@ def build_published_docs(
         if prior is None or status == "stale":
             by_doc[doc_path] = (status, str(res.get("reason", "ok")), str(res["ref_id"]))
 
+    # Badge inputs in bulk: the earliest stored sync time per doc (a persisted
+    # value, never wall-clock) and each referenced node's coverage.
+    synced_at_by_doc = {
+        str(row["doc_path"]): str(row["synced_at"])
+        for row in conn.execute(
+            "SELECT doc_path, MIN(synced_at) AS synced_at FROM sync_state "
+            "WHERE synced_at IS NOT NULL GROUP BY doc_path"
+        ).fetchall()
+    }
+
     # ref_id lookup from the docs table for untracked docs (no sync pair).
     ref_by_doc: dict[str, str] = {}
     for row in conn.execute(
@@ -179,8 +195,8 @@ def build_published_docs(
     ).fetchall():
         ref_by_doc[str(row["path"])] = str(row["ref_id"])
 
-    published: list[PublishedDoc] = []
-    for md in sorted(docs_dir.rglob("*.md")):
+    rows: list[tuple[str, str, str, str, str]] = []
+    for md in sorted(project_tree(project_root).files(docs_dir, suffixes={".md"})):
         rel_path = md.relative_to(docs_dir)
         if any(part.startswith(".") for part in rel_path.parts):
             continue  # skip hidden docs (consistent with publish_docs)
@@ -189,12 +205,13 @@ def build_published_docs(
         if entry is not None and entry[0] in ("ok", "stale"):
             raw_status, reason, ref_id = entry
             status = "fresh" if raw_status == "ok" else "stale"
-            synced_at = _synced_at_for(conn, rel)
-            coverage = _node_coverage_pct(conn, ref_id, project_root)
+            rows.append((rel, status, reason, synced_at_by_doc.get(rel, ""), ref_id))
         else:
-            status, reason, synced_at = "untracked", "untracked", ""
-            ref_id = ref_by_doc.get(rel, "")
-            coverage = _node_coverage_pct(conn, ref_id, project_root) if ref_id else 0.0
+            rows.append((rel, "untracked", "untracked", "", ref_by_doc.get(rel, "")))
+
+    coverage = _coverage_by_ref(conn, {row[4] for row in rows}, project_root)
+    published: list[PublishedDoc] = []
+    for rel, status, reason, synced_at, ref_id in rows:
         published.append(
             PublishedDoc(
                 doc_path=rel,
@@ -202,7 +219,7 @@ def build_published_docs(
                 reason=reason,
                 synced_at=synced_at,
                 ref_id=ref_id,
-                coverage_pct=coverage,
+                coverage_pct=coverage[ref_id],
             )
         )
     return published
@@ -272,48 +289,62 @@ def publish_docs(
     out_dir: Path,
     *,
     project_root: Path,
+    output: StagedOutput | None = None,
 ) -> list[Path]:
     """Copy ``docs/**`` into ``out_dir/docs/…`` with badges; return written paths.
 
     NEVER mutates the source ``docs/`` — badges are injected only into the copy.
-    Non-Markdown files are copied verbatim (no badge). A generated
-    ``docs/index.md`` landing page is emitted so the ``/docs/`` nav target
-    resolves. Deterministic.
+    Non-Markdown files are staged as verbatim file copies, which the commit
+    hardlinks (or reflinks / streams) without reading them. Markdown files are
+    read and badge-injected on a thread pool. A generated ``docs/index.md``
+    landing page is emitted so the ``/docs/`` nav target resolves.
+    Deterministic.
+
+    With *output*, the files are only staged on it (the caller commits the whole
+    site at once); without, they are committed here. Either way a copy whose
+    bytes are already on disk is not rewritten.
     """
     docs_dir = project_root / "docs"
     if not docs_dir.is_dir():
         return []
 
+    staging = output if output is not None else StagedOutput(out_dir)
     badges = {d.doc_path: d for d in build_published_docs(conn, project_root=project_root)}
     written: list[Path] = []
     out_docs = out_dir / "docs"
-    published_md: list[str] = []
+    markdown: list[tuple[Path, Path]] = []
 
-    for src in sorted(docs_dir.rglob("*")):
-        if not src.is_file():
-            continue
+    for src in sorted(project_tree(project_root).files(docs_dir)):
         rel = src.relative_to(docs_dir)
         # Skip hidden / OS-junk files (e.g. ``.DS_Store``): they are
         # non-deterministic per machine and would pollute the published site.
         if any(part.startswith(".") for part in rel.parts):
             continue
         dst = out_docs / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
         if src.suffix == ".md":
-            prose = src.read_text(encoding="utf-8")
-            doc = badges.get(str(rel))
-            content = render_published_doc(doc, prose) if doc is not None else prose
-            dst.write_text(content, encoding="utf-8")
-            published_md.append(rel.as_posix())
+            markdown.append((src, rel))
         else:
-            dst.write_bytes(src.read_bytes())
+            staging.add_file(dst, src)
         written.append(dst)
 
+    def render(item: tuple[Path, Path]) -> str:
+        src, rel = item
+        prose = src.read_text(encoding="utf-8")
+        doc = badges.get(str(rel))
+        return render_published_doc(doc, prose) if doc is not None else prose
+
+    # Reading + badge injection is I/O bound; map() keeps the input order, so
+    # staging (and the output) stays deterministic.
+    with ThreadPoolExecutor(max_workers=_PUBLISH_WORKERS) as pool:
+        for (_, rel), content in zip(markdown, pool.map(render, markdown), strict=True):
+            staging.add_text(out_docs / rel, content)
+
     # Landing page so the `/docs/` nav target resolves (the source docs/ tree
     # has no root index). Written last; deterministic (sorted links).
     index = out_docs / "index.md"
-    index.parent.mkdir(parents=True, exist_ok=True)
-    index.write_text(_render_docs_index(sorted(published_md)), encoding="utf-8")
+    staging.add_text(index, _render_docs_index(sorted(rel.as_posix() for _, rel in markdown)))
     written.append(index)
 
+    if output is None:
+        staging.commit()
     return written
@@ -40,6 +40,12 @@ class StatusData:
     kind_total: dict[str, int] = field(default_factory=dict)
     trends: dict[str, str] = field(default_factory=dict)
     context_metrics: dict[str, object] = field(default_factory=dict)
+    reindex_timings: dict[str, object] = field(default_factory=dict)
+
+
+# Context metrics computed by this process, keyed by (database file, reindex
+# stamp). Held in memory so ``status`` never writes to the index.
+_CONTEXT_METRICS_CACHE: dict[tuple[str, str], dict[str, object]] = {}
 
 
 def compute_context_metrics(
@@ -50,18 +56,39 @@ def compute_context_metrics(
     """Compute context bundle size metrics for the status display.
 
     Iterates over all nodes, builds context bundles, and measures their
-    approximate token sizes using the chars/4 heuristic.
+    approximate token sizes using the chars/4 heuristic. The ``code_symbols``
+    table is indexed once and shared by every bundle, and the result is kept
+    in process memory keyed by the database file and ``last_reindex_at``:
+    repeated calls in a long-lived process (TUI, MCP server, watch) between
+    reindexes reuse it instead of rebuilding a bundle per node.
     """
     import sqlite3 as _sqlite3  # local import to satisfy TYPE_CHECKING usage
 
-    from beadloom.context_oracle.builder import build_context, estimate_tokens
+    from beadloom.context_oracle.builder import SymbolIndex, build_context, estimate_tokens
+    from beadloom.infrastructure.db import get_meta
+
+    stamp = get_meta(conn, "last_reindex_at")
+    db_file = str(conn.execute("PRAGMA database_list").fetchone()[2] or "")
+    # In-memory databases have no file to key on and are never cached.
+    cache_key = (db_file, stamp) if db_file and stamp is not None else None
+    cached = _CONTEXT_METRICS_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return {**cached, "total_symbols": symbols_count}
 
     ref_ids = [row[0] for row in conn.execute("SELECT ref_id FROM nodes").fetchall()]
+    symbol_index = SymbolIndex(conn) if ref_ids else None
 
     bundle_sizes: list[tuple[str, int]] = []
     for ref_id in ref_ids:
         try:
-            bundle = build_context(conn, [ref_id], depth=1, max_nodes=10, max_chunks=5)
+            bundle = build_context(
+                conn,
+                [ref_id],
+                depth=1,
+                max_nodes=10,
+                max_chunks=5,
+                symbol_index=symbol_index,
+            )
             bundle_text = json.dumps(bundle, ensure_ascii=False)
             tokens = estimate_tokens(bundle_text)
             bundle_sizes.append((ref_id, tokens))
@@ -76,22 +103,28 @@ def compute_context_metrics(
         largest_ref = ""
         largest_tokens = 0
 
-    return {
+    metrics: dict[str, object] = {
         "avg_bundle_tokens": avg_tokens,
         "largest_bundle_tokens": largest_tokens,
         "largest_bundle_ref_id": largest_ref,
-        "total_symbols": symbols_count,
     }
+    if cache_key is not None:
+        # Results from earlier reindexes of this database are stale for good.
+        for key in [key for key in _CONTEXT_METRICS_CACHE if key[0] == db_file]:
+            del _CONTEXT_METRICS_CACHE[key]
+        _CONTEXT_METRICS_CACHE[cache_key] = metrics
+    return {**metrics, "total_symbols": symbols_count}
 
 
 def gather_status(conn: sqlite3.Connection, project_root: Path) -> StatusData:
-    """Read the full status payload (counts, coverage, health, trends, metrics).
+    """Read the full status payload (counts, coverage, health, trends, metrics, timings).
 
     ``project_root`` is accepted for symmetry with other application read APIs;
     every figure is computed from the already-opened index connection.
     """
     from beadloom.infrastructure.db import get_meta
     from beadloom.infrastructure.health import compute_trend, get_latest_snapshots
+    from beadloom.infrastructure.reindex_timings import load_timing_history, timing_regressions
 
     nodes_count: int = conn.execute("SELECT count(*) FROM nodes").fetchone()[0]
     edges_count: int = conn.execute("SELECT count(*) FROM edges").fetchone()[0]
@@ -145,6 +178,22 @@ def gather_status(conn: sqlite3.Connection, project_root: Path) -> StatusData:
     # Context metrics: measure bundle sizes per node.
     context_metrics = compute_context_metrics(conn, nodes_count, symbols_count)
 
+    # Stage timings of the last recorded reindex, and stages that regressed.
+    timing_history = load_timing_history(conn)
+    reindex_timings: dict[str, object] = {}
+    if timing_history:
+        latest = timing_history[-1]
+        reindex_timings = {
+            "mode": latest.get("mode"),
+            "at": latest.get("at"),
+            "wall_s": latest.get("wall_s"),
+            "stages": latest.get("stages", []),
+            "regressions": [
+                {"stage": r.stage, "wall_s": r.wall_s, "baseline_s": r.baseline_s}
+                for r in timing_regressions(timing_history)
+            ],
+        }
+
     coverage_pct = (covered / nodes_count * 100) if nodes_count > 0 else 0.0
 
     return StatusData(
@@ -165,4 +214,5 @@ def gather_status(conn: sqlite3.Connection, project_root: Path) -> StatusData:
         kind_total=kind_total,
         trends=trends,
         context_metrics=context_metrics,
+        reindex_timings=reindex_timings,
     )
@@ -117,13 +117,17 @@ def watch(
     """Watch project files and auto-reindex on changes.
 
     Monitors graph YAML, documentation, and source files.
-    Graph changes trigger full reindex; other changes trigger incremental.
+    Every batch triggers an incremental reindex targeted at the changed
+    paths; graph YAML edits are applied in place unless they are structural,
+    in which case the incremental reindex falls back to a full one.
 
     Requires ``watchfiles`` (optional dependency).
     """
     from rich.console import Console
     from watchfiles import watch as fs_watch
 
+    from beadloom.context_oracle.code_indexer import retain_parse_trees
+
     console = Console()
 
     watch_paths = _get_watch_paths(project_root)
@@ -136,42 +140,47 @@ def watch(
     console.print(f"[dim]Debounce: {debounce_ms}ms  |  Press Ctrl+C to stop[/dim]")
     console.print()
 
-    try:
-        for batch in fs_watch(
-            *watch_paths,
-            debounce=debounce_ms,
-        ):
-            relevant = _filter_relevant(batch, project_root)
-            if not relevant:
-                continue
-
-            graph_changed = any(_is_graph_file(path_str, project_root) for _, path_str in relevant)
-
-            if graph_changed:
-                from beadloom.application.reindex import reindex as do_reindex
+    # Hot files are re-parsed incrementally from their last tree.
+    with retain_parse_trees():
+        try:
+            for batch in fs_watch(
+                *watch_paths,
+                debounce=debounce_ms,
+            ):
+                relevant = _filter_relevant(batch, project_root)
+                if not relevant:
+                    continue
+
+                graph_changed = any(
+                    _is_graph_file(path_str, project_root) for _, path_str in relevant
+                )
 
-                do_reindex(project_root)
-                reindex_type = "full"
-            else:
                 from beadloom.application.reindex import incremental_reindex
 
-                incremental_reindex(project_root)
-                reindex_type = "incremental"
-
-            timestamp = _format_time()
-            console.print(
-                f"[dim]{timestamp}[/dim] "
-                f"[green]{reindex_type} reindex[/green] "
-                f"({len(relevant)} file{'s' if len(relevant) != 1 else ''} changed)"
-            )
-
-            if callback is not None:
-                event = WatchEvent(
-                    files_changed=len(relevant),
-                    is_graph_change=graph_changed,
-                    reindex_type=reindex_type,
+                # The watcher already knows what changed: re-hash only those
+                # paths (a periodic full sweep runs inside incremental_reindex).
+                # Graph YAML edits are applied as a node/edge delta; only
+                # structural ones fall back to a full reindex internally.
+                result = incremental_reindex(
+                    project_root,
+                    changed_paths=[path_str for _, path_str in relevant],
+                )
+                reindex_type = "full" if result.full_fallback else "incremental"
+
+                timestamp = _format_time()
+                console.print(
+                    f"[dim]{timestamp}[/dim] "
+                    f"[green]{reindex_type} reindex[/green] "
+                    f"({len(relevant)} file{'s' if len(relevant) != 1 else ''} changed)"
                 )
-                callback(event)
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Watch stopped.[/yellow]")
+                if callback is not None:
+                    event = WatchEvent(
+                        files_changed=len(relevant),
+                        is_graph_change=graph_changed,
+                        reindex_type=reindex_type,
+                    )
+                    callback(event)
+
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Watch stopped.[/yellow]")
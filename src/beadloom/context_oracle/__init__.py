@@ -21,10 +21,16 @@ from beadloom.context_oracle.code_indexer import (
     clear_cache,
     extract_symbols,
     get_lang_config,
+    get_parser,
     parse_annotations,
     supported_extensions,
 )
-from beadloom.context_oracle.search import has_fts5, populate_search_index, search_fts5
+from beadloom.context_oracle.search import (
+    has_fts5,
+    populate_search_index,
+    search_fts5,
+    update_search_index,
+)
 
 __all__ = [
     "CacheEntry",
@@ -42,10 +48,12 @@ __all__ = [
     "compute_etag",
     "extract_symbols",
     "get_lang_config",
+    "get_parser",
     "has_fts5",
     "parse_annotations",
     "populate_search_index",
     "search_fts5",
     "suggest_ref_id",
     "supported_extensions",
+    "update_search_index",
 ]
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import json
+import sys
 from collections import deque
 from typing import TYPE_CHECKING, Any
 
@@ -108,6 +109,57 @@ def suggest_ref_id(conn: sqlite3.Connection, ref_id: str) -> list[str]:
     return combined[:_MAX_SUGGESTIONS]
 
 
+# Priority of edge kinds missing from ``_EDGE_PRIORITY`` (expanded last).
+_DEFAULT_EDGE_PRIORITY = 99
+
+# Priority buckets, most important first.
+_PRIORITY_ORDER: tuple[int, ...] = (
+    *sorted(set(_EDGE_PRIORITY.values())),
+    _DEFAULT_EDGE_PRIORITY,
+)
+
+
+def _fetch_node(conn: sqlite3.Connection, ref_id: str) -> dict[str, Any] | None:
+    row = conn.execute(
+        "SELECT ref_id, kind, summary FROM nodes WHERE ref_id = ?",
+        (ref_id,),
+    ).fetchone()
+    if row is None:
+        return None
+    return {"ref_id": row["ref_id"], "kind": row["kind"], "summary": row["summary"]}
+
+
+def _neighbors_by_priority(
+    conn: sqlite3.Connection, ref_id: str
+) -> list[tuple[str, str, str, str]]:
+    """Return ``(neighbor_id, src, dst, kind)`` for *ref_id*, best edge kinds first.
+
+    Edges are dropped into per-priority buckets (outgoing before incoming
+    within a bucket) and the buckets concatenated — the same order a stable
+    sort by priority gives, without a keyed sort per node.
+    """
+    buckets: dict[int, list[tuple[str, str, str, str]]] = {}
+    for erow in conn.execute(
+        "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.src_ref_id = ?",
+        (ref_id,),
+    ).fetchall():
+        src, dst, kind = erow
+        buckets.setdefault(_EDGE_PRIORITY.get(kind, _DEFAULT_EDGE_PRIORITY), []).append(
+            (dst, src, dst, kind)
+        )
+    for erow in conn.execute(
+        "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.dst_ref_id = ?",
+        (ref_id,),
+    ).fetchall():
+        src, dst, kind = erow
+        buckets.setdefault(_EDGE_PRIORITY.get(kind, _DEFAULT_EDGE_PRIORITY), []).append(
+            (src, src, dst, kind)
+        )
+    if len(buckets) == 1:
+        return next(iter(buckets.values()))
+    return [edge for p in _PRIORITY_ORDER for edge in buckets.get(p, ())]
+
+
 # beadloom:domain=context-oracle
 def bfs_subgraph(
     conn: sqlite3.Connection,
@@ -119,28 +171,25 @@ def bfs_subgraph(
 
     Returns (nodes, edges) where nodes are dicts with ref_id/kind/summary
     and edges are dicts with src/dst/kind.
+
+    Edges are de-duplicated through a set of ``(src, dst, kind)`` identities.
+    Once ``max_nodes`` nodes are visited no further node rows are fetched; the
+    remaining frontier only records its edges up to the first unvisited
+    neighbour, exactly as before the limit was hit.
     """
     visited: set[str] = set()
     collected_nodes: list[dict[str, Any]] = []
     collected_edges: list[dict[str, Any]] = []
+    seen_edges: set[tuple[str, str, str]] = set()
 
     # Seed with focus nodes.
     queue: deque[tuple[str, int]] = deque()
     for rid in focus_ref_ids:
         if rid not in visited and len(visited) < max_nodes:
             visited.add(rid)
-            row = conn.execute(
-                "SELECT ref_id, kind, summary FROM nodes WHERE ref_id = ?",
-                (rid,),
-            ).fetchone()
-            if row is not None:
-                collected_nodes.append(
-                    {
-                        "ref_id": row["ref_id"],
-                        "kind": row["kind"],
-                        "summary": row["summary"],
-                    }
-                )
+            node = _fetch_node(conn, rid)
+            if node is not None:
+                collected_nodes.append(node)
                 queue.append((rid, 0))
 
     while queue:
@@ -148,45 +197,12 @@ def bfs_subgraph(
         if current_depth >= depth:
             continue
 
-        # Gather neighbors from both outgoing and incoming edges.
-        neighbors: list[tuple[str, str, str, str]] = []  # (neighbor_id, src, dst, kind)
-
-        # Outgoing edges.
-        for erow in conn.execute(
-            "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.src_ref_id = ?",
-            (current_id,),
-        ).fetchall():
-            neighbors.append(
-                (
-                    erow["dst_ref_id"],
-                    erow["src_ref_id"],
-                    erow["dst_ref_id"],
-                    erow["kind"],
-                )
-            )
-
-        # Incoming edges.
-        for erow in conn.execute(
-            "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.dst_ref_id = ?",
-            (current_id,),
-        ).fetchall():
-            neighbors.append(
-                (
-                    erow["src_ref_id"],
-                    erow["src_ref_id"],
-                    erow["dst_ref_id"],
-                    erow["kind"],
-                )
-            )
-
-        # Sort by edge priority.
-        neighbors.sort(key=lambda x: _EDGE_PRIORITY.get(x[3], 99))
-
-        for neighbor_id, src, dst, ekind in neighbors:
+        for neighbor_id, src, dst, ekind in _neighbors_by_priority(conn, current_id):
             # Record edge regardless of visit status.
-            edge_dict = {"src": src, "dst": dst, "kind": ekind}
-            if edge_dict not in collected_edges:
-                collected_edges.append(edge_dict)
+            identity = (src, dst, ekind)
+            if identity not in seen_edges:
+                seen_edges.add(identity)
+                collected_edges.append({"src": src, "dst": dst, "kind": ekind})
 
             if neighbor_id in visited:
                 continue
@@ -194,18 +210,9 @@ def bfs_subgraph(
                 break
 
             visited.add(neighbor_id)
-            nrow = conn.execute(
-                "SELECT ref_id, kind, summary FROM nodes WHERE ref_id = ?",
-                (neighbor_id,),
-            ).fetchone()
-            if nrow is not None:
-                collected_nodes.append(
-                    {
-                        "ref_id": nrow["ref_id"],
-                        "kind": nrow["kind"],
-                        "summary": nrow["summary"],
-                    }
-                )
+            node = _fetch_node(conn, neighbor_id)
+            if node is not None:
+                collected_nodes.append(node)
                 queue.append((neighbor_id, current_depth + 1))
 
     return collected_nodes, collected_edges
@@ -254,36 +261,65 @@ def collect_chunks(
     ]
 
 
+# Columns of one indexed symbol, in the order :class:`SymbolIndex` stores them.
+_SYMBOL_FIELDS = ("file_path", "symbol_name", "kind", "line_start", "line_end")
+
+
+class SymbolIndex:
+    """``code_symbols`` grouped by the ref_ids their annotations point at.
+
+    Built with one scan of the table; :meth:`lookup` then answers any subgraph
+    without rescanning, so callers assembling many bundles (e.g. the ``status``
+    context metrics) share a single index.
+
+    Symbols are held as plain tuples with one shared string per file path, and
+    turned into dicts only when looked up: a large project annotates tens of
+    thousands of symbols, and a dict per symbol dominated the index's memory.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._symbols: list[tuple[str, str, str, int, int]] = []
+        self._by_ref: dict[str, list[int]] = {}
+        paths: dict[str, str] = {}
+        rows = conn.execute(
+            "SELECT file_path, symbol_name, kind, line_start, line_end, annotations "
+            "FROM code_symbols ORDER BY id"
+        )
+        for file_path, symbol_name, kind, line_start, line_end, annotations_json in rows:
+            annotations: dict[str, str] = json.loads(annotations_json)
+            if not annotations:
+                continue
+            pos = len(self._symbols)
+            file_path = paths.setdefault(file_path, file_path)
+            self._symbols.append((file_path, symbol_name, sys.intern(kind), line_start, line_end))
+            for val in set(annotations.values()):
+                if isinstance(val, str):
+                    self._by_ref.setdefault(val, []).append(pos)
+
+    def lookup(self, ref_ids: set[str]) -> list[dict[str, Any]]:
+        """Symbols annotated with any of *ref_ids*, in table order, deduplicated."""
+        positions = sorted({pos for rid in ref_ids for pos in self._by_ref.get(rid, ())})
+        all_symbols: list[dict[str, Any]] = []
+        seen: set[tuple[str, str]] = set()
+        for pos in positions:
+            symbol = self._symbols[pos]
+            key = (symbol[0], symbol[1])
+            if key not in seen:
+                seen.add(key)
+                all_symbols.append(dict(zip(_SYMBOL_FIELDS, symbol, strict=True)))
+        return all_symbols
+
+
 def _collect_code_symbols(
     conn: sqlite3.Connection,
     ref_ids: set[str],
+    symbol_index: SymbolIndex | None = None,
 ) -> list[dict[str, Any]]:
     """Collect code symbols linked to subgraph nodes via annotations."""
     if not ref_ids:
         return []
-
-    all_symbols: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
-
-    for row in conn.execute("SELECT * FROM code_symbols").fetchall():
-        annotations: dict[str, str] = json.loads(row["annotations"])
-        for _key, val in annotations.items():
-            if val in ref_ids:
-                key = (row["file_path"], row["symbol_name"])
-                if key not in seen:
-                    seen.add(key)
-                    all_symbols.append(
-                        {
-                            "file_path": row["file_path"],
-                            "symbol_name": row["symbol_name"],
-                            "kind": row["kind"],
-                            "line_start": row["line_start"],
-                            "line_end": row["line_end"],
-                        }
-                    )
-                break
-
-    return all_symbols
+    index = symbol_index if symbol_index is not None else SymbolIndex(conn)
+    return index.lookup(ref_ids)
 
 
 def _matcher_applies(
@@ -382,6 +418,7 @@ def build_context(
     depth: int = DEFAULT_DEPTH,
     max_nodes: int = DEFAULT_MAX_NODES,
     max_chunks: int = DEFAULT_MAX_CHUNKS,
+    symbol_index: SymbolIndex | None = None,
 ) -> dict[str, Any]:
     """Build a full context bundle for the given focus ref_ids.
 
@@ -397,6 +434,9 @@ def build_context(
         Maximum nodes in subgraph (default 20).
     max_chunks:
         Maximum text chunks in bundle (default 10).
+    symbol_index:
+        Prebuilt :class:`SymbolIndex` to reuse across bundles (default: scan
+        ``code_symbols`` for this call).
 
     Returns
     -------
@@ -426,7 +466,7 @@ def build_context(
     text_chunks = collect_chunks(conn, subgraph_ref_ids, max_chunks=max_chunks)
 
     # Step 4: Collect code symbols.
-    code_symbols = _collect_code_symbols(conn, subgraph_ref_ids)
+    code_symbols = _collect_code_symbols(conn, subgraph_ref_ids, symbol_index)
 
     # Step 5: Build focus info (first ref_id).
     focus_node = conn.execute(
@@ -7,16 +7,22 @@ from __future__ import annotations
 
 import hashlib
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from tree_sitter import Language, Parser
 
+from beadloom.infrastructure.source_files import skip_reason
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
     from tree_sitter import Node as TSNode
+    from tree_sitter import Tree
 
 # Regex for beadloom annotations in comments.
 _ANNOTATION_RE = re.compile(r"beadloom:(.+)")
@@ -275,6 +281,145 @@ def clear_cache() -> None:
     _LANG_CACHE.clear()
 
 
+# Per-thread parsers, keyed by the ``LangConfig`` they were built for. A
+# ``Parser`` is not safe to share between threads, so each thread keeps its
+# own; within a thread one parser per language serves every file.
+_PARSERS = threading.local()
+
+
+def get_parser(config: LangConfig) -> Parser:
+    """This thread's reusable tree-sitter parser for *config*'s language."""
+    pool: dict[int, tuple[LangConfig, Parser]] | None = getattr(_PARSERS, "pool", None)
+    if pool is None:
+        pool = _PARSERS.pool = {}
+    entry = pool.get(id(config))
+    if entry is None or entry[0] is not config:
+        # The config is stored alongside so a recycled id() never matches.
+        entry = (config, Parser(config.language))
+        pool[id(config)] = entry
+    return entry[1]
+
+
+# Files whose last tree :class:`ParseTreeCache` keeps (least recently parsed
+# evicted first), and the block size used to find where two sources differ.
+_HOT_FILES = 64
+_DIFF_BLOCK = 4096
+
+
+def _common_prefix(old: bytes, new: bytes, limit: int) -> int:
+    """Length of the common prefix of *old* and *new*, at most *limit*."""
+    i = 0
+    while i + _DIFF_BLOCK <= limit and old[i : i + _DIFF_BLOCK] == new[i : i + _DIFF_BLOCK]:
+        i += _DIFF_BLOCK
+    while i < limit and old[i] == new[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(old: bytes, new: bytes, limit: int) -> int:
+    """Length of the common suffix of *old* and *new*, at most *limit*."""
+    lo, ln = len(old), len(new)
+    i = 0
+    while i + _DIFF_BLOCK <= limit and (
+        old[lo - i - _DIFF_BLOCK : lo - i] == new[ln - i - _DIFF_BLOCK : ln - i]
+    ):
+        i += _DIFF_BLOCK
+    while i < limit and old[lo - i - 1] == new[ln - i - 1]:
+        i += 1
+    return i
+
+
+def _point(source: bytes, offset: int) -> tuple[int, int]:
+    """The ``(row, column)`` tree-sitter point of byte *offset* in *source*."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+class ParseTreeCache:
+    """The last tree and source bytes of each recently parsed file.
+
+    Re-parsing a file whose previous tree is held here is incremental: the
+    byte range that differs from the previous source is applied to the old
+    tree with ``Tree.edit`` and the parser reuses every subtree outside it.
+    Unchanged source returns the held tree as is. Thread-safe.
+    """
+
+    def __init__(self, max_files: int = _HOT_FILES) -> None:
+        self.max_files = max_files
+        self.incremental_parses = 0
+        self._entries: OrderedDict[str, tuple[LangConfig, bytes, Tree]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, key: str, config: LangConfig, source: bytes) -> Tree:
+        """Parse *source* (the file identified by *key*), reusing its last tree."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[0] is config:
+                old_source, old_tree = entry[1], entry[2]
+                if old_source == source:
+                    tree = old_tree
+                else:
+                    tree = self._reparse(config, old_source, old_tree, source)
+            else:
+                tree = get_parser(config).parse(source)
+            self._entries[key] = (config, source, tree)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+            return tree
+
+    def _reparse(self, config: LangConfig, old: bytes, old_tree: Tree, new: bytes) -> Tree:
+        limit = min(len(old), len(new))
+        start = _common_prefix(old, new, limit)
+        suffix = _common_suffix(old, new, limit - start)
+        old_end, new_end = len(old) - suffix, len(new) - suffix
+        start_point = _point(old, start)
+        old_tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=start_point,
+            old_end_point=_point(old, old_end),
+            new_end_point=_point(new, new_end),
+        )
+        self.incremental_parses += 1
+        return get_parser(config).parse(new, old_tree=old_tree)
+
+    def clear(self) -> None:
+        """Drop every held tree."""
+        with self._lock:
+            self._entries.clear()
+
+
+# The cache of the active :func:`retain_parse_trees` block (at most one).
+_RETAINED: list[ParseTreeCache] = []
+
+
+@contextmanager
+def retain_parse_trees(max_files: int = _HOT_FILES) -> Iterator[ParseTreeCache]:
+    """Keep parse trees inside the block, so re-parsing an edited file is incremental.
+
+    For long-running processes (``watch``, the TUI) that parse the same hot
+    files again after every save. A nested block shares the outer cache.
+    """
+    if _RETAINED:
+        yield _RETAINED[0]
+        return
+    cache = ParseTreeCache(max_files)
+    _RETAINED.append(cache)
+    try:
+        yield cache
+    finally:
+        _RETAINED.clear()
+
+
+def parse_source(file_path: Path, config: LangConfig, source: bytes) -> Tree:
+    """Parse *file_path*'s *source*, incrementally when its last tree is retained."""
+    if not _RETAINED:
+        return get_parser(config).parse(source)
+    cache = _RETAINED[0]
+    return cache.parse(str(file_path.absolute()), config, source)
+
+
 def check_parser_availability(extensions: Iterable[str]) -> dict[str, bool]:
     """Check whether a tree-sitter parser is available for each extension.
 
@@ -361,24 +506,24 @@ def extract_symbols(file_path: Path) -> list[dict[str, Any]]:
     """Extract top-level symbols from a source file using tree-sitter.
 
     Detects language by file extension.  Returns empty list if the language
-    is not supported or the grammar package is not installed.
+    is not supported, the grammar package is not installed, or the file is
+    too large, binary or minified (:func:`~beadloom.infrastructure.source_files.skip_reason`).
 
     Returns a list of symbol dicts with: ``symbol_name``, ``kind``,
     ``line_start``, ``line_end``, ``annotations``, ``file_hash``.
     """
     config = get_lang_config(file_path.suffix)
-    if config is None:
+    if config is None or skip_reason(file_path) is not None:
         return []
 
     content = file_path.read_text(encoding="utf-8")
     if not content.strip():
         return []
 
-    file_hash = hashlib.sha256(content.encode()).hexdigest()
     content_bytes = content.encode("utf-8")
+    file_hash = hashlib.sha256(content_bytes).hexdigest()
 
-    parser = Parser(config.language)
-    tree = parser.parse(content_bytes)
+    tree = parse_source(file_path, config, content_bytes)
 
     symbols: list[dict[str, Any]] = []
     pending_annotation: dict[str, str] = {}
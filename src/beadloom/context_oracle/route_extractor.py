@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.source_files import skip_reason
+
 if TYPE_CHECKING:
     from tree_sitter import Node as TSNode
 
@@ -20,7 +22,7 @@ logger = logging.getLogger(__name__)
 _MAX_ROUTES_PER_FILE = 100
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Route:
     """A single API route extracted from a source file."""
 
@@ -743,6 +745,9 @@ def extract_routes(file_path: Path, language: str) -> list[Route]:
     # false positive matches.
     if "route_extractor" in file_path.name:
         return []
+    # Oversized, binary and minified files are not parsed.
+    if skip_reason(file_path) is not None:
+        return []
 
     try:
         content = file_path.read_text(encoding="utf-8")
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import sqlite3
+    from collections.abc import Iterable
 
 
 def _escape_fts5_query(query: str) -> str:
@@ -72,6 +73,21 @@ def search_fts5(
     ]
 
 
+def _insert_search_row(conn: sqlite3.Connection, ref_id: str, kind: str, summary: str) -> None:
+    """Insert the ``search_index`` row of one node, with its doc chunks as content."""
+    # Concatenate chunk content linked to this ref_id, in document order.
+    chunks = conn.execute(
+        "SELECT c.content FROM chunks c JOIN docs d ON c.doc_id = d.id "
+        "WHERE d.ref_id = ? ORDER BY d.path, c.chunk_index",
+        (ref_id,),
+    ).fetchall()
+    content = "\n".join(c["content"] for c in chunks)
+    conn.execute(
+        "INSERT INTO search_index (ref_id, kind, summary, content) VALUES (?, ?, ?, ?)",
+        (ref_id, kind, summary, content),
+    )
+
+
 def populate_search_index(conn: sqlite3.Connection) -> int:
     """Populate the ``search_index`` FTS5 table from nodes + chunks.
 
@@ -80,26 +96,29 @@ def populate_search_index(conn: sqlite3.Connection) -> int:
     conn.execute("DELETE FROM search_index")
 
     nodes = conn.execute("SELECT ref_id, kind, summary FROM nodes").fetchall()
-
-    count = 0
     for node in nodes:
-        ref_id: str = node["ref_id"]
-        kind: str = node["kind"]
-        summary: str = node["summary"]
-
-        # Concatenate chunk content linked to this ref_id.
-        chunks = conn.execute(
-            "SELECT c.content FROM chunks c JOIN docs d ON c.doc_id = d.id WHERE d.ref_id = ?",
-            (ref_id,),
-        ).fetchall()
-        content = "\n".join(c["content"] for c in chunks)
+        _insert_search_row(conn, node["ref_id"], node["kind"], node["summary"])
 
-        conn.execute(
-            "INSERT INTO search_index (ref_id, kind, summary, content) VALUES (?, ?, ?, ?)",
-            (ref_id, kind, summary, content),
-        )
-        count += 1
+    conn.commit()
+    return len(nodes)
+
+
+def update_search_index(conn: sqlite3.Connection, ref_ids: Iterable[str]) -> int:
+    """Rebuild only the ``search_index`` rows of *ref_ids*.
 
+    Used after incremental doc re-indexing, where a chunk delta names the
+    nodes whose doc text changed. Ref_ids without a node just lose their row.
+    Returns the number of rows written.
+    """
+    count = 0
+    for ref_id in sorted(set(ref_ids)):
+        conn.execute("DELETE FROM search_index WHERE ref_id = ?", (ref_id,))
+        node = conn.execute(
+            "SELECT kind, summary FROM nodes WHERE ref_id = ?", (ref_id,)
+        ).fetchone()
+        if node is not None:
+            _insert_search_row(conn, ref_id, node["kind"], node["summary"])
+            count += 1
     conn.commit()
     return count
 
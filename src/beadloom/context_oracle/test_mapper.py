@@ -5,12 +5,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.project_tree import project_tree
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Iterable
     from pathlib import Path
 
 
@@ -24,6 +30,20 @@ class TestMapping:
     coverage_estimate: str  # high | medium | low | none
 
 
+@dataclass(frozen=True)
+class DiscoveredTests:
+    """Result of one classifying pass over the project's files.
+
+    ``stamp`` fingerprints the classified files (path, mtime, size) and the
+    detected frameworks, so a caller can tell whether re-mapping is needed
+    without reading any test file.
+    """
+
+    frameworks: list[str]
+    files: dict[str, list[str]] = field(default_factory=dict)  # framework -> rel paths
+    stamp: str = ""
+
+
 # ---------------------------------------------------------------------------
 # Test function counting patterns
 # ---------------------------------------------------------------------------
@@ -34,217 +54,173 @@ _GO_TEST_RE = re.compile(r"^\s*func\s+Test\w+\(", re.MULTILINE)
 _JUNIT_TEST_RE = re.compile(r"@Test\b")
 _XCTEST_TEST_RE = re.compile(r"^\s*func\s+test\w+\(", re.MULTILINE)
 
+_TEST_COUNT_PATTERNS: dict[str, re.Pattern[str]] = {
+    "pytest": _PYTEST_TEST_RE,
+    "jest": _JEST_TEST_RE,
+    "go_test": _GO_TEST_RE,
+    "junit": _JUNIT_TEST_RE,
+    "xctest": _XCTEST_TEST_RE,
+}
+
 # Import patterns for Python test files
 _IMPORT_FROM_RE = re.compile(r"^\s*from\s+([\w.]+)\s+import", re.MULTILINE)
 _IMPORT_MODULE_RE = re.compile(r"^\s*import\s+([\w.]+)", re.MULTILINE)
 
 
 # ---------------------------------------------------------------------------
-# Framework detection
+# Test file discovery: one pass, every framework at once
 # ---------------------------------------------------------------------------
 
+# File-name patterns that make a file a test file, per framework (in
+# detection order).
+_TEST_FILE_PATTERNS: dict[str, tuple[str, ...]] = {
+    "pytest": ("test_*.py", "*_test.py"),
+    "jest": ("*.test.ts", "*.spec.ts", "*.test.js", "*.spec.js", "*.test.tsx", "*.spec.tsx"),
+    "go_test": ("*_test.go",),
+    "junit": ("*Test.java", "*Test.kt"),
+    "xctest": ("*Tests.swift",),
+}
+
+# Jest is detected from the non-TSX patterns only.
+_JEST_DETECT_PATTERNS = ("*.test.ts", "*.spec.ts", "*.test.js", "*.spec.js")
 
-def _detect_frameworks(project_root: Path) -> list[str]:
-    """Detect test frameworks present in the project.
+_JEST_DIR_SUFFIXES = (".ts", ".tsx", ".js", ".jsx")
+_JUNIT_DIR_SUFFIXES = (".java", ".kt")
 
-    Returns a list of framework names found (may be multiple).
+
+def _classify_test_file(parts: tuple[str, ...]) -> tuple[set[str], set[str]]:
+    """Classify a project-relative path (as parts) against every framework.
+
+    Returns ``(listed, detected)``: the frameworks whose test-file list
+    includes the file, and the frameworks whose presence it signals.
     """
-    frameworks: list[str] = []
-
-    # pytest: conftest.py at root, or test_*.py / *_test.py files
-    if (project_root / "conftest.py").exists() or (
-        ((project_root / "setup.cfg").exists() or (project_root / "pyproject.toml").exists())
-        and _find_files_by_patterns(project_root, ["test_*.py", "*_test.py"])
-    ):
-        frameworks.append("pytest")
-
-    # jest: jest.config.*, *.test.ts, *.spec.ts, __tests__/
-    jest_patterns = [
-        "*.test.ts",
-        "*.spec.ts",
-        "*.test.js",
-        "*.spec.js",
-    ]
-    if (
-        list(project_root.glob("jest.config.*"))
-        or _find_files_by_patterns(project_root, jest_patterns)
-        or _find_dirs_by_name(project_root, "__tests__")
-    ):
-        frameworks.append("jest")
-
-    # go test: *_test.go files
-    if _find_files_by_patterns(project_root, ["*_test.go"]):
-        frameworks.append("go_test")
-
-    # JUnit: src/test/ directory, or *Test.java / *Test.kt files
-    if (project_root / "src" / "test").exists() or _find_files_by_patterns(
-        project_root, ["*Test.java", "*Test.kt"]
-    ):
-        frameworks.append("junit")
-
-    # XCTest: *Tests.swift files, or *Tests/ directories
-    if _find_files_by_patterns(project_root, ["*Tests.swift"]) or _find_dirs_by_name(
-        project_root, "Tests", suffix=True
-    ):
-        frameworks.append("xctest")
-
-    return frameworks
-
-
-def _find_files_by_patterns(root: Path, patterns: list[str]) -> list[Path]:
-    """Find files matching any of the glob patterns recursively."""
-    results: list[Path] = []
-    for pattern in patterns:
-        results.extend(root.rglob(pattern))
-    return results
-
-
-def _find_dirs_by_name(
-    root: Path,
-    name: str,
-    *,
-    suffix: bool = False,
-) -> list[Path]:
-    """Find directories by exact name or name ending."""
-    results: list[Path] = []
-    for item in root.rglob("*"):
-        if item.is_dir() and (
-            (suffix and item.name.endswith(name)) or (not suffix and item.name == name)
-        ):
-            results.append(item)
-    return results
+    name = parts[-1]
+    dirs = parts[:-1]
+    listed: set[str] = set()
+    detected: set[str] = set()
+    for fw, patterns in _TEST_FILE_PATTERNS.items():
+        if any(fnmatchcase(name, pattern) for pattern in patterns):
+            listed.add(fw)
+            detected.add(fw)
+    if "pytest" in listed and "conftest" in name:
+        listed.discard("pytest")
+    if "jest" in detected and not any(fnmatchcase(name, p) for p in _JEST_DETECT_PATTERNS):
+        detected.discard("jest")
+    # Directory conventions: __tests__/ (jest), src/test/ (Maven/Gradle),
+    # *Tests/ (XCTest).
+    if "__tests__" in dirs and name.endswith(_JEST_DIR_SUFFIXES):
+        listed.add("jest")
+    if dirs[:2] == ("src", "test") and name.endswith(_JUNIT_DIR_SUFFIXES):
+        listed.add("junit")
+    if name.endswith(".swift") and any(d.endswith("Tests") for d in dirs):
+        listed.add("xctest")
+    return listed, detected
+
+
+def is_test_file(rel_path: str) -> bool:
+    """True when the project-relative *rel_path* is a test file of any framework."""
+    parts = PurePosixPath(rel_path).parts
+    return bool(parts) and bool(_classify_test_file(parts)[0])
+
+
+def discover_tests(project_root: Path) -> DiscoveredTests:
+    """Find and classify every test file in one walk of the project.
+
+    Replaces one ``rglob`` per framework pattern: each file is matched
+    against all frameworks at once, and the directory conventions
+    (``__tests__/``, ``src/test/``, ``*Tests/``) come from the same listing.
+    """
+    tree = project_tree(project_root)
+    listed: dict[str, set[str]] = {fw: set() for fw in _TEST_FILE_PATTERNS}
+    detected: set[str] = set()
+    stamp = hashlib.sha256()
+
+    for path in tree.files():
+        rel = path.relative_to(project_root)
+        in_lists, signals = _classify_test_file(rel.parts)
+        detected |= signals
+        if not in_lists:
+            continue
+        rel_str = str(rel)
+        for fw in in_lists:
+            listed[fw].add(rel_str)
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        stamp.update(f"{rel_str}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+
+    for directory in tree.dirs():
+        if directory.name == "__tests__":
+            detected.add("jest")
+        if directory.name.endswith("Tests"):
+            detected.add("xctest")
+
+    has_python_config = (project_root / "setup.cfg").exists() or (
+        project_root / "pyproject.toml"
+    ).exists()
+    if not (project_root / "conftest.py").exists() and not has_python_config:
+        detected.discard("pytest")
+    if (project_root / "conftest.py").exists():
+        detected.add("pytest")
+    if list(project_root.glob("jest.config.*")):
+        detected.add("jest")
+    if (project_root / "src" / "test").exists():
+        detected.add("junit")
+
+    frameworks = [fw for fw in _TEST_FILE_PATTERNS if fw in detected]
+    stamp.update(",".join(frameworks).encode())
+    return DiscoveredTests(
+        frameworks=frameworks,
+        files={fw: sorted(paths) for fw, paths in listed.items()},
+        stamp=stamp.hexdigest(),
+    )
 
 
 # ---------------------------------------------------------------------------
-# Test file discovery per framework
+# Per-file facts (test count, imports), cached by content hash
 # ---------------------------------------------------------------------------
 
+# Entries kept per process (oldest evicted first).
+_FACTS_MAX_ENTRIES = 4096
 
-def _find_pytest_test_files(project_root: Path) -> list[str]:
-    """Find all pytest test files."""
-    files: list[str] = []
-    for pattern in ["test_*.py", "*_test.py"]:
-        for f in project_root.rglob(pattern):
-            if f.is_file() and "conftest" not in f.name:
-                rel = str(f.relative_to(project_root))
-                if rel not in files:
-                    files.append(rel)
-    return sorted(files)
-
-
-def _find_jest_test_files(project_root: Path) -> list[str]:
-    """Find all jest test files."""
-    files: list[str] = []
-    jest_patterns = [
-        "*.test.ts",
-        "*.spec.ts",
-        "*.test.js",
-        "*.spec.js",
-        "*.test.tsx",
-        "*.spec.tsx",
-    ]
-    for pattern in jest_patterns:
-        for f in project_root.rglob(pattern):
-            if f.is_file():
-                rel = str(f.relative_to(project_root))
-                if rel not in files:
-                    files.append(rel)
-    # Also check __tests__/ directories
-    for tests_dir in _find_dirs_by_name(project_root, "__tests__"):
-        for f in tests_dir.rglob("*"):
-            if f.is_file() and f.suffix in (".ts", ".tsx", ".js", ".jsx"):
-                rel = str(f.relative_to(project_root))
-                if rel not in files:
-                    files.append(rel)
-    return sorted(files)
-
-
-def _find_go_test_files(project_root: Path) -> list[str]:
-    """Find all Go test files."""
-    files: list[str] = []
-    for f in project_root.rglob("*_test.go"):
-        if f.is_file():
-            files.append(str(f.relative_to(project_root)))
-    return sorted(files)
-
-
-def _find_junit_test_files(project_root: Path) -> list[str]:
-    """Find all JUnit test files."""
-    files: list[str] = []
-    # Standard Maven/Gradle test directory
-    test_dir = project_root / "src" / "test"
-    if test_dir.exists():
-        for f in test_dir.rglob("*"):
-            if f.is_file() and f.suffix in (".java", ".kt"):
-                files.append(str(f.relative_to(project_root)))
-    # Also look for *Test.java / *Test.kt anywhere
-    for pattern in ["*Test.java", "*Test.kt"]:
-        for f in project_root.rglob(pattern):
-            if f.is_file():
-                rel = str(f.relative_to(project_root))
-                if rel not in files:
-                    files.append(rel)
-    return sorted(files)
-
-
-def _find_xctest_test_files(project_root: Path) -> list[str]:
-    """Find all XCTest test files."""
-    files: list[str] = []
-    for f in project_root.rglob("*Tests.swift"):
-        if f.is_file():
-            files.append(str(f.relative_to(project_root)))
-    # Also check *Tests/ directories
-    for tests_dir in _find_dirs_by_name(project_root, "Tests", suffix=True):
-        for f in tests_dir.rglob("*.swift"):
-            if f.is_file():
-                rel = str(f.relative_to(project_root))
-                if rel not in files:
-                    files.append(rel)
-    return sorted(files)
-
-
-def _get_test_files_for_framework(
-    project_root: Path,
-    framework: str,
-) -> list[str]:
-    """Get test files for a specific framework."""
-    finders: dict[str, Callable[[Path], list[str]]] = {
-        "pytest": _find_pytest_test_files,
-        "jest": _find_jest_test_files,
-        "go_test": _find_go_test_files,
-        "junit": _find_junit_test_files,
-        "xctest": _find_xctest_test_files,
-    }
-    finder = finders.get(framework)
-    if finder is None:
-        return []
-    return finder(project_root)
-
+_FACTS_CACHE: OrderedDict[tuple[str, str], tuple[int, tuple[str, ...]]] = OrderedDict()
 
-# ---------------------------------------------------------------------------
-# Test function counting
-# ---------------------------------------------------------------------------
 
+def _test_file_facts(file_path: Path, framework: str) -> tuple[int, tuple[str, ...]]:
+    """``(test count, imported top-level modules)`` for one test file.
 
-def _count_tests_in_file(file_path: Path, framework: str) -> int:
-    """Count the number of test functions/methods in a file."""
+    Keyed by the SHA-256 of the file's bytes, so an unchanged file is counted
+    once per process however many nodes (or reindex runs) it maps to.
+    Imports are only extracted for pytest files.
+    """
     try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
+        data = file_path.read_bytes()
     except OSError:
-        return 0
-
-    patterns: dict[str, re.Pattern[str]] = {
-        "pytest": _PYTEST_TEST_RE,
-        "jest": _JEST_TEST_RE,
-        "go_test": _GO_TEST_RE,
-        "junit": _JUNIT_TEST_RE,
-        "xctest": _XCTEST_TEST_RE,
-    }
-    pattern = patterns.get(framework)
-    if pattern is None:
-        return 0
+        return 0, ()
+    key = (hashlib.sha256(data).hexdigest(), framework)
+    cached = _FACTS_CACHE.get(key)
+    if cached is not None:
+        _FACTS_CACHE.move_to_end(key)
+        return cached
+
+    content = data.decode("utf-8", errors="replace")
+    pattern = _TEST_COUNT_PATTERNS.get(framework)
+    count = len(pattern.findall(content)) if pattern is not None else 0
+    imports: tuple[str, ...] = ()
+    if framework == "pytest":
+        # from auth.service import AuthService -> "auth"; import billing -> "billing"
+        imports = tuple(
+            match.group(1).split(".")[0]
+            for regex in (_IMPORT_FROM_RE, _IMPORT_MODULE_RE)
+            for match in regex.finditer(content)
+        )
 
-    return len(pattern.findall(content))
+    facts = (count, imports)
+    _FACTS_CACHE[key] = facts
+    while len(_FACTS_CACHE) > _FACTS_MAX_ENTRIES:
+        _FACTS_CACHE.popitem(last=False)
+    return facts
 
 
 # ---------------------------------------------------------------------------
@@ -262,8 +238,6 @@ def _extract_module_name_from_test_file(
     - Naming convention: test_auth.py -> "auth", auth.test.ts -> "auth"
     - Directory proximity: tests/auth/test_login.py -> "auth"
     """
-    from pathlib import PurePosixPath
-
     parts = PurePosixPath(test_file).parts
     candidates: list[str] = []
 
@@ -343,69 +317,27 @@ def _extract_module_name_from_test_file(
     return candidates
 
 
-def _extract_imports_from_python_test(
-    file_path: Path,
-) -> list[str]:
-    """Extract module names from Python import statements in a test file."""
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return []
-
-    modules: list[str] = []
-
-    # from auth.service import AuthService -> "auth"
-    for match in _IMPORT_FROM_RE.finditer(content):
-        module_path = match.group(1)
-        top_module = module_path.split(".")[0]
-        modules.append(top_module)
-
-    # import billing -> "billing"
-    for match in _IMPORT_MODULE_RE.finditer(content):
-        module_path = match.group(1)
-        top_module = module_path.split(".")[0]
-        modules.append(top_module)
-
-    return modules
-
-
 def _map_test_file_to_nodes(
     test_file: str,
     framework: str,
-    source_dirs: dict[str, str],
-    project_root: Path,
+    imports: Iterable[str],
+    source_keys_lower: dict[str, str],
 ) -> list[str]:
     """Map a single test file to source node ref_ids.
 
     Uses three strategies in priority order:
-    1. Import analysis (for Python/pytest)
+    1. Import analysis (for Python/pytest; *imports* are the file's top-level
+       imported modules)
     2. Naming convention
     3. Directory proximity
     """
-    matched_nodes: list[str] = []
-    source_keys_lower = {k.lower(): k for k in source_dirs}
-
-    # Strategy 1: Import analysis (pytest only)
-    if framework == "pytest":
-        abs_path = project_root / test_file
-        imports = _extract_imports_from_python_test(abs_path)
-        for imp in imports:
-            imp_lower = imp.lower()
-            if imp_lower in source_keys_lower:
-                ref_id = source_keys_lower[imp_lower]
-                if ref_id not in matched_nodes:
-                    matched_nodes.append(ref_id)
-
-    # Strategy 2 & 3: Naming convention + directory proximity
-    candidates = _extract_module_name_from_test_file(test_file, framework)
+    candidates = [*imports, *_extract_module_name_from_test_file(test_file, framework)]
+    matched_nodes: dict[str, None] = {}
     for candidate in candidates:
-        candidate_lower = candidate.lower()
-        if candidate_lower in source_keys_lower:
-            ref_id = source_keys_lower[candidate_lower]
-            if ref_id not in matched_nodes:
-                matched_nodes.append(ref_id)
-
-    return matched_nodes
+        ref_id = source_keys_lower.get(candidate.lower())
+        if ref_id is not None:
+            matched_nodes.setdefault(ref_id)
+    return list(matched_nodes)
 
 
 # ---------------------------------------------------------------------------
@@ -445,6 +377,8 @@ def _estimate_coverage(test_file_count: int, framework_detected: bool) -> str:
 def map_tests(
     project_root: Path,
     source_dirs: dict[str, str],
+    *,
+    discovered: DiscoveredTests | None = None,
 ) -> dict[str, TestMapping]:
     """Map test files to source nodes.
 
@@ -454,6 +388,8 @@ def map_tests(
         Root of the project to scan.
     source_dirs:
         Mapping of ref_id -> source_path (relative) for source modules.
+    discovered:
+        A :func:`discover_tests` result to reuse; discovered here when omitted.
 
     Returns
     -------
@@ -463,34 +399,33 @@ def map_tests(
     if not source_dirs:
         return {}
 
-    # Step 1: Detect frameworks
-    frameworks = _detect_frameworks(project_root)
+    # Step 1: Detect frameworks and collect their test files (one walk).
+    found = discovered if discovered is not None else discover_tests(project_root)
+    frameworks = found.frameworks
     framework_detected = len(frameworks) > 0
 
-    # Step 2: Collect all test files per framework
-    framework_files: dict[str, list[str]] = {}
+    # Each test file is read at most once per framework, however many nodes
+    # it maps to.
+    facts: dict[tuple[str, str], tuple[int, tuple[str, ...]]] = {}
+
+    def file_facts(test_file: str, fw: str) -> tuple[int, tuple[str, ...]]:
+        key = (test_file, fw)
+        if key not in facts:
+            facts[key] = _test_file_facts(project_root / test_file, fw)
+        return facts[key]
+
+    # Step 2: Map test files to source nodes
+    # node_ref_id -> {framework -> {test_file, ...}}
+    source_keys_lower = {k.lower(): k for k in source_dirs}
+    node_tests: dict[str, dict[str, set[str]]] = {ref_id: {} for ref_id in source_dirs}
+
     for fw in frameworks:
-        framework_files[fw] = _get_test_files_for_framework(project_root, fw)
-
-    # Step 3: Map test files to source nodes
-    # node_ref_id -> {framework -> [test_file, ...]}
-    node_tests: dict[str, dict[str, list[str]]] = {ref_id: {} for ref_id in source_dirs}
-
-    for fw, test_files in framework_files.items():
-        for test_file in test_files:
-            matched_nodes = _map_test_file_to_nodes(
-                test_file,
-                fw,
-                source_dirs,
-                project_root,
-            )
-            for ref_id in matched_nodes:
-                if fw not in node_tests[ref_id]:
-                    node_tests[ref_id][fw] = []
-                if test_file not in node_tests[ref_id][fw]:
-                    node_tests[ref_id][fw].append(test_file)
+        for test_file in found.files.get(fw, []):
+            imports = file_facts(test_file, fw)[1] if fw == "pytest" else ()
+            for ref_id in _map_test_file_to_nodes(test_file, fw, imports, source_keys_lower):
+                node_tests[ref_id].setdefault(fw, set()).add(test_file)
 
-    # Step 4: Build TestMapping for each source node
+    # Step 3: Build TestMapping for each source node
     result: dict[str, TestMapping] = {}
 
     for ref_id in source_dirs:
@@ -499,19 +434,16 @@ def map_tests(
         if fw_tests:
             # Pick the framework with the most test files
             best_fw = max(fw_tests, key=lambda f: len(fw_tests[f]))
-            all_test_files = fw_tests[best_fw]
+            all_test_files = sorted(fw_tests[best_fw])
 
             # Count test functions across all mapped test files
-            total_test_count = 0
-            for test_file in all_test_files:
-                abs_path = project_root / test_file
-                total_test_count += _count_tests_in_file(abs_path, best_fw)
+            total_test_count = sum(file_facts(f, best_fw)[0] for f in all_test_files)
 
             coverage = _estimate_coverage(len(all_test_files), framework_detected)
 
             result[ref_id] = TestMapping(
                 framework=best_fw,
-                test_files=sorted(all_test_files),
+                test_files=all_test_files,
                 test_count=total_test_count,
                 coverage_estimate=coverage,
             )
@@ -572,15 +504,13 @@ def aggregate_parent_tests(
             continue
 
         total_count = 0
-        all_files: list[str] = []
+        all_files: set[str] = set()
         for child_id in children:
             child_mapping = result.get(child_id)
             if child_mapping is None:
                 continue
             total_count += child_mapping.test_count
-            for f in child_mapping.test_files:
-                if f not in all_files:
-                    all_files.append(f)
+            all_files.update(child_mapping.test_files)
 
         if total_count > 0 or all_files:
             coverage = _estimate_coverage(len(all_files), True)
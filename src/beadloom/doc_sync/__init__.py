@@ -9,10 +9,14 @@ from beadloom.doc_sync.audit import (
     run_audit,
 )
 from beadloom.doc_sync.doc_indexer import (
+    ChunkDelta,
     DocIndexResult,
+    chunk_identity,
     chunk_markdown,
     classify_section,
+    index_doc,
     index_docs,
+    remove_doc,
 )
 from beadloom.doc_sync.engine import (
     SyncPair,
@@ -38,6 +42,7 @@ __all__ = [
     "VALID_SURFACES",
     "AuditFinding",
     "AuditResult",
+    "ChunkDelta",
     "DocIndexResult",
     "DocScanner",
     "Fact",
@@ -49,13 +54,16 @@ __all__ = [
     "build_sync_state",
     "check_reference_drift",
     "check_sync",
+    "chunk_identity",
     "chunk_markdown",
     "classify_section",
     "compare_facts",
+    "index_doc",
     "index_docs",
     "mark_reference_synced",
     "mark_synced",
     "mark_synced_by_ref",
     "parse_watches",
+    "remove_doc",
     "run_audit",
 ]
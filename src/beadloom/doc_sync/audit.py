@@ -19,7 +19,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from beadloom.doc_sync.scanner import DocScanner, Mention
+from beadloom.doc_sync.scanner import DocScanner, Mention, MentionCache
+from beadloom.infrastructure.project_config import load_project_config
 
 if TYPE_CHECKING:
     import sqlite3
@@ -341,25 +342,12 @@ def _load_tolerances_from_config(project_root: Path) -> dict[str, float] | None:
 
     Returns ``None`` if no overrides are configured.
     """
-    config_path = project_root / ".beadloom" / "config.yml"
-    if not config_path.is_file():
-        return None
-
-    try:
-        import yaml
-
-        content = config_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
-    except Exception:
+    config = load_project_config(project_root)
+    if config.error is not None:
         logger.warning("Failed to read .beadloom/config.yml for tolerances")
         return None
 
-    if not isinstance(data, dict):
-        return None
-
-    audit_section = data.get("docs_audit")
-    if not isinstance(audit_section, dict):
-        return None
+    audit_section = config.section("docs_audit")
 
     raw_tolerances = audit_section.get("tolerances")
     if not isinstance(raw_tolerances, dict):
@@ -394,24 +382,12 @@ def _load_ignore_from_config(project_root: Path) -> list[IgnoreRule]:
     Returns an empty list when none are configured. Malformed entries (not a
     mapping, or missing any of the three keys) are skipped with a warning.
     """
-    config_path = project_root / ".beadloom" / "config.yml"
-    if not config_path.is_file():
-        return []
-
-    try:
-        import yaml
-
-        data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
-    except Exception:
+    config = load_project_config(project_root)
+    if config.error is not None:
         logger.warning("Failed to read .beadloom/config.yml for audit ignores")
         return []
 
-    if not isinstance(data, dict):
-        return []
-    audit_section = data.get("docs_audit")
-    if not isinstance(audit_section, dict):
-        return []
-    raw = audit_section.get("ignore")
+    raw = config.section("docs_audit").get("ignore")
     if not isinstance(raw, list):
         return []
 
@@ -444,6 +420,9 @@ def run_audit(
     ``.beadloom/config.yml`` if present and passes them to
     :func:`compare_facts`.
 
+    Scan results are cached in *db* per doc content hash, so docs unchanged
+    since the last audit are not scanned again.
+
     Parameters
     ----------
     project_root:
@@ -463,7 +442,9 @@ def run_audit(
 
     scanner = DocScanner()
     paths = scanner.resolve_paths(project_root, scan_paths)
-    mentions = scanner.scan(paths)
+    # Only a run over the default doc set may drop entries it did not see.
+    cache = MentionCache(db, prune=scan_paths is None)
+    mentions = scanner.scan(paths, cache=cache)
 
     tolerances = _load_tolerances_from_config(project_root)
     ignore = _load_ignore_from_config(project_root)
@@ -502,8 +483,9 @@ class FactRegistry:
         self._collect_version(project_root, facts)
         self._collect_db_counts(db, facts)
         self._collect_language_count(db, facts)
-        self._collect_test_count(db, facts)
-        self._collect_framework_count(db, facts)
+        node_tests = self._node_tests(db)
+        self._collect_test_count(db, facts, node_tests)
+        self._collect_framework_count(db, facts, node_tests)
         self._collect_rule_type_count(db, facts)
         self._collect_mcp_tool_count(facts)
         self._collect_cli_command_count(facts)
@@ -704,63 +686,68 @@ class FactRegistry:
         except Exception:
             logger.warning("Cannot query code_symbols for language count")
 
+    @staticmethod
+    def _node_tests(db: sqlite3.Connection) -> list[dict[str, object]] | None:
+        """The ``tests`` mapping of every node's ``extra`` JSON, parsed once.
+
+        Both test facts read it. Returns ``None`` when the nodes table
+        cannot be queried.
+        """
+        try:
+            rows = db.execute(
+                "SELECT extra FROM nodes WHERE extra LIKE '%\"tests\"%'"
+            ).fetchall()
+        except Exception:
+            return None
+        result: list[dict[str, object]] = []
+        for row in rows:
+            try:
+                extra = json.loads(row["extra"] or "{}")
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if isinstance(extra, dict):
+                tests_data = extra.get("tests")
+                if isinstance(tests_data, dict):
+                    result.append(tests_data)
+        return result
+
     def _collect_test_count(
         self,
         db: sqlite3.Connection,
         facts: dict[str, Fact],
+        node_tests: list[dict[str, object]] | None = None,
     ) -> None:
         """Sum test_count from nodes.extra JSON tests.test_count."""
-        try:
-            rows = db.execute("SELECT extra FROM nodes").fetchall()
-            total = 0
-            for row in rows:
-                extra_str: str = row["extra"] or "{}"
-                try:
-                    extra = json.loads(extra_str)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-                if isinstance(extra, dict):
-                    tests_data = extra.get("tests")
-                    if isinstance(tests_data, dict):
-                        count = tests_data.get("test_count", 0)
-                        if isinstance(count, int):
-                            total += count
-
-            facts["test_count"] = Fact(
-                name="test_count", value=total, source="graph DB"
-            )
-        except Exception:
+        if node_tests is None:
+            node_tests = self._node_tests(db)
+        if node_tests is None:
             logger.warning("Cannot query nodes for test count")
+            return
+        total = 0
+        for tests_data in node_tests:
+            count = tests_data.get("test_count", 0)
+            if isinstance(count, int):
+                total += count
+        facts["test_count"] = Fact(name="test_count", value=total, source="graph DB")
 
     def _collect_framework_count(
         self,
         db: sqlite3.Connection,
         facts: dict[str, Fact],
+        node_tests: list[dict[str, object]] | None = None,
     ) -> None:
         """Count nodes with non-empty framework detection data in extra."""
-        try:
-            rows = db.execute("SELECT extra FROM nodes").fetchall()
-            count = 0
-            for row in rows:
-                extra_str: str = row["extra"] or "{}"
-                try:
-                    extra = json.loads(extra_str)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-                if isinstance(extra, dict):
-                    tests_data = extra.get("tests")
-                    if isinstance(tests_data, dict):
-                        framework = tests_data.get("framework", "")
-                        if framework:
-                            count += 1
-
-            facts["framework_count"] = Fact(
-                name="framework_count",
-                value=count,
-                source="graph DB",
-            )
-        except Exception:
+        if node_tests is None:
+            node_tests = self._node_tests(db)
+        if node_tests is None:
             logger.warning("Cannot query nodes for framework count")
+            return
+        count = sum(1 for tests_data in node_tests if tests_data.get("framework", ""))
+        facts["framework_count"] = Fact(
+            name="framework_count",
+            value=count,
+            source="graph DB",
+        )
 
     def _collect_rule_type_count(
         self,
@@ -861,27 +848,12 @@ class FactRegistry:
                   value: 42
                   source: "manual config"
         """
-        config_path = project_root / ".beadloom" / "config.yml"
-        if not config_path.is_file():
-            return
-
-        try:
-            import yaml
-
-            content = config_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
-        except Exception:
+        config = load_project_config(project_root)
+        if config.error is not None:
             logger.warning("Failed to read .beadloom/config.yml for extra facts")
             return
 
-        if not isinstance(data, dict):
-            return
-
-        audit_section = data.get("docs_audit")
-        if not isinstance(audit_section, dict):
-            return
-
-        extra_facts = audit_section.get("extra_facts")
+        extra_facts = config.section("docs_audit").get("extra_facts")
         if not isinstance(extra_facts, dict):
             return
 
@@ -7,7 +7,8 @@ from __future__ import annotations
 
 import hashlib
 import re
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -38,6 +39,32 @@ class DocIndexResult:
     chunks_indexed: int = 0
 
 
+@dataclass
+class ChunkDelta:
+    """What re-indexing one doc changed in the ``chunks`` table.
+
+    ``inserted`` / ``deleted`` hold chunk row ids. ``kept`` counts chunks whose
+    identity matched a stored row and kept its id. ``ref_ids`` are the nodes
+    whose searchable doc text changed (the doc's old and new owner), including
+    a pure reordering of sections.
+    """
+
+    inserted: list[int] = field(default_factory=list)
+    deleted: list[int] = field(default_factory=list)
+    kept: int = 0
+    ref_ids: set[str] = field(default_factory=set)
+
+    @property
+    def changed(self) -> bool:
+        """Whether any chunk was added, removed, reordered or moved to another node."""
+        return bool(self.inserted or self.deleted or self.ref_ids)
+
+    @property
+    def chunk_count(self) -> int:
+        """Chunks the doc has after the update."""
+        return self.kept + len(self.inserted)
+
+
 def classify_section(heading: str) -> str:
     """Classify a section heading into a known type.
 
@@ -128,6 +155,108 @@ def chunk_markdown(text: str) -> list[dict[str, Any]]:
     return chunks
 
 
+def chunk_identity(chunk: dict[str, Any]) -> str:
+    """Content hash identifying a chunk independently of its position.
+
+    Built from heading, section and content, so editing one section leaves
+    the identity of every other chunk unchanged.
+    """
+    key = "\0".join((chunk["heading"], chunk["section"], chunk["content"]))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def index_doc(
+    conn: sqlite3.Connection,
+    rel_path: str,
+    content: str,
+    ref_id: str | None,
+) -> ChunkDelta:
+    """Insert or update one doc and diff its chunks against the stored rows.
+
+    Chunks whose :func:`chunk_identity` matches a stored chunk keep their row
+    id (only ``chunk_index`` / ``node_ref_id`` are updated when they moved);
+    the rest are inserted, and stored chunks that no longer occur are
+    deleted. Does not commit.
+    """
+    file_hash = hashlib.sha256(content.encode()).hexdigest()
+    delta = ChunkDelta()
+    row = conn.execute("SELECT id, ref_id FROM docs WHERE path = ?", (rel_path,)).fetchone()
+    if row is None:
+        cur = conn.execute(
+            "INSERT INTO docs (path, kind, ref_id, hash) VALUES (?, ?, ?, ?)",
+            (rel_path, "other", ref_id, file_hash),
+        )
+        doc_id = cur.lastrowid
+        old_ref_id = None
+    else:
+        doc_id, old_ref_id = row[0], row[1]
+        conn.execute(
+            "UPDATE docs SET ref_id = ?, hash = ? WHERE id = ?", (ref_id, file_hash, doc_id)
+        )
+
+    # Identity -> stored (id, chunk_index, node_ref_id) rows, in document order.
+    stored: dict[str, list[tuple[int, int, str | None]]] = defaultdict(list)
+    for chunk_id, index, identity, node_ref_id in conn.execute(
+        "SELECT id, chunk_index, content_hash, node_ref_id FROM chunks "
+        "WHERE doc_id = ? ORDER BY chunk_index, id",
+        (doc_id,),
+    ):
+        stored[identity].append((chunk_id, index, node_ref_id))
+
+    reordered = False
+    for chunk in chunk_markdown(content):
+        identity = chunk_identity(chunk)
+        matches = stored.get(identity)
+        if matches:
+            chunk_id, index, node_ref_id = matches.pop(0)
+            if index != chunk["chunk_index"] or node_ref_id != ref_id:
+                reordered = reordered or index != chunk["chunk_index"]
+                conn.execute(
+                    "UPDATE chunks SET chunk_index = ?, node_ref_id = ? WHERE id = ?",
+                    (chunk["chunk_index"], ref_id, chunk_id),
+                )
+            delta.kept += 1
+            continue
+        cur = conn.execute(
+            "INSERT INTO chunks (doc_id, chunk_index, heading, section, content, "
+            "node_ref_id, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                doc_id,
+                chunk["chunk_index"],
+                chunk["heading"],
+                chunk["section"],
+                chunk["content"],
+                ref_id,
+                identity,
+            ),
+        )
+        delta.inserted.append(int(cur.lastrowid or 0))
+
+    delta.deleted = [chunk_id for rows in stored.values() for chunk_id, _, _ in rows]
+    conn.executemany("DELETE FROM chunks WHERE id = ?", [(i,) for i in delta.deleted])
+
+    if old_ref_id != ref_id:
+        delta.ref_ids.update(r for r in (old_ref_id, ref_id) if r)
+    elif (delta.inserted or delta.deleted or reordered) and ref_id:
+        delta.ref_ids.add(ref_id)
+    return delta
+
+
+def remove_doc(conn: sqlite3.Connection, rel_path: str) -> ChunkDelta:
+    """Delete one doc and its chunks. Does not commit."""
+    delta = ChunkDelta()
+    row = conn.execute("SELECT id, ref_id FROM docs WHERE path = ?", (rel_path,)).fetchone()
+    if row is None:
+        return delta
+    delta.deleted = [
+        r[0] for r in conn.execute("SELECT id FROM chunks WHERE doc_id = ?", (row[0],))
+    ]
+    conn.execute("DELETE FROM docs WHERE id = ?", (row[0],))
+    if row[1]:
+        delta.ref_ids.add(row[1])
+    return delta
+
+
 def index_docs(
     docs_dir: Path,
     conn: sqlite3.Connection,
@@ -172,7 +301,7 @@ def index_docs(
         for chunk in chunks:
             conn.execute(
                 "INSERT INTO chunks (doc_id, chunk_index, heading, section, content, "
-                "node_ref_id) VALUES (?, ?, ?, ?, ?, ?)",
+                "node_ref_id, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
                     doc_id,
                     chunk["chunk_index"],
@@ -180,6 +309,7 @@ def index_docs(
                     chunk["section"],
                     chunk["content"],
                     ref_id,
+                    chunk_identity(chunk),
                 ),
             )
             result.chunks_indexed += 1
@@ -14,6 +14,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from beadloom.infrastructure.git_objects import GitObjectReader, decode_git_text
+from beadloom.infrastructure.project_config import load_project_config
+from beadloom.infrastructure.source_files import hash_text_file
+
 if TYPE_CHECKING:
     import sqlite3
 
@@ -51,7 +55,10 @@ def build_sync_state(conn: sqlite3.Connection) -> list[SyncPair]:
     """Build sync pairs from docs and code_symbols sharing a ref_id.
 
     For each ref_id that has both a doc and at least one code symbol,
-    creates a SyncPair with current hashes.
+    creates a SyncPair with current hashes: one per annotated file, taking
+    the hash of the file's first matching symbol.
+
+    ``code_symbols`` is read once, streaming, rather than once per doc.
     """
     # Find ref_ids that have linked docs.
     doc_rows = conn.execute(
@@ -61,42 +68,45 @@ def build_sync_state(conn: sqlite3.Connection) -> list[SyncPair]:
     if not doc_rows:
         return []
 
-    pairs: list[SyncPair] = []
+    wanted = {row["ref_id"] for row in doc_rows}
+    # ref_id -> {file_path: file_hash}, files in first-symbol order.
+    files_by_ref: dict[str, dict[str, str]] = {}
+    sym_rows = conn.execute(
+        "SELECT file_path, file_hash, annotations FROM code_symbols ORDER BY id"
+    )
+    for file_path, file_hash, annotations_json in sym_rows:
+        annotations: dict[str, Any] = json.loads(annotations_json)
+        for val in annotations.values():
+            if isinstance(val, str) and val in wanted:
+                files_by_ref.setdefault(val, {}).setdefault(file_path, file_hash)
 
+    pairs: list[SyncPair] = []
     for doc_row in doc_rows:
         ref_id = doc_row["ref_id"]
-        doc_path = doc_row["path"]
-        doc_hash = doc_row["hash"]
-
-        # Find code symbols annotated with this ref_id.
-        sym_rows = conn.execute("SELECT * FROM code_symbols").fetchall()
-        seen_files: set[str] = set()
-
-        for sym in sym_rows:
-            annotations: dict[str, Any] = json.loads(sym["annotations"])
-            for _key, val in annotations.items():
-                if val == ref_id and sym["file_path"] not in seen_files:
-                    seen_files.add(sym["file_path"])
-                    pairs.append(
-                        SyncPair(
-                            ref_id=ref_id,
-                            doc_path=doc_path,
-                            code_path=sym["file_path"],
-                            doc_hash=doc_hash,
-                            code_hash=sym["file_hash"],
-                        )
-                    )
-                    break
+        for code_path, code_hash in files_by_ref.get(ref_id, {}).items():
+            pairs.append(
+                SyncPair(
+                    ref_id=ref_id,
+                    doc_path=doc_row["path"],
+                    code_path=code_path,
+                    doc_hash=doc_row["hash"],
+                    code_hash=code_hash,
+                )
+            )
 
     return pairs
 
 
 def _file_hash(path: Path) -> str | None:
-    """Compute SHA-256 hash of a file, or None if file doesn't exist."""
+    """Compute SHA-256 hash of a file, or None if file doesn't exist.
+
+    Streams the file with universal newlines (see
+    :func:`~beadloom.infrastructure.source_files.hash_text_file`), so the
+    digest matches the one the indexers store for the same text.
+    """
     if not path.is_file():
         return None
-    content = path.read_text(encoding="utf-8")
-    return hashlib.sha256(content.encode()).hexdigest()
+    return hash_text_file(path)
 
 
 def check_sync(
@@ -314,24 +324,6 @@ def _validate_git_ref(project_root: Path, ref: str) -> bool:
     return result.returncode == 0
 
 
-def _file_content_at_ref(project_root: Path, rel_path: str, ref: str) -> str | None:
-    """Return *rel_path* content at *ref* via ``git show``, or None if absent.
-
-    Non-destructive: reads from the object store, never touches the working
-    tree or any beadloom DB.
-    """
-    result = subprocess.run(  # noqa: S603
-        ["git", "show", f"{ref}:{rel_path}"],  # noqa: S607
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        return None
-    return result.stdout
-
-
 def _hash_text(text: str) -> str:
     """SHA-256 of *text* (UTF-8), matching :func:`_file_hash`'s digest."""
     return hashlib.sha256(text.encode()).hexdigest()
@@ -367,24 +359,33 @@ def check_sync_since(
         "SELECT doc_path, code_path, ref_id FROM sync_state"
     ).fetchall()
 
+    pairs = [row for row in sync_rows if row["code_path"]]
+
+    # Every code + doc blob at ``since`` is fetched in ONE ``cat-file --batch``
+    # round-trip instead of two ``git show`` spawns per pair.
+    wanted: list[str] = []
+    for row in pairs:
+        wanted.append(row["code_path"])
+        wanted.append(str(Path("docs") / row["doc_path"]))
+    with GitObjectReader(project_root) as reader:
+        blobs_at_ref = reader.read_blobs(since, wanted)
+    ref_hashes = {
+        rel: _hash_text(decode_git_text(data)) if data is not None else None
+        for rel, data in blobs_at_ref.items()
+    }
+
     results: list[dict[str, Any]] = []
-    for row in sync_rows:
+    for row in pairs:
         doc_path = row["doc_path"]
         code_path = row["code_path"]
         ref_id = row["ref_id"]
-        if not code_path:
-            continue
 
-        code_at_ref = _file_content_at_ref(project_root, code_path, since)
         current_code_hash = _file_hash(project_root / code_path)
-        ref_code_hash = _hash_text(code_at_ref) if code_at_ref is not None else None
-        code_drifted = ref_code_hash != current_code_hash
+        code_drifted = ref_hashes[code_path] != current_code_hash
 
         doc_rel = str(Path("docs") / doc_path)
-        doc_at_ref = _file_content_at_ref(project_root, doc_rel, since)
         current_doc_hash = _file_hash(project_root / "docs" / doc_path)
-        ref_doc_hash = _hash_text(doc_at_ref) if doc_at_ref is not None else None
-        doc_changed = ref_doc_hash != current_doc_hash
+        doc_changed = ref_hashes[doc_rel] != current_doc_hash
 
         stale = code_drifted and not doc_changed
         results.append(
@@ -490,18 +491,8 @@ def _resolve_reference_docs_dir(project_root: Path) -> Path:
     Mirrors the application-layer resolver without importing upward: reads the
     optional ``docs_dir`` key from config, falling back to ``<root>/docs``.
     """
-    import yaml
-
-    config_path = project_root / ".beadloom" / "config.yml"
-    if config_path.is_file():
-        try:
-            config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-        except (OSError, yaml.YAMLError):
-            config = {}
-        docs_path = config.get("docs_dir") if isinstance(config, dict) else None
-        if docs_path:
-            return project_root / str(docs_path)
-    return project_root / "docs"
+    docs_path = load_project_config(project_root).docs_dir
+    return project_root / docs_path if docs_path else project_root / "docs"
 
 
 def _discover_reference_docs(project_root: Path) -> list[tuple[str, list[str]]]:
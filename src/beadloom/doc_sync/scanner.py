@@ -9,13 +9,21 @@ feature to detect stale numeric claims in documentation.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import logging
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class Mention:
@@ -76,6 +84,26 @@ _BACKTICK_RE = re.compile(r"`[^`]+`")
 # Numeric range pattern: 0-100, 1-10, etc.
 _RANGE_RE = re.compile(r"\b\d+-\d+\b")
 
+# Masked in this order (a later pattern sees the blanks of earlier ones).
+_MASK_PATTERNS: tuple[re.Pattern[str], ...] = (
+    _DATE_ISO_RE,  # 2026-02-19
+    _DATE_MONTH_RE,  # Feb 2026
+    _ISSUE_HASH_RE,  # #123
+    _ISSUE_PREFIX_RE,  # BDL-021
+    _HEX_COLOR_RE,  # #FF0000
+    _HEX_LITERAL_RE,  # 0xFF
+    _VERSION_PIN_RE,  # >=0.80, ^1.2.3
+    _LINE_REF_COLON_RE,  # :15
+    _LINE_REF_WORD_RE,  # line 42
+    _LINE_REF_L_RE,  # L42
+    _YEAR_STANDALONE_RE,  # 2026
+    _RANGE_RE,  # 0-100 (Layer 2 — not factual counts)
+)
+
+
+def _blank(match: re.Match[str]) -> str:
+    return " " * len(match.group())
+
 # ---------------------------------------------------------------------------
 # Layer 1: Blocklist modifier words — numbers near these are NOT factual claims
 # ---------------------------------------------------------------------------
@@ -112,6 +140,9 @@ _FP_PLUS_RE = re.compile(r"\b\d+\+")
 # Assignment-style modifiers: limit=10, depth=2, max_nodes=20
 _FP_ASSIGN_RE = re.compile(r"\w+=\d+")
 
+# A % right after a number (checked within the next 3 characters).
+_PERCENT_AFTER_RE = re.compile(r"\s*%")
+
 # ---------------------------------------------------------------------------
 # Layer 3: File-type heuristics — paths with lower/higher FP risk
 # ---------------------------------------------------------------------------
@@ -134,6 +165,182 @@ _EXCLUDE_PATTERNS = (
 )
 
 
+# Bump when a change to the scanning rules alters what a text yields, so
+# cached mentions from older releases are dropped.
+_SCANNER_VERSION = 1
+
+# One mention before its file is attached: (fact_name, value, line, context).
+_Found = tuple[str, str | int, int, str]
+
+
+def _read_doc(path: Path) -> str | None:
+    """Text of a markdown file, or ``None`` when it is not a file."""
+    if not path.is_file():
+        return None
+    return path.read_text(encoding="utf-8")
+
+
+class MentionCache:
+    """Scan results per doc content hash, kept in the ``doc_mentions`` table.
+
+    ``docs audit`` runs in CI gates over thousands of docs, most of them
+    unchanged since the previous run. Entries are keyed by content hash and
+    the low-confidence file flag, and belong to one scanner
+    :attr:`~DocScanner.fingerprint`; entries of any other fingerprint are
+    dropped on store. With *prune*, entries for content not seen in the run
+    are dropped too (use it when the run covered the whole doc set).
+
+    A DB without the table (created before it existed) or one that cannot be
+    written simply runs without the cache.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, prune: bool = False) -> None:
+        self._conn = conn
+        self._prune = prune
+
+    def load(self, fingerprint: str) -> dict[tuple[str, bool], list[_Found]]:
+        """Every cached entry of *fingerprint*."""
+        try:
+            rows = self._conn.execute(
+                "SELECT content_hash, low_confidence, mentions FROM doc_mentions "
+                "WHERE scanner = ?",
+                (fingerprint,),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return {}
+        return {
+            (row[0], bool(row[1])): [
+                (str(f), v, int(n), str(c)) for f, v, n, c in json.loads(row[2])
+            ]
+            for row in rows
+        }
+
+    def store(
+        self,
+        fingerprint: str,
+        fresh: dict[tuple[str, bool], list[_Found]],
+        seen: set[str],
+    ) -> None:
+        """Save *fresh* scan results and drop entries that can no longer hit."""
+        try:
+            self._conn.execute("DELETE FROM doc_mentions WHERE scanner != ?", (fingerprint,))
+            if self._prune:
+                stored = {
+                    row[0] for row in self._conn.execute("SELECT content_hash FROM doc_mentions")
+                }
+                self._conn.executemany(
+                    "DELETE FROM doc_mentions WHERE content_hash = ?",
+                    [(digest,) for digest in stored - seen],
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO doc_mentions "
+                "(content_hash, low_confidence, scanner, mentions) VALUES (?, ?, ?, ?)",
+                [
+                    (digest, int(low), fingerprint, json.dumps(found, ensure_ascii=False))
+                    for (digest, low), found in fresh.items()
+                ],
+            )
+            self._conn.commit()
+        except sqlite3.Error as exc:
+            self._conn.rollback()
+            logger.debug("Mention cache not written: %s", exc)
+
+
+class _LineWords:
+    """Tokens of one masked line, shared by every number on that line."""
+
+    __slots__ = ("alpha", "digit_index", "lower", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        tokens = list(_WORD_RE.finditer(text))
+        self.lower = [m.group().lower() for m in tokens]
+        self.alpha = [w[0].isascii() and w[0].isalpha() for w in self.lower]
+        # Start offset -> token index, for digit tokens only.
+        self.digit_index = {
+            m.start(): i for i, m in enumerate(tokens) if not self.alpha[i]
+        }
+
+
+class _KeywordMatcher:
+    """All fact keywords compiled into one prefix alternation.
+
+    ``positions`` returns, for one line, every token index where each keyword
+    starts. A word is tested against the combined regex once; the keywords
+    it begins are looked up from a per-word memo, so the cost per line does
+    not grow with the number of keywords or fact types.
+    """
+
+    def __init__(self, fact_keywords: tuple[tuple[str, tuple[str, ...]], ...]) -> None:
+        self.keywords: list[tuple[str, tuple[str, ...]]] = [
+            (fact, tuple(keyword.lower().split()))
+            for fact, keywords in fact_keywords
+            for keyword in keywords
+        ]
+        firsts = sorted({words[0] for _, words in self.keywords if words}, key=len)
+        self._prefix_re = re.compile("|".join(re.escape(w) for w in reversed(firsts)) or "(?!)")
+        self._memo: dict[str, frozenset[str]] = {}
+
+    def _firsts(self, word: str) -> frozenset[str]:
+        """Keyword words that *word* starts with (prefix match)."""
+        hit = self._memo.get(word)
+        if hit is None:
+            if self._prefix_re.match(word) is None:
+                hit = frozenset()
+            else:
+                hit = frozenset(
+                    words[0] for _, words in self.keywords if words and word.startswith(words[0])
+                )
+            if len(self._memo) < _KEYWORD_MEMO_MAX:
+                self._memo[word] = hit
+        return hit
+
+    def positions(self, words: _LineWords) -> list[list[int]]:
+        """Token indices where each keyword (in ``self.keywords`` order) starts."""
+        hits = [
+            self._firsts(w) if is_alpha else frozenset()
+            for w, is_alpha in zip(words.lower, words.alpha, strict=True)
+        ]
+        result: list[list[int]] = []
+        for _, kw_words in self.keywords:
+            found: list[int] = []
+            if kw_words:
+                first = kw_words[0]
+                last_start = len(hits) - len(kw_words)
+                for i, hit in enumerate(hits):
+                    if i > last_start:
+                        break
+                    if first in hit and all(
+                        words.alpha[i + j] and words.lower[i + j].startswith(kw)
+                        for j, kw in enumerate(kw_words[1:], 1)
+                    ):
+                        found.append(i)
+            result.append(found)
+        return result
+
+
+# Distinct words remembered per keyword matcher.
+_KEYWORD_MEMO_MAX = 65536
+
+# Letter runs and digit runs: the token stream keyword proximity is measured in.
+_WORD_RE = re.compile(r"[a-zA-Z]+|\d+")
+
+# A line without a digit can hold no version and no number.
+_DIGIT_RE = re.compile(r"\d")
+
+# Markdown bold/italic markers, stripped before tokenizing.
+_EMPHASIS_RE = re.compile(r"\*{1,3}|_{1,3}")
+
+_VERSION_PIN_SUFFIX_RE = re.compile(r"(?:>=|<=|~=|!=|==|\^|[<>])\s*$")
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_matcher(
+    fact_keywords: tuple[tuple[str, tuple[str, ...]], ...],
+) -> _KeywordMatcher:
+    return _KeywordMatcher(fact_keywords)
+
+
 class DocScanner:
     """Scans markdown files for fact mentions using keyword proximity."""
 
@@ -151,23 +358,89 @@ class DocScanner:
 
     PROXIMITY_WINDOW: ClassVar[int] = 5
 
-    def scan(self, paths: list[Path]) -> list[Mention]:
-        """Scan multiple markdown files for fact mentions."""
+    # Files read and scanned concurrently by :meth:`scan`.
+    SCAN_WORKERS: ClassVar[int] = 8
+
+    def _matcher(self) -> _KeywordMatcher:
+        table = tuple(
+            (fact, tuple(keywords))
+            for fact, keywords in self.FACT_KEYWORDS.items()
+            if fact != "version"  # handled separately
+        )
+        return _keyword_matcher(table)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything that decides which mentions a text yields.
+
+        Cached mentions (:class:`MentionCache`) are only reused by a scanner
+        with the same fingerprint.
+        """
+        key = json.dumps(
+            [_SCANNER_VERSION, self.FACT_KEYWORDS, self.PROXIMITY_WINDOW], sort_keys=True
+        )
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def scan(self, paths: list[Path], *, cache: MentionCache | None = None) -> list[Mention]:
+        """Scan multiple markdown files for fact mentions.
+
+        Files are read and scanned in a small thread pool; results keep the
+        order of *paths*. With a *cache*, a file whose content was scanned
+        before is not scanned again.
+        """
+        known = cache.load(self.fingerprint) if cache is not None else {}
+
+        def work(path: Path) -> tuple[str, bool, list[_Found], bool]:
+            content = _read_doc(path)
+            if content is None:
+                return "", False, [], False
+            digest = hashlib.sha256(content.encode()).hexdigest()
+            low_confidence = path.name in _LOW_CONFIDENCE_FILENAMES
+            found = known.get((digest, low_confidence))
+            if found is not None:
+                return digest, low_confidence, found, False
+            return digest, low_confidence, self._scan_lines(content, low_confidence), True
+
         mentions: list[Mention] = []
-        for path in paths:
-            mentions.extend(self.scan_file(path))
+        fresh: dict[tuple[str, bool], list[_Found]] = {}
+        seen: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as pool:
+            for path, (digest, low_confidence, found, scanned) in zip(
+                paths, pool.map(work, paths), strict=True
+            ):
+                if digest:
+                    seen.add(digest)
+                if scanned:
+                    fresh[(digest, low_confidence)] = found
+                mentions.extend(
+                    Mention(fact_name=f, value=v, file=path, line=n, context=c)
+                    for f, v, n, c in found
+                )
+        if cache is not None:
+            cache.store(self.fingerprint, fresh, seen)
         return mentions
 
     def scan_file(self, file_path: Path) -> list[Mention]:
         """Extract fact mentions from a single markdown file."""
-        if not file_path.is_file():
+        content = _read_doc(file_path)
+        if content is None:
             return []
+        low_confidence = file_path.name in _LOW_CONFIDENCE_FILENAMES
+        return [
+            Mention(fact_name=f, value=v, file=file_path, line=n, context=c)
+            for f, v, n, c in self._scan_lines(content, low_confidence)
+        ]
+
+    def _scan_lines(self, content: str, low_confidence: bool) -> list[_Found]:
+        """Mentions in *content* as ``(fact, value, line, context)`` tuples.
 
-        content = file_path.read_text(encoding="utf-8")
+        Lines are consumed one at a time; only a line that contains a digit
+        (outside code blocks) is masked and tokenized.
+        """
         if not content.strip():
             return []
 
-        mentions: list[Mention] = []
+        found: list[_Found] = []
         in_code_block = False
 
         for line_num, line in enumerate(content.splitlines(), 1):
@@ -177,171 +450,127 @@ class DocScanner:
             if stripped.startswith("```"):
                 in_code_block = not in_code_block
                 continue
-            if in_code_block:
+            if in_code_block or _DIGIT_RE.search(line) is None:
                 continue
 
-            # Extract version strings (special handling, no proximity needed)
-            mentions.extend(self._extract_versions(line, file_path, line_num))
+            cleaned = self._mask_false_positives(line)
 
-            # Extract number-based mentions via keyword proximity
-            mentions.extend(self._extract_number_mentions(line, file_path, line_num))
+            # Extract version strings (special handling, no proximity needed)
+            found.extend(
+                ("version", version, line_num, stripped)
+                for version in self._extract_versions(cleaned)
+            )
 
-        return mentions
+            # Extract number-based mentions via keyword proximity. Layer 3:
+            # low-confidence file types carry no count facts.
+            if not low_confidence:
+                found.extend(
+                    (fact, value, line_num, stripped)
+                    for fact, value in self._extract_number_mentions(cleaned)
+                )
 
-    def _extract_versions(
-        self, line: str, file_path: Path, line_num: int
-    ) -> list[Mention]:
-        """Extract semantic version strings from a line."""
-        results: list[Mention] = []
-        cleaned = self._mask_false_positives(line)
+        return found
 
+    @staticmethod
+    def _extract_versions(cleaned: str) -> list[str]:
+        """Extract semantic version strings from a masked line."""
+        results: list[str] = []
         for match in _VERSION_RE.finditer(cleaned):
-            version_str = match.group()
             # Skip if this version is part of a version pin (>=, ^, etc.)
-            start = match.start()
-            prefix = cleaned[:start].rstrip()
-            if prefix and re.search(r"(?:>=|<=|~=|!=|==|\^|[<>])\s*$", prefix):
+            prefix = cleaned[: match.start()].rstrip()
+            if prefix and _VERSION_PIN_SUFFIX_RE.search(prefix):
                 continue
-            results.append(
-                Mention(
-                    fact_name="version",
-                    value=version_str,
-                    file=file_path,
-                    line=line_num,
-                    context=line.strip(),
-                )
-            )
+            results.append(match.group())
         return results
 
-    def _extract_number_mentions(
-        self, line: str, file_path: Path, line_num: int
-    ) -> list[Mention]:
-        """Extract numeric mentions matched via keyword proximity."""
-        results: list[Mention] = []
-        cleaned = self._mask_false_positives(line)
-
-        # Layer 3: suppress count facts for low-confidence file types
-        is_low_confidence_file = file_path.name in _LOW_CONFIDENCE_FILENAMES
-
+    def _extract_number_mentions(self, cleaned: str) -> list[tuple[str, int]]:
+        """Extract ``(fact, number)`` pairs matched via keyword proximity."""
         # Strip markdown bold/italic markers for word extraction
-        text_for_words = re.sub(r"\*{1,3}|_{1,3}", "", cleaned)
+        text = _EMPHASIS_RE.sub("", cleaned)
 
         # Mask backtick-enclosed code references — keywords inside inline
         # code (e.g. `mcp-server`, `node_count`) are identifiers, not
         # natural-language claims about facts.
-        text_for_words = _BACKTICK_RE.sub(
-            lambda m: " " * len(m.group()), text_for_words,
+        text = _BACKTICK_RE.sub(lambda m: " " * len(m.group()), text)
+
+        # Numbers inside a version string were handled by _extract_versions.
+        version_spans = (
+            [(m.start(), m.end()) for m in _VERSION_RE.finditer(text)]
+            if _VERSION_RE.search(cleaned)
+            else []
         )
+        has_percent = _FP_PERCENT_RE.search(text) is not None
+        has_plus = _FP_PLUS_RE.search(text) is not None
+        has_assign = _FP_ASSIGN_RE.search(text) is not None
+
+        words: _LineWords | None = None
+        positions: list[list[int]] = []
+        matcher = self._matcher()
+        window = self.PROXIMITY_WINDOW
+        results: list[tuple[str, int]] = []
 
-        for match in _NUMBER_RE.finditer(text_for_words):
-            number_str = match.group()
-            number_val = int(number_str)
+        for match in _NUMBER_RE.finditer(text):
+            number_val = int(match.group())
 
             # Skip 0 and 1 — too common and ambiguous
             if number_val <= 1:
                 continue
 
-            # Check if this number is part of a version string in original
-            # (already handled by _extract_versions)
-            if _VERSION_RE.search(cleaned):
-                # Check if this specific number position overlaps a version
-                pos = match.start()
-                is_in_version = False
-                for vmatch in _VERSION_RE.finditer(text_for_words):
-                    if vmatch.start() <= pos < vmatch.end():
-                        is_in_version = True
-                        break
-                if is_in_version:
-                    continue
+            pos, end_pos = match.start(), match.end()
+            if any(lo <= pos < hi for lo, hi in version_spans):
+                continue
 
             # Layer 1a: skip if number has a % modifier (threshold, not count)
-            if _FP_PERCENT_RE.search(text_for_words):
-                # Check if THIS number is the one with %
-                end_pos = match.end()
-                rest = text_for_words[end_pos:end_pos + 3]
-                if re.match(r"\s*%", rest):
-                    continue
+            if has_percent and _PERCENT_AFTER_RE.match(text, end_pos, end_pos + 3):
+                continue
 
             # Layer 1a2: skip if number has a + modifier (approximate, e.g. 20+)
-            if _FP_PLUS_RE.search(text_for_words):
-                end_pos = match.end()
-                if end_pos < len(text_for_words) and text_for_words[end_pos] == "+":
-                    continue
+            if has_plus and end_pos < len(text) and text[end_pos] == "+":
+                continue
 
-            # Layer 1b: skip if number is part of an assignment pattern
+            # Layer 1b: skip if number is the RHS of an assignment
             # (e.g. limit=10, depth=2, max_nodes=20)
-            if _FP_ASSIGN_RE.search(text_for_words):
-                # Check if this specific number is the RHS of an assignment
-                start_pos = match.start()
-                if start_pos > 0 and text_for_words[start_pos - 1] == "=":
-                    continue
-
-            # Find position of the number in the raw text to locate nearby words
-            word_positions = list(re.finditer(r"[a-zA-Z]+|\d+", text_for_words))
-
-            # Find index of this number in word_positions
-            num_idx = -1
-            for i, wp in enumerate(word_positions):
-                if wp.start() == match.start() and wp.group() == number_str:
-                    num_idx = i
-                    break
+            if has_assign and pos > 0 and text[pos - 1] == "=":
+                continue
 
-            if num_idx == -1:
+            if words is None:
+                words = _LineWords(text)
+                positions = matcher.positions(words)
+            num_idx = words.digit_index.get(pos, -1)
+            if num_idx == -1 or words.lower[num_idx] != match.group():
                 continue
 
             # Layer 1c: skip if modifier word is within ±3 tokens of number
-            modifier_window_start = max(0, num_idx - 3)
-            modifier_window_end = min(
-                len(word_positions), num_idx + 3 + 1
-            )
+            lo, hi = max(0, num_idx - 3), num_idx + 3 + 1
             modifier_tokens = [
-                wp.group().lower()
-                for wp in word_positions[modifier_window_start:modifier_window_end]
-                if re.match(r"[a-zA-Z]", wp.group())
+                w
+                for w, is_alpha in zip(words.lower[lo:hi], words.alpha[lo:hi], strict=True)
+                if is_alpha
             ]
-
             if self._has_modifier(modifier_tokens):
                 continue
 
-            # Layer 3: suppress count facts for low-confidence files
-            if is_low_confidence_file:
-                continue
-
             # Layer 2: find the closest matching fact type keyword
             # (disambiguates when multiple fact keywords appear nearby)
             # Score is (distance, is_before_number) — lower distance wins;
             # on ties, keywords AFTER the number (is_before=0) beat BEFORE (1).
             best_fact: str | None = None
-            best_score: tuple[int, int] = (self.PROXIMITY_WINDOW + 1, 1)
-
-            for fact_name, keywords in self.FACT_KEYWORDS.items():
-                if fact_name == "version":
-                    continue  # handled separately
-
+            best_score: tuple[int, int] = (window + 1, 1)
+            start, stop = num_idx - window, num_idx + window + 1
+            for (fact_name, _), starts in zip(matcher.keywords, positions, strict=True):
                 # Skip small numbers (<10) for count-type facts — too
                 # many false positives from examples in SPEC docs.
                 if number_val < 10 and fact_name.endswith("_count"):
                     continue
-
-                for keyword in keywords:
-                    kw_words = keyword.lower().split()
-                    score = self._keyword_distance(
-                        kw_words, word_positions, num_idx,
-                    )
-                    if score is not None and score < best_score:
-                        best_score = score
-                        best_fact = fact_name
+                for i in starts:
+                    if start <= i < stop:
+                        score = (abs(i - num_idx), 1 if i < num_idx else 0)
+                        if score < best_score:
+                            best_score = score
+                            best_fact = fact_name
 
             if best_fact is not None:
-                results.append(
-                    Mention(
-                        fact_name=best_fact,
-                        value=number_val,
-                        file=file_path,
-                        line=line_num,
-                        context=line.strip(),
-                    )
-                )
+                results.append((best_fact, number_val))
 
         return results
 
@@ -366,126 +595,12 @@ class DocScanner:
 
         return False
 
-    @classmethod
-    def _keyword_distance(
-        cls,
-        kw_words: list[str],
-        word_positions: list[re.Match[str]],
-        num_idx: int,
-    ) -> tuple[int, int] | None:
-        """Return (distance, before_flag) from a number to a keyword match.
-
-        Layer 2 of false-positive reduction: when multiple fact keywords
-        appear near a number, the closest one wins.  On ties, keywords
-        appearing *after* the number are preferred (``before_flag=0``)
-        over those before it (``before_flag=1``), because natural English
-        typically writes "63 edges" (number then noun).
-
-        Returns ``None`` if the keyword is not found within the proximity
-        window.
-        """
-        window_size = cls.PROXIMITY_WINDOW
-        start = max(0, num_idx - window_size)
-        end = min(len(word_positions), num_idx + window_size + 1)
-
-        best: tuple[int, int] | None = None
-
-        if len(kw_words) == 1:
-            kw = kw_words[0]
-            for i in range(start, end):
-                w = word_positions[i].group().lower()
-                if re.match(r"[a-zA-Z]", w) and (w == kw or w.startswith(kw)):
-                    dist = abs(i - num_idx)
-                    before_flag = 1 if i < num_idx else 0
-                    score = (dist, before_flag)
-                    if best is None or score < best:
-                        best = score
-            return best
-
-        # Multi-word keyword: find consecutive matches
-        kw_len = len(kw_words)
-        for i in range(start, min(end, len(word_positions) - kw_len + 1)):
-            words_at = [word_positions[i + j].group().lower() for j in range(kw_len)]
-            if all(
-                re.match(r"[a-zA-Z]", words_at[j])
-                and (words_at[j] == kw_words[j] or words_at[j].startswith(kw_words[j]))
-                for j in range(kw_len)
-            ):
-                dist = abs(i - num_idx)
-                before_flag = 1 if i < num_idx else 0
-                score = (dist, before_flag)
-                if best is None or score < best:
-                    best = score
-        return best
-
-    @staticmethod
-    def _word_matches_keyword(word: str, kw: str) -> bool:
-        """Check if a window word matches a keyword (prefix match).
-
-        "languages" matches keyword "language", "tools" matches "tool", etc.
-        """
-        return word == kw or word.startswith(kw)
-
-    @staticmethod
-    def _keyword_in_window(kw_words: list[str], window: list[str]) -> bool:
-        """Check if keyword words appear in the window.
-
-        Single-word keywords use prefix matching (e.g. "language" matches
-        "languages").  Multi-word keywords require consecutive prefix matches.
-        """
-        if len(kw_words) == 1:
-            kw = kw_words[0]
-            return any(
-                w == kw or w.startswith(kw) for w in window
-            )
-
-        # Multi-word keyword: check if words appear consecutively (prefix match)
-        kw_len = len(kw_words)
-        for i in range(len(window) - kw_len + 1):
-            if all(
-                window[i + j] == kw_words[j] or window[i + j].startswith(kw_words[j])
-                for j in range(kw_len)
-            ):
-                return True
-        return False
-
     @staticmethod
     def _mask_false_positives(line: str) -> str:
         """Replace false-positive patterns with spaces to prevent matching."""
         result = line
-
-        # Mask ISO dates: 2026-02-19
-        result = _DATE_ISO_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask month-year dates: Feb 2026
-        result = _DATE_MONTH_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask issue IDs: #123
-        result = _ISSUE_HASH_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask project issue IDs: BDL-021
-        result = _ISSUE_PREFIX_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask hex colors: #FF0000
-        result = _HEX_COLOR_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask hex literals: 0xFF
-        result = _HEX_LITERAL_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask version pinning: >=0.80, ^1.2.3
-        result = _VERSION_PIN_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask line number references: :15, line 42, L42
-        result = _LINE_REF_COLON_RE.sub(lambda m: " " * len(m.group()), result)
-        result = _LINE_REF_WORD_RE.sub(lambda m: " " * len(m.group()), result)
-        result = _LINE_REF_L_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask standalone years: 2026, 2025, etc.
-        result = _YEAR_STANDALONE_RE.sub(lambda m: " " * len(m.group()), result)
-
-        # Mask numeric ranges: 0-100, 1-10 (Layer 2 — not factual counts)
-        result = _RANGE_RE.sub(lambda m: " " * len(m.group()), result)
-
+        for pattern in _MASK_PATTERNS:
+            result = pattern.sub(_blank, result)
         return result
 
     def resolve_paths(
@@ -572,27 +687,15 @@ class DocScanner:
 
         logger = logging.getLogger(__name__)
 
-        cfg = config_path or (project_root / ".beadloom" / "config.yml")
-        if not cfg.is_file():
-            return []
-
-        try:
-            import yaml
+        from beadloom.infrastructure.project_config import load_config_file
 
-            content = cfg.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
-        except Exception:
+        cfg = config_path or (project_root / ".beadloom" / "config.yml")
+        config = load_config_file(cfg)
+        if config.error is not None:
             logger.warning("Failed to read %s for exclude paths", cfg)
             return []
 
-        if not isinstance(data, dict):
-            return []
-
-        audit_section = data.get("docs_audit")
-        if not isinstance(audit_section, dict):
-            return []
-
-        raw = audit_section.get("exclude_paths")
+        raw = config.section("docs_audit").get("exclude_paths")
         if not isinstance(raw, list):
             return []
 
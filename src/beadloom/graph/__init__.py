@@ -27,8 +27,10 @@ from beadloom.graph.linter import (
     lint,
 )
 from beadloom.graph.loader import (
+    DeclaredGraph,
     GraphLoadResult,
     ParsedFile,
+    collect_graph,
     get_node_tags,
     load_graph,
     parse_graph_file,
@@ -54,11 +56,13 @@ from beadloom.graph.snapshot import (
     SnapshotInfo,
     compare_snapshots,
     list_snapshots,
+    load_snapshot,
     save_snapshot,
 )
 
 __all__ = [
     "CardinalityRule",
+    "DeclaredGraph",
     "DenyRule",
     "EdgeChange",
     "GraphDiff",
@@ -74,6 +78,7 @@ __all__ = [
     "SnapshotDiff",
     "SnapshotInfo",
     "Violation",
+    "collect_graph",
     "compare_snapshots",
     "compute_diff",
     "compute_diff_from_snapshot",
@@ -94,6 +99,7 @@ __all__ = [
     "load_graph",
     "load_rules",
     "load_rules_with_tags",
+    "load_snapshot",
     "parse_graph_file",
     "render_diff",
     "resolve_import_to_node",
@@ -243,6 +243,68 @@ def map_to_c4(
     return c4_nodes, relationships
 
 
+class C4Model:
+    """A C4 model indexed for repeated filtering (one build, many diagrams).
+
+    Holds the output of :func:`map_to_c4` plus a boundary -> children index and
+    a per-source relationship index, so :meth:`filter` answers the same
+    queries as :func:`filter_c4_nodes` without rescanning the whole model: a
+    component scope costs time proportional to the scope's children and their
+    relationships, and the context/container views are computed once.
+    """
+
+    def __init__(
+        self, nodes: list[C4Node], relationships: list[C4Relationship]
+    ) -> None:
+        self.nodes = nodes
+        self.relationships = relationships
+        self._ids = {n.ref_id for n in nodes}
+        self._children: dict[str, list[C4Node]] = {}
+        for node in nodes:
+            if node.boundary is not None:
+                self._children.setdefault(node.boundary, []).append(node)
+        # Relationships by source, tagged with their position so a filtered
+        # subset keeps the order of the full list.
+        self._rels_from: dict[str, list[tuple[int, C4Relationship]]] = {}
+        for index, rel in enumerate(relationships):
+            self._rels_from.setdefault(rel.src, []).append((index, rel))
+        self._views: dict[str, tuple[list[C4Node], list[C4Relationship]]] = {}
+
+    def filter(
+        self, *, level: str = "container", scope: str | None = None
+    ) -> tuple[list[C4Node], list[C4Relationship]]:
+        """Same contract (and ``ValueError`` cases) as :func:`filter_c4_nodes`."""
+        if level == "component" and not scope:
+            msg = "--level=component requires --scope=<ref-id>"
+            raise ValueError(msg)
+        if level in ("context", "container"):
+            view = self._views.get(level)
+            if view is None:
+                view = filter_c4_nodes(self.nodes, self.relationships, level=level)
+                self._views[level] = view
+            return list(view[0]), list(view[1])
+
+        assert scope is not None  # guaranteed by the check above
+        if scope not in self._ids:
+            msg = f"--scope ref_id '{scope}' not found in graph"
+            raise ValueError(msg)
+        kept = list(self._children.get(scope, ()))
+        kept_ids = {n.ref_id for n in kept}
+        tagged = sorted(
+            (index, rel)
+            for node in kept
+            for index, rel in self._rels_from.get(node.ref_id, ())
+            if rel.dst in kept_ids
+        )
+        return kept, [rel for _, rel in tagged]
+
+
+def build_c4_model(conn: sqlite3.Connection) -> C4Model:
+    """Map the graph to C4 once and index it (see :class:`C4Model`)."""
+    nodes, relationships = map_to_c4(conn)
+    return C4Model(nodes, relationships)
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -6,11 +6,11 @@
 from __future__ import annotations
 
 import json
-import subprocess
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING
 
-import yaml
+from beadloom.infrastructure.git_objects import GitObjectReader, decode_git_text
+from beadloom.infrastructure.yaml_cache import load_yaml_text
 
 if TYPE_CHECKING:
     import sqlite3
@@ -59,34 +59,6 @@ class GraphDiff:
         return bool(self.nodes or self.edges)
 
 
-def _validate_git_ref(project_root: Path, ref: str) -> bool:
-    """Check if the git ref is valid using ``git rev-parse --verify``."""
-    result = subprocess.run(  # noqa: S603
-        ["git", "rev-parse", "--verify", ref],  # noqa: S607
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode == 0
-
-
-def _read_yaml_at_ref(project_root: Path, rel_path: str, ref: str) -> str | None:
-    """Read a file's content at a given git ref.
-
-    Returns the file content as a string, or ``None`` if the file didn't exist
-    at that ref.
-    """
-    result = subprocess.run(  # noqa: S603
-        ["git", "show", f"{ref}:{rel_path}"],  # noqa: S607
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return None
-    return result.stdout
-
-
 def _parse_yaml_content(
     content: str,
 ) -> tuple[dict[str, dict[str, object]], set[tuple[str, str, str]]]:
@@ -97,7 +69,7 @@ def _parse_yaml_content(
         - nodes_dict maps ref_id -> {"kind": ..., "summary": ..., "source": ..., "tags": ...}
         - edges_set contains (src, dst, kind) tuples
     """
-    data = yaml.safe_load(content)
+    data = load_yaml_text(content)
     if data is None:
         return {}, set()
 
@@ -125,26 +97,21 @@ def _parse_yaml_content(
     return nodes_dict, edges_set
 
 
-def _list_graph_files_at_ref(project_root: Path, ref: str) -> list[str]:
-    """List graph YAML files that existed at the given git ref.
+def _read_graph_files_at_ref(
+    reader: GitObjectReader, ref: str
+) -> dict[str, str | None]:
+    """Read every graph YAML file that existed at *ref*, in one batch.
 
-    Uses ``git ls-tree -r --name-only <ref> .beadloom/_graph/`` to get the list.
-    Returns relative paths from the project root.
+    Lists ``.beadloom/_graph/`` at *ref* (the ``git ls-tree -r`` equivalent)
+    and fetches all ``*.yml`` blobs through the shared ``cat-file`` process.
+    Returns ``{rel_path: content | None}`` keyed by project-relative path.
     """
-    result = subprocess.run(  # noqa: S603
-        ["git", "ls-tree", "-r", "--name-only", ref, ".beadloom/_graph/"],  # noqa: S607
-        cwd=project_root,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return []
-    files = [
-        line.strip()
-        for line in result.stdout.strip().split("\n")
-        if line.strip() and line.strip().endswith(".yml")
-    ]
-    return files
+    files = [p for p in reader.list_tree(ref, ".beadloom/_graph") if p.endswith(".yml")]
+    blobs = reader.read_blobs(ref, files)
+    return {
+        rel_path: decode_git_text(data) if data is not None else None
+        for rel_path, data in blobs.items()
+    }
 
 
 def compute_diff(project_root: Path, since: str = "HEAD") -> GraphDiff:
@@ -160,9 +127,11 @@ def compute_diff(project_root: Path, since: str = "HEAD") -> GraphDiff:
     Raises:
         ValueError: If the git ref is invalid.
     """
-    if not _validate_git_ref(project_root, since):
-        msg = f"Invalid git ref: '{since}'"
-        raise ValueError(msg)
+    with GitObjectReader(project_root) as reader:
+        if reader.resolve(since) is None:
+            msg = f"Invalid git ref: '{since}'"
+            raise ValueError(msg)
+        prev_contents = _read_graph_files_at_ref(reader, since)
 
     graph_dir = project_root / ".beadloom" / "_graph"
 
@@ -184,9 +153,7 @@ def compute_diff(project_root: Path, since: str = "HEAD") -> GraphDiff:
     prev_nodes: dict[str, dict[str, object]] = {}
     prev_edges: set[tuple[str, str, str]] = set()
 
-    prev_files = _list_graph_files_at_ref(project_root, since)
-    for rel_path in prev_files:
-        prev_content = _read_yaml_at_ref(project_root, rel_path, since)
+    for prev_content in prev_contents.values():
         if prev_content is not None:
             nodes, edges = _parse_yaml_content(prev_content)
             prev_nodes.update(nodes)
@@ -300,9 +267,9 @@ def compute_diff_from_snapshot(
     Raises:
         ValueError: If the snapshot ID is not found.
     """
-    from beadloom.graph.snapshot import _load_snapshot_data
+    from beadloom.graph.snapshot import load_snapshot
 
-    snap_nodes, snap_edges = _load_snapshot_data(conn, snapshot_id)
+    snap_nodes, snap_edges = load_snapshot(conn, snapshot_id)
 
     # Build snapshot lookup: ref_id -> node dict
     snap_nodes_map: dict[str, dict[str, object]] = {}
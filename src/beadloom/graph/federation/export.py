@@ -17,6 +17,8 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.project_config import load_project_config
+
 if TYPE_CHECKING:
     import sqlite3
 
@@ -186,26 +188,12 @@ def resolve_landscape(project_root: Path) -> str:
 
 def _landscape_from_config(project_root: Path) -> str | None:
     """Read the ``landscape:`` key from ``.beadloom/config.yml`` if present."""
-    config_path = project_root / ".beadloom" / "config.yml"
-    if not config_path.exists():
-        return None
-    import yaml
-
-    config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-    landscape = config.get("landscape")
-    return landscape if isinstance(landscape, str) and landscape else None
+    return load_project_config(project_root).landscape
 
 
 def _repo_from_config(project_root: Path) -> str | None:
     """Read the ``repo:`` key from ``.beadloom/config.yml`` if present."""
-    config_path = project_root / ".beadloom" / "config.yml"
-    if not config_path.exists():
-        return None
-    import yaml
-
-    config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-    repo = config.get("repo")
-    return repo if isinstance(repo, str) and repo else None
+    return load_project_config(project_root).repo
 
 
 def _repo_from_git_remote(project_root: Path) -> str | None:
@@ -0,0 +1,6 @@
+; Top-level `#include` directives (C and C++). The path keeps its quotes
+; or angle brackets.
+
+(translation_unit
+  (preproc_include
+    path: (_) @path) @import)
@@ -0,0 +1,14 @@
+; Go import specs, single or grouped. The line comes from the spec.
+
+(source_file
+  (import_declaration
+    (import_spec
+      path: (interpreted_string_literal
+        . (interpreted_string_literal_content) @path)) @import))
+
+(source_file
+  (import_declaration
+    (import_spec_list
+      (import_spec
+        path: (interpreted_string_literal
+          . (interpreted_string_literal_content) @path)) @import)))
@@ -0,0 +1,6 @@
+; Top-level Java imports, including static and wildcard imports.
+
+(program
+  (import_declaration
+    [(scoped_identifier) (identifier)] @path
+    (asterisk)? @wildcard) @import)
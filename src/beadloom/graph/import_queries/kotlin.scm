@@ -0,0 +1,5 @@
+; Top-level Kotlin imports; an alias and a trailing `.*` are not captured.
+
+(source_file
+  (import
+    (qualified_identifier) @path) @import)
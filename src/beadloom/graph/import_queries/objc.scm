@@ -0,0 +1,13 @@
+; Top-level Objective-C `#import`/`#include` and `@import` directives.
+; Angle-bracket imports and modules are checked against system frameworks.
+
+(translation_unit
+  (preproc_include
+    (system_lib_string) @system) @import)
+
+(translation_unit
+  (preproc_include
+    (string_literal . (string_content) @path)) @import)
+
+(translation_unit
+  (module_import) @module @import)
@@ -0,0 +1,10 @@
+; Top-level Python imports. Relative `from . import x` has a
+; relative_import module_name and never matches.
+
+(module
+  (import_statement
+    (dotted_name) @path) @import)
+
+(module
+  (import_from_statement
+    module_name: (dotted_name) @path) @import)
@@ -0,0 +1,10 @@
+; Top-level `use` declarations; `use x as y` is not matched.
+
+(source_file
+  (use_declaration
+    argument: [
+      (scoped_identifier)
+      (identifier)
+      (scoped_use_list)
+      (use_wildcard)
+    ] @path) @import)
@@ -0,0 +1,5 @@
+; Top-level Swift imports, including `@testable` and kind imports.
+
+(source_file
+  (import_declaration
+    (identifier) @path) @import)
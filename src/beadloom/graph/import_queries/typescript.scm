@@ -0,0 +1,5 @@
+; Top-level ES module imports (TypeScript, TSX, JavaScript, JSX).
+
+(program
+  (import_statement
+    source: (string . (string_fragment) @path)) @import)
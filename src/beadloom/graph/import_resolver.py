@@ -5,22 +5,26 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from tree_sitter import Parser
+from tree_sitter import Query, QueryCursor
 
-from beadloom.context_oracle.code_indexer import get_lang_config
+from beadloom.context_oracle.code_indexer import get_lang_config, parse_source
+from beadloom.infrastructure.project_tree import project_tree
 from beadloom.infrastructure.scan_paths import resolve_scan_paths
+from beadloom.infrastructure.source_files import hash_text_file, skip_reason
 
 if TYPE_CHECKING:
     import sqlite3
-    from pathlib import Path
+    from collections.abc import Callable
 
     from tree_sitter import Node as TSNode
 
+    from beadloom.context_oracle.code_indexer import LangConfig
+
 
 # Rust built-in crates to skip.
 _RUST_BUILTIN_CRATES: frozenset[str] = frozenset({"std", "core", "alloc"})
@@ -35,7 +39,7 @@ _TS_ALIAS_MAP: dict[str, str] = {
 # We skip those.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportInfo:
     """A single import extracted from source code."""
 
@@ -46,263 +50,77 @@ class ImportInfo:
 
 
 # ---------------------------------------------------------------------------
-# Language-specific import extractors
+# Language-specific import queries
 # ---------------------------------------------------------------------------
 
+# Each grammar's top-level imports are matched by one query in
+# ``import_queries/<name>.scm``, compiled once per language. Every match
+# captures the statement as ``@import`` (it gives the line number) plus the
+# node naming the import; a per-language function turns those captures into
+# an import path, or ``None`` to skip the import.
+_QUERY_DIR = Path(__file__).resolve().parent / "import_queries"
 
-def _extract_python_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a Python AST root node."""
-    results: list[ImportInfo] = []
-
-    for child in root.children:
-        if child.type == "import_statement":
-            # `import X` or `import X.Y.Z`
-            for sub in child.children:
-                if sub.type == "dotted_name":
-                    path = sub.text.decode("utf-8") if sub.text else ""
-                    if path:
-                        results.append(
-                            ImportInfo(
-                                file_path=file_path,
-                                line_number=child.start_point.row + 1,
-                                import_path=path,
-                                resolved_ref_id=None,
-                            )
-                        )
-
-        elif child.type == "import_from_statement":
-            # `from X import Y` or `from . import Y` (relative)
-            # Check for relative import: look for relative_import child
-            is_relative = False
-            module_path: str | None = None
-
-            for sub in child.children:
-                if sub.type == "relative_import":
-                    is_relative = True
-                    break
-                if sub.type == "dotted_name" and module_path is None:
-                    # The first dotted_name after 'from' is the module path
-                    module_path = sub.text.decode("utf-8") if sub.text else ""
-
-            if is_relative:
-                continue
-
-            if module_path:
-                results.append(
-                    ImportInfo(
-                        file_path=file_path,
-                        line_number=child.start_point.row + 1,
-                        import_path=module_path,
-                        resolved_ref_id=None,
-                    )
-                )
-
-    return results
-
-
-def _get_ts_import_source(node: TSNode) -> str | None:
-    """Extract the string value from a TypeScript/JS import statement's source."""
-    for child in node.children:
-        if child.type == "string":
-            # The string node contains quote chars and a string_fragment
-            for sub in child.children:
-                if sub.type == "string_fragment":
-                    return sub.text.decode("utf-8") if sub.text else None
-    return None
-
+_Captures = dict[str, list["TSNode"]]
 
-def _extract_ts_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a TypeScript/JavaScript AST root node."""
-    results: list[ImportInfo] = []
 
-    for child in root.children:
-        if child.type != "import_statement":
-            continue
+def _text(node: TSNode) -> str:
+    return node.text.decode("utf-8") if node.text else ""
 
-        source = _get_ts_import_source(child)
-        if source is None:
-            continue
 
-        # Skip relative imports
-        if source.startswith(".") or source.startswith(".."):
-            continue
+def _python_import(captures: _Captures) -> str | None:
+    """``import X`` / ``from X import Y``; relative imports never match."""
+    return _text(captures["path"][0]) or None
 
-        results.append(
-            ImportInfo(
-                file_path=file_path,
-                line_number=child.start_point.row + 1,
-                import_path=source,
-                resolved_ref_id=None,
-            )
-        )
 
-    return results
+def _ts_import(captures: _Captures) -> str | None:
+    """The import source, skipping relative (``./``, ``../``) imports."""
+    source = _text(captures["path"][0])
+    if not source or source.startswith("."):
+        return None
+    return source
 
 
-def _extract_go_import_spec(spec: TSNode, file_path: str) -> ImportInfo | None:
-    """Extract a single Go import spec, returning None for stdlib imports."""
-    # Find the interpreted_string_literal
-    for child in spec.children:
-        if child.type == "interpreted_string_literal":
-            # Get the content (without quotes)
-            for sub in child.children:
-                if sub.type == "interpreted_string_literal_content":
-                    path = sub.text.decode("utf-8") if sub.text else ""
-                    if not path:
-                        return None
-                    # Skip stdlib: no '/' in path
-                    if "/" not in path:
-                        return None
-                    return ImportInfo(
-                        file_path=file_path,
-                        line_number=spec.start_point.row + 1,
-                        import_path=path,
-                        resolved_ref_id=None,
-                    )
-    return None
+def _go_import(captures: _Captures) -> str | None:
+    """The import path; stdlib packages have no '/' in their path (heuristic)."""
+    path = _text(captures["path"][0])
+    return path if "/" in path else None
 
 
-def _extract_go_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a Go AST root node."""
-    results: list[ImportInfo] = []
-
-    for child in root.children:
-        if child.type != "import_declaration":
-            continue
-
-        for sub in child.children:
-            if sub.type == "import_spec":
-                info = _extract_go_import_spec(sub, file_path)
-                if info is not None:
-                    results.append(info)
-            elif sub.type == "import_spec_list":
-                for spec in sub.children:
-                    if spec.type == "import_spec":
-                        info = _extract_go_import_spec(spec, file_path)
-                        if info is not None:
-                            results.append(info)
-
-    return results
-
-
-def _get_rust_use_path(node: TSNode) -> str | None:
-    """Recursively extract the full path from a Rust use_declaration argument node."""
-    if node.type == "scoped_identifier":
-        return node.text.decode("utf-8") if node.text else None
-    if node.type == "identifier":
-        return node.text.decode("utf-8") if node.text else None
-    if node.type == "scoped_use_list":
-        # e.g. `std::{io, fs}` — extract the root prefix
-        return node.text.decode("utf-8") if node.text else None
-    if node.type == "use_wildcard":
-        return node.text.decode("utf-8") if node.text else None
-    return None
-
-
-def _extract_rust_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a Rust AST root node."""
-    results: list[ImportInfo] = []
-
-    for child in root.children:
-        if child.type != "use_declaration":
-            continue
-
-        # Find the argument of `use` (scoped_identifier, scoped_use_list, etc.)
-        for sub in child.children:
-            path = _get_rust_use_path(sub)
-            if path is None:
-                continue
-
-            # Determine the root crate name
-            root_ident = path.split("::")[0] if "::" in path else path
-
-            # Skip built-in crates
-            if root_ident in _RUST_BUILTIN_CRATES:
-                break
-
-            # Skip relative imports (super, self)
-            if root_ident in ("super", "self"):
-                break
-
-            results.append(
-                ImportInfo(
-                    file_path=file_path,
-                    line_number=child.start_point.row + 1,
-                    import_path=path,
-                    resolved_ref_id=None,
-                )
-            )
-            break  # Only one path per use_declaration
-
-    return results
+def _rust_import(captures: _Captures) -> str | None:
+    """The ``use`` path, skipping built-in crates and ``self``/``super``."""
+    path = _text(captures["path"][0])
+    root_ident = path.split("::")[0]
+    if not path or root_ident in _RUST_BUILTIN_CRATES or root_ident in ("super", "self"):
+        return None
+    return path
 
 
 # Kotlin standard-library package prefixes to skip.
 _KOTLIN_STDLIB_PREFIXES: tuple[str, ...] = ("kotlin.", "kotlinx.", "java.", "javax.", "android.")
 
 
-def _extract_kotlin_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a Kotlin AST root node."""
-    results: list[ImportInfo] = []
-    for child in root.children:
-        if child.type == "import":
-            # Find the qualified_identifier (dotted path)
-            for sub in child.children:
-                if sub.type == "qualified_identifier":
-                    path = sub.text.decode("utf-8") if sub.text else ""
-                    if path and not any(path.startswith(p) for p in _KOTLIN_STDLIB_PREFIXES):
-                        results.append(
-                            ImportInfo(
-                                file_path=file_path,
-                                line_number=child.start_point.row + 1,
-                                import_path=path,
-                                resolved_ref_id=None,
-                            )
-                        )
-                    break
-    return results
+def _kotlin_import(captures: _Captures) -> str | None:
+    """The dotted import path, skipping the standard library."""
+    path = _text(captures["path"][0])
+    if not path or path.startswith(_KOTLIN_STDLIB_PREFIXES):
+        return None
+    return path
 
 
 # Java standard-library package prefixes to skip.
 _JAVA_STDLIB_PREFIXES: tuple[str, ...] = ("java.", "javax.", "android.", "sun.", "com.sun.")
 
 
-def _extract_java_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from Java files."""
-    results: list[ImportInfo] = []
-    for child in root.children:
-        if child.type != "import_declaration":
-            continue
-
-        # Find the scoped_identifier or identifier child for the import path.
-        path: str | None = None
-        is_wildcard = False
-        for sub in child.children:
-            if sub.type in ("scoped_identifier", "identifier"):
-                path = sub.text.decode("utf-8") if sub.text else ""
-            elif sub.type == "asterisk":
-                is_wildcard = True
-
-        if not path:
-            continue
-
-        # For wildcard imports, append .* to the path.
-        if is_wildcard:
-            path = f"{path}.*"
-
-        # Skip standard library imports.
-        if any(path.startswith(p) for p in _JAVA_STDLIB_PREFIXES):
-            continue
-
-        results.append(
-            ImportInfo(
-                file_path=file_path,
-                line_number=child.start_point.row + 1,
-                import_path=path,
-                resolved_ref_id=None,
-            )
-        )
-    return results
+def _java_import(captures: _Captures) -> str | None:
+    """The import path (``.*`` appended for wildcards), skipping the standard library."""
+    path = _text(captures["path"][0])
+    if not path:
+        return None
+    if "wildcard" in captures:
+        path = f"{path}.*"
+    if path.startswith(_JAVA_STDLIB_PREFIXES):
+        return None
+    return path
 
 
 # Apple/system frameworks to skip for Swift imports.
@@ -346,37 +164,12 @@ _SWIFT_STDLIB_MODULES: frozenset[str] = frozenset(
 )
 
 
-def _extract_swift_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract imports from a Swift AST root node."""
-    results: list[ImportInfo] = []
-    for child in root.children:
-        if child.type != "import_declaration":
-            continue
-
-        # Find the identifier child (contains the module path).
-        for sub in child.children:
-            if sub.type == "identifier":
-                path = sub.text.decode("utf-8") if sub.text else ""
-                if not path:
-                    break
-
-                # Determine root module name (before first dot).
-                root_module = path.split(".")[0] if "." in path else path
-
-                # Skip Apple/system frameworks.
-                if root_module in _SWIFT_STDLIB_MODULES:
-                    break
-
-                results.append(
-                    ImportInfo(
-                        file_path=file_path,
-                        line_number=child.start_point.row + 1,
-                        import_path=path,
-                        resolved_ref_id=None,
-                    )
-                )
-                break
-    return results
+def _swift_import(captures: _Captures) -> str | None:
+    """The module path, skipping Apple/system frameworks."""
+    path = _text(captures["path"][0])
+    if not path or path.split(".")[0] in _SWIFT_STDLIB_MODULES:
+        return None
+    return path
 
 
 # C/C++ standard and system headers to skip.
@@ -462,34 +255,12 @@ _C_SYSTEM_HEADERS: frozenset[str] = frozenset(
 )
 
 
-def _extract_c_cpp_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract ``#include`` directives from C/C++ files.
-
-    Skips well-known C/C++ standard library headers.
-    """
-    results: list[ImportInfo] = []
-    for node in root.children:
-        if node.type != "preproc_include":
-            continue
-        path_node = node.child_by_field_name("path")
-        if path_node is None:
-            continue
-        raw = path_node.text.decode("utf-8") if path_node.text else ""
-        # Strip surrounding quotes or angle brackets.
-        raw = raw.strip('"<>')
-        if not raw:
-            continue
-        if raw in _C_SYSTEM_HEADERS:
-            continue
-        results.append(
-            ImportInfo(
-                file_path=file_path,
-                line_number=node.start_point.row + 1,
-                import_path=raw,
-                resolved_ref_id=None,
-            )
-        )
-    return results
+def _c_cpp_import(captures: _Captures) -> str | None:
+    """The ``#include`` path without quotes or angle brackets, skipping system headers."""
+    raw = _text(captures["path"][0]).strip('"<>')
+    if not raw or raw in _C_SYSTEM_HEADERS:
+        return None
+    return raw
 
 
 # Apple/system frameworks to skip for Objective-C imports.
@@ -545,74 +316,61 @@ _OBJC_SYSTEM_FRAMEWORKS: frozenset[str] = frozenset(
 )
 
 
-def _extract_objc_imports(root: TSNode, file_path: str) -> list[ImportInfo]:
-    """Extract ``#import`` and ``@import`` directives from Objective-C files.
+def _objc_import(captures: _Captures) -> str | None:
+    """``#import <...>``, ``#import "..."`` or ``@import``, skipping system frameworks."""
+    if "system" in captures:
+        # #import <Framework/Header.h>: checked by its framework.
+        raw = _text(captures["system"][0]).strip("<>")
+        if not raw or raw.split("/")[0] in _OBJC_SYSTEM_FRAMEWORKS:
+            return None
+        return raw
+    if "module" in captures:
+        # @import Module; or @import Module.SubModule; the identifiers are
+        # direct children separated by dots.
+        module = captures["module"][0]
+        parts = [_text(node) for node in module.named_children if node.type == "identifier"]
+        if not parts or parts[0] in _OBJC_SYSTEM_FRAMEWORKS:
+            return None
+        return ".".join(parts)
+    # Quoted #import "MyHeader.h" is always project-local.
+    return _text(captures["path"][0]) or None
+
+
+# Extension -> (query file stem, captures-to-path function).
+_IMPORT_QUERIES: dict[str, tuple[str, Callable[[_Captures], str | None]]] = {
+    ".py": ("python", _python_import),
+    ".ts": ("typescript", _ts_import),
+    ".tsx": ("typescript", _ts_import),
+    ".js": ("typescript", _ts_import),
+    ".jsx": ("typescript", _ts_import),
+    ".go": ("go", _go_import),
+    ".rs": ("rust", _rust_import),
+    ".kt": ("kotlin", _kotlin_import),
+    ".kts": ("kotlin", _kotlin_import),
+    ".java": ("java", _java_import),
+    ".swift": ("swift", _swift_import),
+    ".m": ("objc", _objc_import),
+    ".mm": ("objc", _objc_import),
+    ".c": ("c", _c_cpp_import),
+    ".h": ("c", _c_cpp_import),
+    ".cpp": ("c", _c_cpp_import),
+    ".hpp": ("c", _c_cpp_import),
+}
 
-    Skips well-known Apple/system frameworks.
-    """
-    results: list[ImportInfo] = []
-    for node in root.children:
-        if node.type == "preproc_include":
-            # #import <Framework/Header.h> or #import "Header.h"
-            # In tree-sitter-objc, #import uses preproc_include with:
-            #   - system_lib_string for angle-bracket imports
-            #   - string_literal for quoted imports
-            for child in node.children:
-                if child.type == "system_lib_string":
-                    raw = child.text.decode("utf-8") if child.text else ""
-                    raw = raw.strip("<>")
-                    if not raw:
-                        continue
-                    # Check if it's a system framework (e.g. Foundation/Foundation.h)
-                    base = raw.split("/")[0] if "/" in raw else raw
-                    if base in _OBJC_SYSTEM_FRAMEWORKS:
-                        continue
-                    results.append(
-                        ImportInfo(
-                            file_path=file_path,
-                            line_number=node.start_point.row + 1,
-                            import_path=raw,
-                            resolved_ref_id=None,
-                        )
-                    )
-                elif child.type == "string_literal":
-                    # Quoted import: #import "MyHeader.h"
-                    # Extract text from string_content child
-                    for sub in child.children:
-                        if sub.type == "string_content":
-                            raw = sub.text.decode("utf-8") if sub.text else ""
-                            if raw:
-                                results.append(
-                                    ImportInfo(
-                                        file_path=file_path,
-                                        line_number=node.start_point.row + 1,
-                                        import_path=raw,
-                                        resolved_ref_id=None,
-                                    )
-                                )
-                            break
-
-        elif node.type == "module_import":
-            # @import Module; or @import Module.SubModule;
-            # Identifiers are direct children separated by dots
-            parts: list[str] = []
-            for child in node.children:
-                if child.type == "identifier":
-                    parts.append(child.text.decode("utf-8") if child.text else "")
-            if parts:
-                module_name = ".".join(parts)
-                root_module = parts[0]
-                if root_module not in _OBJC_SYSTEM_FRAMEWORKS:
-                    results.append(
-                        ImportInfo(
-                            file_path=file_path,
-                            line_number=node.start_point.row + 1,
-                            import_path=module_name,
-                            resolved_ref_id=None,
-                        )
-                    )
+# Extension -> (language config, compiled query). A query is bound to the
+# ``Language`` it was compiled for, so a reloaded config recompiles it.
+_QUERY_CACHE: dict[str, tuple[LangConfig, Query]] = {}
 
-    return results
+
+def _import_query(extension: str, stem: str, config: LangConfig) -> Query:
+    """The compiled import query for *extension*, compiled on first use."""
+    cached = _QUERY_CACHE.get(extension)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    source = (_QUERY_DIR / f"{stem}.scm").read_text(encoding="utf-8")
+    query: Query = Query(config.language, source)
+    _QUERY_CACHE[extension] = (config, query)
+    return query
 
 
 # ---------------------------------------------------------------------------
@@ -625,9 +383,13 @@ def extract_imports(file_path: Path) -> list[ImportInfo]:
 
     Detects language by file extension.  Returns empty list if the language
     is not supported or the grammar package is not installed.
+
+    The file is parsed with this thread's pooled parser, and its top-level
+    imports are collected in one pass of the language's compiled query.
     """
+    spec = _IMPORT_QUERIES.get(file_path.suffix)
     config = get_lang_config(file_path.suffix)
-    if config is None:
+    if spec is None or config is None or skip_reason(file_path) is not None:
         return []
 
     try:
@@ -638,34 +400,28 @@ def extract_imports(file_path: Path) -> list[ImportInfo]:
     if not content.strip():
         return []
 
-    content_bytes = content.encode("utf-8")
-    parser = Parser(config.language)
-    tree = parser.parse(content_bytes)
-    root = tree.root_node
+    stem, import_path_of = spec
+    tree = parse_source(file_path, config, content.encode("utf-8"))
+    cursor = QueryCursor(_import_query(file_path.suffix, stem, config))
+    # Every pattern is rooted at the tree's root node, so no match can start
+    # deeper: the cursor never descends into function bodies.
+    cursor.set_max_start_depth(0)
 
     file_str = str(file_path)
-    ext = file_path.suffix
-
-    if ext == ".py":
-        return _extract_python_imports(root, file_str)
-    if ext in (".ts", ".tsx", ".js", ".jsx"):
-        return _extract_ts_imports(root, file_str)
-    if ext == ".go":
-        return _extract_go_imports(root, file_str)
-    if ext == ".rs":
-        return _extract_rust_imports(root, file_str)
-    if ext in (".kt", ".kts"):
-        return _extract_kotlin_imports(root, file_str)
-    if ext == ".java":
-        return _extract_java_imports(root, file_str)
-    if ext == ".swift":
-        return _extract_swift_imports(root, file_str)
-    if ext in (".m", ".mm"):
-        return _extract_objc_imports(root, file_str)
-    if ext in (".c", ".h", ".cpp", ".hpp"):
-        return _extract_c_cpp_imports(root, file_str)
-
-    return []
+    results: list[ImportInfo] = []
+    for _, captures in cursor.matches(tree.root_node):
+        import_path = import_path_of(captures)
+        if import_path is None:
+            continue
+        results.append(
+            ImportInfo(
+                file_path=file_str,
+                line_number=captures["import"][0].start_point.row + 1,
+                import_path=import_path,
+                resolved_ref_id=None,
+            )
+        )
+    return results
 
 
 def _import_path_to_file_paths(
@@ -821,14 +577,14 @@ def _collect_source_files(project_root: Path) -> list[Path]:
     from beadloom.context_oracle.code_indexer import supported_extensions
 
     exts = supported_extensions()
+    tree = project_tree(project_root)
     files: list[Path] = []
 
     for dir_name in resolve_scan_paths(project_root):
         base = project_root / dir_name
         if not base.is_dir():
             continue
-        for ext in exts:
-            files.extend(base.rglob(f"*{ext}"))
+        files.extend(tree.files(base, suffixes=exts))
 
     return sorted(files)
 
@@ -892,11 +648,10 @@ def index_imports(project_root: Path, conn: sqlite3.Connection) -> int:
             continue
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+            file_hash = hash_text_file(file_path)
+        except OSError:
             continue
 
-        file_hash = hashlib.sha256(content.encode()).hexdigest()
         rel_path = str(file_path.relative_to(project_root))
         is_ts = file_path.suffix in ts_extensions
 
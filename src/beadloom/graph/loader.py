@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,7 @@ from beadloom.graph.graphql_surface import (
 )
 from beadloom.graph.sdl import extract_surface
 from beadloom.infrastructure.atomic_io import write_yaml_atomic
+from beadloom.infrastructure.yaml_cache import load_yaml_file
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -96,7 +98,7 @@ class ParsedFile:
     edges: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignEdge:
     """An edge whose src or dst points at another repo (``@repo:ref_id``).
 
@@ -120,6 +122,29 @@ class GraphLoadResult:
     foreign_edges: list[ForeignEdge] = field(default_factory=list)
 
 
+# ``nodes`` row: (ref_id, kind, summary, source, extra_json, lifecycle).
+NodeRow = tuple[str, str, str, str | None, str, str]
+# ``edges`` / ``foreign_edges`` row:
+# (src_ref_id, dst_ref_id, kind, extra_json, lifecycle, contract_key).
+EdgeRow = tuple[str, str, str, str, str, str]
+
+
+@dataclass
+class DeclaredGraph:
+    """The validated rows the graph YAML declares, before they reach SQLite.
+
+    ``nodes`` is keyed by ref_id in load order; ``edges`` holds the local
+    edges whose endpoints both exist (duplicates included, as declared) and
+    ``foreign_edges`` the cross-repo ones. ``result`` carries the diagnostics
+    (its counters stay 0 until the rows are inserted).
+    """
+
+    nodes: dict[str, NodeRow] = field(default_factory=dict)
+    edges: list[EdgeRow] = field(default_factory=list)
+    foreign_edges: list[EdgeRow] = field(default_factory=list)
+    result: GraphLoadResult = field(default_factory=GraphLoadResult)
+
+
 def _format_yaml_error(path: Path, exc: yaml.YAMLError) -> str:
     """Build a clear, line-referenced message from a PyYAML error."""
     mark = getattr(exc, "problem_mark", None)
@@ -141,9 +166,8 @@ def parse_graph_file(path: Path) -> ParsedFile:
     :class:`GraphParseError` naming the file and line -- never swallowed into
     a silent empty result (see BDL-UX-Issues #86).
     """
-    text = path.read_text(encoding="utf-8")
     try:
-        data = yaml.safe_load(text)
+        data = load_yaml_file(path)
     except yaml.YAMLError as exc:
         raise GraphParseError(_format_yaml_error(path, exc)) from exc
 
@@ -184,8 +208,7 @@ def update_node_in_yaml(
     Returns ``True`` if the node was found and updated.
     """
     for yml_path in sorted(graph_dir.glob("*.yml")):
-        text = yml_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(text)
+        data = load_yaml_file(yml_path)
         if data is None:
             continue
         nodes_list: list[dict[str, Any]] = data.get("nodes") or []
@@ -221,27 +244,19 @@ def update_node_in_yaml(
     return False
 
 
-def load_graph(
-    graph_dir: Path,
-    conn: sqlite3.Connection,
-    *,
-    project_root: Path | None = None,
-) -> GraphLoadResult:
-    """Load all ``*.yml`` files from *graph_dir* into SQLite.
+def collect_graph(graph_dir: Path, *, project_root: Path | None = None) -> DeclaredGraph:
+    """Parse and validate every ``*.yml`` in *graph_dir* without touching SQLite.
 
-    Two-pass approach:
-    1. Parse all files and insert nodes (collecting ref_ids).
-    2. Insert edges, skipping those that reference missing nodes.
-
-    *project_root* anchors relative GraphQL ``source_file`` paths declared on
-    ``produces`` contracts (BDL-038 BEAD-03); it defaults to ``graph_dir``'s
-    grandparent (``<root>/.beadloom/_graph`` -> ``<root>``).
-
-    Returns a :class:`GraphLoadResult` with counts and diagnostics.
+    Applies exactly the validation :func:`load_graph` applies (duplicate or
+    missing ref_ids, lifecycle values, dangling and malformed edge endpoints,
+    GraphQL surface folding) and returns the resulting rows in load order,
+    with every diagnostic on :attr:`DeclaredGraph.result`. The delta reload of
+    the incremental reindex diffs these rows against the database.
     """
     if project_root is None:
         project_root = graph_dir.parent.parent
-    result = GraphLoadResult()
+    declared = DeclaredGraph()
+    result = declared.result
 
     # Collect parsed data from all YAML files.
     all_nodes: list[dict[str, Any]] = []
@@ -256,22 +271,17 @@ def load_graph(
         all_nodes.extend(parsed.nodes)
         all_edges.extend(parsed.edges)
 
-    # --- Pass 1: insert nodes ---
-    seen_ref_ids: set[str] = set()
+    # --- Pass 1: nodes ---
     for node in all_nodes:
         ref_id: str = node.get("ref_id", "")
         if not ref_id:
             result.errors.append("Node missing ref_id, skipped")
             continue
 
-        if ref_id in seen_ref_ids:
+        if ref_id in declared.nodes:
             result.errors.append(f"Duplicate ref_id '{ref_id}', skipped")
             continue
-        seen_ref_ids.add(ref_id)
 
-        kind: str = node.get("kind", "")
-        summary: str = node.get("summary", "")
-        source: str | None = node.get("source")
         lifecycle = _normalize_lifecycle(node.get("lifecycle"), f"Node '{ref_id}'", result)
 
         # Everything not in direct/skip fields goes to ``extra``.
@@ -280,34 +290,88 @@ def load_graph(
             if k not in _NODE_DIRECT_FIELDS and k not in _NODE_SKIP_FIELDS:
                 extra[k] = v
 
+        declared.nodes[ref_id] = (
+            _intern(ref_id),
+            _intern(node.get("kind", "")),
+            node.get("summary", ""),
+            node.get("source"),
+            json.dumps(extra, ensure_ascii=False),
+            lifecycle,
+        )
+
+    # --- Pass 2: edges ---
+    for edge in all_edges:
+        _collect_edge(edge, declared, project_root)
+
+    return declared
+
+
+def load_graph(
+    graph_dir: Path,
+    conn: sqlite3.Connection,
+    *,
+    project_root: Path | None = None,
+) -> GraphLoadResult:
+    """Load all ``*.yml`` files from *graph_dir* into SQLite.
+
+    Two-pass approach:
+    1. Parse all files and insert nodes (collecting ref_ids).
+    2. Insert edges, skipping those that reference missing nodes.
+
+    *project_root* anchors relative GraphQL ``source_file`` paths declared on
+    ``produces`` contracts (BDL-038 BEAD-03); it defaults to ``graph_dir``'s
+    grandparent (``<root>/.beadloom/_graph`` -> ``<root>``).
+
+    Returns a :class:`GraphLoadResult` with counts and diagnostics.
+    """
+    declared = collect_graph(graph_dir, project_root=project_root)
+    result = declared.result
+
+    # --- Pass 1: insert nodes ---
+    for row in declared.nodes.values():
         try:
             conn.execute(
                 "INSERT INTO nodes (ref_id, kind, summary, source, extra, lifecycle) "
                 "VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    ref_id,
-                    kind,
-                    summary,
-                    source,
-                    json.dumps(extra, ensure_ascii=False),
-                    lifecycle,
-                ),
+                row,
             )
             result.nodes_loaded += 1
         except sqlite3.IntegrityError as exc:
-            result.errors.append(f"Failed to insert node '{ref_id}': {exc}")
+            result.errors.append(f"Failed to insert node '{row[0]}': {exc}")
 
     conn.commit()
 
     # --- Pass 2: insert edges ---
-    for edge in all_edges:
-        _process_edge(edge, conn, seen_ref_ids, result, project_root)
+    # A foreign endpoint makes an edge cross-repo: it is persisted into the
+    # ``foreign_edges`` table (resolves at the hub, surfaced by ``export``),
+    # never into ``edges`` (the FK cannot bind a @repo: endpoint).
+    for row in declared.foreign_edges:
+        _insert_foreign_edge(conn, *row)
+    for row in declared.edges:
+        try:
+            conn.execute(
+                "INSERT INTO edges (src_ref_id, dst_ref_id, kind, extra, lifecycle, "
+                "contract_key) VALUES (?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            result.edges_loaded += 1
+        except sqlite3.IntegrityError as exc:
+            result.warnings.append(f"Failed to insert edge '{row[0]}→{row[1]}': {exc}")
 
     conn.commit()
 
     return result
 
 
+def _intern(value: Any) -> Any:
+    """*value* interned when it is a string.
+
+    Edge rows then share their endpoint and kind strings with the node rows
+    instead of holding one copy per YAML occurrence.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _classify_endpoint(raw: str, result: GraphLoadResult) -> bool | None:
     """Classify one edge endpoint ref.
 
@@ -323,17 +387,16 @@ def _classify_endpoint(raw: str, result: GraphLoadResult) -> bool | None:
     return ref.is_foreign
 
 
-def _process_edge(
+def _collect_edge(
     edge: dict[str, Any],
-    conn: sqlite3.Connection,
-    seen_ref_ids: set[str],
-    result: GraphLoadResult,
+    declared: DeclaredGraph,
     project_root: Path,
 ) -> None:
-    """Classify and load a single edge (local insert vs foreign vs malformed)."""
-    src: str = edge.get("src", "")
-    dst: str = edge.get("dst", "")
-    edge_kind: str = edge.get("kind", "")
+    """Classify and collect a single edge (local vs foreign vs malformed)."""
+    result = declared.result
+    src: str = _intern(edge.get("src", ""))
+    dst: str = _intern(edge.get("dst", ""))
+    edge_kind: str = _intern(edge.get("kind", ""))
 
     src_foreign = _classify_endpoint(src, result)
     dst_foreign = _classify_endpoint(dst, result)
@@ -345,41 +408,31 @@ def _process_edge(
     )
     edge_extra = _edge_extra(edge)
     _fold_graphql_surface(edge_extra, edge_kind, project_root, src, dst, result)
-    contract_key = _contract_key(edge_extra)
+    row = (
+        src,
+        dst,
+        edge_kind,
+        json.dumps(edge_extra, ensure_ascii=False),
+        lifecycle,
+        _contract_key(edge_extra),
+    )
 
-    # A foreign endpoint makes this a cross-repo edge: persist it into the
-    # ``foreign_edges`` table (resolves at the hub, surfaced by ``export``).
-    # It is NOT inserted into ``edges`` (the FK cannot bind a @repo: endpoint)
+    # A foreign endpoint makes this a cross-repo edge. It is NOT a local edge
     # nor flagged as a dangling node.
     if src_foreign or dst_foreign:
         result.foreign_edges.append(ForeignEdge(src=src, dst=dst, kind=edge_kind))
-        _insert_foreign_edge(conn, src, dst, edge_kind, edge_extra, lifecycle, contract_key)
+        declared.foreign_edges.append(row)
         return
 
     # Both endpoints local — original behavior, unchanged.
-    if src not in seen_ref_ids:
+    if src not in declared.nodes:
         result.warnings.append(f"Edge src '{src}' not found in graph, skipped")
         return
-    if dst not in seen_ref_ids:
+    if dst not in declared.nodes:
         result.warnings.append(f"Edge dst '{dst}' not found in graph, skipped")
         return
 
-    try:
-        conn.execute(
-            "INSERT INTO edges (src_ref_id, dst_ref_id, kind, extra, lifecycle, contract_key) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                src,
-                dst,
-                edge_kind,
-                json.dumps(edge_extra, ensure_ascii=False),
-                lifecycle,
-                contract_key,
-            ),
-        )
-        result.edges_loaded += 1
-    except sqlite3.IntegrityError as exc:
-        result.warnings.append(f"Failed to insert edge '{src}→{dst}': {exc}")
+    declared.edges.append(row)
 
 
 def _edge_extra(edge: dict[str, Any]) -> dict[str, Any]:
@@ -456,7 +509,7 @@ def _insert_foreign_edge(
     src: str,
     dst: str,
     kind: str,
-    extra: dict[str, Any],
+    extra: str,
     lifecycle: str,
     contract_key: str,
 ) -> None:
@@ -465,5 +518,5 @@ def _insert_foreign_edge(
         "INSERT OR REPLACE INTO foreign_edges "
         "(src_ref_id, dst_ref_id, kind, extra, lifecycle, contract_key) "
         "VALUES (?, ?, ?, ?, ?, ?)",
-        (src, dst, kind, json.dumps(extra, ensure_ascii=False), lifecycle, contract_key),
+        (src, dst, kind, extra, lifecycle, contract_key),
     )
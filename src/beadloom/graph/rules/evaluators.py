@@ -28,6 +28,8 @@ from beadloom.graph.rules.types import (
     UnregisteredFeatureCandidateRule,
     Violation,
 )
+from beadloom.infrastructure.path_stats import file_stats_under, path_stats, prefix_bounds
+from beadloom.infrastructure.project_tree import project_tree
 
 if TYPE_CHECKING:
     import sqlite3
@@ -597,9 +599,9 @@ def evaluate_cardinality_rules(
 
     For each node matching a rule's ``for_matcher``, counts:
     - **symbols**: rows in ``code_symbols`` whose ``file_path`` starts with the
-      node's ``source`` prefix.
+      node's ``source`` prefix, read from the ``path_stats`` aggregate.
     - **files**: rows in ``file_index`` whose ``path`` starts with the node's
-      ``source`` prefix.
+      ``source`` prefix (an indexed range count).
     - **doc coverage**: ratio of ``sync_state`` rows with ``status = 'ok'``
       to total ``sync_state`` rows for the node's ``ref_id``.
 
@@ -644,11 +646,7 @@ def evaluate_cardinality_rules(
             # --- max_symbols check ---
             if rule.max_symbols is not None and node_source is not None:
                 prefix = node_source.rstrip("/") + "/"
-                row = conn.execute(
-                    "SELECT COUNT(*) FROM code_symbols WHERE file_path LIKE ?",
-                    (prefix + "%",),
-                ).fetchone()
-                symbol_count = int(row[0]) if row is not None else 0
+                symbol_count = path_stats(conn, prefix).symbol_count
 
                 if symbol_count > rule.max_symbols:
                     violations.append(
@@ -673,8 +671,8 @@ def evaluate_cardinality_rules(
             if rule.max_files is not None and node_source is not None:
                 prefix = node_source.rstrip("/") + "/"
                 row = conn.execute(
-                    "SELECT COUNT(*) FROM file_index WHERE path LIKE ?",
-                    (prefix + "%",),
+                    "SELECT COUNT(*) FROM file_index WHERE path >= ? AND path < ?",
+                    prefix_bounds(prefix),
                 ).fetchone()
                 file_count = int(row[0]) if row is not None else 0
 
@@ -764,8 +762,8 @@ def _candidate_files_for_domain(
     **no** ``feature`` key. The mapped value is the file's indexed-symbol count.
     """
     rows = conn.execute(
-        "SELECT file_path, annotations FROM code_symbols WHERE file_path LIKE ?",
-        (source_prefix + "%",),
+        "SELECT file_path, annotations FROM code_symbols WHERE file_path >= ? AND file_path < ?",
+        prefix_bounds(source_prefix),
     ).fetchall()
 
     counts: dict[str, int] = {}
@@ -909,23 +907,13 @@ def _module_coverage_state(
     """Group indexed symbols under *source_root* into per-module coverage state.
 
     Returns ``{file_path: (symbol_count, has_feature_or_component_annotation)}``
-    for every module with at least one indexed symbol.
+    for every module with at least one indexed symbol, read from the per-file
+    rows of the ``path_stats`` aggregate.
     """
-    rows = conn.execute(
-        "SELECT file_path, annotations FROM code_symbols WHERE file_path LIKE ?",
-        (source_root + "%",),
-    ).fetchall()
-
-    counts: dict[str, int] = {}
-    annotated: dict[str, bool] = {}
-    for row in rows:
-        file_path = str(row[0])
-        counts[file_path] = counts.get(file_path, 0) + 1
-        annotations = _file_annotations(row[1])
-        if annotations is not None and ("feature" in annotations or "component" in annotations):
-            annotated[file_path] = True
-
-    return {path: (count, annotated.get(path, False)) for path, count in counts.items()}
+    return {
+        path: (stats.symbol_count, stats.annotated_files > 0)
+        for path, stats in file_stats_under(conn, source_root).items()
+    }
 
 
 def _disk_modules(project_root: Path, source_root: str) -> list[str]:
@@ -936,17 +924,17 @@ def _disk_modules(project_root: Path, source_root: str) -> list[str]:
     deterministically. This is the candidate enumeration that closes the
     zero-symbol false-negative: a real module with no indexed ``def``/``class``
     symbol produces no ``code_symbols`` row, yet it is still a real module and
-    must be a coverage candidate (BDL-051 S3a / BEAD-17).
+    must be a coverage candidate (BDL-051 S3a / BEAD-17). Directories the
+    project tree prunes (``.gitignore``, ``exclude``, ``node_modules``, ...)
+    hold no candidates.
     """
-    base = (project_root / source_root).resolve()
+    base = project_root / source_root
     if not base.is_dir():
         return []
     rel_root = source_root.rstrip("/")
     modules: list[str] = []
-    for path in base.rglob("*.py"):
-        if not path.is_file():
-            continue
-        rel = path.resolve().relative_to(base).as_posix()
+    for path in project_tree(project_root).files(base, suffixes={".py"}):
+        rel = path.relative_to(base).as_posix()
         modules.append(f"{rel_root}/{rel}")
     return sorted(modules)
 
@@ -11,8 +11,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import yaml
-
 from beadloom.graph.rules.types import (
     SUPPORTED_SCHEMA_VERSIONS,
     VALID_EDGE_KINDS,
@@ -31,6 +29,7 @@ from beadloom.graph.rules.types import (
     Rule,
     UnregisteredFeatureCandidateRule,
 )
+from beadloom.infrastructure.yaml_cache import load_yaml_file
 
 if TYPE_CHECKING:
     import sqlite3
@@ -528,8 +527,7 @@ def load_rules(rules_path: Path) -> list[Rule]:
 
     Raises ``ValueError`` on schema errors (missing version, invalid kinds, etc.).
     """
-    with rules_path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    data = load_yaml_file(rules_path)
 
     if not isinstance(data, dict):
         msg = "rules.yml must be a YAML mapping"
@@ -695,8 +693,7 @@ def load_rules_with_tags(
     Returns a ``(rules, tag_assignments)`` tuple.  *tag_assignments* is
     an empty dict when no ``tags:`` block is present.
     """
-    with rules_path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    data = load_yaml_file(rules_path)
 
     if not isinstance(data, dict):
         msg = "rules.yml must be a YAML mapping"
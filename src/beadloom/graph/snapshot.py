@@ -1,16 +1,42 @@
-"""Architecture snapshot storage: save, list, and compare graph states."""
+"""Architecture snapshot storage: save, list, and compare graph states.
+
+Snapshots are delta-encoded. Every node, and every group of edges sharing one
+``(src, dst, kind)`` identity, is a *record*: its canonical JSON is hashed
+(SHA-256) and stored zlib-compressed once in ``snapshot_records``, however many
+snapshots contain it. A snapshot row only lists the record hashes added (+1) and
+removed (-1) relative to its predecessor (``base_id``) in ``snapshot_deltas``.
+Comparing two snapshots sums the deltas between them and decompresses only the
+records that actually differ; a full load replays the chain. Every
+:data:`_MAX_CHAIN` snapshots a self-contained keyframe (no predecessor) bounds
+the replay length.
+
+Rows written before delta storage (``storage='json'``) keep their full
+``nodes_json`` / ``edges_json`` payload and are still read and compared.
+"""
 
 # beadloom:domain=graph
 # beadloom:feature=snapshot
 
 from __future__ import annotations
 
+import hashlib
 import json
+import zlib
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     import sqlite3
+    from collections.abc import Iterable
+
+# Longest predecessor chain before the next snapshot is stored as a keyframe.
+_MAX_CHAIN = 64
+
+# SQLite bound-parameter budget per ``IN (...)`` query.
+_SQL_CHUNK = 500
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -49,17 +75,128 @@ class SnapshotDiff:
         )
 
 
+@dataclass(frozen=True)
+class _Record:
+    """One content-addressed snapshot record (a node or an edge group)."""
+
+    digest: str
+    entity: str
+    key: str
+    payload: str
+
+
+def _make_record(entity: str, key: str, value: Any) -> _Record:
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(f"{entity}\0{payload}".encode()).hexdigest()
+    return _Record(digest=digest, entity=entity, key=key, payload=payload)
+
+
+def _edge_key(e: dict[str, str]) -> tuple[str, str, str]:
+    return (e["src_ref_id"], e["dst_ref_id"], e["kind"])
+
+
+def _records_from_lists(
+    nodes: list[dict[str, str]], edges: list[dict[str, str]]
+) -> dict[str, _Record]:
+    """Build the record set (by hash) of a full node/edge listing."""
+    records = [_make_record("node", n["ref_id"], n) for n in nodes]
+    groups: dict[tuple[str, str, str], list[dict[str, str]]] = defaultdict(list)
+    for e in edges:
+        groups[_edge_key(e)].append(e)
+    records.extend(
+        _make_record("edge", json.dumps(list(key), ensure_ascii=False), group)
+        for key, group in groups.items()
+    )
+    return {r.digest: r for r in records}
+
+
+def _chunks(items: list[_T]) -> Iterable[list[_T]]:
+    for i in range(0, len(items), _SQL_CHUNK):
+        yield items[i : i + _SQL_CHUNK]
+
+
+def _snapshot_row(conn: sqlite3.Connection, snapshot_id: int) -> sqlite3.Row:
+    row: sqlite3.Row | None = conn.execute(
+        "SELECT id, base_id, storage, nodes_json, edges_json FROM graph_snapshots WHERE id = ?",
+        (snapshot_id,),
+    ).fetchone()
+    if row is None:
+        msg = f"Snapshot {snapshot_id} not found"
+        raise ValueError(msg)
+    return row
+
+
+def _chain(conn: sqlite3.Connection, snapshot_id: int) -> list[int]:
+    """Return the ids of *snapshot_id*'s delta chain, newest first."""
+    rows = conn.execute(
+        "WITH RECURSIVE chain(id, base_id) AS ("
+        "  SELECT id, base_id FROM graph_snapshots WHERE id = ?"
+        "  UNION ALL"
+        "  SELECT g.id, g.base_id FROM graph_snapshots g JOIN chain c ON g.id = c.base_id"
+        ") SELECT id FROM chain",
+        (snapshot_id,),
+    ).fetchall()
+    return [int(r[0]) for r in rows]
+
+
+def _net_ops(conn: sqlite3.Connection, snapshot_ids: Iterable[int]) -> dict[str, int]:
+    """Sum the delta ops of *snapshot_ids* per record hash (zero sums dropped)."""
+    ids = list(snapshot_ids)
+    net: dict[str, int] = defaultdict(int)
+    for chunk in _chunks(ids):
+        placeholders = ",".join("?" * len(chunk))
+        for row in conn.execute(
+            f"SELECT record_hash, op FROM snapshot_deltas WHERE snapshot_id IN ({placeholders})",  # noqa: S608
+            chunk,
+        ):
+            net[row[0]] += int(row[1])
+    return {h: n for h, n in net.items() if n}
+
+
+def _member_hashes(conn: sqlite3.Connection, snapshot_id: int) -> set[str]:
+    """Record hashes making up a delta-stored snapshot."""
+    return {h for h, n in _net_ops(conn, _chain(conn, snapshot_id)).items() if n > 0}
+
+
+def _fetch_records(conn: sqlite3.Connection, hashes: Iterable[str]) -> dict[str, _Record]:
+    """Load and decompress the records for *hashes*."""
+    records: dict[str, _Record] = {}
+    for chunk in _chunks(sorted(hashes)):
+        placeholders = ",".join("?" * len(chunk))
+        sql = f"SELECT hash, entity, record_key, data FROM snapshot_records WHERE hash IN ({placeholders})"  # noqa: E501, S608
+        for row in conn.execute(sql, chunk):
+            records[row[0]] = _Record(
+                digest=row[0],
+                entity=row[1],
+                key=row[2],
+                payload=zlib.decompress(row[3]).decode("utf-8"),
+            )
+    return records
+
+
+def _latest_delta_base(conn: sqlite3.Connection) -> int | None:
+    """Predecessor for the next snapshot, or None when a keyframe is due."""
+    row = conn.execute(
+        "SELECT max(id) FROM graph_snapshots WHERE storage = 'delta'"
+    ).fetchone()
+    if row is None or row[0] is None:
+        return None
+    base_id = int(row[0])
+    if len(_chain(conn, base_id)) >= _MAX_CHAIN:
+        return None
+    return base_id
+
+
 def save_snapshot(conn: sqlite3.Connection, label: str | None = None) -> int:
     """Save current graph state as a snapshot.
 
-    Queries the ``nodes``, ``edges``, and ``code_symbols`` tables,
-    serializes node/edge data to JSON, and stores it in
-    ``graph_snapshots``.
+    Queries the ``nodes``, ``edges``, and ``code_symbols`` tables, stores any
+    node/edge record not seen before in ``snapshot_records`` (compressed,
+    content-addressed) and records the delta against the previous snapshot.
 
     Returns:
         The snapshot_id of the newly created snapshot.
     """
-    # Serialize nodes
     node_rows = conn.execute(
         "SELECT ref_id, kind, summary, source, extra FROM nodes ORDER BY ref_id"
     ).fetchall()
@@ -74,7 +211,6 @@ def save_snapshot(conn: sqlite3.Connection, label: str | None = None) -> int:
         for row in node_rows
     ]
 
-    # Serialize edges
     edge_rows = conn.execute(
         "SELECT src_ref_id, dst_ref_id, kind, extra FROM edges "
         "ORDER BY src_ref_id, dst_ref_id, kind"
@@ -89,68 +225,133 @@ def save_snapshot(conn: sqlite3.Connection, label: str | None = None) -> int:
         for row in edge_rows
     ]
 
-    # Count symbols
     symbols_count: int = conn.execute("SELECT count(*) FROM code_symbols").fetchone()[0]
 
-    nodes_json = json.dumps(nodes_data, ensure_ascii=False)
-    edges_json = json.dumps(edges_data, ensure_ascii=False)
+    current = _records_from_lists(nodes_data, edges_data)
+    base_id = _latest_delta_base(conn)
+    base = _member_hashes(conn, base_id) if base_id is not None else set()
 
-    cursor = conn.execute(
-        "INSERT INTO graph_snapshots (label, nodes_json, edges_json, symbols_count) "
+    conn.executemany(
+        "INSERT OR IGNORE INTO snapshot_records (hash, entity, record_key, data) "
         "VALUES (?, ?, ?, ?)",
-        (label, nodes_json, edges_json, symbols_count),
+        [
+            (r.digest, r.entity, r.key, zlib.compress(r.payload.encode("utf-8")))
+            for h, r in current.items()
+            if h not in base
+        ],
+    )
+    cursor = conn.execute(
+        "INSERT INTO graph_snapshots (label, nodes_json, edges_json, symbols_count, "
+        "base_id, node_count, edge_count, storage) VALUES (?, '', '', ?, ?, ?, ?, 'delta')",
+        (label, symbols_count, base_id, len(nodes_data), len(edges_data)),
+    )
+    snap_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT INTO snapshot_deltas (snapshot_id, record_hash, op) VALUES (?, ?, ?)",
+        [(snap_id, h, 1) for h in sorted(current.keys() - base)]
+        + [(snap_id, h, -1) for h in sorted(base - current.keys())],
     )
     conn.commit()
 
-    return cursor.lastrowid  # type: ignore[return-value]
+    return snap_id  # type: ignore[return-value]
 
 
 def list_snapshots(conn: sqlite3.Connection) -> list[SnapshotInfo]:
     """List all saved snapshots, newest first.
 
+    Counts come from the stored columns; only pre-delta rows fall back to
+    measuring their JSON arrays (in SQL, without deserializing them).
+
     Returns:
         A list of :class:`SnapshotInfo` objects ordered by ``created_at`` descending.
     """
     rows = conn.execute(
-        "SELECT id, label, created_at, nodes_json, edges_json, symbols_count "
+        "SELECT id, label, created_at, symbols_count, "
+        "coalesce(node_count, json_array_length(nodes_json)) AS node_count, "
+        "coalesce(edge_count, json_array_length(edges_json)) AS edge_count "
         "FROM graph_snapshots ORDER BY created_at DESC, id DESC"
     ).fetchall()
 
-    result: list[SnapshotInfo] = []
-    for row in rows:
-        nodes = json.loads(row["nodes_json"])
-        edges = json.loads(row["edges_json"])
-        result.append(
-            SnapshotInfo(
-                id=row["id"],
-                label=row["label"],
-                created_at=row["created_at"],
-                node_count=len(nodes),
-                edge_count=len(edges),
-                symbols_count=row["symbols_count"],
-            )
+    return [
+        SnapshotInfo(
+            id=row["id"],
+            label=row["label"],
+            created_at=row["created_at"],
+            node_count=row["node_count"],
+            edge_count=row["edge_count"],
+            symbols_count=row["symbols_count"],
         )
-    return result
+        for row in rows
+    ]
 
 
-def _load_snapshot_data(
+def _unpack_records(
+    records: Iterable[_Record],
+) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+    """Expand records into node and edge lists in ``save_snapshot`` order."""
+    nodes: list[dict[str, str]] = []
+    edges: list[dict[str, str]] = []
+    for record in records:
+        value = json.loads(record.payload)
+        if record.entity == "node":
+            nodes.append(value)
+        else:
+            edges.extend(value)
+    nodes.sort(key=lambda n: n["ref_id"])
+    edges.sort(key=_edge_key)
+    return nodes, edges
+
+
+def load_snapshot(
     conn: sqlite3.Connection, snapshot_id: int
 ) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
-    """Load and deserialize a snapshot's nodes and edges.
+    """Load a snapshot's full node and edge lists (``save_snapshot`` order).
+
+    Delta-stored snapshots are replayed along their chain; only the records
+    still present are decompressed.
 
     Raises:
         ValueError: If the snapshot_id is not found.
     """
-    row = conn.execute(
-        "SELECT nodes_json, edges_json FROM graph_snapshots WHERE id = ?",
-        (snapshot_id,),
-    ).fetchone()
-    if row is None:
-        msg = f"Snapshot {snapshot_id} not found"
-        raise ValueError(msg)
-    nodes: list[dict[str, str]] = json.loads(row["nodes_json"])
-    edges: list[dict[str, str]] = json.loads(row["edges_json"])
-    return nodes, edges
+    row = _snapshot_row(conn, snapshot_id)
+    if row["storage"] != "delta":
+        nodes: list[dict[str, str]] = json.loads(row["nodes_json"])
+        edges: list[dict[str, str]] = json.loads(row["edges_json"])
+        return nodes, edges
+    members = _fetch_records(conn, _member_hashes(conn, snapshot_id))
+    return _unpack_records(members.values())
+
+
+def _changed_records(
+    conn: sqlite3.Connection, old_id: int, new_id: int
+) -> tuple[list[_Record], list[_Record]]:
+    """Records only in *old_id* and only in *new_id*.
+
+    Two delta snapshots are diffed from their chains: deltas shared by both
+    chains cancel out, so only the ops between the snapshots are summed and
+    only the differing records are decompressed.
+    """
+    old_row = _snapshot_row(conn, old_id)
+    new_row = _snapshot_row(conn, new_id)
+
+    if old_row["storage"] == "delta" and new_row["storage"] == "delta":
+        old_chain = _chain(conn, old_id)
+        new_chain = _chain(conn, new_id)
+        common = set(old_chain) & set(new_chain)
+        net = _net_ops(conn, (i for i in new_chain if i not in common))
+        for digest, n in _net_ops(conn, (i for i in old_chain if i not in common)).items():
+            net[digest] = net.get(digest, 0) - n
+        records = _fetch_records(conn, (h for h, n in net.items() if n))
+        only_old = [records[h] for h, n in net.items() if n < 0]
+        only_new = [records[h] for h, n in net.items() if n > 0]
+        return only_old, only_new
+
+    old_records = _records_from_lists(*load_snapshot(conn, old_id))
+    new_records = _records_from_lists(*load_snapshot(conn, new_id))
+    return (
+        [r for h, r in old_records.items() if h not in new_records],
+        [r for h, r in new_records.items() if h not in old_records],
+    )
 
 
 def compare_snapshots(conn: sqlite3.Connection, old_id: int, new_id: int) -> SnapshotDiff:
@@ -169,12 +370,22 @@ def compare_snapshots(conn: sqlite3.Connection, old_id: int, new_id: int) -> Sna
     Raises:
         ValueError: If either snapshot ID is not found.
     """
-    old_nodes, old_edges = _load_snapshot_data(conn, old_id)
-    new_nodes, new_edges = _load_snapshot_data(conn, new_id)
-
-    # Build lookup dicts by ref_id
-    old_nodes_map: dict[str, dict[str, str]] = {n["ref_id"]: n for n in old_nodes}
-    new_nodes_map: dict[str, dict[str, str]] = {n["ref_id"]: n for n in new_nodes}
+    only_old, only_new = _changed_records(conn, old_id, new_id)
+
+    old_nodes_map: dict[str, dict[str, str]] = {}
+    new_nodes_map: dict[str, dict[str, str]] = {}
+    # Edge identity is (src, dst, kind); a record holds every edge sharing it.
+    old_edge_map: dict[str, list[dict[str, str]]] = {}
+    new_edge_map: dict[str, list[dict[str, str]]] = {}
+    for records, nodes_map, edge_map in (
+        (only_old, old_nodes_map, old_edge_map),
+        (only_new, new_nodes_map, new_edge_map),
+    ):
+        for record in records:
+            if record.entity == "node":
+                nodes_map[record.key] = json.loads(record.payload)
+            else:
+                edge_map[record.key] = json.loads(record.payload)
 
     added_nodes: list[dict[str, str]] = []
     removed_nodes: list[dict[str, str]] = []
@@ -203,18 +414,15 @@ def compare_snapshots(conn: sqlite3.Connection, old_id: int, new_id: int) -> Sna
         if ref_id not in new_nodes_map:
             removed_nodes.append(old_node)
 
-    # Compare edges using (src, dst, kind) as identity
-    def _edge_key(e: dict[str, str]) -> tuple[str, str, str]:
-        return (e["src_ref_id"], e["dst_ref_id"], e["kind"])
-
-    old_edge_set = {_edge_key(e) for e in old_edges}
-    new_edge_set = {_edge_key(e) for e in new_edges}
-
-    old_edge_map = {_edge_key(e): e for e in old_edges}
-    new_edge_map = {_edge_key(e): e for e in new_edges}
-
-    added_edges = [new_edge_map[k] for k in sorted(new_edge_set - old_edge_set)]
-    removed_edges = [old_edge_map[k] for k in sorted(old_edge_set - new_edge_set)]
+    # An edge identity present on both sides only changed its ``extra``.
+    added_edges = sorted(
+        (group[-1] for key, group in new_edge_map.items() if key not in old_edge_map),
+        key=_edge_key,
+    )
+    removed_edges = sorted(
+        (group[-1] for key, group in old_edge_map.items() if key not in new_edge_map),
+        key=_edge_key,
+    )
 
     return SnapshotDiff(
         old_id=old_id,
@@ -43,6 +43,71 @@ CREATE TABLE IF NOT EXISTS reference_state (
 );
 """
 
+# Delta-encoded graph snapshot storage. ``snapshot_records`` holds every node /
+# edge-group record ever captured, zlib-compressed and keyed by the SHA-256 of
+# its canonical JSON (identical records across snapshots are stored once);
+# ``snapshot_deltas`` lists, per snapshot, the record hashes added (+1) or
+# removed (-1) relative to its ``graph_snapshots.base_id`` predecessor. Reused by
+# fresh-schema creation and the migration guard, like ``_REFERENCE_STATE_SQL``.
+_SNAPSHOT_STORE_SQL = """\
+CREATE TABLE IF NOT EXISTS snapshot_records (
+    hash        TEXT PRIMARY KEY,
+    entity      TEXT NOT NULL CHECK(entity IN ('node','edge')),
+    record_key  TEXT NOT NULL,
+    data        BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_deltas (
+    snapshot_id INTEGER NOT NULL REFERENCES graph_snapshots(id) ON DELETE CASCADE,
+    record_hash TEXT NOT NULL REFERENCES snapshot_records(hash),
+    op          INTEGER NOT NULL CHECK(op IN (1,-1)),
+    PRIMARY KEY (snapshot_id, record_hash)
+);
+"""
+
+# Per-file / per-directory symbol aggregates (see ``infrastructure.path_stats``).
+# The triggers record every ``code_symbols`` file touched by an insert, delete or
+# update in ``path_stats_dirty``; ``refresh_path_stats`` folds those files into
+# ``path_stats``. Reused by fresh-schema creation and the migration guard.
+_PATH_STATS_SQL = """\
+CREATE TABLE IF NOT EXISTS path_stats (
+    path            TEXT PRIMARY KEY,
+    is_dir          INTEGER NOT NULL,
+    symbol_count    INTEGER NOT NULL,
+    file_count      INTEGER NOT NULL,
+    annotated_files INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS path_stats_dirty (
+    file_path TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS trg_path_stats_insert AFTER INSERT ON code_symbols
+BEGIN
+    INSERT OR IGNORE INTO path_stats_dirty (file_path) VALUES (NEW.file_path);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_path_stats_delete AFTER DELETE ON code_symbols
+BEGIN
+    INSERT OR IGNORE INTO path_stats_dirty (file_path) VALUES (OLD.file_path);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_path_stats_update
+AFTER UPDATE OF file_path, annotations ON code_symbols
+BEGIN
+    INSERT OR IGNORE INTO path_stats_dirty (file_path) VALUES (OLD.file_path);
+    INSERT OR IGNORE INTO path_stats_dirty (file_path) VALUES (NEW.file_path);
+END;
+"""
+
+# ``docs audit`` scan results per doc content hash (see ``doc_sync.scanner``).
+# Not dropped by a full reindex: entries are content-addressed and tied to the
+# scanner fingerprint. Reused by fresh-schema creation and the migration guard.
+_DOC_MENTIONS_SQL = """\
+CREATE TABLE IF NOT EXISTS doc_mentions (
+    content_hash   TEXT NOT NULL,
+    low_confidence INTEGER NOT NULL,
+    scanner        TEXT NOT NULL,
+    mentions       TEXT NOT NULL,
+    PRIMARY KEY (content_hash, low_confidence)
+) WITHOUT ROWID;
+"""
+
 _SCHEMA_SQL = """\
 -- Graph nodes
 -- ``kind`` is a free-form string (paradigm-agnostic, BDL-038 U1): the DDD preset
@@ -112,7 +177,8 @@ CREATE TABLE IF NOT EXISTS chunks (
     heading     TEXT NOT NULL DEFAULT '',
     section     TEXT NOT NULL DEFAULT '',
     content     TEXT NOT NULL,
-    node_ref_id TEXT REFERENCES nodes(ref_id) ON DELETE SET NULL
+    node_ref_id TEXT REFERENCES nodes(ref_id) ON DELETE SET NULL,
+    content_hash TEXT NOT NULL DEFAULT ''
 );
 
 -- Code symbols
@@ -129,6 +195,9 @@ CREATE TABLE IF NOT EXISTS code_symbols (
     file_hash   TEXT NOT NULL
 );
 
+-- Per-directory symbol aggregates + code_symbols triggers — see ``_PATH_STATS_SQL``
+-- (created by ``ensure_schema_migrations``; single source of truth for the DDL).
+
 -- Doc↔code sync state
 CREATE TABLE IF NOT EXISTS sync_state (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -175,15 +244,28 @@ CREATE TABLE IF NOT EXISTS file_index (
 );
 
 -- Architecture graph snapshots (point-in-time captures)
+-- ``storage='json'`` rows (pre-delta) keep the full node/edge lists in
+-- ``nodes_json``/``edges_json``; ``storage='delta'`` rows leave them empty and
+-- are reconstructed from ``snapshot_deltas`` along the ``base_id`` chain.
 CREATE TABLE IF NOT EXISTS graph_snapshots (
     id              INTEGER PRIMARY KEY,
     label           TEXT,
     created_at      TEXT NOT NULL DEFAULT (datetime('now')),
     nodes_json      TEXT NOT NULL,
     edges_json      TEXT NOT NULL,
-    symbols_count   INTEGER NOT NULL DEFAULT 0
+    symbols_count   INTEGER NOT NULL DEFAULT 0,
+    base_id         INTEGER,
+    node_count      INTEGER,
+    edge_count      INTEGER,
+    storage         TEXT NOT NULL DEFAULT 'json'
 );
 
+-- Snapshot records + deltas — see ``_SNAPSHOT_STORE_SQL``
+-- (appended to this schema below; single source of truth for the DDL).
+
+-- Docs-audit mention cache — see ``_DOC_MENTIONS_SQL``
+-- (appended to this schema below; single source of truth for the DDL).
+
 -- Bundle cache (L2 persistent, survives restarts)
 CREATE TABLE IF NOT EXISTS bundle_cache (
     cache_key   TEXT PRIMARY KEY,
@@ -311,6 +393,13 @@ def ensure_schema_migrations(conn: sqlite3.Connection) -> None:
             )
             conn.commit()
 
+    # Chunk identity for incremental doc re-indexing. Rows from older DBs keep
+    # the empty default and are simply replaced the next time their doc changes.
+    chunk_columns = _table_columns(conn, "chunks")
+    if chunk_columns and "content_hash" not in chunk_columns:
+        conn.execute("ALTER TABLE chunks ADD COLUMN content_hash TEXT NOT NULL DEFAULT ''")
+        conn.commit()
+
     # lifecycle column on nodes/edges (BDL-037 Principle 8). Additive: existing
     # DBs upgrade cleanly and existing rows default to 'active' (no regression).
     node_columns = _table_columns(conn, "nodes")
@@ -333,6 +422,9 @@ def ensure_schema_migrations(conn: sqlite3.Connection) -> None:
     _ensure_reference_state_table(conn)
     _migrate_drop_kind_checks(conn)
     _migrate_lifecycle_external(conn)
+    _ensure_snapshot_store(conn)
+    _ensure_path_stats(conn)
+    _ensure_doc_mentions(conn)
 
 
 def _ensure_reference_state_table(conn: sqlite3.Connection) -> None:
@@ -348,6 +440,55 @@ def _ensure_reference_state_table(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+# Columns added to ``graph_snapshots`` for delta-encoded storage.
+_SNAPSHOT_COLUMNS: dict[str, str] = {
+    "base_id": "INTEGER",
+    "node_count": "INTEGER",
+    "edge_count": "INTEGER",
+    "storage": "TEXT NOT NULL DEFAULT 'json'",
+}
+
+
+def _ensure_snapshot_store(conn: sqlite3.Connection) -> None:
+    """Add the delta-encoded snapshot columns and tables (idempotent).
+
+    Additive: pre-existing snapshots keep their full ``nodes_json`` /
+    ``edges_json`` payload and default to ``storage='json'`` (counts ``NULL``,
+    derived from the JSON on read), so no history is rewritten or lost.
+    """
+    snapshot_columns = _table_columns(conn, "graph_snapshots")
+    if not snapshot_columns:
+        return
+    for column, ddl in _SNAPSHOT_COLUMNS.items():
+        if column not in snapshot_columns:
+            conn.execute(f"ALTER TABLE graph_snapshots ADD COLUMN {column} {ddl}")
+    conn.executescript(_SNAPSHOT_STORE_SQL)
+    conn.commit()
+
+
+def _ensure_path_stats(conn: sqlite3.Connection) -> None:
+    """Create the ``path_stats`` aggregate and its ``code_symbols`` triggers (idempotent).
+
+    An existing DB that predates the table gets it built from ``code_symbols``
+    here, once; from then on reindex keeps it current, so readers never write.
+    """
+    if not _table_exists(conn, "code_symbols"):
+        return
+    backfill = not _table_exists(conn, "path_stats")
+    conn.executescript(_PATH_STATS_SQL)
+    conn.commit()
+    if backfill:
+        from beadloom.infrastructure.path_stats import refresh_path_stats
+
+        refresh_path_stats(conn)
+
+
+def _ensure_doc_mentions(conn: sqlite3.Connection) -> None:
+    """Create the ``doc_mentions`` cache table (idempotent)."""
+    conn.executescript(_DOC_MENTIONS_SQL)
+    conn.commit()
+
+
 def _migrate_edges_contract_kinds(conn: sqlite3.Connection) -> None:
     """Rebuild the ``edges`` table to add contract kinds + ``contract_key`` (#101/#102).
 
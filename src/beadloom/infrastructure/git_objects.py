@@ -0,0 +1,248 @@
+"""Batched git object reads over one long-lived ``git cat-file --batch`` process.
+
+# beadloom:domain=infrastructure
+# beadloom:component=git-objects
+
+Ref-baseline commands (``beadloom diff``, ``sync-check --since``) need the
+content of many files *as they were at a git ref*. Spawning one
+``git show <ref>:<path>`` per file costs a process start each; with hundreds of
+graph files and thousands of sync pairs that dominates the runtime.
+
+:class:`GitObjectReader` keeps a single ``git cat-file --batch`` process open
+and pipelines every request through it: the requests for a whole batch are
+written by a feeder thread while the responses are read back in order, so a
+batch of N blobs is one round-trip instead of N process spawns. Ref
+verification and recursive tree listing go through the same process (a tree
+object is parsed in-process), so a full ``compute_diff`` needs exactly one git
+child.
+
+Read-only and non-destructive: it only reads the object store, never the
+working tree or index. Git being unavailable (missing binary, not a repo)
+degrades to "object absent" — every read returns ``None`` / ``[]`` — mirroring
+the prior ``git show`` helpers.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from types import TracebackType
+
+# Tree entry mode prefix for sub-trees (directories) in a raw tree object.
+_TREE_MODE = b"40000"
+
+
+def decode_git_text(data: bytes) -> str:
+    """Decode blob bytes the way ``subprocess.run(..., text=True)`` did.
+
+    UTF-8 with universal-newline translation, so hashes computed over the
+    decoded text stay identical to the prior ``git show`` -> ``stdout`` path
+    (and to ``Path.read_text`` on the working-tree side).
+    """
+    text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class GitObjectReader:
+    """Read many git objects through one ``git cat-file --batch`` process.
+
+    Use as a context manager (or call :meth:`close`)::
+
+        with GitObjectReader(project_root) as reader:
+            if reader.resolve("HEAD~1") is None:
+                ...
+            blobs = reader.read_blobs("HEAD~1", ["a.py", "docs/a.md"])
+
+    The process is started lazily on the first read and reused for every
+    subsequent one.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self._project_root = project_root
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._failed = False
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the ``cat-file`` process (idempotent)."""
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+    # -- public reads ------------------------------------------------------
+
+    def resolve(self, ref: str) -> str | None:
+        """Return the object id *ref* names, or ``None`` if it does not resolve.
+
+        Equivalent to ``git rev-parse --verify <ref>`` for validation purposes.
+        """
+        found = self._batch([ref])[0]
+        return found[0] if found is not None else None
+
+    def read_blob(self, ref: str, rel_path: str) -> bytes | None:
+        """Return *rel_path*'s blob bytes at *ref*, or ``None`` if absent."""
+        return self.read_blobs(ref, [rel_path])[rel_path]
+
+    def read_blobs(self, ref: str, rel_paths: Iterable[str]) -> dict[str, bytes | None]:
+        """Return ``{rel_path: bytes | None}`` for every path at *ref* in one round-trip.
+
+        A path that did not exist at *ref* (or names a tree, not a blob) maps
+        to ``None``. Duplicate paths are read once.
+        """
+        paths = list(dict.fromkeys(rel_paths))
+        found = self._batch([f"{ref}:{p}" for p in paths])
+        out: dict[str, bytes | None] = {}
+        for path, obj in zip(paths, found, strict=True):
+            out[path] = obj[2] if obj is not None and obj[1] == "blob" else None
+        return out
+
+    def list_tree(self, ref: str, prefix: str) -> list[str]:
+        """List blob paths under directory *prefix* at *ref*, recursively.
+
+        Equivalent to ``git ls-tree -r --name-only <ref> <prefix>/``: returns
+        project-relative POSIX paths (sorted), or ``[]`` when the directory did
+        not exist at *ref*.
+        """
+        root = prefix.strip("/")
+        out: list[str] = []
+        pending = [root]
+        while pending:
+            # One batch per tree depth: every sub-tree at this level is fetched
+            # in the same round-trip.
+            found = self._batch([f"{ref}:{d}" for d in pending])
+            next_level: list[str] = []
+            for directory, obj in zip(pending, found, strict=True):
+                if obj is None or obj[1] != "tree":
+                    continue
+                hex_len = len(obj[0])
+                for mode, name in _parse_tree(obj[2], hex_len // 2):
+                    path = f"{directory}/{name}" if directory else name
+                    if mode == _TREE_MODE:
+                        next_level.append(path)
+                    else:
+                        out.append(path)
+            pending = next_level
+        return sorted(out)
+
+    # -- protocol ----------------------------------------------------------
+
+    def _ensure_proc(self) -> subprocess.Popen[bytes] | None:
+        if self._proc is not None:
+            return self._proc
+        if self._failed:
+            return None
+        try:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],  # noqa: S607
+                cwd=str(self._project_root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            # Git missing / invalid cwd — degrade to "every object absent".
+            self._failed = True
+            return None
+        return self._proc
+
+    def _batch(self, specs: list[str]) -> list[tuple[str, str, bytes] | None]:
+        """Send *specs* and return one ``(oid, type, content)`` or ``None`` each.
+
+        Requests are written by a feeder thread while responses are consumed
+        here, so neither side blocks on a full pipe buffer however large the
+        batch is.
+        """
+        results: list[tuple[str, str, bytes] | None] = [None] * len(specs)
+        # The batch protocol is line-oriented: a spec containing a newline can
+        # never name an object, and would desynchronize the stream.
+        wanted = [i for i, s in enumerate(specs) if "\n" not in s]
+        if not wanted:
+            return results
+        proc = self._ensure_proc()
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            return results
+
+        payload = b"".join(specs[i].encode("utf-8") + b"\n" for i in wanted)
+        feeder = threading.Thread(target=_feed, args=(proc.stdin, payload), daemon=True)
+        feeder.start()
+        try:
+            for i in wanted:
+                results[i] = _read_response(proc.stdout)
+        except (OSError, ValueError):
+            # The process died mid-batch: report the rest as absent and stop
+            # using it (later batches degrade to absent without a restart).
+            self._failed = True
+            self.close()
+        feeder.join()
+        return results
+
+
+def _feed(stdin: IO[bytes], payload: bytes) -> None:
+    try:
+        stdin.write(payload)
+        stdin.flush()
+    except (OSError, ValueError):
+        # Broken pipe / closed by the reader — it already noticed the dead
+        # process and reports the remaining objects as absent.
+        pass
+
+
+def _read_response(stdout: IO[bytes]) -> tuple[str, str, bytes] | None:
+    """Read one ``cat-file --batch`` response (header + content + LF)."""
+    header = stdout.readline()
+    if not header:
+        msg = "git cat-file terminated unexpectedly"
+        raise ValueError(msg)
+    parts = header.rstrip(b"\n").split(b" ")
+    # "<spec> missing" / "<spec> ambiguous" carry no content.
+    if len(parts) != 3 or parts[-1] in (b"missing", b"ambiguous"):
+        return None
+    oid, obj_type, size = parts
+    content = stdout.read(int(size))
+    stdout.read(1)  # trailing LF
+    return oid.decode("ascii"), obj_type.decode("ascii"), content
+
+
+def _parse_tree(data: bytes, oid_len: int) -> list[tuple[bytes, str]]:
+    """Parse a raw tree object into ``(mode, name)`` entries.
+
+    Each entry is ``<mode> SP <name> NUL <oid bytes>``; *oid_len* is 20 for
+    SHA-1 repositories and 32 for SHA-256 ones.
+    """
+    entries: list[tuple[bytes, str]] = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        space = data.index(b" ", pos)
+        nul = data.index(b"\0", space)
+        mode = data[pos:space]
+        name = data[space + 1 : nul].decode("utf-8", errors="surrogateescape")
+        entries.append((mode, name))
+        pos = nul + 1 + oid_len
+    return entries
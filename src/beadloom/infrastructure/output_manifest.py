@@ -0,0 +1,294 @@
+"""Staged file output with a content-hash build manifest.
+
+# beadloom:domain=infrastructure
+# beadloom:component=output-manifest
+
+Generators that emit a whole tree of files (``docs site``) stage every output
+on a :class:`StagedOutput` instead of writing files directly. On
+:meth:`StagedOutput.commit`:
+
+- a file whose new bytes equal the bytes already on disk is NOT rewritten
+  (its mtime is untouched, so downstream build caches stay warm);
+- a file the previous run produced but this run did not is pruned (an orphan
+  output). Only manifest-recorded files are ever removed — anything else
+  under the root (e.g. a committed scaffold) is never touched;
+- the manifest is rewritten with, per output file, the SHA-256 of its content
+  and an *inputs* fingerprint.
+
+The inputs fingerprint lets a caller skip *rendering* altogether:
+:meth:`StagedOutput.unchanged` is true when the previous run produced the same
+path from the same inputs and the file on disk still has the recorded content.
+An empty fingerprint means "always re-render" (cheap outputs).
+
+Verbatim copies of existing files (:meth:`StagedOutput.add_file`, e.g. the
+images of a published docs tree) are never read into memory: on commit the
+destination is hardlinked to the source when the file system allows it, else
+reflinked (copy-on-write clone), else streamed with :func:`shutil.copyfile`.
+A destination that already is the source (same inode), or a copy with the
+source's size and mtime, is left alone. Such files are recorded in the manifest
+for pruning only.
+
+The manifest holds only content-derived values (no mtimes, no wall-clock), so
+regenerating unchanged inputs leaves the whole tree byte-identical.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Bumped when the manifest layout (or what an inputs fingerprint covers)
+#: changes; a manifest of another version is ignored (full re-render).
+_MANIFEST_VERSION = 1
+
+#: Linux ``FICLONE`` ioctl (``_IOW(0x94, 9, int)``): a copy-on-write clone on
+#: btrfs / XFS / overlayfs; any other file system rejects it with an OSError.
+_FICLONE = 0x40049409
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One recorded output file: its content hash + render-inputs fingerprint."""
+
+    content: str
+    inputs: str = ""
+
+
+@dataclass(frozen=True)
+class CommitResult:
+    """What :meth:`StagedOutput.commit` did: all outputs, rewritten, pruned."""
+
+    outputs: tuple[Path, ...]
+    updated: tuple[Path, ...]
+    removed: tuple[Path, ...]
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of *data*."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint(*parts: object) -> str:
+    """A stable SHA-256 fingerprint of *parts* (their ``repr``, in order)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> dict[str, ManifestEntry]:
+    """The manifest at *path* (``{}`` when absent, unreadable or outdated)."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != _MANIFEST_VERSION:
+        return {}
+    files = raw.get("files")
+    if not isinstance(files, dict):
+        return {}
+    entries: dict[str, ManifestEntry] = {}
+    for rel, entry in files.items():
+        if isinstance(entry, dict) and isinstance(entry.get("content"), str):
+            entries[str(rel)] = ManifestEntry(
+                content=entry["content"], inputs=str(entry.get("inputs", ""))
+            )
+    return entries
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Clone *source* to *target* copy-on-write (``OSError`` if unsupported)."""
+    try:
+        import fcntl
+    except ImportError as exc:  # pragma: no cover - non-POSIX
+        raise OSError("reflink is not supported on this platform") from exc
+    with source.open("rb") as src, target.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+def _place_file(source: Path, target: Path) -> bool:
+    """Make *target* a copy of *source*; return False if it already was one.
+
+    *target* is current when it is the same inode as *source* (a hardlink) or
+    has the source's size and mtime (a copy this function made). Otherwise the
+    cheapest available copy replaces it atomically: a hardlink, then a
+    copy-on-write clone, then a streamed copy (whose mtime is set to the
+    source's so the next run recognises it).
+    """
+    src_stat = source.stat()
+    try:
+        dst_stat = target.stat()
+    except OSError:
+        pass
+    else:
+        if os.path.samestat(src_stat, dst_stat) or (
+            dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.beadloom-tmp")
+    tmp.unlink(missing_ok=True)
+    copiers: tuple[Callable[[Path, Path], object], ...] = (os.link, _reflink, shutil.copyfile)
+    for copy in copiers:
+        try:
+            copy(source, tmp)
+            break
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            if copy is shutil.copyfile:
+                raise
+    if not os.path.samestat(src_stat, tmp.stat()):
+        os.utime(tmp, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    tmp.replace(target)
+    return True
+
+
+class StagedOutput:
+    """The files one run produces under *root*, staged until :meth:`commit`.
+
+    Staging the same path twice keeps the last content (a later step may
+    replace an earlier file). Without *manifest_path* nothing is recorded —
+    only the write-only-on-change behaviour applies (no render skipping, no
+    pruning).
+    """
+
+    def __init__(self, root: Path, *, manifest_path: Path | None = None) -> None:
+        self.root = root
+        self._manifest_path = manifest_path
+        self._previous = load_manifest(manifest_path) if manifest_path is not None else {}
+        self._staged: dict[Path, tuple[bytes, str]] = {}
+        self._files: dict[Path, Path] = {}
+        self._kept: dict[Path, ManifestEntry] = {}
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def unchanged(self, path: Path, inputs: str) -> bool:
+        """True if *path* is already up to date for *inputs* (then it is kept).
+
+        Requires a previous manifest entry rendered from the same non-empty
+        *inputs* and the file on disk still holding the recorded content.
+        """
+        if not inputs:
+            return False
+        entry = self._previous.get(self._rel(path))
+        if entry is None or entry.inputs != inputs:
+            return False
+        data = _read_bytes(path)
+        if data is None or content_hash(data) != entry.content:
+            return False
+        self._staged.pop(path, None)
+        self._files.pop(path, None)
+        self._kept[path] = entry
+        return True
+
+    def add_text(self, path: Path, content: str, *, inputs: str = "") -> None:
+        """Stage *content* (UTF-8) for *path*."""
+        self.add_bytes(path, content.encode("utf-8"), inputs=inputs)
+
+    def add_bytes(self, path: Path, data: bytes, *, inputs: str = "") -> None:
+        """Stage raw *data* for *path*."""
+        self._kept.pop(path, None)
+        self._files.pop(path, None)
+        self._staged[path] = (data, inputs)
+
+    def add_file(self, path: Path, source: Path) -> None:
+        """Stage a verbatim copy of the existing file *source* for *path*.
+
+        The bytes are never read: :func:`_place_file` links or copies the file
+        on commit.
+        """
+        self._kept.pop(path, None)
+        self._staged.pop(path, None)
+        self._files[path] = source
+
+    @property
+    def paths(self) -> list[Path]:
+        """Every output path staged or kept so far."""
+        return [*self._staged, *self._files, *self._kept]
+
+    def commit(self) -> CommitResult:
+        """Write changed files, prune orphans, save the manifest."""
+        entries: dict[str, ManifestEntry] = {
+            self._rel(path): entry for path, entry in self._kept.items()
+        }
+        updated: list[Path] = []
+        for path, (data, inputs) in self._staged.items():
+            if _read_bytes(path) != data:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if path.is_file() and path.stat().st_nlink > 1:
+                    path.unlink()  # never write through a hardlink into its source
+                path.write_bytes(data)
+                updated.append(path)
+            entries[self._rel(path)] = ManifestEntry(content=content_hash(data), inputs=inputs)
+        for path, source in self._files.items():
+            if _place_file(source, path):
+                updated.append(path)
+            # Linked/copied files are recorded for ownership (pruning) only.
+            entries[self._rel(path)] = ManifestEntry(content="")
+
+        removed = self._prune(entries)
+        if self._manifest_path is not None:
+            self._save(self._manifest_path, entries)
+        return CommitResult(
+            outputs=tuple(sorted(self.paths)),
+            updated=tuple(sorted(updated)),
+            removed=tuple(removed),
+        )
+
+    def _prune(self, current: dict[str, ManifestEntry]) -> list[Path]:
+        """Remove files the previous run produced that this run did not."""
+        removed: list[Path] = []
+        for rel in sorted(self._previous.keys() - current.keys()):
+            path = self.root / rel
+            if not path.is_file():
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                logger.warning("Could not remove orphaned site file %s", path)
+                continue
+            removed.append(path)
+            # Drop directories the orphan leaves empty (never the root itself).
+            parent = path.parent
+            while parent != self.root and self.root in parent.parents:
+                with contextlib.suppress(OSError):
+                    parent.rmdir()
+                if parent.exists():
+                    break
+                parent = parent.parent
+        return removed
+
+    @staticmethod
+    def _save(path: Path, entries: dict[str, ManifestEntry]) -> None:
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "files": {
+                rel: {"content": entry.content, "inputs": entry.inputs}
+                for rel, entry in sorted(entries.items())
+            },
+        }
+        text = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+        if _read_bytes(path) != text.encode("utf-8"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
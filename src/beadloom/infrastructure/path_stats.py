@@ -0,0 +1,170 @@
+"""Per-directory symbol aggregates maintained alongside ``code_symbols``.
+
+# beadloom:domain=infrastructure
+# beadloom:component=path-stats
+
+Size rules, debt scoring and the module-coverage lint all ask the same
+question of the index: how many symbols / files live under a source prefix.
+Answering it with ``file_path LIKE 'prefix%'`` scans ``code_symbols`` (SQLite
+never uses an index for a case-insensitive ``LIKE``), once per node per rule.
+
+``path_stats`` materializes the answer. It holds one row per indexed file and
+one row per ancestor directory (keyed with a trailing ``/``, the form node
+``source`` values use), each carrying the symbol count, the number of files
+with at least one symbol, and the number of those files whose symbols carry a
+``feature`` / ``component`` annotation. A prefix question is then one primary
+key lookup, and "every file under a prefix" is an indexed range scan.
+
+The aggregate is kept current incrementally. Triggers on ``code_symbols``
+record every touched ``file_path`` in ``path_stats_dirty``;
+:func:`refresh_path_stats` re-counts only those files and applies the
+difference to their ancestor directories. Reindex refreshes before it commits,
+and readers never refresh, so read-only commands stay read-only. An empty
+aggregate next to indexed symbols (a database created before the table
+existed) is rebuilt in full by the schema migration that adds the table.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@dataclass(frozen=True)
+class PathStats:
+    """Aggregate for one file or directory of ``code_symbols``."""
+
+    symbol_count: int = 0
+    file_count: int = 0
+    annotated_files: int = 0
+
+
+def prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Return ``(lo, hi)`` so that ``lo <= path < hi`` iff *path* starts with *prefix*.
+
+    Unlike ``LIKE`` the range is exact (``_`` and ``%`` are not wildcards,
+    case matters) and is served by the index on the compared column.
+    """
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _parent_dirs(file_path: str) -> list[str]:
+    """``src/a/b.py`` -> ``["src/", "src/a/"]``."""
+    parts = file_path.split("/")[:-1]
+    return ["/".join(parts[: i + 1]) + "/" for i in range(len(parts))]
+
+
+def _is_annotated(raw: object) -> bool:
+    """True when a ``code_symbols.annotations`` value names a feature or component."""
+    try:
+        annotations = json.loads(str(raw))
+    except (json.JSONDecodeError, TypeError):
+        return False
+    return isinstance(annotations, dict) and (
+        "feature" in annotations or "component" in annotations
+    )
+
+
+def refresh_path_stats(conn: sqlite3.Connection) -> None:
+    """Fold every file changed since the last refresh into ``path_stats``.
+
+    A no-op (two indexed ``SELECT``s, no write) when nothing is dirty. Commits
+    only a transaction it opened itself, so a caller mid-transaction keeps
+    control of its own commit.
+    """
+    owns_transaction = not conn.in_transaction
+    if conn.execute("SELECT 1 FROM path_stats LIMIT 1").fetchone() is None:
+        if conn.execute("SELECT 1 FROM code_symbols LIMIT 1").fetchone() is None:
+            return
+        conn.execute(
+            "INSERT OR IGNORE INTO path_stats_dirty (file_path) "
+            "SELECT DISTINCT file_path FROM code_symbols"
+        )
+    elif conn.execute("SELECT 1 FROM path_stats_dirty LIMIT 1").fetchone() is None:
+        return
+
+    old = {
+        str(row[0]): (int(row[1]), int(row[2]))
+        for row in conn.execute(
+            "SELECT path, symbol_count, annotated_files FROM path_stats "
+            "WHERE is_dir = 0 AND path IN (SELECT file_path FROM path_stats_dirty)"
+        )
+    }
+    new: dict[str, tuple[int, int]] = {
+        str(row[0]): (0, 0) for row in conn.execute("SELECT file_path FROM path_stats_dirty")
+    }
+    for row in conn.execute(
+        "SELECT file_path, annotations FROM code_symbols "
+        "WHERE file_path IN (SELECT file_path FROM path_stats_dirty)"
+    ):
+        symbols, annotated = new[str(row[0])]
+        new[str(row[0])] = (symbols + 1, annotated or int(_is_annotated(row[1])))
+
+    dir_deltas: dict[str, list[int]] = {}
+    for path, (symbols, annotated) in new.items():
+        old_symbols, old_annotated = old.get(path, (0, 0))
+        delta = (
+            symbols - old_symbols,
+            int(symbols > 0) - int(old_symbols > 0),
+            annotated - old_annotated,
+        )
+        if delta == (0, 0, 0):
+            continue
+        for parent in _parent_dirs(path):
+            totals = dir_deltas.setdefault(parent, [0, 0, 0])
+            for i, value in enumerate(delta):
+                totals[i] += value
+        if symbols:
+            conn.execute(
+                "INSERT OR REPLACE INTO path_stats "
+                "(path, is_dir, symbol_count, file_count, annotated_files) "
+                "VALUES (?, 0, ?, 1, ?)",
+                (path, symbols, annotated),
+            )
+        else:
+            conn.execute("DELETE FROM path_stats WHERE path = ?", (path,))
+
+    conn.executemany(
+        "INSERT INTO path_stats (path, is_dir, symbol_count, file_count, annotated_files) "
+        "VALUES (?, 1, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET "
+        "symbol_count = symbol_count + excluded.symbol_count, "
+        "file_count = file_count + excluded.file_count, "
+        "annotated_files = annotated_files + excluded.annotated_files",
+        [(path, *totals) for path, totals in dir_deltas.items()],
+    )
+    conn.execute("DELETE FROM path_stats WHERE is_dir = 1 AND file_count <= 0")
+    conn.execute("DELETE FROM path_stats_dirty")
+    if owns_transaction:
+        conn.commit()
+
+
+def path_stats(conn: sqlite3.Connection, path: str) -> PathStats:
+    """Aggregate for one file (``src/a/b.py``) or directory (``src/a/``).
+
+    Call :func:`refresh_path_stats` first when ``code_symbols`` may have been
+    written since the last reindex.
+    """
+    row = conn.execute(
+        "SELECT symbol_count, file_count, annotated_files FROM path_stats WHERE path = ?",
+        (path,),
+    ).fetchone()
+    if row is None:
+        return PathStats()
+    return PathStats(int(row[0]), int(row[1]), int(row[2]))
+
+
+def file_stats_under(conn: sqlite3.Connection, prefix: str) -> dict[str, PathStats]:
+    """Per-file aggregates for every indexed file whose path starts with *prefix*."""
+    lo, hi = prefix_bounds(prefix)
+    rows = conn.execute(
+        "SELECT path, symbol_count, annotated_files FROM path_stats "
+        "WHERE path >= ? AND path < ? AND is_dir = 0",
+        (lo, hi),
+    ).fetchall()
+    return {str(row[0]): PathStats(int(row[1]), 1, int(row[2])) for row in rows}
@@ -0,0 +1,182 @@
+"""Process-wide parsed ``.beadloom/config.yml``.
+
+# beadloom:domain=infrastructure
+# beadloom:component=project-config
+
+Scan paths, the docs directory, the file walker, parser warnings, federation
+names and the docs-audit loaders all read ``.beadloom/config.yml``. Each used
+to open and parse it on its own, several times per command, and on every
+tool call in the MCP server.
+
+:func:`load_project_config` parses the file once per process and hands out
+the same :class:`ProjectConfig` until the file changes. A call normally
+costs one ``stat``: a different mtime, size or inode (``write_yaml_atomic``
+replaces the file) re-parses it, so long-lived processes such as the MCP
+server, the TUI and ``watch`` see edits without restarting. A file modified in
+the last two seconds is also re-read and compared by text, since a quick
+rewrite can leave its stat unchanged.
+
+A missing file is an empty config. A file that cannot be read or parsed is
+also empty, with the reason in :attr:`ProjectConfig.error` so a caller can
+warn about it.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from beadloom.infrastructure.yaml_cache import safe_load
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ProjectConfig:
+    """Typed, read-only view of one parsed config file.
+
+    The accessors return copies, so callers can never change the shared
+    document.
+    """
+
+    data: Mapping[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """A copy of top-level *key*, or *default* when it is absent."""
+        if key not in self.data:
+            return default
+        return copy.deepcopy(self.data[key])
+
+    def section(self, key: str) -> dict[str, Any]:
+        """A copy of the mapping under *key*; ``{}`` when absent or not a mapping."""
+        value = self.data.get(key)
+        return copy.deepcopy(value) if isinstance(value, dict) else {}
+
+    def _str(self, key: str) -> str | None:
+        value = self.data.get(key)
+        return value if isinstance(value, str) and value else None
+
+    def _str_list(self, key: str) -> list[str]:
+        value = self.data.get(key)
+        return [str(item) for item in value] if isinstance(value, list) else []
+
+    @property
+    def scan_paths(self) -> list[str]:
+        """``scan_paths``; empty when not configured."""
+        return self._str_list("scan_paths")
+
+    @property
+    def docs_dir(self) -> str | None:
+        """``docs_dir`` relative to the project root, when configured."""
+        value = self.data.get("docs_dir")
+        return str(value) if value else None
+
+    @property
+    def languages(self) -> list[str]:
+        """``languages`` (bare names or extensions); empty when not configured."""
+        return self._str_list("languages")
+
+    @property
+    def exclude(self) -> list[str]:
+        """Extra gitignore-style patterns pruned from file walks."""
+        return self._str_list("exclude")
+
+    @property
+    def walker(self) -> str | None:
+        """``walker`` (``git`` lists files with ``git ls-files``)."""
+        return self._str("walker")
+
+    @property
+    def yaml_cache(self) -> str | None:
+        """``yaml_cache`` (``disk`` persists parsed graph YAML)."""
+        return self._str("yaml_cache")
+
+    @property
+    def max_file_size(self) -> int | None:
+        """``max_file_size`` in bytes (files above it are not parsed), when set."""
+        value = self.data.get("max_file_size")
+        is_size = isinstance(value, int) and not isinstance(value, bool) and value > 0
+        return value if is_size else None
+
+    @property
+    def repo(self) -> str | None:
+        """``repo`` name used by federation exports."""
+        return self._str("repo")
+
+    @property
+    def landscape(self) -> str | None:
+        """``landscape`` name used by federation exports."""
+        return self._str("landscape")
+
+
+_EMPTY = ProjectConfig()
+
+# A file modified this recently may change again within the file system's
+# timestamp granularity without its stat changing, so its text is compared
+# too (the "racy git" problem).
+_SETTLE_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: tuple[int, int, int]  # (mtime_ns, size, inode)
+    settled: bool
+    text: str
+    config: ProjectConfig
+
+
+# Absolute config path -> last parsed entry.
+_CACHE: dict[str, _Entry] = {}
+_LOCK = threading.Lock()
+
+
+def load_config_file(path: Path) -> ProjectConfig:
+    """The parsed config at *path*, re-parsed only when the file changed."""
+    key = str(path.absolute())
+    try:
+        st = path.stat()
+    except OSError:
+        with _LOCK:
+            _CACHE.pop(key, None)
+        return _EMPTY
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _CACHE.get(key)
+    if cached is not None and cached.settled and cached.stamp == stamp:
+        return cached.config
+
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        return ProjectConfig(error=str(exc))
+    if cached is not None and cached.text == text:
+        config = cached.config
+    else:
+        try:
+            data = safe_load(text)
+        except yaml.YAMLError as exc:
+            config = ProjectConfig(error=str(exc))
+        else:
+            config = ProjectConfig(data) if isinstance(data, dict) else _EMPTY
+    settled = time.time_ns() - st.st_mtime_ns > _SETTLE_NS
+    with _LOCK:
+        _CACHE[key] = _Entry(stamp, settled, text, config)
+    return config
+
+
+def load_project_config(project_root: Path) -> ProjectConfig:
+    """The parsed ``<project_root>/.beadloom/config.yml`` (empty when absent)."""
+    return load_config_file(project_root / ".beadloom" / "config.yml")
+
+
+def clear_project_config_cache() -> None:
+    """Forget every parsed config (the next load re-reads from disk)."""
+    with _LOCK:
+        _CACHE.clear()
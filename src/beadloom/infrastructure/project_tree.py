@@ -0,0 +1,397 @@
+"""One pruned, shared walk of the project's files.
+
+# beadloom:domain=infrastructure
+# beadloom:component=project-tree
+
+Reindex, the import resolver, test mapping, the coverage lint, onboarding and
+the docs site all enumerate project files. Each used to run its own
+``Path.rglob("*")`` and filter afterwards, so every walk descended into
+``node_modules``, virtualenvs and build output before discarding them.
+
+:class:`ProjectTree` walks with :func:`os.scandir` and prunes a directory
+*before* descending when
+
+* its name is one of :data:`ALWAYS_PRUNED` (VCS metadata, dependency and tool
+  caches), or
+* it is ignored by a ``.gitignore`` on its path, ``.git/info/exclude`` or the
+  ``exclude`` patterns in ``.beadloom/config.yml`` (gitignore syntax).
+
+With ``walker: git`` in ``config.yml`` the file list comes from one
+``git ls-files --cached --others --exclude-standard`` call instead (falling
+back to the walk outside a git work tree). Walks are memoized per directory,
+and :func:`shared_project_tree` / :func:`shares_project_tree` make every
+:func:`project_tree` call for the same root inside a command reuse one tree.
+Symlinked directories are not descended into, like ``Path.rglob``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import functools
+import os
+import re
+import subprocess
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar
+
+from beadloom.infrastructure.project_config import load_project_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Iterator
+    from pathlib import Path
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# Directory names never worth descending into, ignored or not.
+ALWAYS_PRUNED = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    """One gitignore pattern, relative to the directory (*base*) that declared it."""
+
+    base: str
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    def matches(self, rel: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel.startswith(self.base + "/"):
+                return False
+            rel = rel[len(self.base) + 1 :]
+        target = rel if self.anchored else rel.rsplit("/", 1)[-1]
+        return self.regex.fullmatch(target) is not None
+
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over ``/``-separated paths."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and (end := pattern.find("]", i + 1)) > i + 1:
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_ignore_patterns(lines: Iterable[str], base: str = "") -> list[_IgnoreRule]:
+    """Compile gitignore *lines* declared in the root-relative directory *base*."""
+    rules: list[_IgnoreRule] = []
+    for raw in lines:
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate or line.startswith("\\"):  # ``\#`` / ``\!`` escape a literal
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        rules.append(
+            _IgnoreRule(
+                base=base,
+                regex=re.compile(_glob_regex(line.lstrip("/"))),
+                negate=negate,
+                dir_only=dir_only,
+                anchored=anchored,
+            )
+        )
+    return rules
+
+
+def _is_ignored(rules: Iterable[_IgnoreRule], rel: str, is_dir: bool) -> bool:
+    """Gitignore semantics: the last matching rule decides."""
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def _parts_key(rel: str) -> list[str]:
+    """Sort key giving the ``Path`` ordering of ``sorted(root.rglob(...))``."""
+    return rel.split("/")
+
+
+@dataclass
+class _TreeState:
+    """Listings shared by every root-rebased view of one tree."""
+
+    root_rules: list[_IgnoreRule]
+    use_git: bool
+    walks: dict[str, tuple[list[str], list[str]]] = field(default_factory=dict)
+    dir_rules: dict[str, list[_IgnoreRule]] = field(default_factory=dict)
+
+
+class ProjectTree:
+    """Pruned, memoized listing of the files under a project root."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        exclude: Iterable[str] = (),
+        use_git: bool = False,
+        _state: _TreeState | None = None,
+    ) -> None:
+        self.root = root
+        if _state is None:
+            rules: list[_IgnoreRule] = []
+            info_exclude = root / ".git" / "info" / "exclude"
+            if info_exclude.is_file():
+                rules += parse_ignore_patterns(_read_lines(info_exclude))
+            rules += parse_ignore_patterns(_read_lines(root / ".gitignore"))
+            rules += parse_ignore_patterns(exclude)
+            _state = _TreeState(root_rules=rules, use_git=use_git)
+        self._state = _state
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> ProjectTree:
+        """Tree configured from ``exclude`` / ``walker`` in ``.beadloom/config.yml``."""
+        config = load_project_config(project_root)
+        return cls(project_root, exclude=config.exclude, use_git=config.walker == "git")
+
+    def rooted_at(self, root: Path) -> ProjectTree:
+        """The same listings, returned as paths joined onto *root*."""
+        if root == self.root:
+            return self
+        return ProjectTree(root, _state=self._state)
+
+    # -- queries -----------------------------------------------------------
+
+    def files(
+        self, directory: Path | None = None, *, suffixes: Collection[str] | None = None
+    ) -> list[Path]:
+        """Files under *directory* (default: the root), sorted like ``rglob``."""
+        files, _dirs = self._listing(self._rel(directory))
+        return [
+            self.root / rel
+            for rel in files
+            if suffixes is None or PurePosixPath(rel).suffix in suffixes
+        ]
+
+    def glob(self, pattern: str, directory: Path | None = None) -> list[Path]:
+        """Files under *directory* whose name matches *pattern* (``rglob`` semantics)."""
+        files, _dirs = self._listing(self._rel(directory))
+        return [
+            self.root / rel
+            for rel in files
+            if fnmatch.fnmatchcase(rel.rsplit("/", 1)[-1], pattern)
+        ]
+
+    def dirs(self, directory: Path | None = None) -> list[Path]:
+        """Directories under *directory* that the walk descended into."""
+        _files, dirs = self._listing(self._rel(directory))
+        return [self.root / rel for rel in dirs]
+
+    def is_ignored(self, rel: str, *, is_dir: bool = False) -> bool:
+        """True when the walk would never report the root-relative path *rel*."""
+        parts = rel.split("/")
+        if any(part in ALWAYS_PRUNED for part in (parts if is_dir else parts[:-1])):
+            return True
+        for i in range(1, len(parts) + 1):
+            path = "/".join(parts[:i])
+            parent = "/".join(parts[: i - 1])
+            if _is_ignored(self._rules_for(parent), path, is_dir=is_dir or i < len(parts)):
+                return True
+        return False
+
+    # -- walking -----------------------------------------------------------
+
+    def _rel(self, directory: Path | None) -> str:
+        if directory is None:
+            return ""
+        try:
+            rel = directory.relative_to(self.root).as_posix()
+        except ValueError:
+            rel = os.path.relpath(directory, self.root).replace(os.sep, "/")
+        return "" if rel == "." else rel
+
+    def _listing(self, rel_dir: str) -> tuple[list[str], list[str]]:
+        walks = self._state.walks
+        if self._state.use_git and "" not in walks:
+            listed = self._git_listing()
+            if listed is not None:
+                walks[""] = listed
+        for cached, (files, dirs) in walks.items():
+            if cached == rel_dir:
+                return files, dirs
+            if cached == "" or rel_dir.startswith(cached + "/"):
+                return _under(files, rel_dir), _under(dirs, rel_dir)
+        if rel_dir and self.is_ignored(rel_dir, is_dir=True):
+            walks[rel_dir] = ([], [])
+        else:
+            walks[rel_dir] = self._walk(rel_dir)
+        return walks[rel_dir]
+
+    def _rules_for(self, rel_dir: str) -> list[_IgnoreRule]:
+        """Rules in force inside *rel_dir*: the root's plus every ``.gitignore`` on the way."""
+        cached = self._state.dir_rules.get(rel_dir)
+        if cached is not None:
+            return cached
+        if not rel_dir:
+            rules = self._state.root_rules
+        else:
+            parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+            rules = self._rules_for(parent)
+            own = _read_lines(self.root / rel_dir / ".gitignore")
+            if own:
+                rules = rules + parse_ignore_patterns(own, rel_dir)
+        self._state.dir_rules[rel_dir] = rules
+        return rules
+
+    def _walk(self, rel_dir: str) -> tuple[list[str], list[str]]:
+        files: list[str] = []
+        dirs: list[str] = []
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            rules = self._rules_for(current)
+            try:
+                with os.scandir(self.root / current if current else self.root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{current}/{entry.name}" if current else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in ALWAYS_PRUNED or _is_ignored(rules, rel, True):
+                            continue
+                        dirs.append(rel)
+                        stack.append(rel)
+                    elif entry.is_file() and not _is_ignored(rules, rel, False):
+                        files.append(rel)
+                except OSError:
+                    continue
+        files.sort(key=_parts_key)
+        dirs.sort(key=_parts_key)
+        return files, dirs
+
+    def _git_listing(self) -> tuple[list[str], list[str]] | None:
+        """Files from ``git ls-files`` (tracked + untracked, not ignored); ``None`` off git."""
+
+        def ls_files(*args: str) -> list[str]:
+            out = subprocess.run(  # noqa: S603
+                ["git", "ls-files", "-z", *args],  # noqa: S607
+                cwd=self.root,
+                capture_output=True,
+                check=True,
+            ).stdout
+            return [p for p in out.decode("utf-8", "surrogateescape").split("\0") if p]
+
+        try:
+            listed = ls_files("--cached", "--others", "--exclude-standard")
+            deleted = set(ls_files("--deleted"))
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        files = sorted(
+            (rel for rel in set(listed) - deleted if not self.is_ignored(rel)),
+            key=_parts_key,
+        )
+        return files, _with_ancestors(rel.rsplit("/", 1)[0] for rel in files if "/" in rel)
+
+
+def _read_lines(path: Path) -> list[str]:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+
+
+def _under(paths: list[str], rel_dir: str) -> list[str]:
+    """The entries of *paths* strictly below *rel_dir* (order kept)."""
+    if not rel_dir:
+        return paths
+    prefix = rel_dir + "/"
+    return [p for p in paths if p.startswith(prefix)]
+
+
+def _with_ancestors(dirs: Iterable[str]) -> list[str]:
+    every: set[str] = set()
+    for rel in dirs:
+        parts = rel.split("/")
+        every.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return sorted(every, key=_parts_key)
+
+
+_SHARED: dict[Path, ProjectTree] = {}
+
+
+@contextmanager
+def shared_project_tree(project_root: Path) -> Iterator[ProjectTree]:
+    """Make :func:`project_tree` reuse one tree for *project_root* inside the block."""
+    key = project_root.resolve()
+    active = _SHARED.get(key)
+    if active is not None:
+        yield active.rooted_at(project_root)
+        return
+    tree = ProjectTree.for_project(project_root)
+    _SHARED[key] = tree
+    try:
+        yield tree
+    finally:
+        _SHARED.pop(key, None)
+
+
+def shares_project_tree(
+    func: Callable[Concatenate[Path, _P], _R],
+) -> Callable[Concatenate[Path, _P], _R]:
+    """Decorator: run *func* (first argument: the project root) in a shared tree."""
+
+    @functools.wraps(func)
+    def wrapper(project_root: Path, /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        with shared_project_tree(project_root):
+            return func(project_root, *args, **kwargs)
+
+    return wrapper
+
+
+def project_tree(project_root: Path) -> ProjectTree:
+    """The active shared tree for *project_root*, or a fresh one."""
+    active = _SHARED.get(project_root.resolve())
+    if active is not None:
+        return active.rooted_at(project_root)
+    return ProjectTree.for_project(project_root)
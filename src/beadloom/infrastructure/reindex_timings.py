@@ -0,0 +1,207 @@
+"""Per-stage reindex timings and their history in ``meta``.
+
+# beadloom:domain=infrastructure
+# beadloom:component=reindex-timings
+
+A reindex runs a dozen stages (graph load, docs, symbols, imports, rules, test
+mapping, git activity, routes, sync state, reference state, search index,
+health snapshot, file index). :class:`StageClock` times each one: wall time,
+CPU time of the process, the files it handled (when the stage knows), and the
+rows it wrote, read from the connection's ``total_changes``. A stage entered
+more than once, such as the per-file doc and code stages of an incremental
+run, adds up into one entry.
+
+Every run is appended to a short history under the ``reindex_timings`` meta
+key. :func:`timing_regressions` compares the latest run with the median of
+the earlier runs of the same mode, so ``status`` and ``doctor`` can point at a
+stage that suddenly got slower.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from beadloom.infrastructure.db import get_meta, set_meta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# ``meta`` key holding the recent runs, oldest first.
+TIMINGS_META_KEY = "reindex_timings"
+
+# Runs kept in the history.
+_HISTORY_SIZE = 20
+
+# Earlier runs of the same mode needed before a regression is reported.
+_MIN_BASELINE_RUNS = 3
+
+# A stage regressed when it took this many times its median, and at least
+# ``_REGRESSION_MIN_S`` seconds longer (sub-second jitter is not a regression).
+_REGRESSION_FACTOR = 2.0
+_REGRESSION_MIN_S = 0.5
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """What one reindex stage cost."""
+
+    name: str
+    wall_s: float
+    cpu_s: float
+    files: int
+    rows: int
+
+
+@dataclass
+class StageCounter:
+    """Mutable tally a stage fills in while it runs."""
+
+    files: int = 0
+
+
+@dataclass(frozen=True)
+class TimingRegression:
+    """A stage of the latest run that took far longer than usual."""
+
+    stage: str
+    mode: str
+    wall_s: float
+    baseline_s: float
+
+
+class StageClock:
+    """Times the stages of one reindex run on *conn*."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._started = time.perf_counter()
+        self._stages: dict[str, StageTiming] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageCounter]:
+        """Time the enclosed block as stage *name*; the counter takes its file count."""
+        counter = StageCounter()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        rows = self._conn.total_changes
+        try:
+            yield counter
+        finally:
+            try:
+                rows = self._conn.total_changes - rows
+            except sqlite3.ProgrammingError:  # the stage closed the connection
+                rows = 0
+            timing = StageTiming(
+                name,
+                time.perf_counter() - wall,
+                time.process_time() - cpu,
+                counter.files,
+                rows,
+            )
+            prior = self._stages.get(name)
+            if prior is not None:
+                timing = StageTiming(
+                    name,
+                    prior.wall_s + timing.wall_s,
+                    prior.cpu_s + timing.cpu_s,
+                    prior.files + timing.files,
+                    prior.rows + timing.rows,
+                )
+            self._stages[name] = timing
+
+    @property
+    def timings(self) -> list[StageTiming]:
+        """The stages timed so far, in the order they first ran."""
+        return list(self._stages.values())
+
+    @property
+    def elapsed_s(self) -> float:
+        """Wall time since the clock was created."""
+        return time.perf_counter() - self._started
+
+
+def load_timing_history(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """The recorded runs, oldest first; empty when none are stored or readable."""
+    try:
+        raw = get_meta(conn, TIMINGS_META_KEY)
+        history = json.loads(raw) if raw is not None else []
+    except (ValueError, sqlite3.Error):  # no meta table before the first reindex
+        return []
+    if not isinstance(history, list):
+        return []
+    return [
+        run for run in history if isinstance(run, dict) and isinstance(run.get("stages"), list)
+    ]
+
+
+def record_timings(
+    conn: sqlite3.Connection,
+    mode: str,
+    clock: StageClock,
+    *,
+    history: list[dict[str, Any]] | None = None,
+) -> None:
+    """Append this run to the history in ``meta`` (*history* replaces the stored one)."""
+    runs = load_timing_history(conn) if history is None else list(history)
+    runs.append(
+        {
+            "at": datetime.now(tz=timezone.utc).isoformat(),
+            "mode": mode,
+            "wall_s": round(clock.elapsed_s, 4),
+            "stages": [timing_to_dict(timing) for timing in clock.timings],
+        }
+    )
+    set_meta(conn, TIMINGS_META_KEY, json.dumps(runs[-_HISTORY_SIZE:], ensure_ascii=False))
+
+
+def timing_to_dict(timing: StageTiming) -> dict[str, Any]:
+    """JSON form of *timing*, with times rounded to 0.1 ms."""
+    data = asdict(timing)
+    data["wall_s"] = round(timing.wall_s, 4)
+    data["cpu_s"] = round(timing.cpu_s, 4)
+    return data
+
+
+def _stage_walls(run: dict[str, Any]) -> dict[str, float]:
+    """``{stage: wall_s}`` of a recorded run, plus its ``total``."""
+    walls = {
+        str(stage.get("name")): float(stage.get("wall_s", 0.0))
+        for stage in run.get("stages", [])
+        if isinstance(stage, dict)
+    }
+    walls["total"] = float(run.get("wall_s", 0.0))
+    return walls
+
+
+def timing_regressions(history: list[dict[str, Any]]) -> list[TimingRegression]:
+    """Stages of the latest run in *history* that regressed against earlier runs.
+
+    The latest run is compared with the median of the earlier runs of the
+    same mode (``full`` or ``incremental``), stage by stage and in total.
+    Fewer than three earlier runs give no baseline and no regressions.
+    """
+    if not history:
+        return []
+    latest = history[-1]
+    mode = str(latest.get("mode", ""))
+    earlier = [run for run in history[:-1] if run.get("mode") == mode]
+    if len(earlier) < _MIN_BASELINE_RUNS:
+        return []
+
+    baselines = [_stage_walls(run) for run in earlier]
+    regressions: list[TimingRegression] = []
+    for name, wall_s in _stage_walls(latest).items():
+        samples = [base[name] for base in baselines if name in base]
+        if len(samples) < _MIN_BASELINE_RUNS:
+            continue
+        baseline_s = statistics.median(samples)
+        if wall_s > baseline_s * _REGRESSION_FACTOR and wall_s - baseline_s >= _REGRESSION_MIN_S:
+            regressions.append(TimingRegression(name, mode, wall_s, baseline_s))
+    return regressions
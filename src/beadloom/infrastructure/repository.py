@@ -23,6 +23,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.path_stats import prefix_bounds
+
 if TYPE_CHECKING:
     import sqlite3
 
@@ -229,15 +231,21 @@ def get_symbols_for_source(
 ) -> list[SymbolRow]:
     """Return symbols whose ``file_path`` matches a node *source* prefix.
 
-    A directory source (``src/dom/``) matches every file beneath it via a
-    ``LIKE`` prefix; a file source (``src/dom/feat.py``) matches exactly.
+    A directory source (``src/dom/``) matches every file beneath it via an
+    indexed path range; a file source (``src/dom/feat.py``) matches exactly.
     """
-    pattern = source + "%" if source.endswith("/") else source
-    rows = conn.execute(
-        "SELECT symbol_name, kind, line_start FROM code_symbols "
-        "WHERE file_path LIKE ? ORDER BY file_path, line_start",
-        (pattern,),
-    ).fetchall()
+    if source.endswith("/"):
+        rows = conn.execute(
+            "SELECT symbol_name, kind, line_start FROM code_symbols "
+            "WHERE file_path >= ? AND file_path < ? ORDER BY file_path, line_start",
+            prefix_bounds(source),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT symbol_name, kind, line_start FROM code_symbols "
+            "WHERE file_path = ? ORDER BY line_start",
+            (source,),
+        ).fetchall()
     return [
         SymbolRow(str(r["symbol_name"]), str(r["kind"]), int(r["line_start"]))
         for r in rows
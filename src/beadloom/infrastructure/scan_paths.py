@@ -13,6 +13,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.project_config import load_project_config
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -26,12 +28,4 @@ def resolve_scan_paths(project_root: Path) -> list[str]:
     Reads ``scan_paths`` from ``.beadloom/config.yml``.  Falls back to
     ``["src", "lib", "app"]`` when config is absent or has no scan_paths.
     """
-    config_path = project_root / ".beadloom" / "config.yml"
-    if config_path.exists():
-        import yaml
-
-        config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-        paths = config.get("scan_paths")
-        if isinstance(paths, list) and paths:
-            return [str(p) for p in paths]
-    return list(_DEFAULT_SCAN_DIRS)
+    return load_project_config(project_root).scan_paths or list(_DEFAULT_SCAN_DIRS)
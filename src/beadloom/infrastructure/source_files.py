@@ -0,0 +1,134 @@
+"""Streaming file hashes and the parse guard for source files.
+
+# beadloom:domain=infrastructure
+# beadloom:component=source-files
+
+Reindex and sync checks hash every indexed file, and the code indexer parses
+every source file under the scan paths. Both used to read each file whole and
+decode it as UTF-8, so one minified bundle or generated file of tens of
+megabytes cost that much memory, several times over, and a slow parse.
+
+Hashing streams raw bytes in fixed-size chunks and never decodes:
+
+* :func:`hash_file` is the SHA-256 of the bytes on disk (``file_index``);
+* :func:`hash_text_file` also folds ``\\r\\n`` and ``\\r`` to ``\\n`` on the
+  fly, so it matches the digest of the file read in text mode, which is what
+  ``code_symbols`` and ``sync_state`` have always stored.
+
+:func:`skip_reason` tells the parsers which files to hash but not parse: files
+larger than the configured ceiling (``max_file_size`` in ``config.yml``,
+1 MiB by default), and files whose first 8 KiB look binary (a NUL byte or
+invalid UTF-8) or minified (fewer than one line break per 500 bytes). Only the
+first 8 KiB of a file are read to decide, and only once per file version: the
+reindex and each extractor ask about the same file, so the verdict on the
+sample is kept by path, mtime and size.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Bytes read per step when hashing.
+HASH_CHUNK_SIZE = 1 << 16
+
+# Files above this many bytes are hashed but not parsed, unless
+# ``max_file_size`` in ``config.yml`` says otherwise.
+DEFAULT_MAX_FILE_SIZE = 1 << 20
+
+# Head of a file inspected for binary or minified content.
+_SAMPLE_SIZE = 8192
+
+# A full sample with fewer line breaks than one per this many bytes is minified.
+_MINIFIED_LINE_LENGTH = 500
+
+# Process-wide parse ceiling, set by the reindex from ``config.yml``.
+_LIMITS: dict[str, int] = {"max_file_size": DEFAULT_MAX_FILE_SIZE}
+
+# Sample verdict per path: (mtime_ns, size, reason), reused while both match.
+_SAMPLE_VERDICTS: dict[str, tuple[int, int, str | None]] = {}
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 hex digest of the bytes of *path*, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_text_file(path: Path) -> str:
+    """SHA-256 hex digest of *path* with universal newlines, read in chunks.
+
+    Equal to ``sha256(path.read_text(encoding="utf-8").encode())`` for any
+    UTF-8 file, without decoding it or holding it in memory.
+    """
+    digest = hashlib.sha256()
+    pending_cr = False
+    with path.open("rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_SIZE):
+            if pending_cr:
+                chunk = b"\r" + chunk
+            # A trailing "\r" may be the first half of a "\r\n" split across reads.
+            pending_cr = chunk.endswith(b"\r")
+            if pending_cr:
+                chunk = chunk[:-1]
+            digest.update(chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+    if pending_cr:
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def configure_max_file_size(size: int | None) -> None:
+    """Set the parse ceiling in bytes (``None`` restores the default)."""
+    _LIMITS["max_file_size"] = DEFAULT_MAX_FILE_SIZE if size is None else size
+
+
+def max_file_size() -> int:
+    """The current parse ceiling in bytes."""
+    return _LIMITS["max_file_size"]
+
+
+def skip_reason(path: Path) -> str | None:
+    """Why *path* should be hashed but not parsed; ``None`` when it can be parsed.
+
+    A file that cannot be read is left to the caller (``None``).
+    """
+    limit = _LIMITS["max_file_size"]
+    try:
+        stat = path.stat()
+        size = stat.st_size
+        if size > limit:
+            return f"larger than {limit} bytes ({size} bytes)"
+        key = str(path)
+        cached = _SAMPLE_VERDICTS.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, size):
+            return cached[2]
+        with path.open("rb") as fh:
+            sample = fh.read(_SAMPLE_SIZE)
+    except OSError:
+        return None
+    reason = _sample_reason(sample, size)
+    _SAMPLE_VERDICTS[key] = (stat.st_mtime_ns, size, reason)
+    return reason
+
+
+def _sample_reason(sample: bytes, size: int) -> str | None:
+    """Why the head *sample* of a *size*-byte file rules out parsing, if it does."""
+    if b"\0" in sample:
+        return "binary content"
+    try:
+        # A multi-byte character may straddle the end of a partial sample.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=size <= _SAMPLE_SIZE)
+    except UnicodeDecodeError:
+        return "not UTF-8 text"
+    # "\n", "\r\n" and a lone "\r" each end a line.
+    line_breaks = sample.count(b"\n") + sample.count(b"\r") - sample.count(b"\r\n")
+    if len(sample) == _SAMPLE_SIZE and line_breaks < _SAMPLE_SIZE // _MINIFIED_LINE_LENGTH:
+        return "minified (long lines)"
+    return None
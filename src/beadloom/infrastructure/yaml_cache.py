@@ -0,0 +1,171 @@
+"""Content-addressed parsed-YAML cache for the graph YAML files.
+
+# beadloom:domain=infrastructure
+# beadloom:component=yaml-cache
+
+The same ``.beadloom/_graph/*.yml`` files are parsed by several independent
+readers in one command — the graph loader, the doc-ref map builder, the rules
+loader, ``graph diff`` and the doc generator. :func:`load_yaml_file` gives
+them one access layer:
+
+* parsing uses libyaml's ``CSafeLoader`` when PyYAML was built with it, and
+  falls back to the pure-Python ``SafeLoader`` otherwise (same safe subset);
+* parsed documents are cached by the SHA-256 of the file *content*, so a
+  second read of an unchanged file is a cache hit regardless of path or mtime,
+  and an edited file can never be served stale;
+* the in-memory cache stores the document in pickled form and every hit
+  unpickles a fresh object graph, so callers that mutate the result (the YAML
+  patchers) never corrupt the cached copy; those bytes are produced by this
+  process and never leave it;
+* an optional on-disk layer (:func:`configure_disk_cache`) persists documents
+  across processes as ``<sha256>.json`` files. Files in a project directory
+  are not trusted, so the disk layer is plain JSON, never pickle: a document
+  that JSON cannot represent exactly (dates, non-string keys) is simply not
+  written to disk.
+
+YAML syntax errors are never cached — they propagate as ``yaml.YAMLError``
+exactly as from ``yaml.safe_load``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:  # pragma: no branch - depends on how PyYAML was built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# In-memory entries kept per process (pickled documents, oldest evicted first).
+_MAX_ENTRIES = 512
+
+
+def safe_load(text: str) -> Any:
+    """Parse *text* with the fastest available safe loader (uncached)."""
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+class YamlDocumentCache:
+    """Parsed YAML documents keyed by the SHA-256 of their source text.
+
+    Entries are held as pickled bytes (compact, and every hit yields an
+    independent object graph). *disk_dir*, when set, adds a persistent layer
+    of ``<sha256>.json`` files shared across processes.
+    """
+
+    def __init__(self, *, max_entries: int = _MAX_ENTRIES, disk_dir: Path | None = None) -> None:
+        self._store: OrderedDict[str, bytes] = OrderedDict()
+        self._max_entries = max_entries
+        self.disk_dir = disk_dir
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk layer is left as is)."""
+        self._store.clear()
+
+    def load(self, text: str, *, key: str | None = None) -> Any:
+        """Return the parsed document for *text* (``key`` = its precomputed hash)."""
+        if key is None:
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        blob = self._store.get(key)
+        if blob is not None:
+            self._store.move_to_end(key)
+            # Only bytes pickled by this process are ever stored in memory.
+            return pickle.loads(blob)  # noqa: S301
+
+        raw = self._read_disk(key)
+        if raw is not None:
+            try:
+                doc = json.loads(raw)
+            except ValueError:  # truncated / foreign file
+                pass
+            else:
+                self._remember(key, pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL))
+                return doc
+
+        doc = safe_load(text)
+        self._remember(key, pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL))
+        if self.disk_dir is not None:
+            try:
+                raw = json.dumps(doc, ensure_ascii=False, allow_nan=False).encode("utf-8")
+            except (TypeError, ValueError):  # dates, binary, sets, NaN
+                raw = None
+            # Non-string keys would come back as strings: keep exact documents only.
+            if raw is not None and json.loads(raw) == doc:
+                self._write_disk(key, raw)
+        return doc
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        self._store[key] = blob
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if self.disk_dir is None:
+            return None
+        try:
+            return (self.disk_dir / f"{key}.json").read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, blob: bytes) -> None:
+        """Persist *blob* atomically (temp file + rename); best-effort."""
+        if self.disk_dir is None:
+            return
+        tmp_name: str | None = None
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(blob)
+            Path(tmp_name).replace(self.disk_dir / f"{key}.json")
+            tmp_name = None
+        except OSError:
+            # A read-only / full disk only loses the cross-process speed-up.
+            pass
+        finally:
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    Path(tmp_name).unlink()
+
+
+# Process-wide cache shared by every graph-YAML reader.
+_CACHE = YamlDocumentCache()
+
+
+def load_yaml_text(text: str) -> Any:
+    """Parse YAML *text*, served from the content-hash cache when possible."""
+    return _CACHE.load(text)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Read and parse the YAML file at *path* through the content-hash cache.
+
+    Raises ``OSError`` / ``UnicodeDecodeError`` for unreadable files and
+    ``yaml.YAMLError`` for malformed YAML, like ``yaml.safe_load(path.read_text())``.
+    """
+    data = path.read_bytes()
+    return _CACHE.load(data.decode("utf-8"), key=hashlib.sha256(data).hexdigest())
+
+
+def configure_disk_cache(directory: Path | None) -> None:
+    """Enable (or, with ``None``, disable) the shared cache's on-disk layer."""
+    _CACHE.disk_dir = directory
+
+
+def clear_yaml_cache() -> None:
+    """Drop every in-memory entry of the shared cache."""
+    _CACHE.clear()
@@ -86,7 +86,7 @@ def _load_graph_from_yaml(
     project_root: Path,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """Load all graph nodes and edges from ``.beadloom/_graph/*.yml``."""
-    import yaml
+    from beadloom.infrastructure.yaml_cache import load_yaml_file
 
     graph_dir = project_root / ".beadloom" / "_graph"
     nodes: list[dict[str, Any]] = []
@@ -94,7 +94,7 @@ def _load_graph_from_yaml(
     for yml in sorted(graph_dir.glob("*.yml")):
         if yml.name == "rules.yml":
             continue
-        data = yaml.safe_load(yml.read_text(encoding="utf-8"))
+        data = load_yaml_file(yml)
         if data:
             nodes.extend(data.get("nodes", []))
             edges.extend(data.get("edges", []))
@@ -548,9 +548,8 @@ def _patch_docs_field(graph_dir: Path, docs_map: dict[str, str]) -> None:
         Mapping of ``{ref_id: relative_doc_path}`` for files that were
         **newly created** (not skipped).
     """
-    import yaml
-
     from beadloom.infrastructure.atomic_io import write_yaml_atomic
+    from beadloom.infrastructure.yaml_cache import load_yaml_file
 
     if not docs_map:
         return
@@ -559,7 +558,7 @@ def _patch_docs_field(graph_dir: Path, docs_map: dict[str, str]) -> None:
         if yml.name == "rules.yml":
             continue
 
-        data = yaml.safe_load(yml.read_text(encoding="utf-8"))
+        data = load_yaml_file(yml)
         if not data or "nodes" not in data:
             continue
 
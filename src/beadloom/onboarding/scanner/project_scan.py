@@ -9,6 +9,7 @@ import json
 import re
 from typing import TYPE_CHECKING
 
+from beadloom.infrastructure.project_tree import project_tree
 from beadloom.onboarding.scanner.constants import (
     _CLUSTER_SKIP,
     _CODE_EXTENSIONS,
@@ -38,6 +39,7 @@ def scan_project(project_root: Path) -> ScanResult:
     manifests: list[str] = []
     file_count = 0
     extensions: set[str] = set()
+    tree = project_tree(project_root)
 
     # Pass 1: known source dirs.
     known_dirs: list[str] = []
@@ -52,12 +54,8 @@ def scan_project(project_root: Path) -> ScanResult:
         if item.is_dir():
             if item.name in _SOURCE_DIRS:
                 known_dirs.append(item.name)
-                for f in item.rglob("*"):
-                    if (
-                        f.is_file()
-                        and f.suffix in _CODE_EXTENSIONS
-                        and not _is_in_skip_dir(f, item)
-                    ):
+                for f in tree.files(item, suffixes=_CODE_EXTENSIONS):
+                    if not _is_in_skip_dir(f, item):
                         file_count += 1
                         extensions.add(f.suffix)
             elif item.name not in _SKIP_DIRS:
@@ -68,8 +66,8 @@ def scan_project(project_root: Path) -> ScanResult:
     for dir_name in other_dirs:
         dir_path = project_root / dir_name
         count = 0
-        for f in dir_path.rglob("*"):
-            if f.is_file() and f.suffix in _CODE_EXTENSIONS and not _is_in_skip_dir(f, dir_path):
+        for f in tree.files(dir_path, suffixes=_CODE_EXTENSIONS):
+            if not _is_in_skip_dir(f, dir_path):
                 count += 1
                 extensions.add(f.suffix)
         if count > 0:
@@ -105,6 +103,7 @@ def _cluster_by_dirs(
     """
     clusters: dict[str, list[str]] = {}
     dirs_to_scan = source_dirs if source_dirs is not None else list(_SOURCE_DIRS)
+    tree = project_tree(project_root)
 
     for src_dir_name in dirs_to_scan:
         src_dir = project_root / src_dir_name
@@ -119,12 +118,8 @@ def _cluster_by_dirs(
                 and sub.name not in _CLUSTER_SKIP
             ):
                 files = []
-                for f in sub.rglob("*"):
-                    if (
-                        f.is_file()
-                        and f.suffix in _CODE_EXTENSIONS
-                        and not _is_in_skip_dir(f, sub)
-                    ):
+                for f in tree.files(sub, suffixes=_CODE_EXTENSIONS):
+                    if not _is_in_skip_dir(f, sub):
                         files.append(str(f.relative_to(project_root)))
                 if files:
                     clusters[sub.name] = files
@@ -151,6 +146,7 @@ def _cluster_with_children(
     """
     result: dict[str, ClusterEntry] = {}
     dirs_to_scan = source_dirs if source_dirs is not None else list(_SOURCE_DIRS)
+    tree = project_tree(project_root)
 
     for src_dir_name in dirs_to_scan:
         src_dir = project_root / src_dir_name
@@ -173,12 +169,8 @@ def _cluster_with_children(
                     if item.name in _RECURSIVE_SKIP or item.name in _CLUSTER_SKIP:
                         continue
                     child_files = []
-                    for f in item.rglob("*"):
-                        if (
-                            f.is_file()
-                            and f.suffix in _CODE_EXTENSIONS
-                            and not _is_in_skip_dir(f, item)
-                        ):
+                    for f in tree.files(item, suffixes=_CODE_EXTENSIONS):
+                        if not _is_in_skip_dir(f, item):
                             child_files.append(str(f.relative_to(project_root)))
                     if child_files:
                         children[item.name] = child_files
@@ -32,19 +32,14 @@ def _warn_missing_parsers(project_root: Path) -> None:
     availability via ``check_parser_availability``.  When missing parsers
     are detected, emits a ``click.secho`` warning with install instructions.
     """
-    config_path = project_root / ".beadloom" / "config.yml"
-    if not config_path.exists():
-        return
-
-    import yaml
-
-    from beadloom.context_oracle.code_indexer import check_parser_availability
+    from beadloom.infrastructure.project_config import load_project_config
 
-    config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-    languages: list[str] = config.get("languages", [])
+    languages = load_project_config(project_root).languages
     if not languages:
         return
 
+    from beadloom.context_oracle.code_indexer import check_parser_availability
+
     # Normalise: config may store bare names ("python") or extensions (".py").
     # Map common language names to their canonical extensions.
     name_to_exts: dict[str, list[str]] = {
@@ -111,6 +111,7 @@ def docs_site(
     """
     from beadloom.application.site import generate_site
     from beadloom.infrastructure.db import connection
+    from beadloom.infrastructure.project_tree import shared_project_tree
 
     project_root = project or Path.cwd()
     db_path = project_root / ".beadloom" / "beadloom.db"
@@ -119,9 +120,12 @@ def docs_site(
         sys.exit(1)
 
     out = out_dir if out_dir is not None else project_root / "site"
-    with connection(db_path) as conn:
+    with connection(db_path) as conn, shared_project_tree(project_root):
         result = generate_site(conn, out, project_root=project_root, federated=federated)
-    click.echo(f"Generated {len(result.written)} files under {out}")
+    click.echo(
+        f"Generated {len(result.written)} files under {out} "
+        f"({len(result.updated)} updated, {len(result.removed)} removed)"
+    )
 
 
 @docs.command("audit")
@@ -7,11 +7,15 @@ import json
 import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from beadloom.services.commands._root import _warn_missing_parsers, main
 
+if TYPE_CHECKING:
+    from beadloom.infrastructure.reindex_timings import StageTiming
+
 
 # beadloom:domain=reindex
 @main.command()
@@ -33,7 +37,25 @@ from beadloom.services.commands._root import _warn_missing_parsers, main
     default=False,
     help="Force full rebuild (drop all tables and re-create).",
 )
-def reindex(*, project: Path | None, docs_dir: Path | None, full: bool) -> None:
+@click.option("--timings", is_flag=True, help="Show wall/CPU time, files and rows per stage.")
+@click.option(
+    "--json", "as_json", is_flag=True, help="JSON output (counts, diagnostics, timings)."
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a cProfile dump of the reindex to this file.",
+)
+def reindex(
+    *,
+    project: Path | None,
+    docs_dir: Path | None,
+    full: bool,
+    timings: bool,
+    as_json: bool,
+    profile: Path | None,
+) -> None:
     """Rebuild the SQLite index from Git sources.
 
     By default, performs an incremental reindex (only changed files).
@@ -41,34 +63,56 @@ def reindex(*, project: Path | None, docs_dir: Path | None, full: bool) -> None:
     """
     project_root = project or Path.cwd()
 
-    if full:
-        from beadloom.application.reindex import reindex as do_reindex
+    profiler = None
+    if profile is not None:
+        import cProfile
 
-        result = do_reindex(project_root, docs_dir=docs_dir)
-    else:
-        from beadloom.application.reindex import incremental_reindex
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        if full:
+            from beadloom.application.reindex import reindex as do_reindex
+
+            result = do_reindex(project_root, docs_dir=docs_dir)
+        else:
+            from beadloom.application.reindex import incremental_reindex
 
-        result = incremental_reindex(project_root, docs_dir=docs_dir)
+            result = incremental_reindex(project_root, docs_dir=docs_dir)
+    finally:
+        if profiler is not None and profile is not None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+            click.echo(f"Profile written to {profile}", err=True)
+
+    # Nothing changed — report the current DB totals instead of zeros.
+    totals = _index_totals(project_root) if result.nothing_changed else None
+
+    if as_json:
+        from beadloom.infrastructure.reindex_timings import timing_to_dict
+
+        payload: dict[str, object] = {
+            "nothing_changed": result.nothing_changed,
+            "nodes": result.nodes_loaded,
+            "edges": result.edges_loaded,
+            "docs": result.docs_indexed,
+            "chunks": result.chunks_indexed,
+            "symbols": result.symbols_indexed,
+            "imports": result.imports_indexed,
+            "rules": result.rules_loaded,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "wall_s": round(result.wall_s, 4),
+            "timings": [timing_to_dict(t) for t in result.timings],
+        }
+        payload.update(totals or {})
+        click.echo(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
 
     if result.nothing_changed:
-        # Nothing changed — show current DB totals instead.
-        db_path = project_root / ".beadloom" / "beadloom.db"
-        if db_path.exists():
-            import sqlite3
-
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            try:
-                counts = {
-                    "Nodes": conn.execute("SELECT count(*) FROM nodes").fetchone()[0],
-                    "Edges": conn.execute("SELECT count(*) FROM edges").fetchone()[0],
-                    "Docs": conn.execute("SELECT count(*) FROM docs").fetchone()[0],
-                    "Symbols": conn.execute("SELECT count(*) FROM code_symbols").fetchone()[0],
-                }
-                click.echo("No changes detected. Index is up to date.")
-                for label, count in counts.items():
-                    click.echo(f"{label + ':':9s}{count}")
-            finally:
-                conn.close()
+        if totals is not None:
+            click.echo("No changes detected. Index is up to date.")
+            for key, count in totals.items():
+                click.echo(f"{key.capitalize() + ':':9s}{count}")
         else:
             click.echo("No changes detected.")
     else:
@@ -88,11 +132,45 @@ def reindex(*, project: Path | None, docs_dir: Path | None, full: bool) -> None:
         for warn in result.warnings:
             click.echo(f"  [warn] {warn}")
 
+    if timings:
+        _echo_timings(result.timings, result.wall_s)
+
     # Warn about missing language parsers when symbols == 0.
     if result.symbols_indexed == 0 and not result.nothing_changed:
         _warn_missing_parsers(project_root)
 
 
+def _index_totals(project_root: Path) -> dict[str, int] | None:
+    """Node, edge, doc and symbol totals of the index (``None`` without one)."""
+    db_path = project_root / ".beadloom" / "beadloom.db"
+    if not db_path.exists():
+        return None
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return {
+            "nodes": conn.execute("SELECT count(*) FROM nodes").fetchone()[0],
+            "edges": conn.execute("SELECT count(*) FROM edges").fetchone()[0],
+            "docs": conn.execute("SELECT count(*) FROM docs").fetchone()[0],
+            "symbols": conn.execute("SELECT count(*) FROM code_symbols").fetchone()[0],
+        }
+    finally:
+        conn.close()
+
+
+def _echo_timings(stages: list[StageTiming], wall_s: float) -> None:
+    """Print the per-stage timing table of a reindex."""
+    click.echo("")
+    click.echo(f"{'Stage':16s}{'Wall':>10s}{'CPU':>10s}{'Files':>8s}{'Rows':>9s}")
+    for stage in stages:
+        files = str(stage.files) if stage.files else "-"
+        click.echo(
+            f"{stage.name:16s}{stage.wall_s:>9.3f}s{stage.cpu_s:>9.3f}s{files:>8s}{stage.rows:>9d}"
+        )
+    click.echo(f"{'total':16s}{wall_s:>9.3f}s")
+
+
 # beadloom:domain=doctor
 @main.command()
 @click.option(
@@ -8,6 +8,7 @@ import json
 import re
 import sys
 from pathlib import Path
+from typing import cast
 
 import click
 
@@ -172,6 +173,7 @@ def _status_json(data: object) -> dict[str, object]:
         "by_kind": {kr["kind"]: kr["cnt"] for kr in data.kind_rows},
         "trends": data.trends,
         "context_metrics": data.context_metrics,
+        "reindex_timings": data.reindex_timings,
     }
 
 
@@ -275,3 +277,27 @@ def _render_status(data: object) -> None:
         ctx_table.add_row("Largest bundle", f"~{largest_tokens:,} tokens")
     ctx_table.add_row("Total indexed", f"{total_syms:,} symbols")
     console.print(ctx_table)
+
+    # Reindex Timings section: the last run's slowest stages, and any regressions.
+    timings = data.reindex_timings
+    if timings:
+        stages = cast("list[dict[str, object]]", timings["stages"])
+        regressions = cast("list[dict[str, object]]", timings["regressions"])
+        usual = {
+            str(reg["stage"]): f"[yellow]usually {reg['baseline_s']:.2f}s[/]"
+            for reg in regressions
+        }
+        time_table = Table(title="Reindex Timings", show_header=False, box=None, padding=(0, 1))
+        time_table.add_column("stage", style="cyan")
+        time_table.add_column("wall", justify="right")
+        time_table.add_column("note")
+        time_table.add_row(
+            f"Total ({timings['mode']})", f"{timings['wall_s']:.2f}s", usual.get("total", "")
+        )
+        slowest = sorted(stages, key=lambda st: -float(str(st["wall_s"])))
+        for rank, st in enumerate(slowest):
+            name = str(st["name"])
+            if rank < 3 or name in usual:
+                time_table.add_row(name, f"{st['wall_s']:.2f}s", usual.get(name, ""))
+        console.print()
+        console.print(time_table)
@@ -5,12 +5,16 @@ from __future__ import annotations
 
 import logging
 import sqlite3
-from typing import TYPE_CHECKING, ClassVar
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Header
 
+from beadloom.context_oracle.code_indexer import retain_parse_trees
 from beadloom.tui.data_providers import (
     ActivityDataProvider,
     ContextDataProvider,
@@ -27,7 +31,6 @@ from beadloom.tui.screens.explorer import ExplorerScreen
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
 
     from textual.worker import Worker
 
@@ -41,6 +44,41 @@ SCREEN_DASHBOARD = "dashboard"
 SCREEN_EXPLORER = "explorer"
 SCREEN_DOC_STATUS = "doc_status"
 
+# Cached providers, in refresh order, and the kinds of changed file
+# ("graph" YAML, "doc", "code") their data is derived from.
+_PROVIDER_INPUTS: dict[str, frozenset[str]] = {
+    "graph": frozenset({"graph", "code"}),
+    "lint": frozenset({"graph", "doc", "code"}),
+    "sync": frozenset({"graph", "doc", "code"}),
+    "debt": frozenset({"graph", "doc", "code"}),
+    "activity": frozenset({"graph"}),
+}
+
+
+def _change_kinds(paths: list[str], project_root: Path) -> frozenset[str]:
+    """Classify watcher-reported *paths* as ``graph`` / ``doc`` / ``code`` changes."""
+    graph_dir = project_root / ".beadloom" / "_graph"
+    kinds: set[str] = set()
+    for raw in paths:
+        path = Path(raw)
+        if not path.is_absolute():
+            path = project_root / path
+        if path.is_relative_to(graph_dir):
+            kinds.add("graph")
+        elif path.suffix == ".md":
+            kinds.add("doc")
+        else:
+            kinds.add("code")
+    return frozenset(kinds)
+
+
+def _providers_to_refresh(paths: list[str] | None, project_root: Path) -> list[str]:
+    """Names of the providers whose inputs *paths* touch (all when unknown)."""
+    if paths is None:
+        return list(_PROVIDER_INPUTS)
+    kinds = _change_kinds(paths, project_root)
+    return [name for name, inputs in _PROVIDER_INPUTS.items() if inputs & kinds]
+
 
 class BeadloomApp(App[None]):
     """Beadloom interactive terminal dashboard — multi-screen architecture."""
@@ -75,7 +113,15 @@ class BeadloomApp(App[None]):
         self.no_watch = no_watch
         self._conn: sqlite3.Connection | None = None
         self._file_watcher_worker: Worker[None] | None = None
+        # Parse trees kept while watching, so reindexing a saved file reparses
+        # it incrementally.
+        self._parse_trees = ExitStack()
         self._shutting_down: bool = False
+        # Paths reported by the file watcher since the last reindex.
+        self._pending_changed_paths: set[str] = set()
+        # Background reindex (one at a time; a request while it runs is queued).
+        self._reindex_worker: Worker[None] | None = None
+        self._reindex_queued: bool = False
 
         # Data providers (initialized on mount)
         self.graph_provider: GraphDataProvider | None = None
@@ -104,6 +150,11 @@ class BeadloomApp(App[None]):
         """Read-only view of the file-watcher Worker (``None`` when watching is disabled)."""
         return self._file_watcher_worker
 
+    @property
+    def reindex_worker(self) -> Worker[None] | None:
+        """Read-only view of the last background reindex Worker (``None`` before the first)."""
+        return self._reindex_worker
+
     def _open_db(self) -> sqlite3.Connection:
         """Open SQLite connection (WAL mode — safe for concurrent access).
 
@@ -170,6 +221,8 @@ class BeadloomApp(App[None]):
             source_paths,
         )
         self._file_watcher_worker = worker
+        if worker is not None:
+            self._parse_trees.enter_context(retain_parse_trees())
 
         # Update status bar to show watcher state
         self._for_each_status_bar(lambda bar: bar.set_watcher_active(worker is not None))
@@ -194,6 +247,7 @@ class BeadloomApp(App[None]):
 
     def on_reindex_needed(self, message: ReindexNeeded) -> None:
         """Handle file-change notification from the watcher."""
+        self._pending_changed_paths.update(message.changed_paths)
         count = len(message.changed_paths)
         logger.info("Reindex needed: %d file(s) changed", count)
 
@@ -210,6 +264,7 @@ class BeadloomApp(App[None]):
                 stop_event.set()
             self._file_watcher_worker.cancel()
             self._file_watcher_worker = None
+        self._parse_trees.close()
         if self._conn is not None:
             self._conn.close()
             self._conn = None
@@ -293,19 +348,32 @@ class BeadloomApp(App[None]):
             self.open_explorer(ref_id)
 
     def action_reindex(self) -> None:
-        """Trigger reindex in background, refresh providers, clear watcher badge."""
-        from beadloom.application.reindex import incremental_reindex
+        """Start a background reindex; providers and widgets refresh when it finishes.
 
-        incremental_reindex(self.project_root)
-        self._refresh_providers()
-
-        # Clear the "changes detected" badge on all screens
-        self._for_each_status_bar(lambda bar: bar.clear_changes())
-
-        # Refresh visible screen widgets
-        self._refresh_screen_widgets()
+        The reindex and the provider recomputation run on a thread worker, so
+        the UI stays responsive. A request while one is running is queued and
+        starts when it finishes (with every path reported in the meantime).
+        """
+        if self._reindex_worker is not None and self._reindex_worker.is_running:
+            self._reindex_queued = True
+            self.notify("Reindex already running — queued")
+            return
 
-        self.notify("Reindex complete")
+        # Re-hash only what the watcher reported; with no watcher events (or
+        # watching disabled) scan the whole project and refresh everything.
+        # A failed run puts these paths back (see ``_finish_reindex``).
+        changed = sorted(self._pending_changed_paths) or None
+        self._pending_changed_paths.clear()
+        providers = _providers_to_refresh(changed, self.project_root)
+
+        self._show_progress("reindexing")
+        self._reindex_worker = self.run_worker(
+            partial(self._reindex_in_background, changed, providers),
+            name="reindex",
+            group="reindex",
+            thread=True,
+            exit_on_error=False,
+        )
 
     def action_lint(self) -> None:
         """Run lint check, notify, and update status bar."""
@@ -337,18 +405,77 @@ class BeadloomApp(App[None]):
             lambda bar, msg=message: bar.show_notification(msg)  # type: ignore[misc]
         )
 
-    def _refresh_providers(self) -> None:
-        """Refresh all data providers after reindex."""
-        if self.graph_provider is not None:
-            self.graph_provider.refresh()
-        if self.lint_provider is not None:
-            self.lint_provider.refresh()
-        if self.sync_provider is not None:
-            self.sync_provider.refresh()
-        if self.debt_provider is not None:
-            self.debt_provider.refresh()
-        if self.activity_provider is not None:
-            self.activity_provider.refresh()
+    def _provider(self, name: str) -> Any:
+        """The cached data provider registered as ``<name>_provider``."""
+        return getattr(self, f"{name}_provider", None)
+
+    def _reindex_in_background(self, changed: list[str] | None, names: list[str]) -> None:
+        """Worker body: reindex, then recompute *names* on a private connection.
+
+        Runs off the UI thread, so it never touches the app's connection or a
+        provider's cache; every UI update goes through ``call_from_thread``.
+        """
+        from beadloom.application.reindex import incremental_reindex
+
+        try:
+            incremental_reindex(self.project_root, changed_paths=changed)
+            fresh: dict[str, Any] = {}
+            conn = self._open_db()
+            try:
+                for index, name in enumerate(names, 1):
+                    provider = self._provider(name)
+                    if provider is None:
+                        continue
+                    self._post_from_worker(
+                        self._show_progress, f"refreshing {name} ({index}/{len(names)})"
+                    )
+                    fresh[name] = provider.compute(conn)
+            finally:
+                conn.close()
+        except Exception as exc:
+            logger.exception("Background reindex failed")
+            self._post_from_worker(self._finish_reindex, None, str(exc), changed)
+            return
+        self._post_from_worker(self._finish_reindex, fresh, "", changed)
+
+    def _post_from_worker(self, callback: Callable[..., object], *args: object) -> None:
+        """Run *callback* on the UI thread; a no-op once the app is shutting down."""
+        if self._shutting_down:
+            return
+        try:
+            self.call_from_thread(callback, *args)
+        except RuntimeError:
+            logger.debug("Reindex worker: app is no longer running")
+
+    def _show_progress(self, message: str) -> None:
+        self._for_each_status_bar(lambda bar: bar.set_progress(message))
+
+    def _finish_reindex(
+        self, fresh: dict[str, Any] | None, error: str, changed: list[str] | None = None
+    ) -> None:
+        """UI-thread completion: swap every recomputed cache in at once, then repaint.
+
+        On failure the *changed* paths the run took over are pending again, so
+        the next reindex still re-hashes them.
+        """
+        self._for_each_status_bar(lambda bar: bar.clear_progress())
+        if fresh is None:
+            self._pending_changed_paths.update(changed or ())
+            self.notify(f"Reindex failed: {error}", severity="error")
+        else:
+            for name, data in fresh.items():
+                provider = self._provider(name)
+                if provider is not None:
+                    provider.swap(data)
+            # Clear the "changes detected" badge on all screens
+            if not self._pending_changed_paths:
+                self._for_each_status_bar(lambda bar: bar.clear_changes())
+            self._refresh_screen_widgets()
+            self.notify("Reindex complete")
+
+        if self._reindex_queued:
+            self._reindex_queued = False
+            self.action_reindex()
 
     def _refresh_screen_widgets(self) -> None:
         """Refresh widgets on the currently active screen."""
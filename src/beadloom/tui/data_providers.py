@@ -4,6 +4,11 @@
 Each provider accepts a sqlite3.Connection and project_root Path,
 and provides read-only access to a specific data domain.
 All providers support refresh() for reactive updates after reindex.
+
+Cached providers split ``refresh()`` into ``compute(conn)`` — builds the new
+cache from any connection and touches no provider state, so the TUI runs it
+on a background worker with that thread's own connection — and ``swap()``,
+which installs the result on the UI thread in one assignment.
 """
 
 from __future__ import annotations
@@ -31,16 +36,27 @@ class GraphDataProvider:
 
     def refresh(self) -> None:
         """Reload nodes and edges from the database."""
+        self.swap(self.compute(self.conn))
+
+    def compute(
+        self, conn: sqlite3.Connection
+    ) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+        """Read nodes and edges through *conn* without touching the cache."""
         from beadloom.application import graph_reads
 
-        self._nodes = [
+        nodes = [
             {"ref_id": n.ref_id, "kind": n.kind, "summary": n.summary}
-            for n in graph_reads.get_all_nodes(self.conn)
+            for n in graph_reads.get_all_nodes(conn)
         ]
-        self._edges = [
+        edges = [
             {"src": e.src_ref_id, "dst": e.dst_ref_id, "kind": e.kind}
-            for e in graph_reads.get_all_edges(self.conn)
+            for e in graph_reads.get_all_edges(conn)
         ]
+        return nodes, edges
+
+    def swap(self, data: tuple[list[dict[str, str]], list[dict[str, str]]]) -> None:
+        """Install a :meth:`compute` result as the cached nodes and edges."""
+        self._nodes, self._edges = data
 
     def get_nodes(self) -> list[dict[str, str]]:
         """Return all graph nodes."""
@@ -157,29 +173,36 @@ class LintDataProvider:
 
     def refresh(self) -> None:
         """Re-evaluate lint rules and cache violations."""
+        self.swap(self.compute(self.conn))
+
+    def compute(self, conn: sqlite3.Connection) -> list[dict[str, str | None]]:
+        """Evaluate lint rules through *conn* without touching the cache."""
         from beadloom.graph.rule_engine import evaluate_all, load_rules
 
         rules_path = self.project_root / ".beadloom" / "_graph" / "rules.yml"
         if not rules_path.exists():
-            self._violations = []
-            return
+            return []
 
         try:
             rules = load_rules(rules_path)
-            violations = evaluate_all(self.conn, rules)
-            self._violations = [
-                {
-                    "rule_name": v.rule_name,
-                    "severity": v.severity,
-                    "from_ref_id": v.from_ref_id,
-                    "to_ref_id": v.to_ref_id,
-                    "description": v.rule_description,
-                }
-                for v in violations
-            ]
+            violations = evaluate_all(conn, rules)
         except (ValueError, OSError) as exc:
             logger.warning("Lint evaluation failed: %s", exc)
-            self._violations = []
+            return []
+        return [
+            {
+                "rule_name": v.rule_name,
+                "severity": v.severity,
+                "from_ref_id": v.from_ref_id,
+                "to_ref_id": v.to_ref_id,
+                "description": v.rule_description,
+            }
+            for v in violations
+        ]
+
+    def swap(self, violations: list[dict[str, str | None]]) -> None:
+        """Install a :meth:`compute` result as the cached violations."""
+        self._violations = violations
 
     def get_violations(self) -> list[dict[str, str | None]]:
         """Return all lint violations."""
@@ -203,13 +226,21 @@ class SyncDataProvider:
 
     def refresh(self) -> None:
         """Re-run sync check and cache results."""
+        self.swap(self.compute(self.conn))
+
+    def compute(self, conn: sqlite3.Connection) -> list[dict[str, Any]]:
+        """Run sync check through *conn* without touching the cache."""
         from beadloom.doc_sync.engine import check_sync
 
         try:
-            self._results = check_sync(self.conn, project_root=self.project_root)
+            return check_sync(conn, project_root=self.project_root)
         except (OSError, ValueError, sqlite3.OperationalError) as exc:
             logger.warning("Sync check failed: %s", exc)
-            self._results = []
+            return []
+
+    def swap(self, results: list[dict[str, Any]]) -> None:
+        """Install a :meth:`compute` result as the cached sync results."""
+        self._results = results
 
     def get_sync_results(self) -> list[dict[str, Any]]:
         """Return all sync pair results."""
@@ -241,6 +272,10 @@ class DebtDataProvider:
 
     def refresh(self) -> None:
         """Recompute debt report and cache it."""
+        self.swap(self.compute(self.conn))
+
+    def compute(self, conn: sqlite3.Connection) -> Any:
+        """Build the debt report through *conn* without touching the cache."""
         from beadloom.application.debt_report import (
             collect_debt_data,
             compute_debt_score,
@@ -249,11 +284,15 @@ class DebtDataProvider:
 
         try:
             weights = load_debt_weights(self.project_root)
-            debt_data = collect_debt_data(self.conn, self.project_root, weights)
-            self._report = compute_debt_score(debt_data, weights)
+            debt_data = collect_debt_data(conn, self.project_root, weights)
+            return compute_debt_score(debt_data, weights)
         except (OSError, ValueError) as exc:
             logger.warning("Debt report failed: %s", exc)
-            self._report = None
+            return None
+
+    def swap(self, report: Any) -> None:
+        """Install a :meth:`compute` result as the cached report."""
+        self._report = report
 
     def get_debt_report(self) -> Any:
         """Return the full DebtReport object, or None on error."""
@@ -280,21 +319,28 @@ class ActivityDataProvider:
 
     def refresh(self) -> None:
         """Re-analyze git activity and cache results."""
+        self.swap(self.compute(self.conn))
+
+    def compute(self, conn: sqlite3.Connection) -> dict[str, Any]:
+        """Analyze git activity (sources read through *conn*) without touching the cache."""
         from beadloom.application import graph_reads
         from beadloom.infrastructure.git_activity import analyze_git_activity
 
         # Build source_dirs from the graph index via the application facade.
-        source_dirs = graph_reads.get_node_sources(self.conn)
+        source_dirs = graph_reads.get_node_sources(conn)
 
         if not source_dirs:
-            self._activities = {}
-            return
+            return {}
 
         try:
-            self._activities = analyze_git_activity(self.project_root, source_dirs)
+            return analyze_git_activity(self.project_root, source_dirs)
         except (OSError, ValueError) as exc:
             logger.warning("Git activity analysis failed: %s", exc)
-            self._activities = {}
+            return {}
+
+    def swap(self, activities: dict[str, Any]) -> None:
+        """Install a :meth:`compute` result as the cached activity mapping."""
+        self._activities = activities
 
     def get_activity(self) -> dict[str, Any]:
         """Return activity mapping {ref_id: GitActivity}."""
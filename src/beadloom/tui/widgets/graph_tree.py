@@ -1,16 +1,25 @@
 # beadloom:service=tui
-"""Graph tree widget showing architecture hierarchy with doc status indicators."""
+"""Graph tree widget showing architecture hierarchy with doc status indicators.
+
+The tree is materialized lazily: a node's children are only created when the
+node is first expanded, from a pre-sorted parent -> children index. Refreshes
+reconcile the materialized part of the tree against the new index instead of
+rebuilding it, so expansion state survives a reindex.
+"""
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
 from textual.message import Message
 from textual.widgets import Tree
 
 if TYPE_CHECKING:
-    from textual.widgets._tree import TreeNode
+    from collections.abc import Sequence
+
+    from textual.widgets._tree import NodeID, TreeNode
 
     from beadloom.tui.data_providers import GraphDataProvider, SyncDataProvider
 
@@ -84,11 +93,70 @@ def _build_node_label(
     return f"{indicator} {ref_id} [{count} edges]"
 
 
+@dataclass(frozen=True)
+class _TreeIndex:
+    """Indexed graph hierarchy the tree is materialized from.
+
+    ``children`` maps a parent ref_id to its children, already sorted by
+    (kind order, ref_id); ``roots`` are the nodes that are nobody's child.
+    Labels are built on demand, only for nodes that get materialized.
+    """
+
+    roots: tuple[str, ...]
+    children: dict[str, tuple[str, ...]]
+    doc_ref_ids: set[str]
+    stale_ref_ids: set[str]
+    edge_counts: dict[str, int]
+
+    def label(self, ref_id: str) -> str:
+        return _build_node_label(
+            ref_id,
+            doc_ref_ids=self.doc_ref_ids,
+            stale_ref_ids=self.stale_ref_ids,
+            edge_counts=self.edge_counts,
+        )
+
+    def has_children(self, ref_id: str) -> bool:
+        return bool(self.children.get(ref_id))
+
+
+def _index_graph(
+    nodes: list[dict[str, str]],
+    hierarchy: dict[str, list[str]],
+    *,
+    doc_ref_ids: set[str],
+    stale_ref_ids: set[str],
+    edge_counts: dict[str, int],
+) -> _TreeIndex:
+    """Build a :class:`_TreeIndex` with one dict lookup per node kind."""
+    kinds = {n["ref_id"]: n["kind"] for n in nodes}
+
+    def sort_key(ref_id: str) -> tuple[int, str]:
+        return _KIND_ORDER.get(kinds.get(ref_id, "other"), 99), ref_id
+
+    all_children: set[str] = set()
+    for child_ids in hierarchy.values():
+        all_children.update(child_ids)
+
+    return _TreeIndex(
+        roots=tuple(sorted(kinds.keys() - all_children, key=sort_key)),
+        children={
+            parent: tuple(sorted(child_ids, key=sort_key))
+            for parent, child_ids in hierarchy.items()
+        },
+        doc_ref_ids=doc_ref_ids,
+        stale_ref_ids=stale_ref_ids,
+        edge_counts=edge_counts,
+    )
+
+
 class GraphTreeWidget(Tree[str]):
     """Interactive tree widget showing the architecture graph hierarchy.
 
     Nodes are organized by part_of edges: root -> domains -> features/services.
     Each node label includes a doc status indicator and edge count badge.
+    Children are added when a node is first expanded, so mounting costs
+    O(root-level nodes) regardless of graph size.
 
     Messages:
         NodeSelected: Emitted when the user selects a tree node.
@@ -112,28 +180,42 @@ class GraphTreeWidget(Tree[str]):
         super().__init__(_ROOT_LABEL, id=widget_id)
         self._graph_provider = graph_provider
         self._sync_provider = sync_provider
+        self._index: _TreeIndex | None = None
+        # Tree nodes whose children have been materialized.
+        self._loaded: set[NodeID] = set()
 
     def on_mount(self) -> None:
         """Build the tree when the widget is mounted."""
         self._build_tree()
 
     def _build_tree(self) -> None:
-        """Build the tree structure from graph data providers."""
-        root = self.root
-        root.remove_children()
+        """Sync the tree with the graph data providers.
 
-        if self._graph_provider is None:
+        The first call materializes the root level only; later calls diff the
+        already-materialized nodes against the new hierarchy.
+        """
+        root = self.root
+        index = self._load_index()
+        if index is None:
+            self._index = None
+            self._loaded.clear()
+            root.remove_children()
             root.add_leaf(_EMPTY_LABEL)
             return
 
+        self._index = index
+        self._loaded.add(root.id)
+        self._sync_children(root, index.roots)
+        root.expand()
+
+    def _load_index(self) -> _TreeIndex | None:
+        """Read the providers into a :class:`_TreeIndex` (``None`` when empty)."""
+        if self._graph_provider is None:
+            return None
+
         nodes = self._graph_provider.get_nodes()
         if not nodes:
-            root.add_leaf(_EMPTY_LABEL)
-            return
-
-        hierarchy = self._graph_provider.get_hierarchy()
-        edge_counts = self._graph_provider.get_edge_counts()
-        doc_ref_ids = self._graph_provider.get_doc_ref_ids()
+            return None
 
         # Get stale ref_ids from sync provider
         stale_ref_ids: set[str] = set()
@@ -148,90 +230,82 @@ class GraphTreeWidget(Tree[str]):
             except Exception:
                 logger.debug("Failed to load sync data for tree", exc_info=True)
 
-        # Collect all ref_ids that are children of something
-        all_children: set[str] = set()
-        for children in hierarchy.values():
-            all_children.update(children)
-
-        # Identify root-level nodes (not children of anything)
-        all_ref_ids = {n["ref_id"] for n in nodes}
-        root_level = sorted(
-            all_ref_ids - all_children,
-            key=lambda r: (_KIND_ORDER.get(
-                self._get_node_kind(r, nodes), 99
-            ), r),
+        return _index_graph(
+            nodes,
+            self._graph_provider.get_hierarchy(),
+            doc_ref_ids=self._graph_provider.get_doc_ref_ids(),
+            stale_ref_ids=stale_ref_ids,
+            edge_counts=self._graph_provider.get_edge_counts(),
         )
 
-        for ref_id in root_level:
-            label = _build_node_label(
-                ref_id,
-                doc_ref_ids=doc_ref_ids,
-                stale_ref_ids=stale_ref_ids,
-                edge_counts=edge_counts,
-            )
-            if hierarchy.get(ref_id):
-                branch = root.add(label, data=ref_id)
-                self._add_child_nodes(
-                    branch,
-                    ref_id,
-                    hierarchy=hierarchy,
-                    doc_ref_ids=doc_ref_ids,
-                    stale_ref_ids=stale_ref_ids,
-                    edge_counts=edge_counts,
-                    nodes=nodes,
-                )
-            else:
-                root.add_leaf(label, data=ref_id)
-
-        root.expand()
-
-    def _add_child_nodes(
-        self,
-        parent_node: TreeNode[str],
-        parent_ref_id: str,
-        *,
-        hierarchy: dict[str, list[str]],
-        doc_ref_ids: set[str],
-        stale_ref_ids: set[str],
-        edge_counts: dict[str, int],
-        nodes: list[dict[str, str]],
+    def _add_graph_node(
+        self, parent: TreeNode[str], ref_id: str, *, before: int | None = None
     ) -> None:
-        """Recursively add children to a tree node."""
-        children = hierarchy.get(parent_ref_id, [])
-        sorted_children = sorted(
-            children,
-            key=lambda r: (_KIND_ORDER.get(
-                self._get_node_kind(r, nodes), 99
-            ), r),
+        """Add an unexpanded node for *ref_id*; its children come on expand."""
+        assert self._index is not None
+        parent.add(
+            self._index.label(ref_id),
+            data=ref_id,
+            before=before,
+            allow_expand=self._index.has_children(ref_id),
         )
-        for child_ref_id in sorted_children:
-            label = _build_node_label(
-                child_ref_id,
-                doc_ref_ids=doc_ref_ids,
-                stale_ref_ids=stale_ref_ids,
-                edge_counts=edge_counts,
-            )
-            if hierarchy.get(child_ref_id):
-                branch = parent_node.add(label, data=child_ref_id)
-                self._add_child_nodes(
-                    branch,
-                    child_ref_id,
-                    hierarchy=hierarchy,
-                    doc_ref_ids=doc_ref_ids,
-                    stale_ref_ids=stale_ref_ids,
-                    edge_counts=edge_counts,
-                    nodes=nodes,
-                )
-            else:
-                parent_node.add_leaf(label, data=child_ref_id)
 
-    @staticmethod
-    def _get_node_kind(ref_id: str, nodes: list[dict[str, str]]) -> str:
-        """Get the kind for a ref_id from the nodes list."""
-        for node in nodes:
-            if node["ref_id"] == ref_id:
-                return node["kind"]
-        return "other"
+    def _sync_children(self, parent: TreeNode[str], wanted: Sequence[str]) -> None:
+        """Make *parent*'s children match *wanted*, reusing surviving nodes.
+
+        Surviving nodes keep their expansion state and are updated in place
+        (label, expandability); materialized ones are reconciled recursively.
+        When the surviving nodes changed relative order (a node's kind
+        changed), the level is rebuilt instead.
+        """
+        assert self._index is not None
+        wanted_set = set(wanted)
+        for child in list(parent.children):
+            if child.data not in wanted_set:
+                self._discard(child)
+
+        kept = {child.data: child for child in parent.children if child.data is not None}
+        if [ref_id for ref_id in wanted if ref_id in kept] != list(kept):
+            for child in list(parent.children):
+                self._discard(child)
+            kept = {}
+
+        for position, ref_id in enumerate(wanted):
+            node = kept.get(ref_id)
+            if node is None:
+                self._add_graph_node(parent, ref_id, before=position)
+                continue
+            label = self._index.label(ref_id)
+            if str(node.label) != label:
+                node.set_label(label)
+            children = self._index.children.get(ref_id, ())
+            node.allow_expand = bool(children)
+            if node.id not in self._loaded:
+                continue
+            if children:
+                self._sync_children(node, children)
+            else:
+                for child in list(node.children):
+                    self._discard(child)
+                self._loaded.discard(node.id)
+
+    def _discard(self, node: TreeNode[str]) -> None:
+        """Remove *node* and forget the materialized state of its subtree."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self._loaded.discard(current.id)
+            stack.extend(current.children)
+        node.remove()
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[str]) -> None:
+        """Materialize a node's children the first time it is expanded."""
+        node = event.node
+        if self._index is None or node.id in self._loaded or node.data is None:
+            return
+        self._loaded.add(node.id)
+        for child_ref_id in self._index.children.get(node.data, ()):
+            self._add_graph_node(node, child_ref_id)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected[str]) -> None:
         """Handle tree node selection — emit NodeSelected message."""
@@ -244,10 +318,11 @@ class GraphTreeWidget(Tree[str]):
         graph_provider: GraphDataProvider | None = None,
         sync_provider: SyncDataProvider | None = None,
     ) -> None:
-        """Rebuild the tree from updated providers.
+        """Update the tree from updated providers.
 
-        If providers are given, they replace the current ones.
-        Then the tree is rebuilt from scratch.
+        If providers are given, they replace the current ones. The tree is
+        then reconciled with the new hierarchy: only added, removed or
+        relabelled nodes are touched, and expanded branches stay expanded.
         """
         if graph_provider is not None:
             self._graph_provider = graph_provider
@@ -9,6 +9,7 @@ from textual.widgets import Static
 # Watcher status indicators
 _WATCHER_ACTIVE = "\u25cf"  # filled circle
 _WATCHER_INACTIVE = "\u25cb"  # empty circle
+_PROGRESS = "\u27f3"  # clockwise open circle arrow
 
 # Watcher state constants
 WATCHER_OFF = "off"
@@ -24,7 +25,9 @@ class StatusBarWidget(Static):
     - ``"changes"`` — watcher detected file changes (yellow + count).
     - ``"off"`` — watcher disabled or watchfiles not installed (dim).
 
-    The last action message auto-dismisses on next data refresh.
+    The last action message auto-dismisses on next data refresh. While a
+    background reindex runs, its progress message is shown after the watcher
+    badge until :meth:`clear_progress`.
     """
 
     DEFAULT_CSS = """
@@ -48,12 +51,18 @@ class StatusBarWidget(Static):
         self._watcher_state: str = WATCHER_OFF
         self._change_count: int = 0
         self._last_action: str = ""
+        self._progress: str = ""
 
     @property
     def last_action(self) -> str:
         """Read-only view of the current transient action message."""
         return self._last_action
 
+    @property
+    def progress(self) -> str:
+        """Read-only view of the background-task progress message."""
+        return self._progress
+
     def render(self) -> Text:
         """Render the status bar as Rich Text."""
         text = Text()
@@ -81,6 +90,10 @@ class StatusBarWidget(Static):
         else:
             text.append(f"{_WATCHER_INACTIVE} watcher off", style="dim")
 
+        # Background task progress
+        if self._progress:
+            text.append(f"  |  {_PROGRESS} {self._progress}", style="cyan")
+
         # Last action message
         if self._last_action:
             text.append(f"  |  {self._last_action}", style="italic")
@@ -135,6 +148,16 @@ class StatusBarWidget(Static):
         self._change_count = 0
         self.refresh()
 
+    def set_progress(self, message: str) -> None:
+        """Show the progress of a running background task (e.g. reindex)."""
+        self._progress = message
+        self.refresh()
+
+    def clear_progress(self) -> None:
+        """Remove the background-task progress message."""
+        self._progress = ""
+        self.refresh()
+
     def set_last_action(self, message: str) -> None:
         """Show a transient action message in the status bar."""
         self._last_action = message
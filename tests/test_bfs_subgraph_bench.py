@@ -0,0 +1,122 @@
+"""Micro-benchmark for beadloom.context_oracle.builder.bfs_subgraph.
+
+Runs the traversal on a synthetic layered graph at ``max_nodes`` 10/100/1000,
+checks the result against the original list-dedup / per-node-sort
+implementation kept below as the reference, and records both timings as test
+properties (``--junitxml`` reports them). Nothing asserts on wall-clock time,
+so the benchmark never flakes on a slow machine.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from beadloom.context_oracle.builder import _EDGE_PRIORITY, bfs_subgraph
+from beadloom.infrastructure.db import create_schema, open_db
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable
+    from pathlib import Path
+
+_KINDS = ("part_of", "uses", "depends_on", "touches_code", "implements", "custom")
+
+
+def _reference_bfs(
+    conn: sqlite3.Connection, focus: list[str], depth: int, max_nodes: int
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """The pre-optimisation traversal (list ``in`` dedup, keyed sort per node)."""
+    visited: set[str] = set()
+    nodes: list[dict[str, Any]] = []
+    edges: list[dict[str, Any]] = []
+    queue: deque[tuple[str, int]] = deque()
+    for rid in focus:
+        if rid not in visited and len(visited) < max_nodes:
+            visited.add(rid)
+            row = conn.execute(
+                "SELECT ref_id, kind, summary FROM nodes WHERE ref_id = ?", (rid,)
+            ).fetchone()
+            if row is not None:
+                nodes.append(dict(row))
+                queue.append((rid, 0))
+    while queue:
+        current, level = queue.popleft()
+        if level >= depth:
+            continue
+        neighbors = [
+            (r[1], r[0], r[1], r[2])
+            for r in conn.execute(
+                "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.src_ref_id = ?",
+                (current,),
+            ).fetchall()
+        ] + [
+            (r[0], r[0], r[1], r[2])
+            for r in conn.execute(
+                "SELECT e.src_ref_id, e.dst_ref_id, e.kind FROM edges e WHERE e.dst_ref_id = ?",
+                (current,),
+            ).fetchall()
+        ]
+        neighbors.sort(key=lambda x: _EDGE_PRIORITY.get(x[3], 99))
+        for neighbor, src, dst, kind in neighbors:
+            edge = {"src": src, "dst": dst, "kind": kind}
+            if edge not in edges:
+                edges.append(edge)
+            if neighbor in visited:
+                continue
+            if len(visited) >= max_nodes:
+                break
+            visited.add(neighbor)
+            row = conn.execute(
+                "SELECT ref_id, kind, summary FROM nodes WHERE ref_id = ?", (neighbor,)
+            ).fetchone()
+            if row is not None:
+                nodes.append(dict(row))
+                queue.append((neighbor, level + 1))
+    return nodes, edges
+
+
+@pytest.fixture(scope="module")
+def graph(tmp_path_factory: pytest.TempPathFactory) -> sqlite3.Connection:
+    """~3000 nodes, each linked to a few earlier nodes with mixed edge kinds."""
+    db_path: Path = tmp_path_factory.mktemp("bench") / "bench.db"
+    conn = open_db(db_path)
+    create_schema(conn)
+    count = 3000
+    conn.executemany(
+        "INSERT INTO nodes (ref_id, kind, summary) VALUES (?, 'feature', ?)",
+        [(f"n{i}", f"node {i}") for i in range(count)],
+    )
+    edges = {
+        (f"n{i}", f"n{(i * 7 + j * 13) % i}", _KINDS[(i + j) % len(_KINDS)])
+        for i in range(1, count)
+        for j in range(4)
+    }
+    conn.executemany("INSERT INTO edges (src_ref_id, dst_ref_id, kind) VALUES (?, ?, ?)", edges)
+    conn.commit()
+    return conn
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("max_nodes", [10, 100, 1000])
+def test_bfs_benchmark_matches_reference(
+    graph: sqlite3.Connection,
+    max_nodes: int,
+    record_property: Callable[[str, object], None],
+) -> None:
+    focus = ["n0", "n1500"]
+    expected, ref_seconds = _timed(lambda: _reference_bfs(graph, focus, 4, max_nodes))
+    actual, new_seconds = _timed(lambda: bfs_subgraph(graph, focus, depth=4, max_nodes=max_nodes))
+
+    assert actual == expected
+    assert len(actual[0]) == max_nodes
+    record_property(f"reference_seconds_{max_nodes}", round(ref_seconds, 6))
+    record_property(f"bfs_seconds_{max_nodes}", round(new_seconds, 6))
@@ -9,11 +9,13 @@ from typing import TYPE_CHECKING
 import pytest
 
 from beadloom.graph.c4 import (
+    C4Model,
     C4Node,
     C4Relationship,
     _c4_element_name,
     _compute_depths,
     _load_edges,
+    build_c4_model,
     filter_c4_nodes,
     map_to_c4,
     render_c4_mermaid,
@@ -1558,6 +1560,48 @@ class TestFilterEdgeCases:
         assert comp_ids == {"loader", "diff"}
 
 
+class TestC4Model:
+    """C4Model.filter answers exactly what filter_c4_nodes does, from an index."""
+
+    @pytest.mark.parametrize(
+        ("level", "scope"),
+        [
+            ("context", None),
+            ("container", None),
+            ("component", "beadloom"),
+            ("component", "graph"),
+            ("component", "loader"),
+            ("component", "ext-db"),
+        ],
+    )
+    def test_matches_filter_c4_nodes(self, level: str, scope: str | None) -> None:
+        nodes, rels = _build_realistic_nodes()
+        expected = filter_c4_nodes(nodes, rels, level=level, scope=scope)
+        assert C4Model(nodes, rels).filter(level=level, scope=scope) == expected
+
+    def test_unknown_or_missing_scope_raises(self) -> None:
+        model = C4Model(*_build_realistic_nodes())
+        with pytest.raises(ValueError, match="not found"):
+            model.filter(level="component", scope="nope")
+        with pytest.raises(ValueError, match="requires --scope"):
+            model.filter(level="component")
+
+    def test_cached_views_are_not_shared_lists(self) -> None:
+        model = C4Model(*_build_realistic_nodes())
+        first, _ = model.filter(level="container")
+        first.clear()
+        assert len(model.filter(level="container")[0]) == 4
+
+    def test_build_maps_the_graph_once(self, conn: sqlite3.Connection) -> None:
+        _insert_node(conn, "app", kind="service", summary="App")
+        _insert_node(conn, "core", kind="domain", summary="Core")
+        _insert_edge(conn, "core", "app", "part_of")
+        model = build_c4_model(conn)
+        assert model.filter(level="component", scope="app") == filter_c4_nodes(
+            *map_to_c4(conn), level="component", scope="app"
+        )
+
+
 # ===========================================================================
 # BEAD-06: Test augmentation — edge cases, uncovered lines, CLI integration
 # ===========================================================================
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import pstats
 from typing import TYPE_CHECKING
 
 import yaml
@@ -330,3 +332,74 @@ class TestReindexMissingParserWarning:
         # Assert
         assert result.exit_code == 0, result.output
         assert "No parser available" not in result.output
+
+
+class TestReindexTimings:
+    def test_reindex_timings_table(self, tmp_path: Path) -> None:
+        """--timings prints one row per stage and the total."""
+        # Arrange
+        project = _minimal_project(tmp_path)
+        runner = CliRunner()
+
+        # Act
+        result = runner.invoke(main, ["reindex", "--full", "--timings", "--project", str(project)])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Stage" in result.output
+        assert "symbols" in result.output
+        assert "total" in result.output
+
+    def test_reindex_json_and_profile(self, tmp_path: Path) -> None:
+        """--json prints counts and timings; --profile writes a cProfile dump."""
+        # Arrange
+        project = _minimal_project(tmp_path)
+        profile = tmp_path / "reindex.prof"
+        runner = CliRunner()
+
+        # Act
+        result = runner.invoke(
+            main,
+            ["reindex", "--full", "--json", "--profile", str(profile), "--project", str(project)],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.stdout)
+        assert payload["nothing_changed"] is False
+        assert payload["wall_s"] > 0
+        assert {"name", "wall_s", "cpu_s", "files", "rows"} <= set(payload["timings"][0])
+        assert "Profile written to" in result.stderr
+        assert pstats.Stats(str(profile)).total_calls > 0
+
+    def test_reindex_json_no_op_reports_db_totals(self, tmp_path: Path) -> None:
+        """A no-op run's --json counts are the index totals, not zeros."""
+        # Arrange
+        project = _minimal_project(tmp_path)
+        (project / ".beadloom" / "_graph" / "graph.yml").write_text(
+            yaml.dump(
+                {
+                    "nodes": [
+                        {"ref_id": "F1", "kind": "feature", "summary": "Feature 1"},
+                        {"ref_id": "F2", "kind": "feature", "summary": "Feature 2"},
+                    ],
+                    "edges": [{"src": "F1", "dst": "F2", "kind": "depends_on"}],
+                }
+            )
+        )
+        (project / ".beadloom" / "config.yml").write_text(
+            "languages:\n- python\nscan_paths:\n- src\n"
+        )
+        (project / "src").mkdir()
+        (project / "src" / "app.py").write_text("def handler():\n    pass\n")
+        runner = CliRunner()
+        runner.invoke(main, ["reindex", "--full", "--project", str(project)])
+
+        # Act
+        result = runner.invoke(main, ["reindex", "--json", "--project", str(project)])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.stdout)
+        assert payload["nothing_changed"] is True
+        assert (payload["nodes"], payload["edges"], payload["symbols"]) == (2, 1, 1)
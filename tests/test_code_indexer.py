@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
+from tree_sitter import Parser
 
 from beadloom.context_oracle.code_indexer import (
+    ParseTreeCache,
     check_parser_availability,
     clear_cache,
     extract_symbols,
     get_lang_config,
+    get_parser,
     parse_annotations,
+    retain_parse_trees,
     supported_extensions,
 )
 
@@ -284,6 +289,21 @@ class TestGetLangConfig:
         exts = supported_extensions()
         assert ".py" in exts
 
+    def test_parser_is_pooled_per_thread(self) -> None:
+        config = get_lang_config(".py")
+        assert config is not None
+        parser = get_parser(config)
+        assert get_parser(config) is parser
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(get_parser, config).result()
+        assert other is not parser
+
+        clear_cache()
+        reloaded = get_lang_config(".py")
+        assert reloaded is not None
+        assert get_parser(reloaded) is not parser
+
 
 # --- Multi-language extract_symbols ---
 
@@ -552,3 +572,50 @@ class TestCheckParserAvailability:
         """Python parser should always be available (it is a core dependency)."""
         result = check_parser_availability([".py"])
         assert result == {".py": True}
+
+
+# --- Incremental reparsing ---
+
+
+class TestParseTreeCache:
+    SOURCE = "def a():\n    return 1\n\n\ndef b():\n    return 'é'\n"
+
+    def test_edit_is_parsed_incrementally(self) -> None:
+        config = get_lang_config(".py")
+        assert config is not None
+        cache = ParseTreeCache()
+        cache.parse("m.py", config, self.SOURCE.encode())
+        edited = self.SOURCE.replace("return 1", "x = 2\n    return x").encode()
+        tree = cache.parse("m.py", config, edited)
+        assert cache.incremental_parses == 1
+        assert str(tree.root_node) == str(Parser(config.language).parse(edited).root_node)
+        assert tree.root_node.children[1].start_point.row == 5
+
+    def test_unchanged_source_reuses_tree(self) -> None:
+        config = get_lang_config(".py")
+        assert config is not None
+        cache = ParseTreeCache()
+        first = cache.parse("m.py", config, self.SOURCE.encode())
+        assert cache.parse("m.py", config, self.SOURCE.encode()) is first
+        assert cache.incremental_parses == 0
+
+    def test_least_recent_file_is_evicted(self) -> None:
+        config = get_lang_config(".py")
+        assert config is not None
+        cache = ParseTreeCache(max_files=1)
+        first = cache.parse("a.py", config, b"x = 1\n")
+        cache.parse("b.py", config, b"y = 2\n")
+        assert cache.parse("a.py", config, b"x = 1\n") is not first
+
+    def test_retained_block_keeps_symbols_exact(self, tmp_path: Path) -> None:
+        f = tmp_path / "m.py"
+        f.write_text(self.SOURCE)
+        with retain_parse_trees() as cache:
+            with retain_parse_trees() as nested:
+                assert nested is cache
+            extract_symbols(f)
+            f.write_text("# beadloom:domain=x\n" + self.SOURCE)
+            retained = extract_symbols(f)
+            assert cache.incremental_parses == 1
+        assert retained == extract_symbols(f)
+        assert [s["line_start"] for s in retained] == [2, 6]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from beadloom.context_oracle.builder import (
+    SymbolIndex,
     bfs_subgraph,
     build_context,
     collect_chunks,
@@ -425,3 +426,46 @@ class TestBuildContext:
         bundle = build_context(conn, ["PROJ-1"])
         # Without actual file mtime check, warning should be None
         assert bundle["warning"] is None
+
+
+# --- SymbolIndex ---
+
+
+class TestSymbolIndex:
+    def _insert_symbol(
+        self, conn: sqlite3.Connection, file_path: str, name: str, annotations: str
+    ) -> None:
+        conn.execute(
+            "INSERT INTO code_symbols "
+            "(file_path, symbol_name, kind, line_start, line_end, annotations, file_hash) "
+            "VALUES (?, ?, 'function', 1, 2, ?, 'h')",
+            (file_path, name, annotations),
+        )
+        conn.commit()
+
+    def test_lookup_keeps_table_order_and_dedups(self, conn: sqlite3.Connection) -> None:
+        self._insert_symbol(conn, "b.py", "two", '{"feature": "F2"}')
+        self._insert_symbol(conn, "a.py", "one", '{"domain": "D", "feature": "F1"}')
+        self._insert_symbol(conn, "b.py", "two", '{"feature": "F1"}')
+        self._insert_symbol(conn, "c.py", "none", "{}")
+        index = SymbolIndex(conn)
+        found = index.lookup({"F1", "F2"})
+        assert [(s["file_path"], s["symbol_name"]) for s in found] == [
+            ("b.py", "two"),
+            ("a.py", "one"),
+        ]
+        assert index.lookup({"D"})[0]["symbol_name"] == "one"
+        assert index.lookup({"missing"}) == []
+
+    def test_symbols_share_file_path_strings(self, conn: sqlite3.Connection) -> None:
+        self._insert_symbol(conn, "pkg/mod.py", "one", '{"feature": "F1"}')
+        self._insert_symbol(conn, "pkg/mod.py", "two", '{"feature": "F1"}')
+        first, second = SymbolIndex(conn).lookup({"F1"})
+        assert first["file_path"] is second["file_path"]
+        assert set(first) == {"file_path", "symbol_name", "kind", "line_start", "line_end"}
+
+    def test_shared_index_matches_per_call_scan(self, conn: sqlite3.Connection) -> None:
+        _insert_node(conn, "F1", "feature", "Feature")
+        self._insert_symbol(conn, "a.py", "one", '{"feature": "F1"}')
+        shared = build_context(conn, ["F1"], symbol_index=SymbolIndex(conn))
+        assert shared == build_context(conn, ["F1"])
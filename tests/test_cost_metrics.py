@@ -163,3 +163,52 @@ class TestStatusContextMetrics:
         assert isinstance(metrics["largest_bundle_tokens"], int)
         assert isinstance(metrics["largest_bundle_ref_id"], str)
         assert isinstance(metrics["total_symbols"], int)
+
+
+class TestComputeContextMetricsCache:
+    def test_matches_uncached_bundles(self, tmp_path: Path) -> None:
+        import json
+
+        from beadloom.application.status import compute_context_metrics
+        from beadloom.context_oracle.builder import build_context
+        from beadloom.infrastructure.db import connection
+
+        project = _setup_project(tmp_path)
+        with connection(project / ".beadloom" / "beadloom.db") as conn:
+            sizes = {
+                rid: estimate_tokens(
+                    json.dumps(
+                        build_context(conn, [rid], depth=1, max_nodes=10, max_chunks=5),
+                        ensure_ascii=False,
+                    )
+                )
+                for (rid,) in conn.execute("SELECT ref_id FROM nodes").fetchall()
+            }
+            metrics = compute_context_metrics(conn, len(sizes), 1)
+        assert metrics["avg_bundle_tokens"] == sum(sizes.values()) // len(sizes)
+        assert metrics["largest_bundle_tokens"] == max(sizes.values())
+
+    def test_reused_until_next_reindex(self, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        from beadloom.application.reindex import reindex
+        from beadloom.application.status import compute_context_metrics
+        from beadloom.infrastructure.db import connection
+
+        project = _setup_project(tmp_path)
+        db_path = project / ".beadloom" / "beadloom.db"
+        with connection(db_path) as conn:
+            changes = conn.total_changes
+            first = compute_context_metrics(conn, 3, 1)
+            with patch("beadloom.context_oracle.builder.build_context") as build:
+                assert compute_context_metrics(conn, 3, 7) == {**first, "total_symbols": 7}
+            build.assert_not_called()
+            # Reading status never writes to the index.
+            assert conn.total_changes == changes
+
+        reindex(project)
+        with connection(db_path) as conn, patch(
+            "beadloom.context_oracle.builder.build_context", return_value={}
+        ) as build:
+            compute_context_metrics(conn, 3, 1)
+        assert build.call_count == 3
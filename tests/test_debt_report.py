@@ -30,6 +30,7 @@ from beadloom.application.debt_report import (
     load_debt_weights,
 )
 from beadloom.infrastructure.db import create_schema, open_db
+from beadloom.infrastructure.path_stats import refresh_path_stats
 
 # Note: format_debt_report is imported locally in test methods to avoid
 # circular import issues with Rich, and to test that the public API is
@@ -452,6 +453,7 @@ class TestCollectDebtData:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/big/mod{i}.py", f"func_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
 
         data = collect_debt_data(conn, project_root)
@@ -2272,6 +2274,7 @@ class TestCollectDebtDataEdgeCases:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/small/mod{i}.py", f"func_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
         data = collect_debt_data(conn, project_root)
         assert data.oversized_count == 0
@@ -2337,6 +2340,7 @@ class TestCollectDebtDataEdgeCases:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/custom/m{i}.py", f"fn_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
         # With threshold=30, 50 symbols should be oversized
         low_weights = DebtWeights(oversized_symbols=30)
@@ -2773,6 +2777,7 @@ class TestCountOversizedExcludesChildren:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/beadloom/graph/g{i}.py", f"gfunc_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
 
         # Threshold 200: parent has 150 own + 100 child = 250 total
@@ -2796,6 +2801,7 @@ class TestCountOversizedExcludesChildren:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/leaf/f{i}.py", f"func_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
         _count, refs = _count_oversized(conn, threshold=200)
         assert "leaf" in refs
@@ -2823,7 +2829,137 @@ class TestCountOversizedExcludesChildren:
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (f"src/root/big/m{i}.py", f"func_{i}", "function", 1, 10, "{}", "h"),
             )
+        refresh_path_stats(conn)
         conn.commit()
         _count, refs = _count_oversized(conn, threshold=200)
         assert "big-child" in refs
         assert "root" not in refs  # root has 0 own symbols
+
+
+# ===========================================================================
+# Reindex-stamped category cache
+# ===========================================================================
+
+
+class TestDebtCategoryCache:
+    """Category results are reused until the reindex stamp (or their key) changes."""
+
+    def _seed(self, conn: sqlite3.Connection, stamp: str = "2026-01-01T00:00:00") -> None:
+        from beadloom.infrastructure.db import set_meta
+
+        conn.execute(
+            "INSERT INTO nodes (ref_id, kind, summary, source) VALUES (?, ?, ?, ?)",
+            ("alpha", "domain", "Alpha", "src/alpha/"),
+        )
+        for i in range(3):
+            conn.execute(
+                "INSERT INTO code_symbols (file_path, symbol_name, kind, "
+                "line_start, line_end, annotations, file_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (f"src/alpha/m{i}.py", f"f{i}", "function", 1, 2, "{}", "h"),
+            )
+        refresh_path_stats(conn)
+        set_meta(conn, "last_reindex_at", stamp)
+
+    def test_same_stamp_reuses_every_category(
+        self, conn: sqlite3.Connection, project_root: Path
+    ) -> None:
+        from unittest.mock import patch
+
+        from beadloom.application.debt_report import collect
+
+        self._seed(conn)
+        first = collect_debt_data(conn, project_root)
+        with (
+            patch.object(collect, "_count_violations") as lint,
+            patch.object(collect, "_count_oversized") as oversized,
+            patch.object(collect, "_count_untested") as untested,
+        ):
+            second = collect_debt_data(conn, project_root)
+        lint.assert_not_called()
+        oversized.assert_not_called()
+        untested.assert_not_called()
+        assert second == first
+
+    def test_new_stamp_recomputes(self, conn: sqlite3.Connection, project_root: Path) -> None:
+        from beadloom.infrastructure.db import set_meta
+
+        self._seed(conn)
+        assert collect_debt_data(conn, project_root).undocumented_count == 1
+        conn.execute(
+            "INSERT INTO docs (path, kind, ref_id, hash) VALUES (?, ?, ?, ?)",
+            ("alpha.md", "domain", "alpha", "h"),
+        )
+        # Same stamp: the cached result stands until the next reindex.
+        assert collect_debt_data(conn, project_root).undocumented_count == 1
+        set_meta(conn, "last_reindex_at", "2026-01-02T00:00:00")
+        assert collect_debt_data(conn, project_root).undocumented_count == 0
+
+    def test_threshold_change_recomputes_only_that_category(
+        self, conn: sqlite3.Connection, project_root: Path
+    ) -> None:
+        from unittest.mock import patch
+
+        from beadloom.application.debt_report import collect
+
+        self._seed(conn)
+        assert collect_debt_data(conn, project_root).oversized_count == 0
+        with patch.object(collect, "_count_untracked") as untracked:
+            data = collect_debt_data(conn, project_root, DebtWeights(oversized_symbols=2))
+        untracked.assert_not_called()
+        assert data.oversized_count == 1
+
+    def test_mark_synced_refreshes_stale_count(
+        self, conn: sqlite3.Connection, project_root: Path
+    ) -> None:
+        from beadloom.doc_sync.engine import mark_synced
+
+        self._seed(conn)
+        conn.execute(
+            "INSERT INTO sync_state (doc_path, code_path, ref_id, code_hash_at_sync, "
+            "doc_hash_at_sync, synced_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("alpha.md", "src/alpha/m0.py", "alpha", "old", "old", "2026-01-01", "stale"),
+        )
+        (project_root / "docs").mkdir(exist_ok=True)
+        (project_root / "docs" / "alpha.md").write_text("# Alpha\n")
+        (project_root / "src" / "alpha").mkdir(parents=True, exist_ok=True)
+        (project_root / "src" / "alpha" / "m0.py").write_text("def f0():\n    pass\n")
+        assert collect_debt_data(conn, project_root).stale_count == 1
+        mark_synced(conn, "alpha.md", "src/alpha/m0.py", project_root)
+        assert collect_debt_data(conn, project_root).stale_count == 0
+
+    def test_never_reindexed_index_is_not_cached(
+        self, conn: sqlite3.Connection, project_root: Path
+    ) -> None:
+        from unittest.mock import patch
+
+        from beadloom.application.debt_report import collect
+
+        collect_debt_data(conn, project_root)
+        with patch.object(collect, "_count_untested", return_value=(0, [])) as untested:
+            collect_debt_data(conn, project_root)
+        untested.assert_called_once()
+
+    def test_collecting_never_writes_the_index(
+        self, conn: sqlite3.Connection, project_root: Path, tmp_path: Path
+    ) -> None:
+        import sqlite3 as _sqlite3
+        from unittest.mock import patch
+
+        from beadloom.application.debt_report import collect
+
+        self._seed(conn)
+        conn.commit()
+        changes = conn.total_changes
+        collect_debt_data(conn, project_root)
+        assert conn.total_changes == changes
+        # A read-only connection to the same index reuses the cached categories.
+        db_path = tmp_path / ".beadloom" / "beadloom.db"
+        ro = _sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        ro.row_factory = _sqlite3.Row
+        try:
+            with patch.object(collect, "_count_untested") as untested:
+                collect_debt_data(ro, project_root)
+            untested.assert_not_called()
+        finally:
+            ro.close()
@@ -6,7 +6,13 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from beadloom.doc_sync.doc_indexer import chunk_markdown, classify_section, index_docs
+from beadloom.doc_sync.doc_indexer import (
+    chunk_markdown,
+    classify_section,
+    index_doc,
+    index_docs,
+    remove_doc,
+)
 from beadloom.infrastructure.db import create_schema, open_db
 
 if TYPE_CHECKING:
@@ -202,3 +208,68 @@ class TestIndexDocs:
         index_docs(docs_dir, db)
         row = db.execute("SELECT kind FROM docs").fetchone()
         assert row["kind"] == "other"
+
+
+# --- index_doc (chunk-level diff) ---
+
+
+def _chunk_ids(db: sqlite3.Connection) -> dict[str, int]:
+    rows = db.execute("SELECT id, heading FROM chunks ORDER BY chunk_index").fetchall()
+    return {row["heading"]: row["id"] for row in rows}
+
+
+class TestIndexDoc:
+    @pytest.fixture(autouse=True)
+    def _nodes(self, db: sqlite3.Connection) -> None:
+        db.executemany(
+            "INSERT INTO nodes (ref_id, kind, summary) VALUES (?, 'domain', ?)",
+            [("n1", "One"), ("n2", "Two")],
+        )
+
+    _DOC = "## Spec\n\nRules.\n\n## API\n\nEndpoints.\n\n## Tests\n\nCases.\n"
+
+    def test_unchanged_sections_keep_their_ids(self, db: sqlite3.Connection) -> None:
+        index_doc(db, "spec.md", self._DOC, None)
+        before = _chunk_ids(db)
+        delta = index_doc(db, "spec.md", self._DOC.replace("Endpoints.", "Routes."), None)
+        after = _chunk_ids(db)
+        assert after["Spec"] == before["Spec"]
+        assert after["Tests"] == before["Tests"]
+        assert after["API"] != before["API"]
+        assert delta.inserted == [after["API"]]
+        assert delta.deleted == [before["API"]]
+        assert delta.kept == 2
+        assert db.execute("SELECT count(*) FROM docs").fetchone()[0] == 1
+
+    def test_identical_content_is_a_no_op(self, db: sqlite3.Connection) -> None:
+        index_doc(db, "spec.md", self._DOC, None)
+        delta = index_doc(db, "spec.md", self._DOC, None)
+        assert not delta.changed
+        assert delta.chunk_count == 3
+
+    def test_moved_section_keeps_id_and_updates_index(self, db: sqlite3.Connection) -> None:
+        index_doc(db, "spec.md", self._DOC, "n1")
+        before = _chunk_ids(db)
+        moved = "## Tests\n\nCases.\n\n## Spec\n\nRules.\n\n## API\n\nEndpoints.\n"
+        delta = index_doc(db, "spec.md", moved, "n1")
+        assert not delta.inserted
+        assert not delta.deleted
+        assert delta.ref_ids == {"n1"}
+        assert list(_chunk_ids(db)) == ["Tests", "Spec", "API"]
+        assert _chunk_ids(db)["Tests"] == before["Tests"]
+
+    def test_owner_change_reports_both_nodes(self, db: sqlite3.Connection) -> None:
+        index_doc(db, "spec.md", self._DOC, "n1")
+        delta = index_doc(db, "spec.md", self._DOC, "n2")
+        assert delta.ref_ids == {"n1", "n2"}
+        refs = {row[0] for row in db.execute("SELECT node_ref_id FROM chunks")}
+        assert refs == {"n2"}
+
+    def test_remove_doc(self, db: sqlite3.Connection) -> None:
+        index_doc(db, "spec.md", self._DOC, "n1")
+        ids = set(_chunk_ids(db).values())
+        delta = remove_doc(db, "spec.md")
+        assert set(delta.deleted) == ids
+        assert delta.ref_ids == {"n1"}
+        assert db.execute("SELECT count(*) FROM chunks").fetchone()[0] == 0
+        assert not remove_doc(db, "spec.md").changed
@@ -7,10 +7,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from beadloom.doc_sync.scanner import DocScanner, Mention
+from beadloom.doc_sync.scanner import DocScanner, Mention, MentionCache
+from beadloom.infrastructure.db import create_schema, open_db
 
 if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
     from pathlib import Path
+    from typing import Any
 
 
 # ---------------------------------------------------------------------------
@@ -869,3 +873,90 @@ class TestFileTypeHeuristics:
         paths = scanner.resolve_paths(tmp_path)
         spec_in_docs = [p for p in paths if "SPEC.md" in str(p)]
         assert len(spec_in_docs) == 0
+
+
+# ===========================================================================
+# Mention cache
+# ===========================================================================
+
+
+class TestMentionCache:
+    @pytest.fixture()
+    def conn(self, tmp_path: Path) -> Iterator[sqlite3.Connection]:
+        conn = open_db(tmp_path / "test.db")
+        create_schema(conn)
+        yield conn
+        conn.close()
+
+    @staticmethod
+    def _count_scans(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        scanned: list[str] = []
+        real = DocScanner._scan_lines
+
+        def spy(self: DocScanner, content: str, low_confidence: bool) -> list[Any]:
+            scanned.append(content)
+            return real(self, content, low_confidence)
+
+        monkeypatch.setattr(DocScanner, "_scan_lines", spy)
+        return scanned
+
+    def test_unchanged_docs_are_not_rescanned(
+        self,
+        scanner: DocScanner,
+        conn: sqlite3.Connection,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        a = _write_md(tmp_path, "a.md", "We support 12 languages.\n")
+        b = _write_md(tmp_path, "b.md", "Graph has 150 nodes.\n")
+        first = scanner.scan([a, b], cache=MentionCache(conn))
+        scanned = self._count_scans(monkeypatch)
+        _write_md(tmp_path, "b.md", "Graph has 160 nodes.\n")
+        second = scanner.scan([a, b], cache=MentionCache(conn))
+        assert scanned == ["Graph has 160 nodes.\n"]
+        assert second[0] == first[0]
+        assert [m.value for m in second] == [12, 160]
+
+    def test_same_content_in_another_file_reuses_entry(
+        self, scanner: DocScanner, conn: sqlite3.Connection, tmp_path: Path
+    ) -> None:
+        a = _write_md(tmp_path, "a.md", "Version 1.2.3 ships 40 commands.\n")
+        scanner.scan([a], cache=MentionCache(conn))
+        b = _write_md(tmp_path, "b.md", "Version 1.2.3 ships 40 commands.\n")
+        result = scanner.scan([b], cache=MentionCache(conn))
+        assert {m.file for m in result} == {b}
+        assert result == scanner.scan([b])
+
+    def test_prune_drops_unseen_content(
+        self, scanner: DocScanner, conn: sqlite3.Connection, tmp_path: Path
+    ) -> None:
+        a = _write_md(tmp_path, "a.md", "We support 12 languages.\n")
+        scanner.scan([a], cache=MentionCache(conn))
+        _write_md(tmp_path, "a.md", "We support 13 languages.\n")
+        scanner.scan([a], cache=MentionCache(conn, prune=True))
+        assert conn.execute("SELECT count(*) FROM doc_mentions").fetchone()[0] == 1
+
+    def test_other_scanner_fingerprint_is_dropped(
+        self, scanner: DocScanner, conn: sqlite3.Connection, tmp_path: Path
+    ) -> None:
+        a = _write_md(tmp_path, "a.md", "We support 12 languages.\n")
+        scanner.scan([a], cache=MentionCache(conn))
+
+        class Wider(DocScanner):
+            PROXIMITY_WINDOW = 8
+
+        assert Wider().fingerprint != scanner.fingerprint
+        Wider().scan([a], cache=MentionCache(conn))
+        rows = conn.execute("SELECT scanner FROM doc_mentions").fetchall()
+        assert [row[0] for row in rows] == [Wider().fingerprint]
+
+    def test_db_without_table_scans_uncached(
+        self, scanner: DocScanner, tmp_path: Path
+    ) -> None:
+        a = _write_md(tmp_path, "a.md", "We support 12 languages.\n")
+        conn = open_db(tmp_path / "bare.db")
+        try:
+            result = scanner.scan([a], cache=MentionCache(conn))
+        finally:
+            conn.close()
+        assert [m.value for m in result] == [12]
@@ -0,0 +1,146 @@
+"""Tests for beadloom.infrastructure.git_objects — batched ``cat-file`` reads."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from beadloom.infrastructure.git_objects import GitObjectReader, decode_git_text
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "t@t",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "t@t",
+}
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+        env=_GIT_ENV,
+    )
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    """A repo with a nested tree committed at HEAD~1 and edited at HEAD."""
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg" / "sub" / "b.py").write_text("b = 2\n")
+    (tmp_path / "pkg" / "with space.md").write_text("# spaced\n")
+    (tmp_path / "top.txt").write_text("top\n")
+    _git(tmp_path, "init")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "first")
+    (tmp_path / "pkg" / "a.py").write_text("a = 100\n")
+    (tmp_path / "pkg" / "c.py").write_text("c = 3\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "second")
+    return tmp_path
+
+
+class TestResolve:
+    def test_valid_ref_returns_oid(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            oid = reader.resolve("HEAD")
+        assert oid is not None
+        assert len(oid) in (40, 64)
+
+    def test_invalid_ref_returns_none(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            assert reader.resolve("no-such-ref-xyz") is None
+
+    def test_newline_in_ref_is_rejected(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            assert reader.resolve("HEAD\nHEAD") is None
+            # The stream stays in sync for subsequent reads.
+            assert reader.resolve("HEAD") is not None
+
+
+class TestReadBlobs:
+    def test_reads_many_blobs_at_ref(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            blobs = reader.read_blobs(
+                "HEAD~1", ["pkg/a.py", "pkg/sub/b.py", "pkg/c.py", "pkg/with space.md"]
+            )
+        assert blobs == {
+            "pkg/a.py": b"a = 1\n",
+            "pkg/sub/b.py": b"b = 2\n",
+            "pkg/c.py": None,  # added later
+            "pkg/with space.md": b"# spaced\n",
+        }
+
+    def test_tree_path_is_not_a_blob(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            assert reader.read_blob("HEAD", "pkg") is None
+
+    def test_single_process_for_many_reads(self, repo: Path) -> None:
+        real_popen = subprocess.Popen
+        with patch(
+            "beadloom.infrastructure.git_objects.subprocess.Popen", side_effect=real_popen
+        ) as popen, GitObjectReader(repo) as reader:
+            reader.resolve("HEAD")
+            reader.read_blobs("HEAD", ["pkg/a.py", "top.txt"])
+            reader.list_tree("HEAD", "pkg")
+        assert popen.call_count == 1
+
+    def test_large_batch_does_not_deadlock(self, repo: Path) -> None:
+        # 30 x 100 KB responses overflow any pipe buffer while the requests
+        # are still being written — the feeder thread keeps both sides moving.
+        big = {f"big/{i}.txt": f"{i}".encode() * 100_000 for i in range(30)}
+        (repo / "big").mkdir()
+        for rel, data in big.items():
+            (repo / rel).write_bytes(data)
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-m", "big")
+        with GitObjectReader(repo) as reader:
+            blobs = reader.read_blobs("HEAD", list(big))
+        assert blobs == big
+
+    def test_not_a_repo_degrades_to_absent(self, tmp_path: Path) -> None:
+        with GitObjectReader(tmp_path) as reader:
+            assert reader.resolve("HEAD") is None
+            assert reader.read_blobs("HEAD", ["x"]) == {"x": None}
+
+    def test_missing_git_binary_degrades_to_absent(self, repo: Path) -> None:
+        with patch(
+            "beadloom.infrastructure.git_objects.subprocess.Popen",
+            side_effect=FileNotFoundError("git"),
+        ), GitObjectReader(repo) as reader:
+            assert reader.resolve("HEAD") is None
+            assert reader.list_tree("HEAD", "pkg") == []
+
+
+class TestListTree:
+    def test_recursive_listing_matches_ls_tree(self, repo: Path) -> None:
+        expected = subprocess.run(
+            ["git", "ls-tree", "-r", "--name-only", "HEAD", "pkg/"],  # noqa: S607
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split("\n")
+        with GitObjectReader(repo) as reader:
+            listed = reader.list_tree("HEAD", "pkg/")
+        assert listed == sorted(p for p in expected if p)
+
+    def test_missing_directory_lists_nothing(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            assert reader.list_tree("HEAD", "nope") == []
+
+
+def test_decode_git_text_translates_newlines() -> None:
+    assert decode_git_text(b"a\r\nb\rc\n") == "a\nb\nc\n"
@@ -386,6 +386,55 @@ class TestExtractImportsRust:
         assert len(results) == 0
 
 
+# ===================================================================
+# Import queries
+# ===================================================================
+
+
+class TestImportQueries:
+    """The per-language ``import_queries/*.scm`` files."""
+
+    def test_every_available_query_compiles(self) -> None:
+        from beadloom.context_oracle.code_indexer import get_lang_config
+        from beadloom.graph.import_resolver import _IMPORT_QUERIES, _import_query
+
+        for ext, (stem, _) in _IMPORT_QUERIES.items():
+            config = get_lang_config(ext)
+            if config is None:
+                continue
+            query = _import_query(ext, stem, config)
+            assert "import" in [query.capture_name(i) for i in range(query.capture_count)]
+
+    def test_query_is_compiled_once_per_language(self) -> None:
+        from beadloom.context_oracle.code_indexer import get_lang_config
+        from beadloom.graph.import_resolver import _import_query
+
+        config = get_lang_config(".py")
+        assert config is not None
+        assert _import_query(".py", "python", config) is _import_query(".py", "python", config)
+
+    def test_only_top_level_imports(self, tmp_path: Path) -> None:
+        from beadloom.graph.import_resolver import extract_imports
+
+        py = tmp_path / "mod.py"
+        py.write_text(
+            "import os, json\n"
+            "def f():\n"
+            "    import inner\n"
+            "class A:\n"
+            "    from nested import x\n"
+            "from pkg.sub import (\n"
+            "    name,\n"
+            ")\n"
+        )
+        results = extract_imports(py)
+        assert [(r.line_number, r.import_path) for r in results] == [
+            (1, "os"),
+            (1, "json"),
+            (6, "pkg.sub"),
+        ]
+
+
 # ===================================================================
 # resolve_import_to_node
 # ===================================================================
@@ -31,6 +31,7 @@ from beadloom.graph.rule_engine import (
     load_rules,
 )
 from beadloom.infrastructure.db import create_schema
+from beadloom.infrastructure.path_stats import refresh_path_stats
 from beadloom.services.cli import main
 
 if TYPE_CHECKING:
@@ -54,6 +55,8 @@ def _insert_symbol(
         " VALUES (?, ?, ?, ?, ?, ?, ?)",
         (file_path, symbol_name, "function", 1, 10, json.dumps(annotations), "h"),
     )
+    # Reindex folds new symbols into ``path_stats``; do the same here.
+    refresh_path_stats(conn)
 
 
 def _mc_rule(
@@ -0,0 +1,137 @@
+"""Tests for beadloom.infrastructure.output_manifest — staged, incremental output."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from beadloom.infrastructure.output_manifest import (
+    StagedOutput,
+    fingerprint,
+    load_manifest,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _run(root: Path, files: dict[str, str], inputs: str = "") -> StagedOutput:
+    output = StagedOutput(root, manifest_path=root / "manifest.json")
+    for rel, content in files.items():
+        path = root / rel
+        if not output.unchanged(path, inputs):
+            output.add_text(path, content, inputs=inputs)
+    return output
+
+
+class TestCommit:
+    def test_writes_new_files_and_records_them(self, tmp_path: Path) -> None:
+        result = _run(tmp_path, {"a.md": "A", "sub/b.md": "B"}).commit()
+        assert result.updated == (tmp_path / "a.md", tmp_path / "sub" / "b.md")
+        assert (tmp_path / "sub" / "b.md").read_text(encoding="utf-8") == "B"
+        assert set(load_manifest(tmp_path / "manifest.json")) == {"a.md", "sub/b.md"}
+
+    def test_identical_bytes_are_not_rewritten(self, tmp_path: Path) -> None:
+        _run(tmp_path, {"a.md": "A"}).commit()
+        before = (tmp_path / "a.md").stat().st_mtime_ns
+        result = _run(tmp_path, {"a.md": "A"}).commit()
+        assert result.updated == ()
+        assert result.outputs == (tmp_path / "a.md",)
+        assert (tmp_path / "a.md").stat().st_mtime_ns == before
+
+    def test_last_staged_content_wins(self, tmp_path: Path) -> None:
+        output = StagedOutput(tmp_path)
+        output.add_text(tmp_path / "index.md", "first")
+        output.add_text(tmp_path / "index.md", "second")
+        assert output.commit().outputs == (tmp_path / "index.md",)
+        assert (tmp_path / "index.md").read_text(encoding="utf-8") == "second"
+
+
+class TestRenderSkip:
+    def test_unchanged_inputs_keep_the_file(self, tmp_path: Path) -> None:
+        _run(tmp_path, {"a.md": "A"}, inputs="v1").commit()
+        output = StagedOutput(tmp_path, manifest_path=tmp_path / "manifest.json")
+        assert output.unchanged(tmp_path / "a.md", "v1")
+        assert not output.unchanged(tmp_path / "a.md", "v2")
+        assert not output.unchanged(tmp_path / "a.md", "")
+
+    def test_edited_file_is_not_considered_current(self, tmp_path: Path) -> None:
+        _run(tmp_path, {"a.md": "A"}, inputs="v1").commit()
+        (tmp_path / "a.md").write_text("hand edit", encoding="utf-8")
+        output = StagedOutput(tmp_path, manifest_path=tmp_path / "manifest.json")
+        assert not output.unchanged(tmp_path / "a.md", "v1")
+
+    def test_kept_files_stay_in_the_manifest(self, tmp_path: Path) -> None:
+        _run(tmp_path, {"a.md": "A"}, inputs="v1").commit()
+        _run(tmp_path, {"a.md": "A"}, inputs="v1").commit()
+        assert load_manifest(tmp_path / "manifest.json")["a.md"].inputs == "v1"
+
+
+class TestPrune:
+    def test_orphans_and_their_empty_dirs_are_removed(self, tmp_path: Path) -> None:
+        (tmp_path / "scaffold.mjs").write_text("keep", encoding="utf-8")
+        _run(tmp_path, {"a.md": "A", "gone/b.md": "B"}).commit()
+        result = _run(tmp_path, {"a.md": "A"}).commit()
+        assert result.removed == (tmp_path / "gone" / "b.md",)
+        assert not (tmp_path / "gone").exists()
+        assert (tmp_path / "scaffold.mjs").exists()
+
+    def test_no_manifest_means_no_pruning(self, tmp_path: Path) -> None:
+        (tmp_path / "old.md").write_text("x", encoding="utf-8")
+        output = StagedOutput(tmp_path)
+        output.add_text(tmp_path / "a.md", "A")
+        assert output.commit().removed == ()
+        assert (tmp_path / "old.md").exists()
+
+
+class TestFileCopies:
+    def test_file_is_linked_and_kept_on_the_next_run(self, tmp_path: Path) -> None:
+        source = tmp_path / "src.png"
+        source.write_bytes(b"\x89PNG")
+        out = tmp_path / "out"
+        output = StagedOutput(out, manifest_path=out / "manifest.json")
+        output.add_file(out / "img.png", source)
+        assert output.commit().updated == (out / "img.png",)
+        assert (out / "img.png").read_bytes() == b"\x89PNG"
+
+        again = StagedOutput(out, manifest_path=out / "manifest.json")
+        again.add_file(out / "img.png", source)
+        result = again.commit()
+        assert result.updated == ()
+        assert result.outputs == (out / "img.png",)
+        assert "img.png" in load_manifest(out / "manifest.json")
+
+    def test_replaced_source_is_published_again(self, tmp_path: Path) -> None:
+        source = tmp_path / "src.png"
+        source.write_bytes(b"old")
+        out = tmp_path / "out"
+        output = StagedOutput(out)
+        output.add_file(out / "img.png", source)
+        output.commit()
+        source.unlink()
+        source.write_bytes(b"new!")
+        output = StagedOutput(out)
+        output.add_file(out / "img.png", source)
+        assert output.commit().updated == (out / "img.png",)
+        assert (out / "img.png").read_bytes() == b"new!"
+
+    def test_text_write_never_goes_through_a_link(self, tmp_path: Path) -> None:
+        source = tmp_path / "src.md"
+        source.write_text("source", encoding="utf-8")
+        output = StagedOutput(tmp_path / "out")
+        output.add_file(tmp_path / "out" / "a.md", source)
+        output.commit()
+        output = StagedOutput(tmp_path / "out")
+        output.add_text(tmp_path / "out" / "a.md", "generated")
+        output.commit()
+        assert source.read_text(encoding="utf-8") == "source"
+        assert (tmp_path / "out" / "a.md").read_text(encoding="utf-8") == "generated"
+
+
+def test_corrupt_manifest_means_full_render(tmp_path: Path) -> None:
+    (tmp_path / "manifest.json").write_text("{not json", encoding="utf-8")
+    assert load_manifest(tmp_path / "manifest.json") == {}
+
+
+def test_fingerprint_is_order_sensitive_and_stable() -> None:
+    assert fingerprint("a", 1) == fingerprint("a", 1)
+    assert fingerprint("a", 1) != fingerprint(1, "a")
@@ -0,0 +1,135 @@
+"""Tests for beadloom.infrastructure.path_stats — per-directory symbol aggregates."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from beadloom.application.reindex import incremental_reindex, reindex
+from beadloom.graph.rule_engine import CardinalityRule, NodeMatcher, evaluate_all
+from beadloom.infrastructure.db import create_schema, ensure_schema_migrations, open_db
+from beadloom.infrastructure.path_stats import (
+    PathStats,
+    file_stats_under,
+    path_stats,
+    prefix_bounds,
+    refresh_path_stats,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture()
+def conn() -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    create_schema(db)
+    return db
+
+
+def _add(conn: sqlite3.Connection, file_path: str, n: int, annotations: object = None) -> None:
+    for i in range(n):
+        conn.execute(
+            "INSERT INTO code_symbols (file_path, symbol_name, kind, line_start, line_end, "
+            "annotations, file_hash) VALUES (?, ?, 'function', ?, ?, ?, 'h')",
+            (file_path, f"f{i}", i + 1, i + 1, json.dumps(annotations or {})),
+        )
+
+
+class TestAggregate:
+    def test_directories_sum_their_files(self, conn: sqlite3.Connection) -> None:
+        _add(conn, "src/a/x.py", 3, {"feature": "x"})
+        _add(conn, "src/a/sub/y.py", 2)
+        _add(conn, "src/b.py", 1)
+        refresh_path_stats(conn)
+        assert path_stats(conn, "src/a/") == PathStats(5, 2, 1)
+        assert path_stats(conn, "src/a/sub/") == PathStats(2, 1, 0)
+        assert path_stats(conn, "src/") == PathStats(6, 3, 1)
+        assert path_stats(conn, "src/a/x.py") == PathStats(3, 1, 1)
+        assert path_stats(conn, "missing/") == PathStats()
+
+    def test_changed_files_update_their_ancestors(self, conn: sqlite3.Connection) -> None:
+        _add(conn, "src/a/x.py", 3)
+        _add(conn, "src/a/y.py", 2)
+        refresh_path_stats(conn)
+        conn.execute("DELETE FROM code_symbols WHERE file_path = 'src/a/x.py'")
+        _add(conn, "src/a/x.py", 1, {"component": "c"})
+        conn.execute("DELETE FROM code_symbols WHERE file_path = 'src/a/y.py'")
+        refresh_path_stats(conn)
+        assert path_stats(conn, "src/a/") == PathStats(1, 1, 1)
+        assert path_stats(conn, "src/a/y.py") == PathStats()
+        assert conn.execute("SELECT COUNT(*) FROM path_stats_dirty").fetchone()[0] == 0
+
+    def test_emptied_directory_is_dropped(self, conn: sqlite3.Connection) -> None:
+        _add(conn, "src/gone/x.py", 2)
+        refresh_path_stats(conn)
+        conn.execute("DELETE FROM code_symbols")
+        refresh_path_stats(conn)
+        assert conn.execute("SELECT COUNT(*) FROM path_stats").fetchone()[0] == 0
+
+    def test_empty_aggregate_is_rebuilt(self, conn: sqlite3.Connection) -> None:
+        _add(conn, "src/a/x.py", 2)
+        conn.execute("DELETE FROM path_stats_dirty")
+        refresh_path_stats(conn)
+        assert path_stats(conn, "src/a/").symbol_count == 2
+
+    def test_files_under_prefix_is_exact(self, conn: sqlite3.Connection) -> None:
+        _add(conn, "src/a/x.py", 1)
+        _add(conn, "src/ab/y.py", 1)
+        _add(conn, "src/aXb/z.py", 1)
+        refresh_path_stats(conn)
+        assert set(file_stats_under(conn, "src/a/")) == {"src/a/x.py"}
+        assert set(file_stats_under(conn, "src/a_b/")) == set()
+
+
+def test_database_predating_the_aggregate_is_backfilled_once(conn: sqlite3.Connection) -> None:
+    _add(conn, "src/a/x.py", 2)
+    for trigger in ("insert", "delete", "update"):
+        conn.execute(f"DROP TRIGGER trg_path_stats_{trigger}")
+    conn.execute("DROP TABLE path_stats")
+    conn.execute("DROP TABLE path_stats_dirty")
+    ensure_schema_migrations(conn)
+    assert path_stats(conn, "src/a/").symbol_count == 2
+
+
+def test_rule_evaluation_does_not_write(conn: sqlite3.Connection) -> None:
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "INSERT INTO nodes (ref_id, kind, summary, source) VALUES ('a', 'domain', 'A', 'src/a/')"
+    )
+    _add(conn, "src/a/x.py", 3)
+    refresh_path_stats(conn)
+    _add(conn, "src/a/y.py", 2)
+    conn.commit()
+    changes = conn.total_changes
+    rule = CardinalityRule(
+        name="size", description="", for_matcher=NodeMatcher(kind="domain"), max_symbols=4
+    )
+    # Only the reindex folds new symbols in; readers see the last refreshed state.
+    assert evaluate_all(conn, [rule]) == []
+    assert conn.total_changes == changes
+
+
+def test_prefix_bounds() -> None:
+    lo, hi = prefix_bounds("src/a/")
+    assert lo <= "src/a/x.py" < hi
+    assert not lo <= "src/ab/x.py" < hi
+
+
+def test_reindex_keeps_the_aggregate_current(tmp_path: Path) -> None:
+    (tmp_path / ".beadloom" / "_graph").mkdir(parents=True)
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    module = tmp_path / "src" / "pkg" / "mod.py"
+    module.write_text("def a():\n    pass\n\n\ndef b():\n    pass\n")
+    reindex(tmp_path)
+    module.write_text("def a():\n    pass\n")
+    incremental_reindex(tmp_path)
+    conn = open_db(tmp_path / ".beadloom" / "beadloom.db")
+    try:
+        assert path_stats(conn, "src/pkg/") == PathStats(1, 1, 0)
+        assert conn.execute("SELECT COUNT(*) FROM path_stats_dirty").fetchone()[0] == 0
+    finally:
+        conn.close()
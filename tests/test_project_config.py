@@ -0,0 +1,108 @@
+"""Tests for beadloom.infrastructure.project_config — the shared config.yml cache."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from beadloom.infrastructure import project_config
+from beadloom.infrastructure.project_config import (
+    ProjectConfig,
+    clear_project_config_cache,
+    load_project_config,
+)
+from beadloom.infrastructure.scan_paths import resolve_scan_paths
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    clear_project_config_cache()
+
+
+def _write_config(root: Path, text: str, *, age_s: int = 0) -> Path:
+    path = root / ".beadloom" / "config.yml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if age_s:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - age_s * 1_000_000_000))
+    return path
+
+
+def test_missing_file_is_empty(tmp_path: Path) -> None:
+    config = load_project_config(tmp_path)
+    assert config == ProjectConfig()
+    assert config.scan_paths == []
+    assert config.docs_dir is None
+
+
+def test_typed_accessors(tmp_path: Path) -> None:
+    _write_config(
+        tmp_path,
+        "scan_paths: [src, lib]\ndocs_dir: documentation\nlanguages: [python]\n"
+        "exclude: [build/]\nwalker: git\nrepo: api\ndocs_audit:\n  ignore: []\n",
+    )
+    config = load_project_config(tmp_path)
+    assert config.scan_paths == ["src", "lib"]
+    assert config.docs_dir == "documentation"
+    assert config.languages == ["python"]
+    assert config.exclude == ["build/"]
+    assert config.walker == "git"
+    assert config.repo == "api"
+    assert config.landscape is None
+    assert config.section("docs_audit") == {"ignore": []}
+    assert config.section("missing") == {}
+
+
+def test_max_file_size_must_be_a_positive_int(tmp_path: Path) -> None:
+    _write_config(tmp_path, "max_file_size: 4096\n")
+    assert load_project_config(tmp_path).max_file_size == 4096
+    for value in ("0", "-1", "true", "big"):
+        clear_project_config_cache()
+        _write_config(tmp_path, f"max_file_size: {value}\n")
+        assert load_project_config(tmp_path).max_file_size is None
+
+
+def test_settled_file_is_parsed_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_config(tmp_path, "scan_paths: [src]\n", age_s=60)
+    calls: list[str] = []
+    real = project_config.safe_load
+    monkeypatch.setattr(project_config, "safe_load", lambda text: calls.append(text) or real(text))
+    first = load_project_config(tmp_path)
+    assert load_project_config(tmp_path) is first
+    assert len(calls) == 1
+
+
+def test_edit_is_picked_up(tmp_path: Path) -> None:
+    _write_config(tmp_path, "scan_paths: [src]\n", age_s=60)
+    assert resolve_scan_paths(tmp_path) == ["src"]
+    _write_config(tmp_path, "scan_paths: [app]\n")
+    assert resolve_scan_paths(tmp_path) == ["app"]
+
+
+def test_same_stat_rewrite_is_compared_by_text(tmp_path: Path) -> None:
+    path = _write_config(tmp_path, "walker: abc\n")
+    st = path.stat()
+    assert load_project_config(tmp_path).walker == "abc"
+    path.write_text("walker: git\n", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_project_config(tmp_path).walker == "git"
+
+
+def test_accessors_return_copies(tmp_path: Path) -> None:
+    _write_config(tmp_path, "docs_audit:\n  ignore: [a]\n")
+    load_project_config(tmp_path).section("docs_audit")["ignore"].append("b")
+    assert load_project_config(tmp_path).section("docs_audit") == {"ignore": ["a"]}
+
+
+def test_malformed_file_records_error(tmp_path: Path) -> None:
+    _write_config(tmp_path, "scan_paths: [src\n")
+    config = load_project_config(tmp_path)
+    assert config.error is not None
+    assert config.scan_paths == []
+    assert resolve_scan_paths(tmp_path) == ["src", "lib", "app"]
@@ -0,0 +1,140 @@
+"""Tests for beadloom.infrastructure.project_tree — the shared pruned file walker."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from beadloom.application.reindex import reindex
+from beadloom.infrastructure.db import open_db
+from beadloom.infrastructure.project_tree import (
+    ProjectTree,
+    parse_ignore_patterns,
+    project_tree,
+    shared_project_tree,
+    shares_project_tree,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _rels(root: Path, paths: list[Path]) -> list[str]:
+    return [p.relative_to(root).as_posix() for p in paths]
+
+
+class TestPruning:
+    def test_always_pruned_directories_are_skipped(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "src/a.py", "node_modules/pkg/b.js", "src/__pycache__/a.pyc")
+        assert _rels(tmp_path, ProjectTree(tmp_path).files()) == ["src/a.py"]
+
+    def test_gitignore_patterns(self, tmp_path: Path) -> None:
+        _touch(
+            tmp_path,
+            "src/a.py",
+            "src/gen.py",
+            "build/out.py",
+            "logs/keep.log",
+            "logs/drop.log",
+        )
+        (tmp_path / ".gitignore").write_text("build/\nsrc/gen.py\n*.log\n!keep.log\n")
+        files = _rels(tmp_path, ProjectTree(tmp_path).files())
+        assert files == [".gitignore", "logs/keep.log", "src/a.py"]
+
+    def test_dir_only_pattern_keeps_files(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "out", "src/out/x.py")
+        (tmp_path / ".gitignore").write_text("out/\n")
+        files = _rels(tmp_path, ProjectTree(tmp_path).files())
+        assert files == [".gitignore", "out"]
+
+    def test_nested_gitignore_is_relative_to_its_directory(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "src/pkg/vendor/v.py", "src/pkg/m.py", "vendor/top.py")
+        (tmp_path / "src" / "pkg" / ".gitignore").write_text("/vendor\n")
+        files = _rels(tmp_path, ProjectTree(tmp_path).files(suffixes={".py"}))
+        assert files == ["src/pkg/m.py", "vendor/top.py"]
+
+    def test_config_exclude(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "src/a.py", "src/fixtures/big.py")
+        (tmp_path / ".beadloom").mkdir()
+        (tmp_path / ".beadloom" / "config.yml").write_text("exclude:\n  - src/fixtures/\n")
+        tree = ProjectTree.for_project(tmp_path)
+        assert _rels(tmp_path, tree.files(tmp_path / "src")) == ["src/a.py"]
+        assert tree.is_ignored("src/fixtures", is_dir=True)
+
+    def test_ignored_start_directory_is_empty(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "node_modules/x.js")
+        assert ProjectTree(tmp_path).files(tmp_path / "node_modules") == []
+
+    def test_glob_and_dirs(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "tests/test_a.py", "tests/conftest.py", "src/a.py")
+        tree = ProjectTree(tmp_path)
+        assert _rels(tmp_path, tree.glob("test_*.py")) == ["tests/test_a.py"]
+        assert _rels(tmp_path, tree.dirs()) == ["src", "tests"]
+
+    def test_order_matches_sorted_rglob(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "a-b/x.py", "a/x.py", "a/b/y.py", "a.py")
+        tree = ProjectTree(tmp_path)
+        expected = sorted(p for p in tmp_path.rglob("*") if p.is_file())
+        assert tree.files() == expected
+
+
+def test_parse_ignore_patterns_skips_comments_and_blanks() -> None:
+    assert parse_ignore_patterns(["# comment", "", "   "]) == []
+
+
+class TestSharing:
+    def test_scope_shares_one_tree(self, tmp_path: Path) -> None:
+        _touch(tmp_path, "src/a.py")
+        with shared_project_tree(tmp_path) as tree:
+            assert project_tree(tmp_path) is tree
+            assert _rels(tmp_path, tree.files()) == ["src/a.py"]
+            _touch(tmp_path, "src/b.py")
+            assert _rels(tmp_path, project_tree(tmp_path).files()) == ["src/a.py"]
+        assert _rels(tmp_path, project_tree(tmp_path).files()) == ["src/a.py", "src/b.py"]
+
+    def test_decorator_opens_a_scope(self, tmp_path: Path) -> None:
+        @shares_project_tree
+        def command(root: Path) -> bool:
+            return project_tree(root) is project_tree(root)
+
+        assert command(tmp_path)
+        assert project_tree(tmp_path) is not project_tree(tmp_path)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_walker_lists_tracked_and_untracked(tmp_path: Path) -> None:
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)  # noqa: S603, S607
+    _touch(tmp_path, "src/a.py", "src/new.py", "dist/out.py")
+    (tmp_path / ".gitignore").write_text("dist/\n")
+    (tmp_path / ".beadloom").mkdir()
+    (tmp_path / ".beadloom" / "config.yml").write_text("walker: git\n")
+    tree = ProjectTree.for_project(tmp_path)
+    assert _rels(tmp_path, tree.files(tmp_path / "src")) == ["src/a.py", "src/new.py"]
+
+
+def test_reindex_skips_ignored_directories(tmp_path: Path) -> None:
+    (tmp_path / ".beadloom" / "_graph").mkdir(parents=True)
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("def a():\n    pass\n")
+    (tmp_path / "src" / "node_modules").mkdir()
+    (tmp_path / "src" / "node_modules" / "dep.py").write_text("def b():\n    pass\n")
+    (tmp_path / "src" / "generated").mkdir()
+    (tmp_path / "src" / "generated" / "gen.py").write_text("def c():\n    pass\n")
+    (tmp_path / ".gitignore").write_text("src/generated/\n")
+    reindex(tmp_path)
+    conn = open_db(tmp_path / ".beadloom" / "beadloom.db")
+    try:
+        paths = {row[0] for row in conn.execute("SELECT DISTINCT file_path FROM code_symbols")}
+    finally:
+        conn.close()
+    assert paths == {"src/pkg/mod.py"}
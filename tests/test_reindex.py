@@ -463,6 +463,38 @@ class TestIncrementalReindex:
         assert "Updated" in chunk["content"]
         conn.close()
 
+    def test_changed_doc_keeps_unchanged_chunks(
+        self,
+        project: Path,
+        db_path: Path,
+    ) -> None:
+        """A one-section edit replaces that chunk only and refreshes its node's FTS row."""
+        graph_dir = project / ".beadloom" / "_graph"
+        (graph_dir / "g.yml").write_text(
+            "nodes:\n  - ref_id: N1\n    kind: domain\n    summary: N1\n"
+            "    docs:\n      - docs/spec.md\n"
+        )
+        doc = project / "docs" / "spec.md"
+        doc.write_text("## Spec\n\nOriginal rules.\n\n## API\n\nEndpoints.\n")
+        incremental_reindex(project)
+        conn = open_db(db_path)
+        before = dict(conn.execute("SELECT heading, id FROM chunks").fetchall())
+        conn.close()
+
+        doc.write_text("## Spec\n\nRevised rules.\n\n## API\n\nEndpoints.\n")
+        incremental_reindex(project)
+
+        conn = open_db(db_path)
+        after = dict(conn.execute("SELECT heading, id FROM chunks").fetchall())
+        content = conn.execute(
+            "SELECT content FROM search_index WHERE ref_id = ?", ("N1",)
+        ).fetchone()[0]
+        conn.close()
+        assert after["API"] == before["API"]
+        assert after["Spec"] != before["Spec"]
+        assert "Revised" in content
+        assert "Original" not in content
+
     def test_added_code_file_indexed(
         self,
         project: Path,
@@ -1373,3 +1405,282 @@ class TestStoredIndexHelpersNarrowExcepts:
             _snapshot_sync_baselines(conn)
 
         conn.close()
+
+
+class TestPathTargetedIncrementalReindex:
+    """incremental_reindex(changed_paths=...) trusts the watcher's path set."""
+
+    def _seed(self, project: Path) -> None:
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(
+            "nodes:\n  - ref_id: N1\n    kind: domain\n    summary: N1\n"
+        )
+        (project / "docs" / "a.md").write_text("## A\n\nOriginal.\n")
+        (project / "src" / "mod.py").write_text("def one():\n    pass\n")
+        reindex(project)
+
+    def test_only_reported_paths_are_hashed(self, project: Path) -> None:
+        from unittest.mock import patch
+
+        from beadloom.application.reindex import change_detection
+
+        self._seed(project)
+        (project / "src" / "mod.py").write_text("def one():\n    pass\n\n\ndef two():\n    pass\n")
+        with patch.object(
+            change_detection, "_compute_file_hash", wraps=change_detection._compute_file_hash
+        ) as hashed:
+            result = incremental_reindex(project, changed_paths=[project / "src" / "mod.py"])
+        assert [c.args[0].name for c in hashed.call_args_list] == ["mod.py"]
+        assert result.symbols_indexed == 2
+
+    def test_relative_added_and_deleted_paths(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        (project / "docs" / "a.md").unlink()
+        (project / "docs" / "b.md").write_text("## B\n\nNew.\n")
+        incremental_reindex(project, changed_paths=["docs/a.md", "docs/b.md"])
+
+        conn = open_db(db_path)
+        stored = _get_stored_file_index(conn)
+        conn.close()
+        assert "docs/a.md" not in stored
+        assert stored["docs/b.md"][1] == "doc"
+
+    def test_removed_directory_drops_its_files(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        (project / "src" / "pkg").mkdir()
+        (project / "src" / "pkg" / "x.py").write_text("def x():\n    pass\n")
+        incremental_reindex(project, changed_paths=["src/pkg/x.py"])
+        (project / "src" / "pkg" / "x.py").unlink()
+        (project / "src" / "pkg").rmdir()
+        incremental_reindex(project, changed_paths=[project / "src" / "pkg"])
+
+        conn = open_db(db_path)
+        assert "src/pkg/x.py" not in _get_stored_file_index(conn)
+        rows = conn.execute(
+            "SELECT count(*) FROM code_symbols WHERE file_path = 'src/pkg/x.py'"
+        ).fetchone()
+        conn.close()
+        assert rows[0] == 0
+
+    def test_unreported_edit_waits_for_sweep(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        (project / "docs" / "a.md").write_text("## A\n\nEdited behind the watcher.\n")
+
+        result = incremental_reindex(project, changed_paths=[])
+        assert result.nothing_changed
+
+        result = incremental_reindex(project, changed_paths=[], full_sweep_interval_s=0)
+        assert result.docs_indexed == 1
+
+    def test_full_sweep_stamp(self, project: Path, db_path: Path) -> None:
+        from datetime import datetime, timedelta, timezone
+
+        from beadloom.application.reindex import _full_sweep_due
+
+        self._seed(project)
+        conn = open_db(db_path)
+        stamp = get_meta(conn, "last_full_scan_at")
+        assert stamp is not None
+        later = datetime.fromisoformat(stamp) + timedelta(seconds=301)
+        assert not _full_sweep_due(conn, 300.0, now=datetime.now(tz=timezone.utc))
+        assert _full_sweep_due(conn, 300.0, now=later)
+        conn.close()
+
+    def test_graph_change_is_picked_up(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(
+            "nodes:\n  - ref_id: N1\n    kind: domain\n    summary: Renamed\n"
+        )
+        result = incremental_reindex(project, changed_paths=[".beadloom/_graph/g.yml"])
+        assert result.nodes_loaded == 1
+        conn = open_db(db_path)
+        row = conn.execute("SELECT summary FROM nodes WHERE ref_id = 'N1'").fetchone()
+        assert row[0] == "Renamed"
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Graph-YAML delta reload
+# ---------------------------------------------------------------------------
+
+
+_DELTA_GRAPH = """\
+nodes:
+  - ref_id: root
+    kind: service
+    summary: Root
+  - ref_id: app
+    kind: domain
+    summary: App
+    source: src/app
+    docs: [docs/app.md]
+  - ref_id: adr-1
+    kind: adr
+    summary: First decision
+edges:
+  - {src: app, dst: root, kind: part_of}
+  - {src: adr-1, dst: app, kind: uses}
+"""
+
+
+class TestGraphDeltaReload:
+    """Graph edits are applied in place and match a full reindex."""
+
+    @staticmethod
+    def _seed(project: Path, graph: str = _DELTA_GRAPH) -> None:
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(graph)
+        (project / "src" / "app").mkdir()
+        (project / "src" / "app" / "core.py").write_text(
+            "# beadloom:domain=app\ndef run():\n    pass\n"
+        )
+        (project / "docs" / "app.md").write_text("## App\n\nThe app.\n")
+        (project / "docs" / "adr.md").write_text("## ADR\n\nDecided.\n")
+        reindex(project)
+
+    @staticmethod
+    def _state(db_path: Path) -> dict[str, object]:
+        conn = open_db(db_path)
+        state: dict[str, object] = {
+            "nodes": sorted(
+                tuple(r) for r in conn.execute("SELECT * FROM nodes").fetchall()
+            ),
+            "edges": sorted(
+                tuple(r) for r in conn.execute("SELECT * FROM edges").fetchall()
+            ),
+            "docs": sorted(
+                tuple(r) for r in conn.execute("SELECT path, ref_id FROM docs").fetchall()
+            ),
+            "chunks": sorted(
+                tuple(r)
+                for r in conn.execute(
+                    "SELECT d.path, c.node_ref_id FROM chunks c JOIN docs d ON d.id = c.doc_id"
+                ).fetchall()
+            ),
+            "rules": sorted(
+                tuple(r) for r in conn.execute("SELECT name, rule_json FROM rules").fetchall()
+            ),
+        }
+        conn.close()
+        return state
+
+    def _assert_delta_matches_full(self, project: Path, db_path: Path, graph: str) -> None:
+        from unittest.mock import patch
+
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(graph)
+        with patch(
+            "beadloom.application.reindex.incremental.reindex",
+            side_effect=AssertionError("full reindex"),
+        ):
+            incremental_reindex(project)
+        delta_state = self._state(db_path)
+        reindex(project)
+        assert delta_state == self._state(db_path)
+
+    def test_summary_edit(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        self._assert_delta_matches_full(
+            project, db_path, _DELTA_GRAPH.replace("summary: App", "summary: Renamed app")
+        )
+
+    def test_derived_extra_survives(self, project: Path, db_path: Path) -> None:
+        import json
+
+        self._seed(project)
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(
+            _DELTA_GRAPH.replace("summary: Root", "summary: Root v2\n    tags: [core]")
+        )
+        incremental_reindex(project)
+        conn = open_db(db_path)
+        extra = json.loads(
+            conn.execute("SELECT extra FROM nodes WHERE ref_id = 'root'").fetchone()[0]
+        )
+        conn.close()
+        assert extra["tags"] == ["core"]
+        assert "config" in extra
+
+    def test_sourceless_node_edge_and_doc_changes(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        graph = (
+            _DELTA_GRAPH.replace("  - {src: adr-1, dst: app, kind: uses}\n", "")
+            + "  - {src: adr-2, dst: app, kind: uses, lifecycle: planned}\n"
+        ).replace(
+            "edges:",
+            "  - ref_id: adr-2\n    kind: adr\n    summary: Second\n"
+            "    docs: [docs/adr.md]\nedges:",
+        )
+        self._assert_delta_matches_full(project, db_path, graph)
+        conn = open_db(db_path)
+        row = conn.execute("SELECT ref_id FROM docs WHERE path = 'adr.md'").fetchone()
+        conn.close()
+        assert row[0] == "adr-2"
+
+    def test_removed_node(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        graph = _DELTA_GRAPH.replace(
+            "  - ref_id: adr-1\n    kind: adr\n    summary: First decision\n", ""
+        ).replace("  - {src: adr-1, dst: app, kind: uses}\n", "")
+        self._assert_delta_matches_full(project, db_path, graph)
+
+    def test_annotation_edges_are_kept(self, project: Path, db_path: Path) -> None:
+        graph = _DELTA_GRAPH + "  - {src: app, dst: app, kind: touches_code, note: declared}\n"
+        self._seed(project, graph)
+        # Dropping the declared copy keeps the annotation-derived edge.
+        self._assert_delta_matches_full(project, db_path, _DELTA_GRAPH)
+        conn = open_db(db_path)
+        row = conn.execute(
+            "SELECT extra FROM edges WHERE src_ref_id = 'app' AND kind = 'touches_code'"
+        ).fetchone()
+        conn.close()
+        assert row[0] == "{}"
+
+    def test_rules_change_reloads_rules(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        rules = project / ".beadloom" / "_graph" / "rules.yml"
+        rules.write_text(
+            "version: 1\nrules:\n"
+            "  - name: adr-needs-target\n    description: ADRs use something\n"
+            "    require:\n      for: {kind: adr}\n      has_edge_to: {}\n"
+        )
+        self._assert_delta_matches_full(project, db_path, _DELTA_GRAPH)
+        assert self._state(db_path)["rules"]
+
+    def test_structural_conflicts_fall_back(self, project: Path, db_path: Path) -> None:
+        from beadloom.application.reindex import _plan_graph_delta
+
+        self._seed(project)
+        graph_dir = project / ".beadloom" / "_graph"
+        conn = open_db(db_path)
+        cases = {
+            "source of 'app' changed": _DELTA_GRAPH.replace("src/app", "src/app2"),
+            "part_of hierarchy of 'app' changed": _DELTA_GRAPH.replace(
+                "  - {src: app, dst: root, kind: part_of}\n", ""
+            ),
+            "graph YAML has errors": _DELTA_GRAPH + "  - ref_id: app\n",
+        }
+        for reason, graph in cases.items():
+            (graph_dir / "g.yml").write_text(graph)
+            assert _plan_graph_delta(conn, graph_dir, project).conflict == reason
+        conn.close()
+
+        (graph_dir / "g.yml").write_text(_DELTA_GRAPH.replace("src/app", "src/app2"))
+        result = incremental_reindex(project)
+        assert result.full_fallback is True
+        assert result.nodes_loaded == 3
+        conn = open_db(db_path)
+        row = conn.execute("SELECT source FROM nodes WHERE ref_id = 'app'").fetchone()
+        conn.close()
+        assert row[0] == "src/app2"
+
+    def test_missing_baseline_falls_back(self, project: Path, db_path: Path) -> None:
+        self._seed(project)
+        conn = open_db(db_path)
+        conn.execute("DELETE FROM meta WHERE key = 'graph_declared_edges'")
+        conn.commit()
+        conn.close()
+        (project / ".beadloom" / "_graph" / "g.yml").write_text(
+            _DELTA_GRAPH.replace("summary: App", "summary: Renamed app")
+        )
+        result = incremental_reindex(project)
+        assert result.nodes_loaded == 3
+        conn = open_db(db_path)
+        assert get_meta(conn, "graph_declared_edges") is not None
+        conn.close()
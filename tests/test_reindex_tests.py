@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from beadloom.application.reindex import reindex
+from beadloom.application.reindex import incremental_reindex, reindex
 from beadloom.context_oracle.builder import build_context
 from beadloom.infrastructure.db import create_schema, open_db
 
@@ -195,6 +195,35 @@ class TestReindexTestMapping:
 
         conn.close()
 
+    def test_incremental_reindex_updates_test_mapping(self, tmp_path: Path) -> None:
+        """A test-only edit is picked up by incremental reindex."""
+        project = _make_project(tmp_path)
+        _write_file(
+            project / ".beadloom" / "_graph" / "domains.yml",
+            "nodes:\n  - ref_id: auth\n    kind: domain\n    summary: Auth\n"
+            "    source: src/auth\n",
+        )
+        _write_file(project / "src" / "auth" / "login.py", "def login():\n    pass\n")
+        _write_file(project / "conftest.py", "import pytest\n")
+        _write_file(project / "tests" / "test_auth.py", "def test_login():\n    assert True\n")
+        reindex(project)
+
+        assert incremental_reindex(project).nothing_changed
+
+        _write_file(
+            project / "tests" / "test_auth_token.py",
+            "def test_token():\n    assert True\n\ndef test_expiry():\n    assert True\n",
+        )
+        result = incremental_reindex(project)
+        assert not result.nothing_changed
+
+        conn = open_db(project / ".beadloom" / "beadloom.db")
+        row = conn.execute("SELECT extra FROM nodes WHERE ref_id = 'auth'").fetchone()
+        conn.close()
+        tests_info = json.loads(row["extra"])["tests"]
+        assert tests_info["test_count"] == 3
+        assert tests_info["test_files"] == ["tests/test_auth.py", "tests/test_auth_token.py"]
+
 
 # ---------------------------------------------------------------------------
 # Integration: context bundle includes tests line
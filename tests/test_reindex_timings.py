@@ -0,0 +1,139 @@
+"""Tests for beadloom.infrastructure.reindex_timings — stage timings and their history."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+from beadloom.application.doctor import Severity, _check_reindex_timings
+from beadloom.application.reindex import incremental_reindex, reindex
+from beadloom.infrastructure.db import create_schema, open_db
+from beadloom.infrastructure.reindex_timings import (
+    StageClock,
+    TimingRegression,
+    load_timing_history,
+    record_timings,
+    timing_regressions,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    create_schema(conn)
+    return conn
+
+
+def _run(mode: str, total: float, **stages: float) -> dict[str, Any]:
+    return {
+        "mode": mode,
+        "wall_s": total,
+        "stages": [{"name": name, "wall_s": wall} for name, wall in stages.items()],
+    }
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / ".beadloom" / "_graph").mkdir(parents=True)
+    (tmp_path / ".beadloom" / "_graph" / "services.yml").write_text(
+        "nodes:\n  - ref_id: app\n    kind: service\n    summary: App\n    source: src/\n"
+    )
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def run():\n    pass\n")
+    return tmp_path
+
+
+class TestStageClock:
+    def test_stages_count_rows_and_repeated_stages_add_up(self) -> None:
+        conn = _conn()
+        clock = StageClock(conn)
+        for i in range(2):
+            with clock.stage("write") as counter:
+                counter.files = 1
+                conn.execute("INSERT INTO meta (key, value) VALUES (?, 'x')", (f"k{i}",))
+        with clock.stage("read"):
+            conn.execute("SELECT * FROM meta").fetchall()
+        write, read = clock.timings
+        assert (write.name, write.files, write.rows) == ("write", 2, 2)
+        assert (read.name, read.files, read.rows) == ("read", 0, 0)
+        assert clock.elapsed_s >= write.wall_s + read.wall_s
+
+    def test_stage_may_close_the_connection(self) -> None:
+        conn = _conn()
+        clock = StageClock(conn)
+        with clock.stage("fallback"):
+            conn.close()
+        assert clock.timings[0].rows == 0
+
+    def test_history_is_capped(self) -> None:
+        conn = _conn()
+        clock = StageClock(conn)
+        for _ in range(25):
+            record_timings(conn, "full", clock)
+        assert len(load_timing_history(conn)) == 20
+
+    def test_unreadable_history_is_empty(self) -> None:
+        assert load_timing_history(sqlite3.connect(":memory:")) == []
+        conn = _conn()
+        conn.execute("INSERT INTO meta (key, value) VALUES ('reindex_timings', 'not json')")
+        assert load_timing_history(conn) == []
+
+
+class TestRegressions:
+    def test_slow_stage_is_flagged_against_same_mode_median(self) -> None:
+        history = [_run("full", 2.0, symbols=1.0, docs=0.1) for _ in range(3)]
+        history.append(_run("incremental", 30.0, symbols=20.0))
+        history.append(_run("full", 2.5, symbols=2.5, docs=0.3))
+        assert timing_regressions(history) == [TimingRegression("symbols", "full", 2.5, 1.0)]
+
+    def test_needs_three_earlier_runs(self) -> None:
+        history = [_run("full", 1.0, symbols=1.0) for _ in range(2)]
+        history.append(_run("full", 9.0, symbols=9.0))
+        assert timing_regressions(history) == []
+
+    def test_small_absolute_slowdown_is_jitter(self) -> None:
+        history = [_run("full", 0.1, symbols=0.1) for _ in range(3)]
+        history.append(_run("full", 0.4, symbols=0.4))
+        assert timing_regressions(history) == []
+
+    def test_doctor_warns_on_regression(self) -> None:
+        conn = _conn()
+        assert _check_reindex_timings(conn)[0].severity == Severity.OK
+        history = [_run("full", 1.0, search=0.2) for _ in range(3)]
+        history.append(_run("full", 1.1, search=1.5))
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('reindex_timings', ?)",
+            (json.dumps(history),),
+        )
+        (check,) = _check_reindex_timings(conn)
+        assert check.severity == Severity.WARNING
+        assert "'search' took 1.50s, usually 0.20s (full runs)" in check.description
+
+
+def test_reindex_records_timings_and_full_runs_keep_history(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    first = reindex(project)
+    names = [timing.name for timing in first.timings]
+    assert names[:4] == ["schema", "graph", "docs", "symbols"]
+    assert names[-1] == "file_index"
+    assert first.wall_s > 0
+    symbols = next(timing for timing in first.timings if timing.name == "symbols")
+    assert symbols.files == 1
+    assert symbols.rows >= 1
+
+    reindex(project)
+    (project / "src" / "app.py").write_text("def run():\n    return 1\n")
+    incremental = incremental_reindex(project)
+    assert "scan" in [timing.name for timing in incremental.timings]
+    # A run with nothing to do is timed but not recorded.
+    assert incremental_reindex(project).nothing_changed
+
+    conn = open_db(project / ".beadloom" / "beadloom.db")
+    try:
+        history = load_timing_history(conn)
+    finally:
+        conn.close()
+    assert [run["mode"] for run in history] == ["full", "full", "incremental"]
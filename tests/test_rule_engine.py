@@ -29,6 +29,7 @@ from beadloom.graph.rule_engine import (
     validate_rules,
 )
 from beadloom.infrastructure.db import create_schema, open_db
+from beadloom.infrastructure.path_stats import refresh_path_stats
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -2307,6 +2308,7 @@ def cardinality_db() -> sqlite3.Connection:
         ("docs/auth/API.md", "src/auth/api/", "auth", "ch2", "dh2", "2026-01-01", "stale", "def"),
     )
 
+    refresh_path_stats(conn)
     conn.commit()
     return conn
 
@@ -2610,6 +2612,8 @@ def _insert_symbol(
         " VALUES (?, ?, ?, ?, ?, ?, ?)",
         (file_path, symbol_name, "function", 1, 10, json.dumps(annotations), "h"),
     )
+    # Reindex folds new symbols into ``path_stats``; do the same here.
+    refresh_path_stats(conn)
 
 
 @pytest.fixture()
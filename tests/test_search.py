@@ -137,6 +137,27 @@ class TestPopulateSearchIndex:
         assert row[0] == 3
 
 
+class TestUpdateSearchIndex:
+    def test_rebuilds_only_named_rows(self, search_conn: sqlite3.Connection) -> None:
+        from beadloom.context_oracle.search import search_fts5, update_search_index
+
+        search_conn.execute("UPDATE chunks SET content = 'SAML single sign-on'")
+        search_conn.execute("UPDATE nodes SET summary = 'Payment ledger' WHERE ref_id = 'PAY-1'")
+        assert update_search_index(search_conn, ["AUTH-1"]) == 1
+        assert [r["ref_id"] for r in search_fts5(search_conn, "SAML")] == ["AUTH-1"]
+        assert search_fts5(search_conn, "OAuth2") == []
+        # PAY-1 was not named, so its row still holds the old summary.
+        assert [r["ref_id"] for r in search_fts5(search_conn, "gateway")] == ["PAY-1"]
+
+    def test_missing_node_loses_its_row(self, search_conn: sqlite3.Connection) -> None:
+        from beadloom.context_oracle.search import update_search_index
+
+        search_conn.execute("DELETE FROM nodes WHERE ref_id = 'PAY-1'")
+        assert update_search_index(search_conn, ["PAY-1"]) == 0
+        row = search_conn.execute("SELECT count(*) FROM search_index").fetchone()
+        assert row[0] == 2
+
+
 class TestHasFts5:
     def test_has_fts5_with_data(self, search_conn: sqlite3.Connection) -> None:
         from beadloom.context_oracle.search import has_fts5
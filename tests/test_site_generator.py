@@ -539,6 +539,110 @@ def test_empty_graph_still_emits_index(tmp_path: Path) -> None:
     assert (out / "index.md").exists()
 
 
+# ---------------------------------------------------------------------------
+# Incremental generation (build manifest)
+# ---------------------------------------------------------------------------
+
+
+def test_regenerate_rewrites_and_rerenders_nothing(
+    conn: sqlite3.Connection, tmp_path: Path
+) -> None:
+    from unittest.mock import patch
+
+    from beadloom.application import site_pages
+
+    out = tmp_path / "site"
+    first = generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    assert first.updated == first.written
+
+    with patch.object(
+        site_pages, "render_node_page", wraps=site_pages.render_node_page
+    ) as render:
+        second = generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    render.assert_not_called()
+    assert second.written == first.written
+    assert second.updated == ()
+    assert second.removed == ()
+
+
+def test_symbol_change_rerenders_only_the_owning_page(
+    conn: sqlite3.Connection, tmp_path: Path
+) -> None:
+    from unittest.mock import patch
+
+    from beadloom.application import site_pages
+
+    out = tmp_path / "site"
+    generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    conn.execute(
+        "INSERT INTO code_symbols "
+        "(file_path, symbol_name, kind, line_start, line_end, file_hash) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ("src/beadloom/graph/loader.py", "load_graph", "function", 1, 5, "h2"),
+    )
+    with patch.object(
+        site_pages, "render_node_page", wraps=site_pages.render_node_page
+    ) as render:
+        result = generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+
+    assert [c.args[1].ref_id for c in render.call_args_list] == ["graph"]
+    assert out / "domains" / "graph.md" in result.updated
+    assert out / "domains" / "application.md" not in result.updated
+    assert "`load_graph`" in (out / "domains" / "graph.md").read_text(encoding="utf-8")
+
+
+def test_removed_node_page_is_pruned(conn: sqlite3.Connection, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    scaffold = out / ".vitepress" / "config.mjs"
+    scaffold.parent.mkdir(parents=True)
+    scaffold.write_text("// committed scaffold\n", encoding="utf-8")
+    generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    assert (out / "features" / "reindex.md").exists()
+
+    conn.execute("DELETE FROM edges WHERE src_ref_id = 'reindex'")
+    conn.execute("DELETE FROM nodes WHERE ref_id = 'reindex'")
+    result = generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+
+    assert result.removed == (out / "features" / "reindex.md",)
+    assert not (out / "features").exists()
+    assert scaffold.read_text(encoding="utf-8") == "// committed scaffold\n"
+
+
+def test_hand_edited_output_is_restored(conn: sqlite3.Connection, tmp_path: Path) -> None:
+    out = tmp_path / "site"
+    generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    page = out / "domains" / "graph.md"
+    original = page.read_bytes()
+    page.write_text("edited", encoding="utf-8")
+
+    result = generate_site(conn, out, project_root=tmp_path, now_ts=_FIXED_TS)
+    assert result.updated == (page,)
+    assert page.read_bytes() == original
+
+
+def test_c4_model_is_built_once_per_build(conn: sqlite3.Connection, tmp_path: Path) -> None:
+    from unittest.mock import patch
+
+    from beadloom.graph import c4
+
+    with patch.object(c4, "map_to_c4", wraps=c4.map_to_c4) as mapped:
+        generate_site(conn, tmp_path / "site", project_root=tmp_path, now_ts=_FIXED_TS)
+    assert mapped.call_count == 1
+
+
+def test_parallel_rendering_matches_sequential(tmp_path: Path) -> None:
+    from beadloom.application.site_pages import render_all_pages
+
+    db = sqlite3.connect(tmp_path / "beadloom.db")
+    db.row_factory = sqlite3.Row
+    create_schema(db)
+    _seed(db)
+
+    sequential = render_all_pages(db, workers=1)
+    assert render_all_pages(db, workers=2) == sequential
+    assert [page.rel_path for page in sequential] == sorted(p.rel_path for p in sequential)
+
+
 # ---------------------------------------------------------------------------
 # CLI: `beadloom docs site`
 # ---------------------------------------------------------------------------
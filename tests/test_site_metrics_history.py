@@ -2,7 +2,7 @@
 
 The metrics-history store is an additive append-log of honest metric points
 ``{ts, lint_violations, debt_score, coverage_pct, sync_pct, nodes, edges,
-symbols}`` persisted to ``.beadloom/metrics_history.json``. Trends on the
+symbols}`` persisted to ``.beadloom/metrics_history.db``. Trends on the
 dashboard come *only* from these real recorded points — never an interpolated
 or fabricated one. Timestamps are injected (never ``now()`` inside the store)
 so the series is deterministic in tests.
@@ -10,7 +10,8 @@ so the series is deterministic in tests.
 These tests assert: append/read round-trips, the series is sorted by ts, no
 fabrication (read returns exactly what was appended), idempotent dedup of an
 identical ts, and a structural backfill from ``graph_snapshots`` so the trend
-isn't empty on day one.
+isn't empty on day one. Old points are downsampled to the latest real point per
+day / week, and a legacy JSON log is imported once.
 """
 
 from __future__ import annotations
@@ -30,6 +31,12 @@ if TYPE_CHECKING:
     import sqlite3
     from pathlib import Path
 
+    import pytest
+
+
+def _legacy(project: Path) -> Path:
+    return project / ".beadloom" / "metrics_history.json"
+
 
 def _project(tmp_path: Path) -> Path:
     project = tmp_path / "proj"
@@ -81,7 +88,7 @@ def test_append_then_read_round_trips(tmp_path: Path) -> None:
 def test_history_written_under_dot_beadloom(tmp_path: Path) -> None:
     project = _project(tmp_path)
     append_metrics_point(project, _point("2026-06-01T00:00:00+00:00"))
-    assert history_path(project) == project / ".beadloom" / "metrics_history.json"
+    assert history_path(project) == project / ".beadloom" / "metrics_history.db"
     assert history_path(project).exists()
 
 
@@ -126,24 +133,10 @@ def test_duplicate_ts_is_idempotent_overwrite(tmp_path: Path) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Determinism: injected ts, byte-stable JSON store
+# Determinism: injected ts
 # ---------------------------------------------------------------------------
 
 
-def test_store_json_is_deterministic_sorted(tmp_path: Path) -> None:
-    project = _project(tmp_path)
-    append_metrics_point(project, _point("2026-06-02T00:00:00+00:00", nodes=2))
-    append_metrics_point(project, _point("2026-06-01T00:00:00+00:00", nodes=1))
-    raw = history_path(project).read_text(encoding="utf-8")
-    parsed = json.loads(raw)
-    # Stored sorted by ts and each object key-sorted -> byte stable.
-    assert [pt["ts"] for pt in parsed] == [
-        "2026-06-01T00:00:00+00:00",
-        "2026-06-02T00:00:00+00:00",
-    ]
-    assert raw == json.dumps(parsed, sort_keys=True, indent=2, ensure_ascii=False) + "\n"
-
-
 def test_append_uses_injected_ts_not_now(tmp_path: Path) -> None:
     project = _project(tmp_path)
     point = _point("1999-01-01T00:00:00+00:00")
@@ -232,27 +225,27 @@ def test_backfill_is_idempotent(tmp_path: Path) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Robust read: malformed store / rows are skipped (best-effort, never crashes)
+# Legacy JSON import: malformed store / rows are skipped (best-effort)
 # ---------------------------------------------------------------------------
 
 
 def test_read_malformed_json_returns_empty(tmp_path: Path) -> None:
     project = _project(tmp_path)
-    history_path(project).write_text("{ not json", encoding="utf-8")
+    _legacy(project).write_text("{ not json", encoding="utf-8")
     # A corrupt store degrades to an empty (honest) series, never raises.
     assert read_history(project) == []
 
 
 def test_read_non_list_payload_returns_empty(tmp_path: Path) -> None:
     project = _project(tmp_path)
-    history_path(project).write_text('{"ts": "2026-01-01"}', encoding="utf-8")
+    _legacy(project).write_text('{"ts": "2026-01-01"}', encoding="utf-8")
     # A JSON object (not a list of points) is not a valid store -> empty.
     assert read_history(project) == []
 
 
 def test_read_skips_rows_without_a_valid_ts(tmp_path: Path) -> None:
     project = _project(tmp_path)
-    history_path(project).write_text(
+    _legacy(project).write_text(
         json.dumps(
             [
                 {"ts": "2026-01-01T00:00:00+00:00", "nodes": 5},
@@ -271,7 +264,7 @@ def test_read_skips_rows_without_a_valid_ts(tmp_path: Path) -> None:
 
 def test_read_coerces_field_types_and_defaults(tmp_path: Path) -> None:
     project = _project(tmp_path)
-    history_path(project).write_text(
+    _legacy(project).write_text(
         json.dumps(
             [
                 {
@@ -298,6 +291,122 @@ def test_read_coerces_field_types_and_defaults(tmp_path: Path) -> None:
     assert point.symbols == 12
 
 
+def test_legacy_log_is_imported_once_and_left_alone(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    legacy = _legacy(project)
+    legacy.write_text(
+        json.dumps([{"ts": "2026-06-01T00:00:00+00:00", "nodes": 4}]), encoding="utf-8"
+    )
+    before = legacy.read_bytes()
+    append_metrics_point(project, _point("2026-06-02T00:00:00+00:00", nodes=5))
+    assert [p.nodes for p in read_history(project)] == [4, 5]
+    assert legacy.read_bytes() == before
+
+
+def test_read_serves_the_legacy_log_without_migrating(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    _legacy(project).write_text(
+        json.dumps(
+            [
+                {"ts": "2026-05-01T01:00:00+00:00", "nodes": 1},
+                {"ts": "2026-05-01T17:00:00+00:00", "nodes": 3},
+                {"ts": "2026-05-10T00:00:00+00:00", "nodes": 9},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    # Downsampled as the migration will be, but nothing is written.
+    assert [p.nodes for p in read_history(project)] == [3, 9]
+    assert not history_path(project).exists()
+    append_metrics_point(project, _point("2026-05-10T01:00:00+00:00", nodes=10))
+    assert [p.nodes for p in read_history(project)] == [3, 9, 10]
+
+
+def test_read_does_not_write_to_the_store(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    append_metrics_point(project, _point("2026-05-10T00:00:00+00:00"))
+    store = history_path(project)
+    before = store.stat().st_mtime_ns, store.read_bytes()
+    assert len(read_history(project)) == 1
+    assert (store.stat().st_mtime_ns, store.read_bytes()) == before
+
+
+# ---------------------------------------------------------------------------
+# Downsampling: bounded series of real points
+# ---------------------------------------------------------------------------
+
+
+def test_old_points_keep_the_latest_real_point_per_day(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    for hour, nodes in ((1, 1), (9, 2), (17, 3)):
+        append_metrics_point(project, _point(f"2026-05-01T{hour:02d}:00:00+00:00", nodes=nodes))
+    append_metrics_point(project, _point("2026-05-10T00:00:00+00:00", nodes=9))
+    series = read_history(project)
+    # The 05-01 bucket keeps its last real point; no averaged value appears.
+    assert [(p.ts, p.nodes) for p in series] == [
+        ("2026-05-01T17:00:00+00:00", 3),
+        ("2026-05-10T00:00:00+00:00", 9),
+    ]
+
+
+def test_recent_points_are_kept_raw(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    for hour in (1, 2, 3):
+        append_metrics_point(project, _point(f"2026-05-10T{hour:02d}:00:00+00:00"))
+    assert len(read_history(project)) == 3
+
+
+def test_points_past_the_daily_window_collapse_to_weeks(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    # Mon 2026-01-05 .. Sun 2026-01-11 is one ISO week; 01-12 starts the next.
+    for day in range(5, 13):
+        append_metrics_point(project, _point(f"2026-01-{day:02d}T12:00:00+00:00", nodes=day))
+    append_metrics_point(project, _point("2026-06-01T00:00:00+00:00", nodes=99))
+    assert [p.nodes for p in read_history(project)] == [11, 12, 99]
+
+
+def test_read_is_capped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from beadloom.application import site_metrics_history
+
+    project = _project(tmp_path)
+    for minute in range(5):
+        append_metrics_point(project, _point(f"2026-05-10T00:{minute:02d}:00+00:00"))
+    monkeypatch.setattr(site_metrics_history, "_MAX_POINTS", 2)
+    series = read_history(project)
+    assert [p.ts for p in series] == [
+        "2026-05-10T00:03:00+00:00",
+        "2026-05-10T00:04:00+00:00",
+    ]
+
+
+def test_backfill_skips_snapshots_already_downsampled(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    append_metrics_point(project, _point("2026-05-01T18:00:00+00:00", nodes=7))
+    append_metrics_point(project, _point("2026-05-10T00:00:00+00:00", nodes=9))
+    conn = _conn(project)
+    try:
+        _snapshot(conn, created_at="2026-05-01 10:00:00", nodes=5, edges=4, symbols=20)
+        backfill_structural_history(conn, project)
+    finally:
+        conn.close()
+    assert [p.nodes for p in read_history(project)] == [7, 9]
+
+
+def test_backfill_downsamples_like_an_append(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    conn = _conn(project)
+    try:
+        for hour, nodes in ((1, 1), (9, 2), (17, 3)):
+            _snapshot(
+                conn, created_at=f"2026-05-01 {hour:02d}:00:00", nodes=nodes, edges=0, symbols=0
+            )
+        _snapshot(conn, created_at="2026-05-10 00:00:00", nodes=9, edges=0, symbols=0)
+        backfill_structural_history(conn, project)
+    finally:
+        conn.close()
+    assert [p.nodes for p in read_history(project)] == [3, 9]
+
+
 # ---------------------------------------------------------------------------
 # Snapshot ts normalization (dedup against recorded points)
 # ---------------------------------------------------------------------------
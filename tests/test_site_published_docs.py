@@ -323,6 +323,27 @@ def test_source_docs_byte_unchanged(conn: sqlite3.Connection, project: Path) ->
     assert before == after
 
 
+def test_assets_are_linked_not_rewritten(conn: sqlite3.Connection, project: Path) -> None:
+    image = project / "docs" / "diagram.png"
+    image.write_bytes(b"\x89PNG binary")
+    out = project / "site"
+    generate_site(conn, out, project_root=project)
+    published = out / "docs" / "diagram.png"
+    assert published.read_bytes() == b"\x89PNG binary"
+
+    result = generate_site(conn, out, project_root=project)
+    assert published not in result.updated
+    assert image.read_bytes() == b"\x89PNG binary"
+
+
+def test_badges_match_per_doc_lookups(conn: sqlite3.Connection, project: Path) -> None:
+    """The bulk badge queries agree with the stored per-doc sync_state rows."""
+    docs = {d.doc_path: d for d in build_published_docs(conn, project_root=project)}
+    for row in conn.execute("SELECT doc_path, synced_at FROM sync_state").fetchall():
+        assert docs[row["doc_path"]].synced_at == row["synced_at"]
+    assert docs["orphan.md"].coverage_pct == 0.0
+
+
 # ---------------------------------------------------------------------------
 # Badge injection is a stable marker-delimited prefix.
 # ---------------------------------------------------------------------------
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import zlib
 
 import pytest
 
+from beadloom.graph import snapshot
 from beadloom.graph.snapshot import (
     SnapshotDiff,
     SnapshotInfo,
     compare_snapshots,
     list_snapshots,
+    load_snapshot,
     save_snapshot,
 )
 from beadloom.infrastructure.db import create_schema
@@ -79,24 +82,18 @@ class TestSaveSnapshot:
         ).fetchone()
         assert row["label"] is None
 
-    def test_save_captures_nodes_json(self, populated_conn: sqlite3.Connection) -> None:
-        """Saved snapshot contains all nodes as JSON."""
+    def test_save_captures_nodes(self, populated_conn: sqlite3.Connection) -> None:
+        """Saved snapshot contains all nodes."""
         snap_id = save_snapshot(populated_conn)
-        row = populated_conn.execute(
-            "SELECT nodes_json FROM graph_snapshots WHERE id = ?", (snap_id,)
-        ).fetchone()
-        nodes = json.loads(row["nodes_json"])
+        nodes, _ = load_snapshot(populated_conn, snap_id)
         assert len(nodes) == 2
         ref_ids = {n["ref_id"] for n in nodes}
         assert ref_ids == {"auth-login", "user-service"}
 
-    def test_save_captures_edges_json(self, populated_conn: sqlite3.Connection) -> None:
-        """Saved snapshot contains all edges as JSON."""
+    def test_save_captures_edges(self, populated_conn: sqlite3.Connection) -> None:
+        """Saved snapshot contains all edges."""
         snap_id = save_snapshot(populated_conn)
-        row = populated_conn.execute(
-            "SELECT edges_json FROM graph_snapshots WHERE id = ?", (snap_id,)
-        ).fetchone()
-        edges = json.loads(row["edges_json"])
+        _, edges = load_snapshot(populated_conn, snap_id)
         assert len(edges) == 1
         assert edges[0]["src_ref_id"] == "auth-login"
         assert edges[0]["dst_ref_id"] == "user-service"
@@ -114,11 +111,9 @@ class TestSaveSnapshot:
         """save_snapshot works on an empty database."""
         snap_id = save_snapshot(conn)
         row = conn.execute(
-            "SELECT nodes_json, edges_json, symbols_count FROM graph_snapshots WHERE id = ?",
-            (snap_id,),
+            "SELECT symbols_count FROM graph_snapshots WHERE id = ?", (snap_id,)
         ).fetchone()
-        assert json.loads(row["nodes_json"]) == []
-        assert json.loads(row["edges_json"]) == []
+        assert load_snapshot(conn, snap_id) == ([], [])
         assert row["symbols_count"] == 0
 
     def test_save_multiple_snapshots(self, populated_conn: sqlite3.Connection) -> None:
@@ -289,3 +284,135 @@ class TestCompareSnapshots:
         diff_rev = compare_snapshots(populated_conn, id2, id1)
         assert len(diff_rev.removed_nodes) == 1
         assert diff_rev.removed_nodes[0]["ref_id"] == "billing"
+
+
+def _add_node(conn: sqlite3.Connection, ref_id: str, summary: str = "") -> None:
+    conn.execute(
+        "INSERT INTO nodes (ref_id, kind, summary) VALUES (?, ?, ?)",
+        (ref_id, "feature", summary),
+    )
+    conn.commit()
+
+
+class TestDeltaStorage:
+    def test_unchanged_graph_stores_empty_delta(
+        self, populated_conn: sqlite3.Connection
+    ) -> None:
+        id1 = save_snapshot(populated_conn)
+        records_before = populated_conn.execute(
+            "SELECT count(*) FROM snapshot_records"
+        ).fetchone()[0]
+        id2 = save_snapshot(populated_conn)
+        deltas = populated_conn.execute(
+            "SELECT count(*) FROM snapshot_deltas WHERE snapshot_id = ?", (id2,)
+        ).fetchone()[0]
+        records_after = populated_conn.execute(
+            "SELECT count(*) FROM snapshot_records"
+        ).fetchone()[0]
+        assert deltas == 0
+        assert records_after == records_before
+        assert load_snapshot(populated_conn, id1) == load_snapshot(populated_conn, id2)
+
+    def test_delta_holds_only_changed_records(self, populated_conn: sqlite3.Connection) -> None:
+        save_snapshot(populated_conn)
+        populated_conn.execute(
+            "UPDATE nodes SET summary = 'Renamed' WHERE ref_id = 'user-service'"
+        )
+        populated_conn.commit()
+        id2 = save_snapshot(populated_conn)
+        ops = populated_conn.execute(
+            "SELECT op FROM snapshot_deltas WHERE snapshot_id = ? ORDER BY op", (id2,)
+        ).fetchall()
+        assert [r["op"] for r in ops] == [-1, 1]
+
+    def test_records_are_compressed(self, populated_conn: sqlite3.Connection) -> None:
+        save_snapshot(populated_conn)
+        row = populated_conn.execute(
+            "SELECT data FROM snapshot_records WHERE entity = 'node' LIMIT 1"
+        ).fetchone()
+        assert json.loads(zlib.decompress(row["data"]))["kind"] in {"feature", "service"}
+
+    def test_chain_replays_across_many_snapshots(self, conn: sqlite3.Connection) -> None:
+        ids = []
+        for i in range(5):
+            _add_node(conn, f"n{i}")
+            ids.append(save_snapshot(conn))
+        conn.execute("DELETE FROM nodes WHERE ref_id = 'n0'")
+        conn.commit()
+        ids.append(save_snapshot(conn))
+        nodes, _ = load_snapshot(conn, ids[-1])
+        assert [n["ref_id"] for n in nodes] == ["n1", "n2", "n3", "n4"]
+        nodes, _ = load_snapshot(conn, ids[2])
+        assert [n["ref_id"] for n in nodes] == ["n0", "n1", "n2"]
+
+        diff = compare_snapshots(conn, ids[1], ids[-1])
+        assert [n["ref_id"] for n in diff.added_nodes] == ["n2", "n3", "n4"]
+        assert [n["ref_id"] for n in diff.removed_nodes] == ["n0"]
+
+    def test_keyframe_bounds_chain(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(snapshot, "_MAX_CHAIN", 3)
+        ids = []
+        for i in range(7):
+            _add_node(conn, f"n{i}")
+            ids.append(save_snapshot(conn))
+        bases = [
+            conn.execute("SELECT base_id FROM graph_snapshots WHERE id = ?", (i,)).fetchone()[0]
+            for i in ids
+        ]
+        assert bases.count(None) == 3
+        diff = compare_snapshots(conn, ids[0], ids[-1])
+        assert [n["ref_id"] for n in diff.added_nodes] == [f"n{i}" for i in range(1, 7)]
+
+    def test_edge_extra_change_is_not_an_edge_diff(
+        self, populated_conn: sqlite3.Connection
+    ) -> None:
+        id1 = save_snapshot(populated_conn)
+        populated_conn.execute("UPDATE edges SET extra = '{\"note\": 1}'")
+        populated_conn.commit()
+        id2 = save_snapshot(populated_conn)
+        diff = compare_snapshots(populated_conn, id1, id2)
+        assert not diff.has_changes
+
+    def test_list_counts_without_payload(self, populated_conn: sqlite3.Connection) -> None:
+        save_snapshot(populated_conn)
+        info = list_snapshots(populated_conn)[0]
+        assert (info.node_count, info.edge_count) == (2, 1)
+
+
+class TestLegacyJsonSnapshots:
+    """Rows written before delta storage keep working."""
+
+    @pytest.fixture()
+    def legacy_id(self, conn: sqlite3.Connection) -> int:
+        nodes = [
+            {"ref_id": "a", "kind": "domain", "summary": "A", "source": None, "extra": "{}"},
+            {"ref_id": "b", "kind": "domain", "summary": "B", "source": None, "extra": "{}"},
+        ]
+        edges = [{"src_ref_id": "a", "dst_ref_id": "b", "kind": "uses", "extra": "{}"}]
+        cursor = conn.execute(
+            "INSERT INTO graph_snapshots (nodes_json, edges_json, symbols_count) "
+            "VALUES (?, ?, 3)",
+            (json.dumps(nodes), json.dumps(edges)),
+        )
+        conn.commit()
+        return int(cursor.lastrowid or 0)
+
+    def test_list_and_load(self, conn: sqlite3.Connection, legacy_id: int) -> None:
+        info = list_snapshots(conn)[0]
+        assert (info.id, info.node_count, info.edge_count) == (legacy_id, 2, 1)
+        nodes, edges = load_snapshot(conn, legacy_id)
+        assert [n["ref_id"] for n in nodes] == ["a", "b"]
+        assert len(edges) == 1
+
+    def test_compare_legacy_with_delta(self, conn: sqlite3.Connection, legacy_id: int) -> None:
+        conn.execute("INSERT INTO nodes (ref_id, kind, summary) VALUES ('a', 'domain', 'A2')")
+        conn.commit()
+        new_id = save_snapshot(conn)
+        diff = compare_snapshots(conn, legacy_id, new_id)
+        assert diff.changed_nodes == [
+            {"ref_id": "a", "kind": "domain", "old_summary": "A", "new_summary": "A2"}
+        ]
+        assert [n["ref_id"] for n in diff.removed_nodes] == ["b"]
+        assert len(diff.removed_edges) == 1
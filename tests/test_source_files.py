@@ -0,0 +1,140 @@
+"""Tests for beadloom.infrastructure.source_files — streaming hashes and the parse guard."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from beadloom.application.reindex import reindex
+from beadloom.context_oracle.code_indexer import extract_symbols
+from beadloom.infrastructure import source_files
+from beadloom.infrastructure.db import open_db
+from beadloom.infrastructure.source_files import (
+    DEFAULT_MAX_FILE_SIZE,
+    configure_max_file_size,
+    hash_file,
+    hash_text_file,
+    max_file_size,
+    skip_reason,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _default_limit() -> Iterator[None]:
+    yield
+    configure_max_file_size(None)
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestHashing:
+    def test_hash_file_matches_whole_file_digest(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 1000
+        path = _write(tmp_path / "blob.bin", data)
+        assert hash_file(path) == hashlib.sha256(data).hexdigest()
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"a = 1\nb = 2\n",
+            b"a = 1\r\nb = 2\r\n",
+            b"a = 1\rb = 2\r",
+            b"mixed\r\n\r\rend\n\xc3\xa9\r",
+            b"",
+        ],
+    )
+    def test_hash_text_file_matches_text_mode_digest(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, data: bytes
+    ) -> None:
+        # Tiny chunks put a "\r\n" across a chunk boundary.
+        monkeypatch.setattr(source_files, "HASH_CHUNK_SIZE", 3)
+        path = _write(tmp_path / "mod.py", data)
+        expected = hashlib.sha256(path.read_text(encoding="utf-8").encode()).hexdigest()
+        assert hash_text_file(path) == expected
+
+
+class TestSkipReason:
+    def test_ordinary_source_is_parsed(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "mod.py", b"def f():\n    return 1\n" * 1000)
+        assert skip_reason(path) is None
+
+    def test_file_above_ceiling(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "big.py", b"x = 1\n" * 100)
+        configure_max_file_size(100)
+        assert max_file_size() == 100
+        assert skip_reason(path) == "larger than 100 bytes (600 bytes)"
+        configure_max_file_size(None)
+        assert max_file_size() == DEFAULT_MAX_FILE_SIZE
+        assert skip_reason(path) is None
+
+    def test_binary_and_non_utf8(self, tmp_path: Path) -> None:
+        assert skip_reason(_write(tmp_path / "a.py", b"x = 1\n\0\0")) == "binary content"
+        assert skip_reason(_write(tmp_path / "b.py", b"s = '\xe9'\n")) == "not UTF-8 text"
+
+    def test_character_split_by_the_sample_is_not_invalid(self, tmp_path: Path) -> None:
+        data = (b"#" * 99 + b"\n") * 81 + b"#" * 91 + "é".encode() + b"\n" * 100
+        assert skip_reason(_write(tmp_path / "c.py", data)) is None
+
+    def test_minified(self, tmp_path: Path) -> None:
+        data = b"var a=1;" * 5000
+        assert skip_reason(_write(tmp_path / "bundle.min.js", data)) == "minified (long lines)"
+
+    def test_cr_only_line_breaks_are_not_minified(self, tmp_path: Path) -> None:
+        data = b"x = 1\r" * 2000
+        assert skip_reason(_write(tmp_path / "old_mac.py", data)) is None
+
+    def test_sample_is_read_once_per_file_version(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = _write(tmp_path / "mod.py", b"x = 1\n")
+        samples: list[bytes] = []
+        real = source_files._sample_reason
+
+        def counting(sample: bytes, size: int) -> str | None:
+            samples.append(sample)
+            return real(sample, size)
+
+        monkeypatch.setattr(source_files, "_sample_reason", counting)
+        assert skip_reason(path) is None
+        assert skip_reason(path) is None
+        assert len(samples) == 1
+        path.write_bytes(b"x = 1\n\0")
+        assert skip_reason(path) == "binary content"
+        assert len(samples) == 2
+
+    def test_extractors_return_nothing_for_skipped_files(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "mod.py", b"def f():\n    pass\n")
+        assert extract_symbols(path)
+        configure_max_file_size(4)
+        assert extract_symbols(path) == []
+
+
+def test_reindex_reports_and_skips_unparsed_sources(tmp_path: Path) -> None:
+    (tmp_path / ".beadloom" / "_graph").mkdir(parents=True)
+    (tmp_path / ".beadloom" / "config.yml").write_text("max_file_size: 2000\n")
+    _write(tmp_path / "src" / "small.py", b"def small():\n    pass\n")
+    _write(tmp_path / "src" / "large.py", b"def large():\n    pass\n" * 200)
+    _write(tmp_path / "src" / "data.py", b"\0\0\0")
+    result = reindex(tmp_path)
+    assert "Source 'src/large.py' not parsed: larger than 2000 bytes (4400 bytes)" in (
+        result.warnings
+    )
+    assert "Source 'src/data.py' not parsed: binary content" in result.warnings
+    conn = open_db(tmp_path / ".beadloom" / "beadloom.db")
+    try:
+        symbols = {row[0] for row in conn.execute("SELECT symbol_name FROM code_symbols")}
+        indexed = {row[0] for row in conn.execute("SELECT path FROM file_index")}
+    finally:
+        conn.close()
+    assert symbols == {"small"}
+    assert {"src/large.py", "src/data.py"} <= indexed
@@ -134,6 +134,38 @@ class TestBuildSyncState:
         assert "src/a.py" in code_paths
         assert "src/b.py" in code_paths
 
+    def test_one_pair_per_doc_and_file_in_table_order(self, conn: sqlite3.Connection) -> None:
+        """Each doc gets one pair per file, hashed from its first matching symbol."""
+        conn.execute(
+            "INSERT INTO nodes (ref_id, kind, summary) VALUES (?, ?, ?)",
+            ("F1", "feature", "Feature 1"),
+        )
+        for doc_path in ("spec.md", "notes.md"):
+            conn.execute(
+                "INSERT INTO docs (path, kind, ref_id, hash) VALUES (?, ?, ?, ?)",
+                (doc_path, "feature", "F1", "dochash"),
+            )
+        for file_path, name, annots, file_hash in (
+            ("src/b.py", "fn_b", {"feature": "F1", "domain": "F1"}, "hash_b1"),
+            ("src/a.py", "fn_a", {"feature": "F1"}, "hash_a"),
+            ("src/b.py", "fn_b2", {"feature": "F1"}, "hash_b2"),
+            ("src/c.py", "fn_c", {"feature": "F2"}, "hash_c"),
+        ):
+            conn.execute(
+                "INSERT INTO code_symbols "
+                "(file_path, symbol_name, kind, line_start, line_end, annotations, file_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (file_path, name, "function", 1, 5, json.dumps(annots), file_hash),
+            )
+        conn.commit()
+        pairs = build_sync_state(conn)
+        assert [(p.doc_path, p.code_path, p.code_hash) for p in pairs] == [
+            ("spec.md", "src/b.py", "hash_b1"),
+            ("spec.md", "src/a.py", "hash_a"),
+            ("notes.md", "src/b.py", "hash_b1"),
+            ("notes.md", "src/a.py", "hash_a"),
+        ]
+
 
 class TestCheckSync:
     def test_all_ok(self, conn: sqlite3.Connection, project: Path) -> None:
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from beadloom.context_oracle.test_mapper import TestMapping, aggregate_parent_tests, map_tests
+from beadloom.context_oracle.test_mapper import (
+    TestMapping,
+    aggregate_parent_tests,
+    discover_tests,
+    is_test_file,
+    map_tests,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -358,6 +364,53 @@ class TestEdgeCases:
         assert total_tests >= 2
 
 
+# ---------------------------------------------------------------------------
+# Single-pass discovery
+# ---------------------------------------------------------------------------
+
+
+class TestDiscovery:
+    """One walk classifies files for every framework at once."""
+
+    def test_files_classified_per_framework(self, tmp_path: Path) -> None:
+        _write_file(tmp_path / "conftest.py")
+        _write_file(tmp_path / "tests" / "test_auth.py")
+        _write_file(tmp_path / "tests" / "conftest_test.py")
+        _write_file(tmp_path / "web" / "__tests__" / "helpers.js")
+        _write_file(tmp_path / "web" / "cart.spec.tsx")
+        _write_file(tmp_path / "src" / "test" / "java" / "Helper.java")
+        _write_file(tmp_path / "App" / "AppTests" / "Helpers.swift")
+        found = discover_tests(tmp_path)
+        assert found.frameworks == ["pytest", "jest", "junit", "xctest"]
+        assert found.files["pytest"] == ["tests/test_auth.py"]
+        assert found.files["jest"] == ["web/__tests__/helpers.js", "web/cart.spec.tsx"]
+        assert found.files["junit"] == ["src/test/java/Helper.java"]
+        assert found.files["xctest"] == ["App/AppTests/Helpers.swift"]
+
+    def test_stamp_follows_test_files(self, tmp_path: Path) -> None:
+        _write_file(tmp_path / "conftest.py")
+        _write_file(tmp_path / "tests" / "test_auth.py", "def test_a():\n    pass\n")
+        stamp = discover_tests(tmp_path).stamp
+        _write_file(tmp_path / "src" / "auth.py", "x = 1\n")
+        assert discover_tests(tmp_path).stamp == stamp
+        _write_file(tmp_path / "tests" / "test_billing.py")
+        assert discover_tests(tmp_path).stamp != stamp
+
+    def test_is_test_file(self) -> None:
+        assert is_test_file("tests/test_auth.py")
+        assert is_test_file("src/auth/__tests__/util.ts")
+        assert not is_test_file("src/auth/service.py")
+        assert not is_test_file("conftest.py")
+
+    def test_count_follows_content(self, tmp_path: Path) -> None:
+        _write_file(tmp_path / "conftest.py")
+        test_file = tmp_path / "tests" / "test_auth.py"
+        _write_file(test_file, "def test_a():\n    pass\n")
+        assert map_tests(tmp_path, {"auth": "src/auth"})["auth"].test_count == 1
+        _write_file(test_file, "def test_a():\n    pass\n\ndef test_b():\n    pass\n")
+        assert map_tests(tmp_path, {"auth": "src/auth"})["auth"].test_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Parent Aggregation (Issue #26)
 # ---------------------------------------------------------------------------
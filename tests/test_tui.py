@@ -1059,6 +1059,17 @@ class TestStatusBarWidget:
 
         assert widget.last_action == "Test message"
 
+    def test_progress_shown_until_cleared(self) -> None:
+        """set_progress renders the message; clear_progress removes it."""
+        from beadloom.tui.widgets.status_bar import StatusBarWidget
+
+        widget = StatusBarWidget()
+        widget.set_progress("refreshing lint (2/5)")
+        assert "refreshing lint (2/5)" in widget.render().plain
+        widget.clear_progress()
+        assert widget.progress == ""
+        assert "refreshing" not in widget.render().plain
+
     def test_stale_count_red_when_positive(self) -> None:
         """StatusBarWidget shows stale in red style when count > 0."""
         from beadloom.tui.widgets.status_bar import StatusBarWidget
@@ -1109,6 +1120,88 @@ class TestDashboardScreen:
 
             await pilot.press("q")
 
+    def test_index_graph_sorts_by_kind_then_ref_id(self) -> None:
+        """_index_graph orders roots and children by kind order, then ref_id."""
+        from beadloom.tui.widgets.graph_tree import _index_graph
+
+        nodes = [
+            {"ref_id": "zeta", "kind": "domain"},
+            {"ref_id": "api", "kind": "service"},
+            {"ref_id": "b-feat", "kind": "feature"},
+            {"ref_id": "a-feat", "kind": "feature"},
+            {"ref_id": "sub", "kind": "domain"},
+        ]
+        index = _index_graph(
+            nodes,
+            {"zeta": ["b-feat", "a-feat", "sub", "unknown"]},
+            doc_ref_ids=set(),
+            stale_ref_ids=set(),
+            edge_counts={},
+        )
+        assert index.roots == ("api", "zeta")
+        assert index.children["zeta"] == ("sub", "a-feat", "b-feat", "unknown")
+        assert index.has_children("zeta")
+        assert not index.has_children("api")
+
+    @pytest.mark.asyncio()
+    async def test_tree_materializes_children_on_expand(
+        self, populated_db: tuple[Path, Path]
+    ) -> None:
+        """Branch children are only created when the branch is first expanded."""
+        db_path, project_root = populated_db
+        from beadloom.tui.app import BeadloomApp
+        from beadloom.tui.widgets.graph_tree import GraphTreeWidget
+
+        app = BeadloomApp(db_path=db_path, project_root=project_root)
+        async with app.run_test() as pilot:
+            tree = app.screen.query_one("#graph-tree", GraphTreeWidget)
+            auth = next(c for c in tree.root.children if c.data == "auth")
+            assert auth.allow_expand
+            assert len(auth.children) == 0
+
+            auth.expand()
+            await pilot.pause()
+            assert [c.data for c in auth.children] == ["auth-login"]
+
+            await pilot.press("q")
+
+    @pytest.mark.asyncio()
+    async def test_tree_refresh_applies_delta_and_keeps_expansion(
+        self, populated_db: tuple[Path, Path]
+    ) -> None:
+        """refresh_data() reconciles the hierarchy instead of rebuilding the tree."""
+        from unittest.mock import patch
+
+        db_path, project_root = populated_db
+        from beadloom.tui.app import BeadloomApp
+        from beadloom.tui.widgets.graph_tree import GraphTreeWidget
+
+        app = BeadloomApp(db_path=db_path, project_root=project_root)
+        async with app.run_test() as pilot:
+            tree = app.screen.query_one("#graph-tree", GraphTreeWidget)
+            auth = next(c for c in tree.root.children if c.data == "auth")
+            auth.expand()
+            await pilot.pause()
+            login = auth.children[0]
+
+            provider = tree._graph_provider
+            assert provider is not None
+            with patch.object(
+                provider,
+                "get_hierarchy",
+                return_value={"auth": ["auth-login", "payments"]},
+            ):
+                tree.refresh_data()
+
+            # payments moved under auth; the existing nodes were reused.
+            assert [c.data for c in tree.root.children] == ["auth"]
+            assert tree.root.children[0] is auth
+            assert auth.is_expanded
+            assert [c.data for c in auth.children] == ["payments", "auth-login"]
+            assert auth.children[1] is login
+
+            await pilot.press("q")
+
     @pytest.mark.asyncio()
     async def test_dashboard_has_graph_tree(
         self, populated_db: tuple[Path, Path]
@@ -4492,8 +4585,11 @@ class TestPerformanceLargeGraph:
             root = tree.root
             assert len(root.children) == 10
 
-            # Each domain branch should have 50 feature children
+            # Children are materialized on expand: 50 features per domain
             first_domain = root.children[0]
+            assert first_domain.allow_expand
+            first_domain.expand()
+            await pilot.pause()
             assert len(first_domain.children) == 50
 
             await pilot.press("q")
@@ -5095,6 +5191,115 @@ class TestAppLifecycle:
             await pilot.pause()
             await pilot.press("q")
 
+    @pytest.mark.asyncio()
+    async def test_app_reindex_runs_off_the_ui_thread(
+        self, populated_db: tuple[Path, Path]
+    ) -> None:
+        """Reindex + provider recomputation run on a worker; caches swap on the UI thread."""
+        import threading
+        from unittest.mock import patch
+
+        db_path, project_root = populated_db
+        from beadloom.tui.app import BeadloomApp
+
+        ui_thread = threading.get_ident()
+        reindex_threads: list[int] = []
+
+        def _fake_reindex(*_args: object, **_kwargs: object) -> None:
+            reindex_threads.append(threading.get_ident())
+
+        app = BeadloomApp(db_path=db_path, project_root=project_root, no_watch=True)
+        with patch(
+            "beadloom.application.reindex.incremental_reindex", side_effect=_fake_reindex
+        ):
+            async with app.run_test() as pilot:
+                assert app.graph_provider is not None
+                app.graph_provider.swap(([], []))
+                await pilot.press("r")
+                assert app.reindex_worker is not None
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert reindex_threads
+                assert reindex_threads[0] != ui_thread
+                # The recomputed graph cache was swapped in.
+                assert {n["ref_id"] for n in app.graph_provider.get_nodes()} >= {"auth"}
+                await pilot.press("q")
+
+    @pytest.mark.asyncio()
+    async def test_app_reindex_failure_is_reported(
+        self, populated_db: tuple[Path, Path]
+    ) -> None:
+        """A failing background reindex notifies instead of crashing the app."""
+        from unittest.mock import patch
+
+        db_path, project_root = populated_db
+        from beadloom.tui.app import BeadloomApp
+
+        app = BeadloomApp(db_path=db_path, project_root=project_root, no_watch=True)
+        with patch(
+            "beadloom.application.reindex.incremental_reindex",
+            side_effect=OSError("disk gone"),
+        ), patch.object(app, "notify") as notify:
+            async with app.run_test() as pilot:
+                await pilot.press("r")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                messages = [str(call.args[0]) for call in notify.call_args_list]
+                assert any("disk gone" in m for m in messages)
+                await pilot.press("q")
+
+    @pytest.mark.asyncio()
+    async def test_app_reindex_failure_keeps_changed_paths(
+        self, populated_db: tuple[Path, Path]
+    ) -> None:
+        """Paths taken by a failed reindex are re-hashed by the next one."""
+        from unittest.mock import patch
+
+        db_path, project_root = populated_db
+        from beadloom.tui.app import BeadloomApp
+
+        app = BeadloomApp(db_path=db_path, project_root=project_root, no_watch=True)
+        with patch(
+            "beadloom.application.reindex.incremental_reindex",
+            side_effect=OSError("disk gone"),
+        ) as reindex:
+            async with app.run_test() as pilot:
+                app._pending_changed_paths.add("src/auth/login.py")
+                await pilot.press("r")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert app._pending_changed_paths == {"src/auth/login.py"}
+                await pilot.press("r")
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert reindex.call_args.kwargs["changed_paths"] == ["src/auth/login.py"]
+                await pilot.press("q")
+
+    def test_providers_to_refresh_follow_changed_inputs(self, tmp_path: Path) -> None:
+        """Only providers whose inputs a change touches are recomputed."""
+        from beadloom.tui.app import _providers_to_refresh
+
+        assert _providers_to_refresh(None, tmp_path) == [
+            "graph",
+            "lint",
+            "sync",
+            "debt",
+            "activity",
+        ]
+        assert _providers_to_refresh([str(tmp_path / "docs" / "a.md")], tmp_path) == [
+            "lint",
+            "sync",
+            "debt",
+        ]
+        assert _providers_to_refresh(["src/x.py"], tmp_path) == [
+            "graph",
+            "lint",
+            "sync",
+            "debt",
+        ]
+        graph_file = str(tmp_path / ".beadloom" / "_graph" / "g.yml")
+        assert "activity" in _providers_to_refresh([graph_file], tmp_path)
+
     @pytest.mark.asyncio()
     async def test_app_action_lint_null_provider(
         self, populated_db: tuple[Path, Path]
@@ -5,6 +5,9 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+import watchfiles
+
+from beadloom.application.reindex import reindex
 from beadloom.application.watcher import (
     DEFAULT_DEBOUNCE_MS,
     WatchEvent,
@@ -12,11 +15,15 @@ from beadloom.application.watcher import (
     _format_time,
     _get_watch_paths,
     _is_graph_file,
+    watch,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
+    import pytest
+
 
 class TestGetWatchPathsBasic:
     def test_get_watch_paths_basic(self, tmp_path: Path) -> None:
@@ -187,3 +194,42 @@ class TestDefaultDebounceMs:
     def test_default_debounce_ms(self) -> None:
         """DEFAULT_DEBOUNCE_MS is 500."""
         assert DEFAULT_DEBOUNCE_MS == 500
+
+
+class TestWatchReportsReindexType:
+    _GRAPH = "nodes:\n  - ref_id: app\n    kind: domain\n    summary: App\n    source: src/app/\n"
+
+    def _edit_graph(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, graph: str
+    ) -> WatchEvent:
+        graph_file = tmp_path / ".beadloom" / "_graph" / "g.yml"
+        graph_file.parent.mkdir(parents=True)
+        graph_file.write_text(self._GRAPH)
+        (tmp_path / "src" / "app").mkdir(parents=True)
+        reindex(tmp_path)
+        graph_file.write_text(graph)
+
+        def one_batch(*_paths: object, **_kwargs: object) -> Iterator[set[tuple[int, str]]]:
+            yield {(watchfiles.Change.modified, str(graph_file))}
+
+        monkeypatch.setattr(watchfiles, "watch", one_batch)
+        events: list[WatchEvent] = []
+        watch(tmp_path, callback=events.append)
+        assert len(events) == 1
+        return events[0]
+
+    def test_graph_delta_is_incremental(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        graph = self._GRAPH.replace("summary: App", "summary: Renamed app")
+        event = self._edit_graph(tmp_path, monkeypatch, graph)
+        assert event.is_graph_change is True
+        assert event.reindex_type == "incremental"
+
+    def test_structural_graph_edit_reports_full(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A source change falls back to a full reindex, and the event says so."""
+        graph = self._GRAPH.replace("src/app/", "src/app2/")
+        event = self._edit_graph(tmp_path, monkeypatch, graph)
+        assert event.reindex_type == "full"
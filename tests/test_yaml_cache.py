@@ -0,0 +1,148 @@
+"""Tests for beadloom.infrastructure.yaml_cache — content-addressed YAML parsing."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from beadloom.infrastructure import yaml_cache
+from beadloom.infrastructure.yaml_cache import (
+    YamlDocumentCache,
+    clear_yaml_cache,
+    load_yaml_file,
+    load_yaml_text,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DOC = """\
+nodes:
+  - ref_id: alpha
+    kind: domain
+    summary: Alpha
+    docs: [docs/alpha.md]
+edges:
+  - {src: alpha, dst: beta, kind: uses}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    clear_yaml_cache()
+
+
+class TestParsing:
+    def test_matches_safe_load(self) -> None:
+        assert load_yaml_text(_DOC) == yaml.safe_load(_DOC)
+
+    def test_empty_document_is_none(self) -> None:
+        assert load_yaml_text("") is None
+
+    def test_syntax_error_propagates_and_is_not_cached(self) -> None:
+        cache = YamlDocumentCache()
+        with pytest.raises(yaml.YAMLError):
+            cache.load("nodes: [unclosed")
+        assert len(cache) == 0
+
+
+class TestCaching:
+    def test_second_load_does_not_reparse(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.yml"
+        path.write_text(_DOC, encoding="utf-8")
+        with patch.object(yaml_cache, "safe_load", wraps=yaml_cache.safe_load) as parse:
+            first = load_yaml_file(path)
+            second = load_yaml_file(path)
+        assert parse.call_count == 1
+        assert first == second
+
+    def test_same_content_at_another_path_is_a_hit(self, tmp_path: Path) -> None:
+        (tmp_path / "a.yml").write_text(_DOC, encoding="utf-8")
+        (tmp_path / "b.yml").write_text(_DOC, encoding="utf-8")
+        with patch.object(yaml_cache, "safe_load", wraps=yaml_cache.safe_load) as parse:
+            load_yaml_file(tmp_path / "a.yml")
+            load_yaml_file(tmp_path / "b.yml")
+        assert parse.call_count == 1
+
+    def test_edited_file_is_reparsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.yml"
+        path.write_text(_DOC, encoding="utf-8")
+        load_yaml_file(path)
+        path.write_text(_DOC.replace("Alpha", "Changed"), encoding="utf-8")
+        assert load_yaml_file(path)["nodes"][0]["summary"] == "Changed"
+
+    def test_hits_return_independent_objects(self) -> None:
+        first = load_yaml_text(_DOC)
+        first["nodes"][0]["summary"] = "mutated by a patcher"
+        assert load_yaml_text(_DOC)["nodes"][0]["summary"] == "Alpha"
+
+    def test_lru_eviction_bounds_memory(self) -> None:
+        cache = YamlDocumentCache(max_entries=2)
+        for i in range(5):
+            cache.load(f"value: {i}")
+        assert len(cache) == 2
+
+
+class TestDiskLayer:
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        disk = tmp_path / "cache"
+        YamlDocumentCache(disk_dir=disk).load(_DOC)
+        assert len(list(disk.glob("*.json"))) == 1
+
+        fresh = YamlDocumentCache(disk_dir=disk)
+        with patch.object(yaml_cache, "safe_load") as parse:
+            doc = fresh.load(_DOC)
+        parse.assert_not_called()
+        assert doc == yaml.safe_load(_DOC)
+
+    def test_corrupt_entry_falls_back_to_parsing(self, tmp_path: Path) -> None:
+        disk = tmp_path / "cache"
+        YamlDocumentCache(disk_dir=disk).load(_DOC)
+        entry = next(disk.glob("*.json"))
+        entry.write_bytes(b"not json {")
+        assert YamlDocumentCache(disk_dir=disk).load(_DOC) == yaml.safe_load(_DOC)
+
+    def test_pickle_in_cache_dir_is_never_loaded(self, tmp_path: Path) -> None:
+        disk = tmp_path / "cache"
+        disk.mkdir()
+        key = hashlib.sha256(_DOC.encode("utf-8")).hexdigest()
+        (disk / f"{key}.pickle").write_bytes(pickle.dumps({"nodes": "planted"}))
+        (disk / f"{key}.json").write_bytes(pickle.dumps({"nodes": "planted"}))
+        assert YamlDocumentCache(disk_dir=disk).load(_DOC) == yaml.safe_load(_DOC)
+
+    def test_documents_json_cannot_represent_stay_in_memory(self, tmp_path: Path) -> None:
+        disk = tmp_path / "cache"
+        cache = YamlDocumentCache(disk_dir=disk)
+        assert cache.load("released: 2026-01-02\n1: one\n") == {
+            "released": datetime.date(2026, 1, 2),
+            1: "one",
+        }
+        assert cache.load("2: two\n") == {2: "two"}
+        assert not list(disk.glob("*.json"))
+
+    def test_unwritable_disk_dir_is_best_effort(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = YamlDocumentCache(disk_dir=blocker / "cache")
+        assert cache.load(_DOC) == yaml.safe_load(_DOC)
+
+
+def test_reindex_opt_in_enables_disk_cache(tmp_path: Path) -> None:
+    from beadloom.application.reindex.indexing import _configure_yaml_cache
+
+    (tmp_path / ".beadloom").mkdir()
+    (tmp_path / ".beadloom" / "config.yml").write_text("yaml_cache: disk\n")
+    try:
+        _configure_yaml_cache(tmp_path)
+        assert yaml_cache._CACHE.disk_dir == tmp_path / ".beadloom" / "cache" / "yaml"
+        (tmp_path / ".beadloom" / "config.yml").write_text("scan_paths: [src]\n")
+        _configure_yaml_cache(tmp_path)
+        assert yaml_cache._CACHE.disk_dir is None
+    finally:
+        yaml_cache.configure_disk_cache(None)